@@ -1,9 +1,9 @@
 import os
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from mem0.embeddings.configs import EmbedderConfig
+from mem0.embeddings.configs import EmbedderConfig, compacted_dims
 from mem0.graphs.configs import GraphStoreConfig
 from mem0.llms.configs import LlmConfig
 from mem0.vector_stores.configs import VectorStoreConfig
@@ -60,6 +60,26 @@ class MemoryConfig(BaseModel):
         default=None,
     )
 
+    @model_validator(mode="after")
+    def size_vector_store_for_compaction(self):
+        # Compacted vectors are narrower than the model's, so the store is sized for them unless configured explicitly
+        dims = compacted_dims(self.embedder)
+        store_config = self.vector_store.config
+        if (
+            dims is None
+            or not isinstance(store_config, BaseModel)
+            or "embedding_model_dims" not in type(store_config).model_fields
+        ):
+            return self
+        if "embedding_model_dims" not in store_config.model_fields_set:
+            store_config.embedding_model_dims = dims
+        elif store_config.embedding_model_dims != dims:
+            raise ValueError(
+                f"vector_store.config.embedding_model_dims ({store_config.embedding_model_dims}) must match "
+                f"embedder.compaction.dims ({dims})"
+            )
+        return self
+
 
 class AzureConfig(BaseModel):
     """
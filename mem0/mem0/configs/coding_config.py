@@ -3,6 +3,7 @@ Coding-specific memory configuration optimizations for autonomous AI agents.
 This module extends the base MemoryConfig with parameters tuned for coding contexts.
 """
 
+import re
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field
@@ -26,6 +27,51 @@ class CodingMemoryConfig(MemoryConfig):
         default=0.85,
         description="Higher threshold for coding contexts to reduce redundant storage",
     )
+    deduplication_cache_size: int = Field(
+        default=10000,
+        description="Number of memories whose deduplication features (tokens, patterns, embedding) are cached by id",
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.9,
+        description="Word-set Jaccard similarity above which the MinHash/LSH index reports a stored memory as a duplicate",
+    )
+    near_duplicate_index_dir: Optional[str] = Field(
+        default=None,
+        description="Directory the per-scope MinHash/LSH near-duplicate indexes are persisted to (in memory only when None)",
+    )
+
+    # Memory budget of the learning and statistics state
+    learning_history_size: int = Field(
+        default=1000,
+        description="Records each learning history keeps; older records only contribute to the streaming aggregates",
+    )
+    learning_reservoir_size: int = Field(
+        default=100,
+        description="Size of the uniform random sample each streaming statistic keeps of its values",
+    )
+    learning_ewma_alpha: float = Field(
+        default=0.1,
+        description="Smoothing factor of the exponentially weighted moving averages in the learning statistics",
+    )
+
+    # Offloading of CPU-bound enrichment (categorization, coding metadata, tagging)
+    enrichment_backend: str = Field(
+        default="inline",
+        description='Where enrichment runs: "inline" on the calling thread, or "process" in worker processes, which '
+        "keeps ingestion bursts from holding the GIL while other threads serve searches",
+    )
+    enrichment_workers: Optional[int] = Field(
+        default=None,
+        description="Number of worker processes of the process backend (the number of CPUs when None)",
+    )
+    enrichment_batch_size: int = Field(
+        default=32,
+        description="Memories enriched per worker task",
+    )
+    enrichment_timeout: Optional[float] = Field(
+        default=30.0,
+        description="Seconds to wait for worker results before enriching the remaining memories inline",
+    )
 
     # Context-aware storage prioritization
     coding_context_weights: Dict[str, float] = Field(
@@ -93,6 +139,13 @@ class CodingMemoryConfig(MemoryConfig):
     )
 
 
+_FILE_REFERENCE_PATTERNS = [
+    re.compile(r"(\w+\.\w+)"),  # filename.ext
+    re.compile(r"(/[\w/]+\.\w+)"),  # /path/to/file.ext
+    re.compile(r"(\w+/[\w/]+\.\w+)"),  # relative/path/file.ext
+]
+
+
 class CodingFactExtractor:
     """
     Coding-specific fact extraction logic for autonomous AI agents.
@@ -166,16 +219,8 @@ class CodingFactExtractor:
         metadata = {}
 
         # Extract file references
-        import re
-
-        file_patterns = [
-            r"(\w+\.\w+)",  # filename.ext
-            r"(/[\w/]+\.\w+)",  # /path/to/file.ext
-            r"(\w+/[\w/]+\.\w+)",  # relative/path/file.ext
-        ]
-
-        for pattern in file_patterns:
-            matches = re.findall(pattern, fact)
+        for pattern in _FILE_REFERENCE_PATTERNS:
+            matches = pattern.findall(fact)
             if matches:
                 metadata["file_references"] = list(set(matches))
                 break
@@ -23,6 +23,11 @@ class BaseEmbedderConfig(ABC):
         # Huggingface specific
         model_kwargs: Optional[dict] = None,
         huggingface_base_url: Optional[str] = None,
+        huggingface_backend: Optional[str] = None,
+        huggingface_quantization: Optional[str] = None,
+        huggingface_threads: Optional[int] = None,
+        huggingface_batch_size: Optional[int] = None,
+        huggingface_warmup: bool = False,
         # AzureOpenAI specific
         azure_kwargs: Optional[AzureConfig] = {},
         http_client_proxies: Optional[Union[Dict, str]] = None,
@@ -55,11 +60,23 @@ class BaseEmbedderConfig(ABC):
         :type model_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
         :param huggingface_base_url: Huggingface base URL to be use, defaults to None
         :type huggingface_base_url: Optional[str], optional
+        :param huggingface_backend: Local inference backend for the huggingface model, "torch" or "onnx", defaults to "torch"
+        :type huggingface_backend: Optional[str], optional
+        :param huggingface_quantization: With the "onnx" backend, export and use an int8 dynamically quantized model
+            for this CPU target ("arm64", "avx2", "avx512" or "avx512_vnni"), defaults to None
+        :type huggingface_quantization: Optional[str], optional
+        :param huggingface_threads: Intra-op threads used by the huggingface model, defaults to the backend's choice
+        :type huggingface_threads: Optional[int], optional
+        :param huggingface_batch_size: Texts per forward pass when encoding batches, defaults to the model's default
+        :type huggingface_batch_size: Optional[int], optional
+        :param huggingface_warmup: Run one encode pass when the huggingface model is loaded, defaults to False
+        :type huggingface_warmup: bool, optional
         :param openai_base_url: Openai base URL to be use, defaults to "https://api.openai.com/v1"
         :type openai_base_url: Optional[str], optional
         :param azure_kwargs: key-value arguments for the AzureOpenAI embedding model, defaults a dict inside init
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
-        :param http_client_proxies: The proxy server settings used to create self.http_client, defaults to None
+        :param http_client_proxies: The proxy server settings used to create self.http_client
+            (and the async client of providers that have one), defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
         :param vertex_credentials_json: The path to the Vertex AI credentials JSON file, defaults to None
         :type vertex_credentials_json: Optional[str], optional
@@ -80,6 +97,7 @@ class BaseEmbedderConfig(ABC):
 
         # AzureOpenAI specific
         self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_client_proxies = http_client_proxies
 
         # Ollama specific
         self.ollama_base_url = ollama_base_url
@@ -87,6 +105,11 @@ class BaseEmbedderConfig(ABC):
         # Huggingface specific
         self.model_kwargs = model_kwargs or {}
         self.huggingface_base_url = huggingface_base_url
+        self.huggingface_backend = huggingface_backend
+        self.huggingface_quantization = huggingface_quantization
+        self.huggingface_threads = huggingface_threads
+        self.huggingface_batch_size = huggingface_batch_size
+        self.huggingface_warmup = huggingface_warmup
         # AzureOpenAI specific
         self.azure_kwargs = AzureConfig(**azure_kwargs) or {}
 
@@ -88,7 +88,8 @@ class BaseLlmConfig(ABC):
         :type openai_base_url: Optional[str], optional
         :param azure_kwargs: key-value arguments for the AzureOpenAI LLM model, defaults a dict inside init
         :type azure_kwargs: Optional[Dict[str, Any]], defaults a dict inside init
-        :param http_client_proxies: The proxy server(s) settings used to create self.http_client, defaults to None
+        :param http_client_proxies: The proxy server(s) settings used to create self.http_client
+            (and the async client of providers that have one), defaults to None
         :type http_client_proxies: Optional[Dict | str], optional
         :param deepseek_base_url: DeepSeek base URL to be use, defaults to None
         :type deepseek_base_url: Optional[str], optional
@@ -115,6 +116,7 @@ class BaseLlmConfig(ABC):
 
         # AzureOpenAI specific
         self.http_client = httpx.Client(proxies=http_client_proxies) if http_client_proxies else None
+        self.http_client_proxies = http_client_proxies
 
         # Openrouter specific
         self.models = models
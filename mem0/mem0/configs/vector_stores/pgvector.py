@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -13,6 +13,9 @@ class PGVectorConfig(BaseModel):
     port: Optional[int] = Field(None, description="Database port. Default is 1536")
     diskann: Optional[bool] = Field(True, description="Use diskann for approximate nearest neighbors search")
     hnsw: Optional[bool] = Field(False, description="Use hnsw for faster search")
+    vector_datatype: Literal["float32", "float16"] = Field(
+        "float32", description="Precision vectors are stored at; float16 uses the halfvec type (pgvector 0.7+)"
+    )
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
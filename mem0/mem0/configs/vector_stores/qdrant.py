@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -17,6 +17,9 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    vector_datatype: Literal["float32", "float16"] = Field(
+        "float32", description="Precision vectors are stored at; float16 halves the index size"
+    )
 
     @model_validator(mode="before")
     @classmethod
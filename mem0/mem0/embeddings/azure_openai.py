@@ -1,7 +1,8 @@
 import os
 from typing import Literal, Optional
 
-from openai import AzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
@@ -17,14 +18,24 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         api_version = self.config.azure_kwargs.api_version or os.getenv("EMBEDDING_AZURE_API_VERSION")
         default_headers = self.config.azure_kwargs.default_headers
 
-        self.client = AzureOpenAI(
-            azure_deployment=azure_deployment,
-            azure_endpoint=azure_endpoint,
-            api_version=api_version,
-            api_key=api_key,
-            http_client=self.config.http_client,
-            default_headers=default_headers,
-        )
+        self._client_params = {
+            "azure_deployment": azure_deployment,
+            "azure_endpoint": azure_endpoint,
+            "api_version": api_version,
+            "api_key": api_key,
+            "default_headers": default_headers,
+        }
+        self.client = AzureOpenAI(http_client=self.config.http_client, **self._client_params)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncAzureOpenAI:
+        """AsyncAzureOpenAI client with its own connection pool, created on first use."""
+        if self._async_client is None:
+            proxies = self.config.http_client_proxies
+            http_client = httpx.AsyncClient(proxies=proxies) if proxies else None
+            self._async_client = AsyncAzureOpenAI(http_client=http_client, **self._client_params)
+        return self._async_client
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -38,3 +49,51 @@ class AzureOpenAIEmbedding(EmbeddingBase):
         """
         text = text.replace("\n", " ")
         return self.client.embeddings.create(input=[text], model=self.config.model).data[0].embedding
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts with a single Azure OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        response = self.client.embeddings.create(
+            input=[text.replace("\n", " ") for text in texts], model=self.config.model
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text with the asyncio Azure OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(input=[text], model=self.config.model)
+        return response.data[0].embedding
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts with a single request on the asyncio Azure OpenAI client.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        response = await self.async_client.embeddings.create(
+            input=[text.replace("\n", " ") for text in texts], model=self.config.model
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -0,0 +1,173 @@
+import threading
+from collections import defaultdict
+from typing import Dict, List, Literal, Optional
+
+from mem0.embeddings.base import EmbeddingBase
+
+# Largest number of texts each provider accepts in one embedding request (or, for local models, a batch size that
+# keeps a forward pass cheap). Providers without an entry use DEFAULT_MAX_BATCH_SIZE.
+PROVIDER_MAX_BATCH_SIZES = {
+    "openai": 2048,
+    "azure_openai": 2048,
+    "huggingface": 64,
+    "gemini": 100,
+    "vertexai": 250,
+}
+DEFAULT_MAX_BATCH_SIZE = 32
+
+
+class _PendingEmbedding:
+    __slots__ = ("text", "done", "taken", "embedding", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.taken = False
+        self.embedding = None
+        self.error: Optional[BaseException] = None
+
+
+class CoalescingEmbedder(EmbeddingBase):
+    """
+    Embedder wrapper that merges concurrent single-text `embed` calls into batched `embed_batch` requests.
+
+    The first caller of an empty queue leads the batch: it waits up to `max_wait_ms` for other callers to join, then
+    embeds everything queued in one request and hands every caller its vector. A queue that reaches `max_batch_size`
+    is flushed right away by the caller that filled it. Calls with different `memory_action`s are never mixed, since
+    some providers embed documents and queries differently.
+
+    Callers on any thread share the batches; coroutines join them through `aembed`, which waits in a worker thread.
+    A failed request raises its exception in every caller of the batch.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait_ms: float = 5.0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.embedder = embedder
+        self.config = embedder.config
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._lock = threading.Lock()
+        self._queues: Dict[Optional[str], List[_PendingEmbedding]] = defaultdict(list)
+        self._stats = {
+            "requests": 0,
+            "batches": 0,
+            "batched_texts": 0,
+            "largest_batch": 0,
+            "full_flushes": 0,
+            "timed_flushes": 0,
+            "errors": 0,
+        }
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the wrapper, e.g. provider-specific `model` or `client`.
+        embedder = self.__dict__.get("embedder")
+        if embedder is None:
+            raise AttributeError(name)
+        return getattr(embedder, name)
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, batched with concurrent calls.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        pending = _PendingEmbedding(text)
+        with self._lock:
+            self._stats["requests"] += 1
+            queue = self._queues[memory_action]
+            queue.append(pending)
+            leader = len(queue) == 1
+            batch = self._take(memory_action) if len(queue) >= self.max_batch_size else None
+            if batch:
+                self._stats["full_flushes"] += 1
+
+        if batch:
+            self._run(batch, memory_action)
+        elif leader and not pending.done.wait(self.max_wait):
+            with self._lock:
+                batch = None if pending.taken else self._take(memory_action)
+                if batch:
+                    self._stats["timed_flushes"] += 1
+            if batch:
+                self._run(batch, memory_action)
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.embedding
+
+    def _take(self, memory_action: Optional[str]) -> List[_PendingEmbedding]:
+        # Called with the lock held; the queue never holds more than max_batch_size texts
+        batch = self._queues.pop(memory_action, [])
+        for pending in batch:
+            pending.taken = True
+        return batch
+
+    def _run(self, batch: List[_PendingEmbedding], memory_action: Optional[str]):
+        try:
+            embeddings = self.embedder.embed_batch([pending.text for pending in batch], memory_action)
+            if len(embeddings) != len(batch):
+                raise ValueError(f"Embedder returned {len(embeddings)} embeddings for {len(batch)} texts")
+            for pending, embedding in zip(batch, embeddings):
+                pending.embedding = embedding
+        except Exception as e:
+            for pending in batch:
+                pending.error = e
+            with self._lock:
+                self._stats["errors"] += 1
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batched_texts"] += len(batch)
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+        for pending in batch:
+            pending.done.set()
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts, split into requests of at most `max_batch_size` texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        texts = list(texts)
+        embeddings = []
+        for start in range(0, len(texts), self.max_batch_size):
+            embeddings.extend(self.embedder.embed_batch(texts[start : start + self.max_batch_size], memory_action))
+        return embeddings
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts on the wrapped embedder's async client, in requests of at most
+        `max_batch_size` texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        texts = list(texts)
+        embeddings = []
+        for start in range(0, len(texts), self.max_batch_size):
+            embeddings.extend(
+                await self.embedder.aembed_batch(texts[start : start + self.max_batch_size], memory_action)
+            )
+        return embeddings
+
+    def coalescing_info(self) -> Dict:
+        """Batching statistics, including the mean number of texts per request."""
+        with self._lock:
+            info = dict(self._stats)
+        info["mean_batch_size"] = info["batched_texts"] / info["batches"] if info["batches"] else 0.0
+        info["max_batch_size"] = self.max_batch_size
+        info["max_wait_ms"] = self.max_wait * 1000.0
+        return info
@@ -0,0 +1,207 @@
+import copy
+import os
+from typing import Dict, List, Literal, Optional
+
+import numpy as np
+
+from mem0.embeddings.base import EmbeddingBase
+
+COMPACTION_METHODS = ("truncate", "pca")
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def recall_at_k(reference: np.ndarray, candidate: np.ndarray, k: int = 10) -> float:
+    """
+    Mean share of each vector's k nearest neighbours under `reference` that `candidate` also ranks in its top k.
+
+    Both arguments hold the same texts, one row each; every row is used as a query against the others by cosine
+    similarity.
+    """
+    k = min(k, len(reference) - 1)
+    if k < 1:
+        return 1.0
+
+    def neighbours(vectors):
+        vectors = _unit_rows(np.asarray(vectors, dtype=np.float32))
+        similarities = vectors @ vectors.T
+        np.fill_diagonal(similarities, -np.inf)
+        return np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+
+    expected, actual = neighbours(reference), neighbours(candidate)
+    return float(np.mean([len(np.intersect1d(e, a)) / k for e, a in zip(expected, actual)]))
+
+
+class CompactingEmbedder(EmbeddingBase):
+    """
+    Embedder wrapper that hands narrower, optionally half-precision vectors to the vector and graph stores.
+
+    With "truncate", vectors keep their first `dims` values, which preserves similarity for Matryoshka-trained models
+    such as OpenAI's text-embedding-3 family. With "pca", they are centred and projected onto `dims` principal
+    components fitted by `fit_projection`; `Memory` only accepts a projection already saved to `projection_path`, so
+    fit it on a standalone wrapper first. Either way the result is renormalized to unit length. `float16` rounds the
+    values to half precision, so stores that keep float16 hold exactly the vectors that queries are compared with.
+
+    Queries are embedded by the same wrapper, so they are compacted the same way as stored vectors.
+    `compaction_report` measures what the compaction costs in recall on a sample of texts.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingBase,
+        dims: int,
+        method: str = "truncate",
+        projection_path: Optional[str] = None,
+        float16: bool = False,
+    ):
+        if method not in COMPACTION_METHODS:
+            raise ValueError(f"Unsupported compaction method '{method}', expected one of {COMPACTION_METHODS}")
+        self.embedder = embedder
+        self.config = copy.copy(embedder.config)
+        self.config.embedding_dims = dims
+        self.dims = dims
+        self.method = method
+        self.projection_path = projection_path
+        self.float16 = float16
+
+        self._projection = None
+        if method == "pca" and projection_path and os.path.exists(projection_path):
+            with np.load(projection_path) as projection:
+                self._set_projection(projection["mean"], projection["components"])
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the wrapper, e.g. provider-specific `model` or `client`.
+        embedder = self.__dict__.get("embedder")
+        if embedder is None:
+            raise AttributeError(name)
+        return getattr(embedder, name)
+
+    def _set_projection(self, mean, components):
+        components = np.asarray(components, dtype=np.float32)
+        if components.shape[0] != self.dims:
+            raise ValueError(f"The PCA projection has {components.shape[0]} components, expected {self.dims}")
+        self._projection = (np.asarray(mean, dtype=np.float32), components)
+
+    def _embed_matrix(self, texts: List[str], memory_action=None) -> np.ndarray:
+        # Local models (HuggingFace) return their float32 matrix directly, skipping the round trip through lists
+        embed_batch_array = getattr(self.embedder, "embed_batch_array", None)
+        if embed_batch_array is not None:
+            return embed_batch_array(list(texts), memory_action)
+        return np.asarray(self.embedder.embed_batch(list(texts), memory_action), dtype=np.float32)
+
+    def compact(self, vectors) -> np.ndarray:
+        """
+        Compact full-width embeddings.
+
+        Args:
+            vectors: Embeddings from the wrapped embedder, one per row.
+        Returns:
+            np.ndarray: float32 matrix with `dims` columns and unit-length rows.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.method == "truncate":
+            if vectors.shape[1] < self.dims:
+                raise ValueError(f"Cannot truncate {vectors.shape[1]}-dimensional embeddings to {self.dims}")
+            vectors = vectors[:, : self.dims]
+        else:
+            if self._projection is None:
+                raise ValueError("PCA compaction needs a projection; call fit_projection() on a sample of texts")
+            mean, components = self._projection
+            vectors = (vectors - mean) @ components.T
+        vectors = _unit_rows(vectors)
+        if self.float16:
+            vectors = vectors.astype(np.float16).astype(np.float32)
+        return vectors
+
+    def fit_projection(self, texts: List[str]):
+        """
+        Fit the PCA projection on a sample of texts and save it to `projection_path` when one is configured.
+
+        The sample should resemble the stored memories and hold at least `dims` texts. Vectors stored with an earlier
+        projection are not comparable with the new one, so fit before storing memories or re-embed them afterwards.
+        """
+        vectors = self._embed_matrix(texts, "add")
+        if len(vectors) < self.dims:
+            raise ValueError(f"Fitting {self.dims} components needs at least {self.dims} texts, got {len(vectors)}")
+        mean = vectors.mean(axis=0)
+        _, _, components = np.linalg.svd(vectors - mean, full_matrices=False)
+        self._set_projection(mean, components[: self.dims])
+        if self.projection_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.projection_path)), exist_ok=True)
+            with open(self.projection_path, "wb") as f:
+                np.savez(f, mean=self._projection[0], components=self._projection[1])
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the compacted embedding for the given text.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        return self.compact([self.embedder.embed(text, memory_action)])[0].tolist()
+
+    def embed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the compacted embeddings for several texts.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        return self.embed_batch_array(texts, memory_action).tolist()
+
+    def embed_batch_array(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> np.ndarray:
+        """
+        Get the compacted embeddings for several texts as a float32 matrix, without converting them to Python lists.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: One row per text, in order.
+        """
+        if not texts:
+            return np.empty((0, self.dims), dtype=np.float32)
+        return self.compact(self._embed_matrix(texts, memory_action))
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Async version of `embed`, on the wrapped embedder's async client."""
+        return self.compact([await self.embedder.aembed(text, memory_action)])[0].tolist()
+
+    async def aembed_batch(self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Async version of `embed_batch`, on the wrapped embedder's async client."""
+        if not texts:
+            return []
+        return self.compact(await self.embedder.aembed_batch(texts, memory_action)).tolist()
+
+    def compaction_report(self, texts: List[str], k: int = 10) -> Dict:
+        """
+        Measure the size reduction and the recall cost of compaction on a sample of texts.
+
+        Each text is used as a query against the others; recall is the share of its k nearest neighbours under the
+        full-width embeddings that the compacted embeddings also return.
+        """
+        full = self._embed_matrix(texts, "add")
+        bytes_per_value = 2 if self.float16 else 4
+        return {
+            "method": self.method,
+            "source_dims": full.shape[1],
+            "dims": self.dims,
+            "float16": self.float16,
+            "bytes_per_vector": self.dims * bytes_per_value,
+            "compression": full.shape[1] * 4 / (self.dims * bytes_per_value),
+            "k": k,
+            "recall_at_k": recall_at_k(full, self.compact(full), k),
+        }
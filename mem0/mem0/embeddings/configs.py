@@ -1,6 +1,51 @@
-from typing import Optional
+import os
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+class EmbeddingCoalescingConfig(BaseModel):
+    max_batch_size: Optional[int] = Field(
+        description="Most texts merged into one embedding request. Defaults to the provider's limit",
+        default=None,
+    )
+    max_wait_ms: float = Field(
+        description="How long the first caller of a batch waits for concurrent calls to join it, in milliseconds",
+        default=5.0,
+    )
+
+
+class EmbeddingCompactionConfig(BaseModel):
+    method: Literal["truncate", "pca"] = Field(
+        description="'truncate' keeps the leading dimensions of Matryoshka-trained models, "
+        "'pca' projects onto principal components fitted on a sample of texts",
+        default="truncate",
+    )
+    dims: int = Field(description="Dimensions of the stored and query vectors after compaction", gt=0)
+    projection_path: Optional[str] = Field(
+        description="File the fitted PCA projection is saved to and loaded from",
+        default=None,
+    )
+    float16: bool = Field(
+        description="Round vectors to half precision, for vector stores configured to store float16",
+        default=False,
+    )
+
+    @model_validator(mode="after")
+    def require_fitted_projection(self):
+        # Memory cannot fit a projection itself, and without one every embedding call would fail
+        if self.method == "pca" and not (self.projection_path and os.path.isfile(self.projection_path)):
+            raise ValueError(
+                "PCA compaction needs a projection fitted beforehand: set projection_path to a file saved by "
+                "CompactingEmbedder.fit_projection()"
+            )
+        return self
+
+
+def compacted_dims(embedder_config) -> Optional[int]:
+    """Width of the vectors handed to the stores when `embedder_config` enables compaction, else None."""
+    compaction = getattr(embedder_config, "compaction", None)
+    return compaction.dims if isinstance(compaction, EmbeddingCompactionConfig) else None
 
 
 class EmbedderConfig(BaseModel):
@@ -9,6 +54,14 @@ class EmbedderConfig(BaseModel):
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    coalescing: Optional[EmbeddingCoalescingConfig] = Field(
+        description="Optionally merge concurrent single-text embedding calls into batched requests",
+        default=None,
+    )
+    compaction: Optional[EmbeddingCompactionConfig] = Field(
+        description="Optionally reduce the width and precision of embeddings before they are stored or searched",
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
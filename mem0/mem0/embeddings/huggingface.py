@@ -1,9 +1,12 @@
 import logging
-from typing import Literal, Optional
+import os
+from typing import List, Literal, Optional
 
+import numpy as np
 from openai import OpenAI
 from sentence_transformers import SentenceTransformer
 
+from mem0.configs.base import mem0_dir
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
 
@@ -11,8 +14,51 @@ logging.getLogger("transformers").setLevel(logging.WARNING)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 logging.getLogger("huggingface_hub").setLevel(logging.WARNING)
 
+HUGGINGFACE_BACKENDS = ("torch", "onnx")
+QUANTIZATION_TARGETS = ("arm64", "avx2", "avx512", "avx512_vnni")
+
+
+def _onnx_session_options(threads: int):
+    try:
+        import onnxruntime
+    except ImportError:
+        raise ImportError(
+            "onnxruntime is not installed. Please install it using pip install 'sentence-transformers[onnx]'"
+        )
+
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = threads
+    # Embedding graphs are sequential; parallel operator scheduling only adds contention with the intra-op threads
+    options.inter_op_num_threads = 1
+    return options
+
+
+def _export_quantized_onnx_model(model_name: str, quantization: str, **kwargs) -> str:
+    """
+    Export an int8 dynamically quantized ONNX copy of a model once, under the mem0 directory.
+
+    Returns:
+        str: The directory of the exported model; the quantized weights are in `onnx/model_qint8_<target>.onnx`.
+    """
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    export_dir = os.path.join(mem0_dir, "onnx_models", model_name.replace("/", "--"))
+    if not os.path.exists(os.path.join(export_dir, "onnx", f"model_qint8_{quantization}.onnx")):
+        model = SentenceTransformer(model_name, backend="onnx", **kwargs)
+        model.save_pretrained(export_dir)
+        export_dynamic_quantized_onnx_model(model, quantization, export_dir)
+    return export_dir
+
 
 class HuggingFaceEmbedding(EmbeddingBase):
+    """
+    Embeddings from a local SentenceTransformer model, or from a Text Embeddings Inference (TEI) server.
+
+    Local models run on PyTorch by default. The "onnx" backend runs them on ONNX Runtime, optionally with an int8
+    quantized export for the CPU's instruction set, which is usually the faster choice for CPU-only deployments.
+    Note that `huggingface_threads` with the "torch" backend sets PyTorch's process-wide thread count.
+    """
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -21,10 +67,45 @@ class HuggingFaceEmbedding(EmbeddingBase):
         else:
             self.config.model = self.config.model or "multi-qa-MiniLM-L6-cos-v1"
 
-            self.model = SentenceTransformer(self.config.model, **self.config.model_kwargs)
+            self.model = self._load_model()
 
             self.config.embedding_dims = self.config.embedding_dims or self.model.get_sentence_embedding_dimension()
 
+            if self.config.huggingface_warmup:
+                # The first forward pass allocates buffers and, for ONNX, optimizes the graph; do it before any request
+                self._encode(["warm-up"])
+
+    def _load_model(self) -> SentenceTransformer:
+        backend = self.config.huggingface_backend or "torch"
+        if backend not in HUGGINGFACE_BACKENDS:
+            raise ValueError(f"Unsupported huggingface backend '{backend}', expected one of {HUGGINGFACE_BACKENDS}")
+        quantization = self.config.huggingface_quantization
+        if quantization and (backend != "onnx" or quantization not in QUANTIZATION_TARGETS):
+            raise ValueError(f"huggingface_quantization requires the onnx backend and one of {QUANTIZATION_TARGETS}")
+        threads = self.config.huggingface_threads
+
+        if backend == "torch":
+            if threads:
+                import torch
+
+                torch.set_num_threads(threads)
+            return SentenceTransformer(self.config.model, **self.config.model_kwargs)
+
+        kwargs = dict(self.config.model_kwargs)
+        onnx_kwargs = dict(kwargs.pop("model_kwargs", None) or {})
+        if threads:
+            onnx_kwargs["session_options"] = _onnx_session_options(threads)
+        model_name = self.config.model
+        if quantization:
+            model_name = _export_quantized_onnx_model(self.config.model, quantization, **kwargs)
+            onnx_kwargs["file_name"] = f"onnx/model_qint8_{quantization}.onnx"
+        return SentenceTransformer(model_name, backend="onnx", model_kwargs=onnx_kwargs, **kwargs)
+
+    def _encode(self, texts):
+        if self.config.huggingface_batch_size:
+            return self.model.encode(texts, convert_to_numpy=True, batch_size=self.config.huggingface_batch_size)
+        return self.model.encode(texts, convert_to_numpy=True)
+
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
         Get the embedding for the given text using Hugging Face.
@@ -38,4 +119,39 @@ class HuggingFaceEmbedding(EmbeddingBase):
         if self.config.huggingface_base_url:
             return self.client.embeddings.create(input=text, model="tei").data[0].embedding
         else:
-            return self.model.encode(text, convert_to_numpy=True).tolist()
+            return self._encode(text).tolist()
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts in one request or forward pass.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        if self.config.huggingface_base_url:
+            response = self.client.embeddings.create(input=list(texts), model="tei")
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        return self._encode(list(texts)).tolist()
+
+    def embed_batch_array(
+        self, texts: List[str], memory_action: Optional[Literal["add", "search", "update"]] = None
+    ) -> np.ndarray:
+        """
+        Get the embeddings for several texts as a float32 matrix, without converting them to Python lists.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            np.ndarray: One row per text, in order.
+        """
+        if not texts:
+            return np.empty((0, self.config.embedding_dims or 0), dtype=np.float32)
+        if self.config.huggingface_base_url:
+            return np.asarray(self.embed_batch(texts, memory_action), dtype=np.float32)
+        return np.asarray(self._encode(list(texts)), dtype=np.float32)
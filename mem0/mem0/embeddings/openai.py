@@ -2,7 +2,7 @@ import os
 import warnings
 from typing import Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
@@ -29,7 +29,23 @@ class OpenAIEmbedding(EmbeddingBase):
                 DeprecationWarning,
             )
 
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._client_params = {"api_key": api_key, "base_url": base_url}
+        self.client = OpenAI(**self._client_params)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client with its own connection pool, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_params)
+        return self._async_client
+
+    def _request_params(self, texts):
+        return {
+            "input": [text.replace("\n", " ") for text in texts],
+            "model": self.config.model,
+            "dimensions": self.config.embedding_dims,
+        }
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -41,9 +57,47 @@ class OpenAIEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
-        text = text.replace("\n", " ")
-        return (
-            self.client.embeddings.create(input=[text], model=self.config.model, dimensions=self.config.embedding_dims)
-            .data[0]
-            .embedding
-        )
+        return self.client.embeddings.create(**self._request_params([text])).data[0].embedding
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts with a single OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        response = self.client.embeddings.create(**self._request_params(texts))
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text with the asyncio OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        response = await self.async_client.embeddings.create(**self._request_params([text]))
+        return response.data[0].embedding
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts with a single request on the asyncio OpenAI client.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: One embedding vector per text, in order.
+        """
+        if not texts:
+            return []
+        response = await self.async_client.embeddings.create(**self._request_params(texts))
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
@@ -0,0 +1,147 @@
+import math
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from mem0.graphs.resolution import tokenize
+
+Triple = Tuple[str, str, str]
+
+
+def analyze(text: str) -> List[str]:
+    """Tokenize `text` for BM25, folding simple plurals and verb forms ("lives" -> "live")."""
+    tokens = []
+    for token in tokenize(text):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class _ScopeIndex:
+    def __init__(self):
+        self.docs: Dict[Triple, Counter] = {}
+        self.lengths: Dict[Triple, int] = {}
+        self.df: Counter = Counter()
+        self.total_length = 0
+
+    def add(self, triple: Triple):
+        if triple in self.docs:
+            return
+        terms = Counter(analyze(" ".join(triple)))
+        self.docs[triple] = terms
+        self.lengths[triple] = sum(terms.values())
+        self.total_length += self.lengths[triple]
+        self.df.update(terms.keys())
+
+    def remove(self, triple: Triple):
+        terms = self.docs.pop(triple, None)
+        if terms is None:
+            return
+        self.total_length -= self.lengths.pop(triple)
+        self.df.subtract(terms.keys())
+        for term in terms:
+            if self.df[term] <= 0:
+                del self.df[term]
+
+
+class IncrementalBM25Index:
+    """
+    Per-(user_id, agent_id) BM25 statistics over the (source, relationship, destination) triples of the graph.
+
+    Term frequencies and document frequencies are maintained as relations are written and deleted, so reranking
+    search results is a sparse dot product against corpus-level IDF rather than a fresh index per request. Scopes are
+    evicted least-recently-used beyond `max_scopes`.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, max_scopes: int = 1000):
+        self.k1 = k1
+        self.b = b
+        self.max_scopes = max_scopes
+        self._scopes: "OrderedDict[Tuple, _ScopeIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_loaded(self, key: Tuple) -> bool:
+        with self._lock:
+            return key in self._scopes
+
+    def load(self, key: Tuple, triples: Iterable[Triple]):
+        """Replace the indexed triples of a scope."""
+        index = _ScopeIndex()
+        for triple in triples:
+            index.add(tuple(triple))
+        with self._lock:
+            self._scopes[key] = index
+            self._scopes.move_to_end(key)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def add(self, key: Tuple, triples: Iterable[Triple]):
+        """Index newly written triples in the scope and, for agent scopes, in the user-wide scope."""
+        triples = [tuple(triple) for triple in triples]
+        with self._lock:
+            for scope in {key, (key[0], None)}:
+                index = self._scopes.get(scope)
+                if index is not None:
+                    for triple in triples:
+                        index.add(triple)
+
+    def remove(self, key: Tuple, triples: Iterable[Triple]):
+        """Drop deleted triples from every scope that may have contained them."""
+        triples = [tuple(triple) for triple in triples]
+        with self._lock:
+            if key[1] is not None:
+                # Another agent may still hold the same triple, so the user-wide statistics must be reloaded.
+                self._scopes.pop((key[0], None), None)
+                scopes = [key]
+            else:
+                scopes = [k for k in self._scopes if k[0] == key[0]]
+            for scope in scopes:
+                index = self._scopes.get(scope)
+                if index is not None:
+                    for triple in triples:
+                        index.remove(triple)
+
+    def invalidate(self, key: Optional[Tuple] = None):
+        """Forget one scope (all agents of a user when agent_id is None), or every scope when `key` is None."""
+        with self._lock:
+            if key is None:
+                self._scopes.clear()
+            else:
+                for cached_key in [k for k in self._scopes if k[0] == key[0] and (key[1] is None or k == key)]:
+                    del self._scopes[cached_key]
+
+    def score(self, key: Tuple, query: str, triples: Sequence[Triple]) -> List[float]:
+        """BM25 score of each triple for `query`, using the scope's corpus statistics."""
+        query_terms = set(analyze(query))
+        with self._lock:
+            index = self._scopes.get(key)
+            if index is None:
+                index = _ScopeIndex()
+            else:
+                self._scopes.move_to_end(key)
+            n_docs = max(len(index.docs), 1)
+            avg_length = index.total_length / len(index.docs) if index.docs else 1.0
+            idf = {
+                term: math.log(1 + (n_docs - index.df.get(term, 0) + 0.5) / (index.df.get(term, 0) + 0.5))
+                for term in query_terms
+            }
+            scores = []
+            for triple in triples:
+                triple = tuple(triple)
+                terms = index.docs.get(triple) or Counter(analyze(" ".join(triple)))
+                length = sum(terms.values())
+                norm = self.k1 * (1 - self.b + self.b * length / avg_length)
+                scores.append(
+                    sum(
+                        idf[term] * terms[term] * (self.k1 + 1) / (terms[term] + norm)
+                        for term in query_terms & terms.keys()
+                    )
+                )
+        return scores
+
+    def top_n(self, key: Tuple, query: str, triples: Sequence[Triple], n: int = 5) -> List[Triple]:
+        """Return the `n` best scoring triples; ties keep their input order."""
+        scores = self.score(key, query, triples)
+        order = sorted(range(len(triples)), key=lambda i: -scores[i])
+        return [tuple(triples[i]) for i in order[:n]]
@@ -1,6 +1,6 @@
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from mem0.llms.configs import LlmConfig
 
@@ -11,6 +11,24 @@ class Neo4jConfig(BaseModel):
     password: Optional[str] = Field(None, description="Password for the graph database")
     database: Optional[str] = Field(None, description="Database for the graph database")
     base_label: Optional[bool] = Field(None, description="Whether to use base node label __Entity__ for all entities")
+    vector_index: Optional[bool] = Field(
+        True, description="Whether to use a native vector index on __Entity__.embedding (requires base_label)"
+    )
+    vector_index_candidates: Optional[int] = Field(
+        100, description="Number of nearest nodes fetched from the vector index before user/agent filtering"
+    )
+    search_depth: Optional[int] = Field(
+        1, description="Number of hops expanded around the matched entities when searching the graph"
+    )
+    search_hop_limit: Optional[int] = Field(
+        None, description="Maximum number of relations kept per hop when searching the graph (defaults to the limit)"
+    )
+    max_connection_pool_size: Optional[int] = Field(
+        None, description="Maximum number of pooled connections (sessions) per driver (driver default when None)"
+    )
+    connection_acquisition_timeout: Optional[float] = Field(
+        None, description="Seconds to wait for a pooled connection before failing (driver default when None)"
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -28,6 +46,13 @@ class MemgraphConfig(BaseModel):
     url: Optional[str] = Field(None, description="Host address for the graph database")
     username: Optional[str] = Field(None, description="Username for the graph database")
     password: Optional[str] = Field(None, description="Password for the graph database")
+    vector_index_capacity: Optional[int] = Field(
+        None,
+        description="Minimum capacity of the entity vector index; it is sized to the existing nodes and grown as needed",
+    )
+    vector_index_candidates: Optional[int] = Field(
+        100, description="Number of nearest nodes fetched from the vector index before user/agent filtering"
+    )
 
     @model_validator(mode="before")
     def check_host_port_or_path(cls, values):
@@ -70,18 +95,40 @@ class NeptuneConfig(BaseModel):
             )
 
 
+class LocalGraphConfig(BaseModel):
+    path: Optional[str] = Field(
+        None, description="SQLite file the graph is persisted to (kept in memory only when None)"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class GraphStoreConfig(BaseModel):
     provider: str = Field(
-        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune')",
+        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune', 'local')",
         default="neo4j",
     )
-    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig] = Field(
+    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig, LocalGraphConfig] = Field(
         description="Configuration for the specific data store", default=None
     )
     llm: Optional[LlmConfig] = Field(description="LLM configuration for querying the graph store", default=None)
     custom_prompt: Optional[str] = Field(
         description="Custom prompt to fetch entities from the given text", default=None
     )
+    extraction_mode: Literal["multi_call", "single_call"] = Field(
+        description="'multi_call' extracts entities and relations with separate LLM calls, "
+        "'single_call' extracts both with one structured tool call",
+        default="multi_call",
+    )
+    search_entity_resolver: Literal["llm", "lexical"] = Field(
+        description="'llm' extracts query entities with an LLM call, "
+        "'lexical' matches the query against the names of the user's existing nodes",
+        default="llm",
+    )
+    rerank_top_n: int = Field(
+        description="Number of relations returned by graph search after BM25 reranking",
+        default=5,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -92,5 +139,14 @@ class GraphStoreConfig(BaseModel):
             return MemgraphConfig(**v.model_dump())
         elif provider == "neptune":
             return NeptuneConfig(**v.model_dump())
+        elif provider == "local":
+            return LocalGraphConfig(**v.model_dump())
         else:
             raise ValueError(f"Unsupported graph store provider: {provider}")
+
+    @model_validator(mode="after")
+    def default_local_config(self):
+        # The embedded store needs no connection settings, so enable it without an explicit config.
+        if self.provider == "local" and self.config is None:
+            self.config = LocalGraphConfig()
+        return self
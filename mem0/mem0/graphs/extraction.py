@@ -0,0 +1,222 @@
+import logging
+
+from mem0.graphs.tools import (
+    DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+    DELETE_MEMORY_TOOL_GRAPH,
+    EXTRACT_ENTITIES_STRUCT_TOOL,
+    EXTRACT_ENTITIES_TOOL,
+    EXTRACT_GRAPH_STRUCT_TOOL,
+    EXTRACT_GRAPH_TOOL,
+    RELATIONS_STRUCT_TOOL,
+    RELATIONS_TOOL,
+)
+from mem0.graphs.utils import EXTRACT_GRAPH_PROMPT, EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.memory.utils import agenerate_response, format_entities
+
+logger = logging.getLogger(__name__)
+
+
+class GraphExtractionMixin:
+    """
+    LLM steps shared by graph stores: entity and relation extraction, and the choice of relations to delete.
+
+    Each step builds its request and parses the response in separate helpers, so that the sync step and its
+    `_a`-prefixed async variant send the same prompt; the async variants use the LLM's native async client when it
+    has one. Expects `self.config`, `self.llm` and `self.llm_provider` to be
+    set by the store.
+    """
+
+    def _retrieve_nodes_from_data(self, data, filters):
+        """Extracts all the entities mentioned in the query."""
+        search_results = self.llm.generate_response(**self._retrieve_nodes_request(data, filters))
+        return self._parse_retrieved_nodes(search_results)
+
+    async def _aretrieve_nodes_from_data(self, data, filters):
+        """Async version of `_retrieve_nodes_from_data`."""
+        search_results = await agenerate_response(self.llm, **self._retrieve_nodes_request(data, filters))
+        return self._parse_retrieved_nodes(search_results)
+
+    def _retrieve_nodes_request(self, data, filters):
+        _tools = [EXTRACT_ENTITIES_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_ENTITIES_STRUCT_TOOL]
+        return dict(
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"You are a smart assistant who understands entities and their types in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source entity. Extract all the entities from the text. ***DO NOT*** answer the question itself if the given text is a question.",
+                },
+                {"role": "user", "content": data},
+            ],
+            tools=_tools,
+        )
+
+    def _parse_retrieved_nodes(self, search_results):
+        entity_type_map = {}
+
+        try:
+            for tool_call in search_results["tool_calls"]:
+                if tool_call["name"] != "extract_entities":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+        except Exception as e:
+            logger.exception(
+                f"Error in search tool: {e}, llm_provider={self.llm_provider}, search_results={search_results}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
+        return entity_type_map
+
+    def _extract_graph_from_data(self, data, filters):
+        """Extract entities, their types and the relations among them with a single LLM call."""
+        extracted = self.llm.generate_response(**self._extract_graph_request(data, filters))
+        return self._parse_extracted_graph(extracted)
+
+    async def _aextract_graph_from_data(self, data, filters):
+        """Async version of `_extract_graph_from_data`."""
+        extracted = await agenerate_response(self.llm, **self._extract_graph_request(data, filters))
+        return self._parse_extracted_graph(extracted)
+
+    def _extract_graph_request(self, data, filters):
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+
+        custom_prompt = self.config.graph_store.custom_prompt
+        system_content = EXTRACT_GRAPH_PROMPT.replace("USER_ID", user_identity).replace(
+            "CUSTOM_PROMPT", f"5. {custom_prompt}" if custom_prompt else ""
+        )
+
+        _tools = [EXTRACT_GRAPH_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_GRAPH_STRUCT_TOOL]
+
+        return dict(
+            messages=[
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": data},
+            ],
+            tools=_tools,
+        )
+
+    def _parse_extracted_graph(self, extracted):
+        entity_type_map = {}
+        relations = []
+        try:
+            for tool_call in extracted.get("tool_calls", []):
+                if tool_call["name"] != "extract_graph":
+                    continue
+                arguments = tool_call.get("arguments", {})
+                for item in arguments.get("entities", []):
+                    entity_type_map[item["entity"]] = item["entity_type"]
+                relations.extend(arguments.get("relations", []))
+        except Exception as e:
+            logger.exception(f"Error in graph extraction: {e}, llm_provider={self.llm_provider}, extracted={extracted}")
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        relations = self._remove_spaces_from_entities(relations)
+        logger.debug(f"Entity type map: {entity_type_map}\n Extracted relations: {relations}")
+        return entity_type_map, relations
+
+    def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
+        """Establish relations among the extracted nodes."""
+        extracted_entities = self.llm.generate_response(**self._relations_request(data, filters, entity_type_map))
+        return self._parse_relations(extracted_entities)
+
+    async def _aestablish_nodes_relations_from_data(self, data, filters, entity_type_map):
+        """Async version of `_establish_nodes_relations_from_data`."""
+        extracted_entities = await agenerate_response(
+            self.llm, **self._relations_request(data, filters, entity_type_map)
+        )
+        return self._parse_relations(extracted_entities)
+
+    def _relations_request(self, data, filters, entity_type_map):
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+
+        if self.config.graph_store.custom_prompt:
+            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
+            # Add the custom prompt line if configured
+            system_content = system_content.replace("CUSTOM_PROMPT", f"4. {self.config.graph_store.custom_prompt}")
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": data},
+            ]
+        else:
+            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": f"List of entities: {list(entity_type_map.keys())}. \n\nText: {data}"},
+            ]
+
+        _tools = [RELATIONS_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [RELATIONS_STRUCT_TOOL]
+
+        return dict(messages=messages, tools=_tools)
+
+    def _parse_relations(self, extracted_entities):
+        entities = []
+        if extracted_entities.get("tool_calls"):
+            entities = extracted_entities["tool_calls"][0].get("arguments", {}).get("entities", [])
+
+        entities = self._remove_spaces_from_entities(entities)
+        logger.debug(f"Extracted entities: {entities}")
+        return entities
+
+    def _get_delete_entities_from_search_output(self, search_output, data, filters):
+        """Get the entities to be deleted from the search output."""
+        memory_updates = self.llm.generate_response(**self._delete_entities_request(search_output, data, filters))
+        return self._parse_delete_entities(memory_updates)
+
+    async def _aget_delete_entities_from_search_output(self, search_output, data, filters):
+        """Async version of `_get_delete_entities_from_search_output`."""
+        memory_updates = await agenerate_response(
+            self.llm, **self._delete_entities_request(search_output, data, filters)
+        )
+        return self._parse_delete_entities(memory_updates)
+
+    def _delete_entities_request(self, search_output, data, filters):
+        search_output_string = format_entities(search_output)
+
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+
+        system_prompt, user_prompt = get_delete_messages(search_output_string, data, user_identity)
+
+        _tools = [DELETE_MEMORY_TOOL_GRAPH]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [
+                DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+            ]
+
+        return dict(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+    def _parse_delete_entities(self, memory_updates):
+        to_be_deleted = []
+        for item in memory_updates.get("tool_calls", []):
+            if item.get("name") == "delete_graph_memory":
+                to_be_deleted.append(item.get("arguments"))
+        # Clean entities formatting
+        to_be_deleted = self._remove_spaces_from_entities(to_be_deleted)
+        logger.debug(f"Deleted relationships: {to_be_deleted}")
+        return to_be_deleted
+
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
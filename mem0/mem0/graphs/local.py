@@ -0,0 +1,473 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mem0.graphs.bm25 import IncrementalBM25Index
+from mem0.graphs.extraction import GraphExtractionMixin
+from mem0.graphs.pagination import GraphPaginationMixin, build_page, build_summary
+from mem0.graphs.resolution import LexicalEntityResolver, scope_key
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+logger = logging.getLogger(__name__)
+
+
+class _EmbeddingMatrix:
+    """Unit-normalized embeddings of one user's nodes, with their ids and agent ids."""
+
+    def __init__(self, rows):
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.agent_ids = [row[1] for row in rows]
+        if rows:
+            matrix = np.stack([np.frombuffer(row[2], dtype=np.float32) for row in rows])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self.matrix = matrix / np.where(norms == 0, 1, norms)
+        else:
+            self.matrix = np.zeros((0, 0), dtype=np.float32)
+
+    def similarities(self, queries: np.ndarray, agent_id: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Cosine similarity of each query to every node, restricted to `agent_id` when given."""
+        ids, matrix = self.ids, self.matrix
+        if agent_id is not None:
+            mask = np.array([a == agent_id for a in self.agent_ids], dtype=bool)
+            ids, matrix = ids[mask], matrix[mask]
+        if not len(ids):
+            return ids, np.zeros((len(queries), 0), dtype=np.float32)
+        return ids, queries @ matrix.T
+
+
+class MemoryGraph(GraphExtractionMixin, GraphPaginationMixin):
+    """
+    Embedded graph store for single-node deployments and tests.
+
+    Nodes and edges live in SQLite tables indexed on both edge endpoints; node embeddings are kept in a NumPy
+    matrix per user so similarity lookups are a single matrix product. The database is in memory unless `path` is
+    configured, in which case the graph persists across restarts.
+    """
+
+    def __init__(self, config, embedding_model=None, llm=None):
+        self.config = config
+        self.path = getattr(self.config.graph_store.config, "path", None) or ":memory:"
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._create_tables()
+        self._matrices: Dict[str, _EmbeddingMatrix] = {}
+
+        self.embedding_model = embedding_model or EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+        )
+
+        self.llm_provider = "openai_structured"
+        if self.config.llm.provider:
+            self.llm_provider = self.config.llm.provider
+        if self.config.graph_store.llm:
+            self.llm_provider = self.config.graph_store.llm.provider
+
+        self.llm = llm or LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.user_id = None
+        self.threshold = 0.7
+
+        self.extraction_mode = getattr(self.config.graph_store, "extraction_mode", "multi_call")
+        self.search_entity_resolver = getattr(self.config.graph_store, "search_entity_resolver", "llm")
+        self.rerank_top_n = getattr(self.config.graph_store, "rerank_top_n", 5)
+        self.lexical_resolver = LexicalEntityResolver()
+        self.bm25_index = IncrementalBM25Index()
+
+    def _create_tables(self):
+        with self._lock, self.connection:
+            self.connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS nodes (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    label TEXT,
+                    user_id TEXT NOT NULL,
+                    agent_id TEXT,
+                    embedding BLOB,
+                    mentions INTEGER DEFAULT 1,
+                    created REAL
+                );
+                CREATE INDEX IF NOT EXISTS nodes_user_name ON nodes (user_id, name);
+                CREATE TABLE IF NOT EXISTS edges (
+                    id INTEGER PRIMARY KEY,
+                    source_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+                    destination_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+                    relationship TEXT NOT NULL,
+                    mentions INTEGER DEFAULT 1,
+                    created REAL,
+                    UNIQUE (source_id, relationship, destination_id)
+                );
+                CREATE INDEX IF NOT EXISTS edges_source ON edges (source_id);
+                CREATE INDEX IF NOT EXISTS edges_destination ON edges (destination_id);
+                """
+            )
+
+    def add(self, data, filters):
+        """
+        Adds data to the graph.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        if self.extraction_mode == "single_call":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+
+        deleted_entities = self._delete_entities(to_be_deleted, filters)
+        added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
+    def search(self, query, filters, limit=100):
+        """
+        Search for memories and related graph data.
+
+        Args:
+            query (str): Query to search for.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+
+        Returns:
+            list: The best matching relations, as dictionaries with "source", "relationship" and "destination".
+        """
+        if self.search_entity_resolver == "lexical":
+            key = scope_key(filters)
+            if not self.lexical_resolver.is_loaded(key):
+                where, params = self._scope_clause(filters, "n")
+                with self._lock:
+                    rows = self.connection.execute(f"SELECT DISTINCT n.name FROM nodes n WHERE {where}", params)
+                    self.lexical_resolver.load(key, [row[0] for row in rows.fetchall()])
+            node_list = self.lexical_resolver.resolve(key, query)
+        else:
+            node_list = list(self._retrieve_nodes_from_data(query, filters).keys())
+        search_output = self._search_graph_db(node_list=node_list, filters=filters)
+
+        if not search_output:
+            return []
+
+        key = scope_key(filters)
+        if not self.bm25_index.is_loaded(key):
+            self.bm25_index.load(
+                key, [(r["source"], r["relationship"], r["target"]) for r in self.get_all(filters, limit=None)]
+            )
+        triples = [(item["source"], item["relationship"], item["destination"]) for item in search_output]
+        reranked_results = self.bm25_index.top_n(key, query, triples, n=self.rerank_top_n)
+
+        search_results = [
+            {"source": source, "relationship": relationship, "destination": destination}
+            for source, relationship, destination in reranked_results
+        ]
+        logger.info(f"Returned {len(search_results)} search results")
+        return search_results
+
+    def delete_all(self, filters):
+        where, params = self._scope_clause(filters, "nodes")
+        with self._lock, self.connection:
+            self.connection.execute(
+                f"""
+                DELETE FROM edges WHERE source_id IN (SELECT id FROM nodes WHERE {where})
+                OR destination_id IN (SELECT id FROM nodes WHERE {where})
+                """,
+                params + params,
+            )
+            self.connection.execute(f"DELETE FROM nodes WHERE {where}", params)
+            self._matrices.pop(filters["user_id"], None)
+        self.lexical_resolver.invalidate(scope_key(filters))
+        self.bm25_index.invalidate((filters["user_id"], None))
+
+    def get_all(self, filters, limit=100):
+        """
+        Retrieves all relationships of the user from the graph.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100; None for all.
+        Returns:
+            list: Dictionaries with "source", "relationship" and "target".
+        """
+        source_where, params = self._scope_clause(filters, "s")
+        destination_where, destination_params = self._scope_clause(filters, "d")
+        with self._lock:
+            rows = self.connection.execute(
+                f"""
+                SELECT s.name, e.relationship, d.name
+                FROM edges e
+                JOIN nodes s ON s.id = e.source_id
+                JOIN nodes d ON d.id = e.destination_id
+                WHERE {source_where} AND {destination_where}
+                ORDER BY e.id
+                LIMIT ?
+                """,
+                params + destination_params + [-1 if limit is None else limit],
+            ).fetchall()
+        results = [{"source": row[0], "relationship": row[1], "target": row[2]} for row in rows]
+        logger.info(f"Retrieved {len(results)} relationships")
+        return results
+
+    def get_page(self, filters, page_size=100, page_token=None, relationship=None, entity=None):
+        """
+        Retrieves one page of relations, ordered by relationship id, for streaming a whole graph.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            page_size (int): The maximum number of relations in the page. Defaults to 100.
+            page_token (str, optional): The "next_page_token" of the previous page.
+            relationship (str, optional): Only return relations of this type.
+            entity (str, optional): Only return relations whose source or target is this entity.
+        Returns:
+            dict: "results", the relations as in `get_all`, and "next_page_token", None on the last page.
+        """
+        source_where, params = self._scope_clause(filters, "s")
+        destination_where, destination_params = self._scope_clause(filters, "d")
+        conditions = [source_where, destination_where]
+        params = params + destination_params
+        if page_token is not None:
+            conditions.append("e.id > ?")
+            params.append(int(page_token))
+        if relationship:
+            conditions.append("e.relationship = ?")
+            params.append(relationship.lower().replace(" ", "_"))
+        if entity:
+            conditions.append("(s.name = ? OR d.name = ?)")
+            params += [entity.lower().replace(" ", "_")] * 2
+        with self._lock:
+            rows = self.connection.execute(
+                f"""
+                SELECT s.name, e.relationship, d.name, e.id
+                FROM edges e
+                JOIN nodes s ON s.id = e.source_id
+                JOIN nodes d ON d.id = e.destination_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY e.id
+                LIMIT ?
+                """,
+                params + [page_size + 1],
+            ).fetchall()
+        return build_page(
+            [{"source": row[0], "relationship": row[1], "target": row[2], "cursor": row[3]} for row in rows], page_size
+        )
+
+    def summarize(self, filters, top_k=10):
+        """
+        Summarizes the user's graph without transferring it.
+
+        Returns:
+            dict: "relationships", the number of relations per type, and "top_entities", the `top_k` most
+                mentioned entities.
+        """
+        source_where, params = self._scope_clause(filters, "s")
+        destination_where, destination_params = self._scope_clause(filters, "d")
+        node_where, node_params = self._scope_clause(filters, "n")
+        with self._lock:
+            relationship_rows = self.connection.execute(
+                f"""
+                SELECT e.relationship, COUNT(*) AS count
+                FROM edges e
+                JOIN nodes s ON s.id = e.source_id
+                JOIN nodes d ON d.id = e.destination_id
+                WHERE {source_where} AND {destination_where}
+                GROUP BY e.relationship
+                ORDER BY count DESC, e.relationship
+                """,
+                params + destination_params,
+            ).fetchall()
+            entity_rows = self.connection.execute(
+                f"SELECT n.name, n.mentions FROM nodes n WHERE {node_where} ORDER BY n.mentions DESC, n.name LIMIT ?",
+                node_params + [top_k],
+            ).fetchall()
+        return build_summary(
+            [{"relationship": row[0], "count": row[1]} for row in relationship_rows],
+            [{"name": row[0], "mentions": row[1]} for row in entity_rows],
+        )
+
+    def reset(self):
+        """Reset the graph by clearing all nodes and relationships."""
+        logger.warning("Clearing graph...")
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM edges")
+            self.connection.execute("DELETE FROM nodes")
+            self._matrices.clear()
+        self.lexical_resolver.invalidate()
+        self.bm25_index.invalidate()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    @staticmethod
+    def _scope_clause(filters, alias):
+        where = f"{alias}.user_id = ?"
+        params = [filters["user_id"]]
+        if filters.get("agent_id"):
+            where += f" AND {alias}.agent_id = ?"
+            params.append(filters["agent_id"])
+        return where, params
+
+    def _matrix(self, user_id) -> _EmbeddingMatrix:
+        """The user's embedding matrix, rebuilt from SQLite after nodes were added or deleted."""
+        with self._lock:
+            matrix = self._matrices.get(user_id)
+            if matrix is None:
+                rows = self.connection.execute(
+                    "SELECT id, agent_id, embedding FROM nodes WHERE user_id = ? AND embedding IS NOT NULL",
+                    (user_id,),
+                ).fetchall()
+                matrix = self._matrices[user_id] = _EmbeddingMatrix(rows)
+            return matrix
+
+    def _embed(self, names: List[str]) -> np.ndarray:
+        embeddings = np.asarray(self.embedding_model.embed_batch(names), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1, norms)
+
+    def _search_graph_db(self, node_list, filters, limit=100):
+        """Search the relations around the nodes similar to any of `node_list`."""
+        if not node_list:
+            return []
+
+        ids, similarities = self._matrix(filters["user_id"]).similarities(
+            self._embed(list(node_list)), filters.get("agent_id")
+        )
+        if not ids.size:
+            return []
+        best = similarities.max(axis=0)
+        seeds = {
+            int(node_id): float(similarity) for node_id, similarity in zip(ids, best) if similarity >= self.threshold
+        }
+        if not seeds:
+            return []
+
+        placeholders = ", ".join("?" * len(seeds))
+        source_where, params = self._scope_clause(filters, "s")
+        destination_where, destination_params = self._scope_clause(filters, "d")
+        with self._lock:
+            rows = self.connection.execute(
+                f"""
+                SELECT s.name, s.id, e.relationship, e.id, d.name, d.id
+                FROM edges e
+                JOIN nodes s ON s.id = e.source_id
+                JOIN nodes d ON d.id = e.destination_id
+                WHERE (e.source_id IN ({placeholders}) OR e.destination_id IN ({placeholders}))
+                AND {source_where} AND {destination_where}
+                """,
+                list(seeds) + list(seeds) + params + destination_params,
+            ).fetchall()
+
+        results = [
+            {
+                "source": row[0],
+                "source_id": row[1],
+                "relationship": row[2],
+                "relation_id": row[3],
+                "destination": row[4],
+                "destination_id": row[5],
+                "similarity": round(max(seeds.get(row[1], -1.0), seeds.get(row[5], -1.0)), 4),
+            }
+            for row in rows
+        ]
+        results.sort(key=lambda result: -result["similarity"])
+        return results[:limit]
+
+    def _delete_entities(self, to_be_deleted, filters):
+        """Delete the given relationships between the user's nodes."""
+        source_where, params = self._scope_clause(filters, "s")
+        destination_where, destination_params = self._scope_clause(filters, "d")
+        results = []
+        with self._lock, self.connection:
+            for item in to_be_deleted:
+                rows = self.connection.execute(
+                    f"""
+                    SELECT e.id, s.name, d.name, e.relationship
+                    FROM edges e
+                    JOIN nodes s ON s.id = e.source_id
+                    JOIN nodes d ON d.id = e.destination_id
+                    WHERE s.name = ? AND d.name = ? AND e.relationship = ?
+                    AND {source_where} AND {destination_where}
+                    """,
+                    [item["source"], item["destination"], item["relationship"]] + params + destination_params,
+                ).fetchall()
+                self.connection.executemany("DELETE FROM edges WHERE id = ?", [(row[0],) for row in rows])
+                results.append([{"source": row[1], "target": row[2], "relationship": row[3]} for row in rows])
+        self.bm25_index.remove(
+            scope_key(filters),
+            [(record["source"], record["relationship"], record["target"]) for records in results for record in records],
+        )
+        return results
+
+    def _add_entities(self, to_be_added, filters, entity_type_map):
+        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        user_id = filters["user_id"]
+        agent_id = filters.get("agent_id", None)
+
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        if not names:
+            return []
+        embeddings = dict(zip(names, self._embed(names)))
+
+        # Resolve every name to the most similar existing node of the user, as the Neo4j store does.
+        ids, similarities = self._matrix(user_id).similarities(np.stack(list(embeddings.values())), agent_id)
+        resolved = {}
+        if ids.size:
+            best = similarities.argmax(axis=1)
+            for row, name in enumerate(names):
+                if similarities[row, best[row]] >= 0.9:
+                    resolved[name] = int(ids[best[row]])
+
+        results = []
+        now = time.time()
+        with self._lock, self.connection:
+            for item in to_be_added:
+                node_ids = []
+                for name in (item["source"], item["destination"]):
+                    node_id = resolved.get(name)
+                    if node_id is None:
+                        node_id = resolved[name] = self._merge_node(
+                            name, entity_type_map.get(name, "__User__"), user_id, agent_id, embeddings[name], now
+                        )
+                    else:
+                        self.connection.execute("UPDATE nodes SET mentions = mentions + 1 WHERE id = ?", (node_id,))
+                    node_ids.append(node_id)
+                self.connection.execute(
+                    """
+                    INSERT INTO edges (source_id, destination_id, relationship, created) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (source_id, relationship, destination_id) DO UPDATE SET mentions = mentions + 1
+                    """,
+                    (node_ids[0], node_ids[1], item["relationship"], now),
+                )
+                source_name, destination_name = (
+                    self.connection.execute("SELECT name FROM nodes WHERE id = ?", (node_id,)).fetchone()[0]
+                    for node_id in node_ids
+                )
+                results.append(
+                    [{"source": source_name, "relationship": item["relationship"], "target": destination_name}]
+                )
+
+        key = scope_key(filters)
+        self.lexical_resolver.add(key, names)
+        self.bm25_index.add(
+            key,
+            [(record["source"], record["relationship"], record["target"]) for records in results for record in records],
+        )
+        return results
+
+    def _merge_node(self, name, label, user_id, agent_id, embedding, now):
+        """Return the id of the node named `name` in the scope, creating it if needed."""
+        where, params = self._scope_clause({"user_id": user_id, "agent_id": agent_id}, "nodes")
+        row = self.connection.execute(f"SELECT id FROM nodes WHERE name = ? AND {where}", [name] + params).fetchone()
+        if row:
+            self.connection.execute("UPDATE nodes SET mentions = mentions + 1 WHERE id = ?", (row[0],))
+            return row[0]
+        cursor = self.connection.execute(
+            "INSERT INTO nodes (name, label, user_id, agent_id, embedding, created) VALUES (?, ?, ?, ?, ?, ?)",
+            (name, label, user_id, agent_id, np.asarray(embedding, dtype=np.float32).tobytes(), now),
+        )
+        self._matrices.pop(user_id, None)
+        return cursor.lastrowid
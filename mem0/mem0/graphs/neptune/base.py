@@ -8,6 +8,7 @@ try:
 except ImportError:
     raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
 
+from mem0.graphs.pagination import GraphPaginationMixin, build_page, build_summary
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -22,7 +23,7 @@ from mem0.utils.factory import EmbedderFactory, LlmFactory
 logger = logging.getLogger(__name__)
 
 
-class NeptuneBase(ABC):
+class NeptuneBase(GraphPaginationMixin, ABC):
     """
     Abstract base class for neptune (neptune analytics and neptune db) calls using OpenCypher
     to store/retrieve data
@@ -371,6 +372,50 @@ class NeptuneBase(ABC):
         """
         pass
 
+    def get_page(self, filters, page_size=100, page_token=None, relationship=None, entity=None):
+        """
+        Retrieves one page of relations, in a stable order, for streaming a whole graph.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            page_size (int): The maximum number of relations in the page. Defaults to 100.
+            page_token (str, optional): The "next_page_token" of the previous page.
+            relationship (str, optional): Only return relations of this type.
+            entity (str, optional): Only return relations whose source or target is this entity.
+        Returns:
+            dict: "results", the relations as in `get_all`, and "next_page_token", None on the last page.
+        """
+        query, params = self._get_page_cypher(filters, page_size, page_token, relationship, entity)
+        return build_page(self.graph.query(query, params=params), page_size)
+
+    @abstractmethod
+    def _get_page_cypher(self, filters, page_size, page_token, relationship, entity):
+        """
+        Returns the OpenCypher query and parameters to get a page of edges, with their sort key as "cursor"
+        """
+        pass
+
+    def summarize(self, filters, top_k=10):
+        """
+        Summarizes the user's graph without transferring it.
+
+        Returns:
+            dict: "relationships", the number of relations per type, and "top_entities", the `top_k` most
+                mentioned entities.
+        """
+        relationship_query, entity_query = self._summary_cypher(filters, top_k)
+        return build_summary(
+            self.graph.query(relationship_query[0], params=relationship_query[1]),
+            self.graph.query(entity_query[0], params=entity_query[1]),
+        )
+
+    @abstractmethod
+    def _summary_cypher(self, filters, top_k):
+        """
+        Returns the OpenCypher (query, parameters) pairs counting edges per type and ranking nodes by mentions
+        """
+        pass
+
     def _search_graph_db(self, node_list, filters, limit=100):
         """
         Search similar nodes among and their respective incoming and outgoing relations.
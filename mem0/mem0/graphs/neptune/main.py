@@ -1,4 +1,7 @@
 import logging
+
+from mem0.graphs.pagination import page_conditions
+
 from .base import NeptuneBase
 
 try:
@@ -10,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 class MemoryGraph(NeptuneBase):
-    def __init__(self, config):
+    def __init__(self, config, embedding_model=None, llm=None):
         self.config = config
 
         self.graph = None
@@ -24,7 +27,7 @@ class MemoryGraph(NeptuneBase):
 
         self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
 
-        self.embedding_model = NeptuneBase._create_embedding_model(self.config)
+        self.embedding_model = embedding_model or NeptuneBase._create_embedding_model(self.config)
 
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
@@ -32,7 +35,7 @@ class MemoryGraph(NeptuneBase):
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = NeptuneBase._create_llm(self.config, self.llm_provider)
+        self.llm = llm or NeptuneBase._create_llm(self.config, self.llm_provider)
         self.user_id = None
         self.threshold = 0.7
 
@@ -326,6 +329,53 @@ class MemoryGraph(NeptuneBase):
         params = {"user_id": filters["user_id"], "limit": limit}
         return cypher, params
 
+    def _get_page_cypher(self, filters, page_size, page_token, relationship, entity):
+        """
+        Returns the OpenCypher query and parameters to get a page of edges, ordered by edge id. Every page matches
+        and sorts all of the user's edges before skipping to the token, so streaming N edges costs about
+        N / page_size such scans.
+
+        :param filters: search filters
+        :param page_size: number of edges in the page
+        :param page_token: edge id of the last edge of the previous page
+        :param relationship: optional edge type to filter on
+        :param entity: optional node name to filter on
+        :return: str, dict
+        """
+        conditions, params = page_conditions("id(r)", page_token, relationship, entity)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cypher = f"""
+        MATCH (n {self.node_label} {{user_id: $user_id}})-[r]->(m {self.node_label} {{user_id: $user_id}})
+        {where}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target, id(r) AS cursor
+        ORDER BY cursor
+        LIMIT $limit
+        """
+        params.update({"user_id": filters["user_id"], "limit": page_size + 1})
+        return cypher, params
+
+    def _summary_cypher(self, filters, top_k):
+        """
+        Returns the OpenCypher queries and parameters counting edges per type and ranking nodes by mentions
+
+        :param filters: search filters
+        :param top_k: number of nodes to return
+        :return: (str, dict), (str, dict)
+        """
+        relationship_cypher = f"""
+        MATCH (n {self.node_label} {{user_id: $user_id}})-[r]->(m {self.node_label} {{user_id: $user_id}})
+        RETURN type(r) AS relationship, count(r) AS count
+        ORDER BY count DESC, relationship
+        """
+        entity_cypher = f"""
+        MATCH (n {self.node_label} {{user_id: $user_id}})
+        RETURN n.name AS name, coalesce(n.mentions, 0) AS mentions
+        ORDER BY mentions DESC, name
+        LIMIT $top_k
+        """
+        params = {"user_id": filters["user_id"]}
+        return (relationship_cypher, params), (entity_cypher, {**params, "top_k": top_k})
+
     def _search_graph_db_cypher(self, n_embedding, filters, limit):
         """
         Returns the OpenCypher query and parameters to search for similar nodes in the memory store
@@ -0,0 +1,73 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def page_conditions(
+    cursor_expr: Optional[str],
+    page_token: Optional[str] = None,
+    relationship: Optional[str] = None,
+    entity: Optional[str] = None,
+    parse_token: Callable[[str], Any] = str,
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    WHERE conditions and parameters for a page of `(n)-[r]->(m)` relations.
+
+    Relations are ordered by `cursor_expr`, a stable key of `r`, and the page token is the key of the last relation
+    of the previous page. Stores with a composite keyset cursor pass no token and add their own condition. Names are normalized like extracted entities, so "New York" matches `new_york`.
+    """
+    conditions, params = [], {}
+    if page_token is not None:
+        conditions.append(f"{cursor_expr} > $page_token")
+        params["page_token"] = parse_token(page_token)
+    if relationship:
+        conditions.append("type(r) = $relationship")
+        params["relationship"] = relationship.lower().replace(" ", "_")
+    if entity:
+        conditions.append("(n.name = $entity OR m.name = $entity)")
+        params["entity"] = entity.lower().replace(" ", "_")
+    return conditions, params
+
+
+def build_page(rows: List[Dict[str, Any]], page_size: int, encode_cursor: Callable[[Any], str] = str) -> Dict[str, Any]:
+    """Turn up to `page_size + 1` rows with a "cursor" column into a page of relations and the next page token."""
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    return {
+        "results": [
+            {"source": row["source"], "relationship": row["relationship"], "target": row["target"]} for row in rows
+        ],
+        "next_page_token": encode_cursor(rows[-1]["cursor"]) if has_more else None,
+    }
+
+
+def build_summary(relationship_rows: List[Dict[str, Any]], entity_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "relationships": [{"relationship": row["relationship"], "count": row["count"]} for row in relationship_rows],
+        "top_entities": [{"name": row["name"], "mentions": row["mentions"]} for row in entity_rows],
+    }
+
+
+class GraphPaginationMixin:
+    """
+    Streams a user's whole graph page by page.
+
+    Expects `get_page(filters, page_size, page_token, relationship, entity)` to return a dict with "results" and
+    "next_page_token", as built by `build_page`.
+    """
+
+    def iter_all(self, filters, page_size=500, relationship=None, entity=None):
+        """
+        Yield every relation of the user's graph, fetching `page_size` relations per query.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            page_size (int): Number of relations fetched per round trip. Defaults to 500.
+            relationship (str, optional): Only yield relations of this type.
+            entity (str, optional): Only yield relations whose source or target is this entity.
+        """
+        page_token = None
+        while True:
+            page = self.get_page(filters, page_size, page_token, relationship=relationship, entity=entity)
+            yield from page["results"]
+            page_token = page["next_page_token"]
+            if page_token is None:
+                return
@@ -0,0 +1,148 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SELF_REFERENCES = frozenset({"i", "me", "my", "mine", "myself"})
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase `text` and split it into alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def scope_key(filters: Dict) -> Tuple[str, Optional[str]]:
+    """Key graph state by the (user_id, agent_id) pair used to scope nodes."""
+    return filters["user_id"], filters.get("agent_id")
+
+
+class LexicalEntityResolver:
+    """
+    Resolves the entities mentioned in a query without an LLM.
+
+    Keeps, per (user_id, agent_id), the names of the user's existing graph nodes indexed by their normalized token
+    sequence, and matches query n-grams against them. Self-references ("I", "my", ...) resolve to the user's own
+    node. Scopes are evicted least-recently-used beyond `max_scopes`.
+    """
+
+    def __init__(self, max_ngram: int = 6, max_scopes: int = 1000):
+        self.max_ngram = max_ngram
+        self.max_scopes = max_scopes
+        self._scopes: "OrderedDict[Tuple, Dict[str, Set[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        return "_".join(tokenize(name))
+
+    def is_loaded(self, key: Tuple) -> bool:
+        with self._lock:
+            return key in self._scopes
+
+    def load(self, key: Tuple, names: Iterable[str]):
+        """Replace the known node names of a scope."""
+        index: Dict[str, Set[str]] = {}
+        for name in names:
+            if name:
+                index.setdefault(self._normalize(name), set()).add(name)
+        with self._lock:
+            self._scopes[key] = index
+            self._scopes.move_to_end(key)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def add(self, key: Tuple, names: Iterable[str]):
+        """Record newly written node names for a scope that is already loaded."""
+        with self._lock:
+            index = self._scopes.get(key)
+            if index is None:
+                return
+            for name in names:
+                if name:
+                    index.setdefault(self._normalize(name), set()).add(name)
+
+    def invalidate(self, key: Optional[Tuple] = None):
+        """Forget one scope, or every scope when `key` is None."""
+        with self._lock:
+            if key is None:
+                self._scopes.clear()
+            else:
+                for cached_key in [k for k in self._scopes if k[0] == key[0] and (key[1] is None or k == key)]:
+                    del self._scopes[cached_key]
+
+    def resolve(self, key: Tuple, text: str) -> List[str]:
+        """Return the known node names mentioned in `text`, in order of first mention."""
+        with self._lock:
+            index = self._scopes.get(key)
+            if index is None:
+                return []
+            self._scopes.move_to_end(key)
+
+        tokens = tokenize(text)
+        found: Dict[str, None] = {}
+        for start in range(len(tokens)):
+            if tokens[start] in SELF_REFERENCES:
+                for name in index.get(self._normalize(key[0]), ()):
+                    found[name] = None
+            for end in range(min(len(tokens), start + self.max_ngram), start, -1):
+                for name in sorted(index.get("_".join(tokens[start:end]), ())):
+                    found[name] = None
+        return list(found)
+
+
+class EntityResolutionCache:
+    """
+    Bounded per-(user_id, agent_id) map from entity names to their resolved graph node and embedding.
+
+    Lets graph writes skip the embedding call and the node similarity lookup for entities that recur across
+    messages. Entries are evicted least-recently-used within a scope, and whole scopes beyond `max_scopes`.
+    """
+
+    def __init__(self, max_entries_per_scope: int = 10000, max_scopes: int = 1000):
+        self.max_entries_per_scope = max_entries_per_scope
+        self.max_scopes = max_scopes
+        self._scopes: "OrderedDict[Tuple, OrderedDict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, name: str) -> Optional[Tuple[str, List[float]]]:
+        """Return the cached (element_id, embedding) for `name`, or None."""
+        with self._lock:
+            entries = self._scopes.get(key)
+            if entries is None or name not in entries:
+                return None
+            self._scopes.move_to_end(key)
+            entries.move_to_end(name)
+            return entries[name]
+
+    def put(self, key: Tuple, name: str, element_id: str, embedding: List[float]):
+        with self._lock:
+            entries = self._scopes.get(key)
+            if entries is None:
+                entries = self._scopes[key] = OrderedDict()
+            self._scopes.move_to_end(key)
+            entries[name] = (element_id, embedding)
+            entries.move_to_end(name)
+            while len(entries) > self.max_entries_per_scope:
+                entries.popitem(last=False)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def discard(self, key: Tuple, names: Iterable[str]):
+        """Forget individual names, e.g. after their nodes were deleted."""
+        with self._lock:
+            entries = self._scopes.get(key)
+            if entries is None:
+                return
+            for name in names:
+                entries.pop(name, None)
+
+    def invalidate(self, key: Optional[Tuple] = None):
+        """Forget one scope (all agents of a user when agent_id is None), or every scope when `key` is None."""
+        with self._lock:
+            if key is None:
+                self._scopes.clear()
+            else:
+                for cached_key in [k for k in self._scopes if k[0] == key[0] and (key[1] is None or k == key)]:
+                    del self._scopes[cached_key]
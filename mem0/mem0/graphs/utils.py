@@ -54,6 +54,29 @@ Strive to construct a coherent and easily understandable knowledge graph by esht
 
 Adhere strictly to these guidelines to ensure high-quality knowledge graph extraction."""
 
+EXTRACT_GRAPH_PROMPT = """
+
+You are an advanced algorithm designed to extract structured information from text to construct knowledge graphs. In a single pass, identify the entities in the text with their types and establish the relationships among them. Follow these key principles:
+
+1. Extract only explicitly stated information from the text.
+2. List every entity mentioned in the text together with its type (e.g. person, organization, location, food).
+3. Establish relationships only among the entities you listed.
+4. Use "USER_ID" as the entity for any self-references (e.g., "I," "me," "my," etc.) in user messages.
+CUSTOM_PROMPT
+
+Relationships:
+    - Use consistent, general, and timeless relationship types.
+    - Example: Prefer "professor" over "became_professor."
+    - Relationships should only be established among the entities explicitly mentioned in the user message.
+
+Entity Consistency:
+    - Ensure that relationships are coherent and logically align with the context of the message.
+    - Maintain consistent naming for entities across the entities and relations lists.
+
+Strive to construct a coherent and easily understandable knowledge graph by establishing all the relationships among the entities and adherence to the user’s context.
+
+Adhere strictly to these guidelines to ensure high-quality knowledge graph extraction."""
+
 DELETE_RELATIONS_SYSTEM_PROMPT = """
 You are a graph memory manager specializing in identifying, managing, and optimizing relationships within graph-based memories. Your primary task is to analyze a list of existing relationships and determine which ones should be deleted based on the new information provided.
 Input:
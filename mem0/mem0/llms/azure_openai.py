@@ -2,7 +2,8 @@ import json
 import os
 from typing import Dict, List, Optional
 
-from openai import AzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
@@ -23,14 +24,24 @@ class AzureOpenAILLM(LLMBase):
         api_version = self.config.azure_kwargs.api_version or os.getenv("LLM_AZURE_API_VERSION")
         default_headers = self.config.azure_kwargs.default_headers
 
-        self.client = AzureOpenAI(
-            azure_deployment=azure_deployment,
-            azure_endpoint=azure_endpoint,
-            api_version=api_version,
-            api_key=api_key,
-            http_client=self.config.http_client,
-            default_headers=default_headers,
-        )
+        self._client_params = {
+            "azure_deployment": azure_deployment,
+            "azure_endpoint": azure_endpoint,
+            "api_version": api_version,
+            "api_key": api_key,
+            "default_headers": default_headers,
+        }
+        self.client = AzureOpenAI(http_client=self.config.http_client, **self._client_params)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncAzureOpenAI:
+        """AsyncAzureOpenAI client with its own connection pool, created on first use."""
+        if self._async_client is None:
+            proxies = self.config.http_client_proxies
+            http_client = httpx.AsyncClient(proxies=proxies) if proxies else None
+            self._async_client = AsyncAzureOpenAI(http_client=http_client, **self._client_params)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -62,26 +73,7 @@ class AzureOpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-    ):
-        """
-        Generate a response based on the given messages using Azure OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-
-        Returns:
-            str: The generated response.
-        """
-
+    def _request_params(self, messages, response_format, tools, tool_choice):
         user_prompt = messages[-1]["content"]
 
         user_prompt = user_prompt.replace("assistant", "ai")
@@ -107,6 +99,50 @@ class AzureOpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
 
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using Azure OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages with the asyncio Azure OpenAI client.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
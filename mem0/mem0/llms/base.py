@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
@@ -30,3 +31,18 @@ class LLMBase(ABC):
             str: The generated response.
         """
         pass
+
+    async def agenerate_response(self, messages, **kwargs):
+        """
+        Generate a response without blocking the event loop.
+
+        Providers with an asyncio client override this; the default runs `generate_response` in a worker thread.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            **kwargs: The other arguments of `generate_response`, e.g. `response_format` or `tools`.
+
+        Returns:
+            str: The generated response.
+        """
+        return await asyncio.to_thread(self.generate_response, messages, **kwargs)
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 
 try:
-    from ollama import Client
+    from ollama import AsyncClient, Client
 except ImportError:
     raise ImportError("The 'ollama' library is required. Please install it using 'pip install ollama'.")
 
@@ -16,8 +16,16 @@ class OllamaLLM(LLMBase):
         if not self.config.model:
             self.config.model = "llama3.1:70b"
         self.client = Client(host=self.config.ollama_base_url)
+        self._async_client = None
         self._ensure_model_exists()
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """Asyncio Ollama client with its own connection pool, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncClient(host=self.config.ollama_base_url)
+        return self._async_client
+
     def _ensure_model_exists(self):
         """
         Ensure the specified model exists locally. If not, pull it from Ollama.
@@ -56,6 +64,23 @@ class OllamaLLM(LLMBase):
         else:
             return response["message"]["content"]
 
+    def _request_params(self, messages, response_format, tools, tool_choice):
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens,
+                "top_p": self.config.top_p,
+            },
+        }
+        if response_format:
+            params["format"] = "json"
+
+        if tools:
+            params["tools"] = tools
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -75,20 +100,29 @@ class OllamaLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "options": {
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens,
-                "top_p": self.config.top_p,
-            },
-        }
-        if response_format:
-            params["format"] = "json"
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = self.client.chat(**params)
+        return self._parse_response(response, tools)
 
-        if tools:
-            params["tools"] = tools
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages with the asyncio Ollama client.
 
-        response = self.client.chat(**params)
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat(**params)
         return self._parse_response(response, tools)
@@ -0,0 +1,268 @@
+import asyncio
+import json
+import logging
+
+try:
+    from neo4j import AsyncGraphDatabase
+except ImportError:
+    raise ImportError("neo4j is not installed. Please install it using pip install neo4j")
+
+from mem0.graphs.pagination import build_page, build_summary
+from mem0.graphs.resolution import scope_key
+from mem0.memory.graph_memory import ENTITY_VECTOR_INDEX, MemoryGraph
+from mem0.memory.utils import aembed_batch
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMemoryGraph(MemoryGraph):
+    """
+    Neo4j graph memory on the async driver.
+
+    Builds the same Cypher as `MemoryGraph`, but awaits the database instead of blocking a worker thread for each
+    round trip. Embeddings and the LLM extraction steps use the native async clients of the embedder and LLM when
+    they have them, and worker threads otherwise. Schema setup happens on first use, since it cannot be awaited in
+    `__init__`.
+    """
+
+    def __init__(self, config, embedding_model=None, llm=None):
+        self.config = config
+        graph_config = self.config.graph_store.config
+        self.driver = AsyncGraphDatabase.driver(
+            graph_config.url,
+            auth=(graph_config.username, graph_config.password),
+            notifications_min_severity="OFF",
+            **self._driver_pool_config(),
+        )
+        self.database = graph_config.database
+        self._setup_components(embedding_model, llm)
+        self.vector_index_name = None
+        self._schema_ready = False
+        self._schema_lock = None
+
+    async def _ensure_schema(self):
+        if self._schema_ready:
+            return
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
+        async with self._schema_lock:
+            if self._schema_ready:
+                return
+            for cypher in self._entity_index_queries():
+                try:  # Safely add indexes; the composite one is Enterprise only
+                    await self._query(cypher)
+                except Exception:
+                    pass
+            embedding_dims = self._vector_index_dims()
+            if embedding_dims:
+                try:
+                    await self._query(self._vector_index_query(embedding_dims))
+                    self.vector_index_name = ENTITY_VECTOR_INDEX
+                except Exception as e:
+                    logger.warning(
+                        f"Could not create vector index {ENTITY_VECTOR_INDEX}, falling back to full scans: {e}"
+                    )
+            self._schema_ready = True
+
+    async def _query(self, cypher, params=None):
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(cypher, params or {})
+            return await result.data()
+
+    async def _query_similar_nodes(self, build_query, params):
+        """Run a similarity query, falling back to a full scan if the vector index cannot be queried."""
+        if self.vector_index_name:
+            try:
+                return await self._query(build_query(), params)
+            except Exception as e:
+                logger.warning(f"Vector index query failed, falling back to full scans: {e}")
+                self.vector_index_name = None
+        return await self._query(build_query(), params)
+
+    async def _run_write_transaction(self, statements):
+        """Run (cypher, params) statements in a single async write transaction and return their records."""
+        if not statements:
+            return []
+
+        async def work(tx):
+            records = []
+            for cypher, params in statements:
+                result = await tx.run(cypher, params)
+                records.extend(await result.data())
+            return records
+
+        async with self.driver.session(database=self.database) as session:
+            return await session.execute_write(work)
+
+    async def add(self, data, filters):
+        """
+        Adds data to the graph.
+
+        The lookup of existing relations for the delete decision and the resolution of the entities to add are
+        independent, so they run concurrently.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        await self._ensure_schema()
+        if self.extraction_mode == "single_call":
+            entity_type_map, to_be_added = await self._aextract_graph_from_data(data, filters)
+        else:
+            entity_type_map = await self._aretrieve_nodes_from_data(data, filters)
+            to_be_added = await self._aestablish_nodes_relations_from_data(data, filters, entity_type_map)
+
+        async def find_deletions():
+            search_output = await self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+            return await self._aget_delete_entities_from_search_output(search_output, data, filters)
+
+        to_be_deleted, prepared = await asyncio.gather(find_deletions(), self._prepare_entities(to_be_added, filters))
+
+        deleted_entities = await self._delete_entities(to_be_deleted, filters)
+        added_entities = await self._add_entities(to_be_added, filters, entity_type_map, prepared=prepared)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
+    async def search(self, query, filters, limit=100):
+        """
+        Search for memories and related graph data.
+
+        Args:
+            query (str): Query to search for.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+
+        Returns:
+            list: The best matching relations, as dictionaries with "source", "relationship" and "destination".
+        """
+        await self._ensure_schema()
+        if self.search_entity_resolver == "lexical":
+            node_list = await self._resolve_query_entities(query, filters)
+        else:
+            node_list = list((await self._aretrieve_nodes_from_data(query, filters)).keys())
+        search_output = await self._search_graph_db(
+            node_list=node_list, filters=filters, depth=self.search_depth, hop_limit=self.search_hop_limit
+        )
+
+        if not search_output:
+            return []
+
+        if not self.bm25_index.is_loaded(scope_key(filters)):
+            await self._load_bm25_index(filters)
+        return self._rerank(query, filters, search_output)
+
+    async def delete_all(self, filters):
+        await self._query(*self._delete_all_query(filters))
+        self._invalidate_scope(filters)
+
+    async def get_all(self, filters, limit=100):
+        """
+        Retrieves all nodes and relationships from the graph database based on optional filtering criteria.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+        Returns:
+            list: Dictionaries with "source", "relationship" and "target".
+        """
+        results = await self._query(*self._get_all_query(filters, limit))
+        final_results = [
+            {"source": result["source"], "relationship": result["relationship"], "target": result["target"]}
+            for result in results
+        ]
+        logger.info(f"Retrieved {len(final_results)} relationships")
+        return final_results
+
+    async def get_page(self, filters, page_size=100, page_token=None, relationship=None, entity=None):
+        """Retrieves one page of relations in a stable order; see `MemoryGraph.get_page`."""
+        rows = await self._query(*self._get_page_query(filters, page_size, page_token, relationship, entity))
+        return build_page(rows, page_size, encode_cursor=json.dumps)
+
+    async def iter_all(self, filters, page_size=500, relationship=None, entity=None):
+        """Yield every relation of the user's graph, fetching `page_size` relations per query."""
+        page_token = None
+        while True:
+            page = await self.get_page(filters, page_size, page_token, relationship=relationship, entity=entity)
+            for result in page["results"]:
+                yield result
+            page_token = page["next_page_token"]
+            if page_token is None:
+                return
+
+    async def summarize(self, filters, top_k=10):
+        """Counts relations per type and finds the most mentioned entities; see `MemoryGraph.summarize`."""
+        relationship_rows, entity_rows = await asyncio.gather(
+            self._query(*self._relationship_counts_query(filters)),
+            self._query(*self._top_entities_query(filters, top_k)),
+        )
+        return build_summary(relationship_rows, entity_rows)
+
+    async def reset(self):
+        """Reset the graph by clearing all nodes and relationships."""
+        logger.warning("Clearing graph...")
+        self._reset_caches()
+        return await self._query("MATCH (n) DETACH DELETE n")
+
+    async def close(self):
+        await self.driver.close()
+
+    async def _resolve_query_entities(self, query, filters):
+        """Find the user's existing nodes mentioned in the query without calling the LLM."""
+        key = scope_key(filters)
+        if not self.lexical_resolver.is_loaded(key):
+            rows = await self._query(*self._node_names_query(filters))
+            self.lexical_resolver.load(key, [row["name"] for row in rows])
+        return self.lexical_resolver.resolve(key, query)
+
+    async def _load_bm25_index(self, filters):
+        """Index all relations of the user's graph to seed the BM25 corpus statistics."""
+        rows = await self._query(*self._relations_query(filters))
+        self.bm25_index.load(
+            scope_key(filters), [(row["source"], row["relationship"], row["destination"]) for row in rows]
+        )
+
+    async def _search_graph_db(self, node_list, filters, limit=100, depth=1, hop_limit=None):
+        """Search the relations around the nodes similar to any of `node_list`, in a single query."""
+        if not node_list:
+            return []
+        embeddings = await aembed_batch(self.embedding_model, list(node_list))
+        return await self._query_similar_nodes(
+            *self._search_graph_db_query(embeddings, filters, limit, depth, hop_limit)
+        )
+
+    async def _resolve_nodes(self, embeddings, filters, threshold=0.9):
+        """Map each entity name to the elementId of its most similar existing node, in a single query."""
+        if not embeddings:
+            return {}
+        results = await self._query_similar_nodes(*self._resolve_nodes_query(embeddings, filters, threshold))
+        return {row["name"]: row["element_id"] for row in results}
+
+    async def _delete_entities(self, to_be_deleted, filters):
+        """Delete the entities from the graph, one UNWIND statement per relationship type in a single transaction."""
+        records = await self._run_write_transaction(self._delete_entities_statements(to_be_deleted, filters))
+        results = self._collect_by_index(records, len(to_be_deleted))
+        self.bm25_index.remove(scope_key(filters), self._triples(results))
+        return results
+
+    async def _prepare_entities(self, to_be_added, filters):
+        """Resolve the names of `to_be_added` to existing nodes; returns (resolved ids, embeddings, cached names)."""
+        resolved, embeddings, cached, misses = self._lookup_entity_cache(to_be_added, filters)
+        if misses:
+            embeddings.update(zip(misses, await aembed_batch(self.embedding_model, misses)))
+            resolved.update(
+                await self._resolve_nodes({name: embeddings[name] for name in misses}, filters, threshold=0.9)
+            )
+        return resolved, embeddings, cached
+
+    async def _add_entities(self, to_be_added, filters, entity_type_map, prepared=None):
+        """Add the new entities to the graph in a single async transaction. Merge the nodes if they already exist."""
+        resolved, embeddings, cached = prepared or await self._prepare_entities(to_be_added, filters)
+        statements = self._add_entities_statements(to_be_added, filters, entity_type_map, resolved, embeddings)
+        records = await self._run_write_transaction(statements)
+        results, stale = self._record_added_entities(to_be_added, filters, records, embeddings, cached)
+        if stale:
+            retried = await self._add_entities([to_be_added[idx] for idx in stale], filters, entity_type_map)
+            for idx, result in zip(stale, retried):
+                results[idx] = result
+        self._index_added_entities(filters, embeddings, results)
+        return results
@@ -3,9 +3,12 @@ Enhanced Memory class optimized for coding contexts and autonomous AI agents.
 This module extends the base Memory class with coding-specific optimizations.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import uuid
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 
@@ -13,29 +16,231 @@ from mem0.configs.coding_config import CodingFactExtractor, CodingMemoryConfig
 from mem0.memory.enhanced_deduplication import (
     AutonomousDeduplicationManager,
 )
+from mem0.memory.enrichment import create_enrichment_executor
+from mem0.memory.learning_state import RingBuffer
 from mem0.memory.main import AsyncMemory, Memory
-from mem0.memory.utils import parse_messages, remove_code_blocks
+from mem0.memory.telemetry import capture_event
+from mem0.memory.timezone_utils import create_memory_timestamps
+from mem0.memory.utils import aembed_batch, agenerate_response, parse_messages, remove_code_blocks
 
 logger = logging.getLogger(__name__)
 
 
-class CodingMemory(Memory):
+class _CodingFactPipeline:
     """
-    Enhanced Memory class optimized for coding contexts and autonomous AI agents.
+    Batch ingestion of extracted coding facts, shared by `CodingMemory` and `AsyncCodingMemory`.
+
+    All facts are categorized first, then embedded in one batch and searched with one multi-query request. The
+    deduplication decisions are made together, and the accepted facts are stored with one vector store insert and
+    one history transaction. The two classes only differ in how they run the I/O stages.
     """
 
-    def __init__(self, config: CodingMemoryConfig):
-        super().__init__(config)
+    def _initialize_coding_state(self, config: CodingMemoryConfig):
         self.coding_config = config
         self.fact_extractor = CodingFactExtractor()
 
         # Enhanced caching for coding contexts
         self.coding_cache = {}
-        self.context_patterns = {}
+        # The latest memories per category, bounded by learning_history_size, and all-time counts
+        self.context_patterns: Dict[str, RingBuffer] = {}
+        self.context_pattern_counts: Dict[str, int] = defaultdict(int)
 
         # Initialize enhanced deduplication
         self.deduplication_manager = AutonomousDeduplicationManager(config.__dict__)
 
+        # Categorization and metadata extraction, inline or in worker processes
+        self.enrichment_executor = create_enrichment_executor(config.__dict__)
+
+    def _coding_fact_extraction_messages(self, messages) -> List[Dict[str, str]]:
+        """Build the LLM messages of the coding-optimized fact extraction."""
+        system_prompt = (
+            self.coding_config.coding_fact_extraction_prompt or self.fact_extractor.get_coding_fact_extraction_prompt()
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"Input:\n{parse_messages(messages)}"},
+        ]
+
+    @staticmethod
+    def _parse_coding_facts(response: str) -> List[str]:
+        try:
+            return json.loads(remove_code_blocks(response))["facts"]
+        except Exception as e:
+            logger.error(f"Error in coding fact extraction: {e}")
+            return []
+
+    def _prepare_coding_facts(self, facts: List[str], metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Categorize the facts and build their metadata; CPU only, so it runs before any embedding or search.
+
+        Categorization and metadata extraction go through the enrichment executor, which may run them in worker
+        processes.
+        """
+        prepared = []
+        for fact, (category, coding_metadata) in zip(facts, self.enrichment_executor.map("coding_facts", facts)):
+            # Apply context-aware scoring
+            context_weight = self.coding_config.coding_context_weights.get(category, 0.5)
+
+            prepared.append(
+                {
+                    "fact": fact,
+                    "category": category,
+                    "context_weight": context_weight,
+                    "metadata": {
+                        **metadata,
+                        "category": category,
+                        "context_weight": context_weight,
+                        **coding_metadata,
+                    },
+                }
+            )
+        return prepared
+
+    @staticmethod
+    def _format_candidates(results) -> List[Dict[str, Any]]:
+        """
+        Convert vector search results to the format expected by the deduplication manager.
+
+        The search score is kept as the base similarity of candidates whose embedding the deduplicator has not cached.
+        """
+        return [
+            {"id": mem.id, "memory": mem.payload.get("data", ""), "metadata": mem.payload, "score": mem.score}
+            for mem in results
+        ]
+
+    def _select_coding_facts(
+        self,
+        prepared: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+        candidates: List[list],
+        filters: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Make the deduplication decisions of a batch of facts.
+
+        Facts accepted earlier in the batch are compared like stored memories, and are remembered and indexed right
+        away, so one batch cannot store the same fact twice.
+
+        Returns:
+            The accepted facts, each with its new memory "id" and its "embedding"
+        """
+        scope = self.deduplication_manager.scope_key(filters)
+        accepted, indexed_scopes = [], set()
+        for item, embedding, results in zip(prepared, embeddings, candidates):
+            existing = self._format_candidates(results)
+            existing.extend({"id": a["id"], "memory": a["fact"], "metadata": a["metadata"]} for a in accepted)
+
+            dedup_result = self.deduplication_manager.process_memory(
+                item["fact"],
+                existing,
+                item["metadata"],
+                embedding=embedding,
+                scope=scope,
+                memory_exists=self._memory_exists,
+            )
+            if dedup_result["should_deduplicate"]:
+                logger.debug(f"Fact rejected by enhanced deduplication: {dedup_result['reasoning']}")
+                continue
+
+            memory_id = str(uuid.uuid4())
+            memory_scope = self.deduplication_manager.scope_key(item["metadata"])
+            self.deduplication_manager.deduplicator.remember(memory_id, item["fact"], embedding)
+            self.deduplication_manager.index_memory(memory_id, item["fact"], memory_scope, save=False)
+            indexed_scopes.add(memory_scope)
+            accepted.append({**item, "id": memory_id, "embedding": embedding})
+        self.deduplication_manager.save_indexes(list(indexed_scopes))
+        return accepted
+
+    def _memory_exists(self, memory_id: str) -> bool:
+        """Whether a memory of the near-duplicate index is still stored; assumes it is when the store cannot tell."""
+        try:
+            return self.vector_store.get(vector_id=memory_id) is not None
+        except Exception as e:
+            logger.warning(f"Could not check whether memory {memory_id} still exists: {e}")
+            return True
+
+    def _stored_memory_scope(self, memory_id: str):
+        """
+        Near-duplicate index scope of a stored memory, read before it is updated or deleted.
+
+        Only needed with persisted indexes, whose scope may not be loaded in this process; otherwise None, and every
+        loaded index is cleaned.
+        """
+        if not self.deduplication_manager.near_duplicate_index_dir:
+            return None
+        existing = self.vector_store.get(vector_id=memory_id)
+        return self.deduplication_manager.scope_key(existing.payload) if existing is not None else None
+
+    def _forget_coding_memories(self, accepted: List[Dict[str, Any]]):
+        """Drop accepted facts from the deduplication caches after their insert failed."""
+        for item in accepted:
+            self.deduplication_manager.deduplicator.dedup_cache.pop(item["id"], None)
+            self.deduplication_manager.remove_memory(item["id"])
+
+    @staticmethod
+    def _coding_memory_payloads(accepted: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        timestamps = create_memory_timestamps()
+        for item in accepted:
+            payload = item["metadata"]
+            payload["data"] = item["fact"]
+            payload["hash"] = hashlib.md5(item["fact"].encode()).hexdigest()
+            payload.update(timestamps)
+        return [item["metadata"] for item in accepted]
+
+    @staticmethod
+    def _coding_history_records(accepted: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "memory_id": item["id"],
+                "old_memory": None,
+                "new_memory": item["fact"],
+                "event": "ADD",
+                "created_at": item["metadata"].get("created_at"),
+                "actor_id": item["metadata"].get("actor_id"),
+                "role": item["metadata"].get("role"),
+            }
+            for item in accepted
+        ]
+
+    def _record_coding_patterns(self, accepted: List[Dict[str, Any]]):
+        """Store coding-specific patterns for optimization."""
+        for item in accepted:
+            category = item["category"]
+            if category not in self.context_patterns:
+                self.context_patterns[category] = RingBuffer(maxlen=self.coding_config.learning_history_size)
+            self.context_pattern_counts[category] += 1
+
+            self.context_patterns[category].append(
+                {
+                    "memory_id": item["id"],
+                    "data": item["fact"][:100],  # Store first 100 chars for pattern matching
+                    "metadata": item["metadata"],
+                }
+            )
+
+    @staticmethod
+    def _coding_memory_results(accepted: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": item["id"],
+                "memory": item["fact"],
+                "category": item["category"],
+                "context_weight": item["context_weight"],
+                "event": "ADD",
+            }
+            for item in accepted
+        ]
+
+
+class CodingMemory(_CodingFactPipeline, Memory):
+    """
+    Enhanced Memory class optimized for coding contexts and autonomous AI agents.
+    """
+
+    def __init__(self, config: CodingMemoryConfig):
+        super().__init__(config)
+        self._initialize_coding_state(config)
+
         # Initialize coding-specific components
         self._initialize_coding_optimizations()
 
@@ -109,29 +314,12 @@ class CodingMemory(Memory):
         if not infer:
             return super()._add_to_vector_store(messages, metadata, filters, infer)
 
-        # Use coding-specific fact extraction
-        parsed_messages = parse_messages(messages)
-
         # Apply coding-optimized fact extraction
-        system_prompt = (
-            self.coding_config.coding_fact_extraction_prompt or self.fact_extractor.get_coding_fact_extraction_prompt()
-        )
-        user_prompt = f"Input:\n{parsed_messages}"
-
         response = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=self._coding_fact_extraction_messages(messages),
             response_format={"type": "json_object"},
         )
-
-        try:
-            response = remove_code_blocks(response)
-            new_retrieved_facts = json.loads(response)["facts"]
-        except Exception as e:
-            logger.error(f"Error in coding fact extraction: {e}")
-            new_retrieved_facts = []
+        new_retrieved_facts = self._parse_coding_facts(response)
 
         if not new_retrieved_facts:
             logger.debug("No coding facts retrieved from input.")
@@ -145,144 +333,67 @@ class CodingMemory(Memory):
     ) -> List[Dict[str, Any]]:
         """
         Process coding facts with enhanced categorization and metadata.
-        """
-        processed_memories = []
-
-        for fact in facts:
-            # Auto-categorize the fact
-            category = self.fact_extractor.categorize_coding_fact(fact)
-
-            # Extract coding-specific metadata
-            coding_metadata = self.fact_extractor.extract_coding_metadata(fact)
-
-            # Apply context-aware scoring
-            context_weight = self.coding_config.coding_context_weights.get(category, 0.5)
-
-            # Enhanced metadata with coding context
-            enhanced_metadata = {
-                **metadata,
-                "category": category,
-                "context_weight": context_weight,
-                **coding_metadata,
-            }
-
-            # Apply enhanced similarity checking
-            if self._should_store_coding_fact(fact, enhanced_metadata, filters):
-                # Create memory with enhanced metadata
-                embeddings = self.embedding_model.embed(fact, "add")
-                memory_id = self._create_coding_memory(fact, embeddings, enhanced_metadata)
-
-                processed_memories.append(
-                    {
-                        "id": memory_id,
-                        "memory": fact,
-                        "category": category,
-                        "context_weight": context_weight,
-                        "event": "ADD",
-                    }
-                )
 
-        return processed_memories
-
-    def _should_store_coding_fact(self, fact: str, metadata: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        """
-        Determine if a coding fact should be stored based on enhanced deduplication.
+        Each fact is embedded once, and the embeddings and candidate searches of the whole batch are made in one
+        call each.
         """
-        # Get existing memories for comparison
-        embeddings = self.embedding_model.embed(fact, "add")
-        existing_memories = self.vector_store.search(
-            query=fact,
-            vectors=embeddings,
-            limit=5,
-            filters=filters,
-        )
-
-        # Convert to format expected by deduplication manager
-        existing_memories_formatted = []
-        for mem in existing_memories:
-            existing_memories_formatted.append(
-                {
-                    "id": mem.id,
-                    "memory": mem.payload.get("data", ""),
-                    "metadata": mem.payload,
-                }
-            )
-
-        # Use enhanced deduplication logic
-        dedup_result = self.deduplication_manager.process_memory(fact, existing_memories_formatted, metadata)
-
-        # Log deduplication decision
-        if dedup_result["should_deduplicate"]:
-            logger.debug(f"Fact rejected by enhanced deduplication: {dedup_result['reasoning']}")
-            return False
+        prepared = self._prepare_coding_facts(facts, metadata)
+        if not prepared:
+            return []
 
-        return True
+        embeddings = self.embedding_model.embed_batch(facts, "add")
+        candidates = self.vector_store.search_batch(queries=facts, vectors=embeddings, limit=5, filters=filters)
+        accepted = self._select_coding_facts(prepared, embeddings, candidates, filters)
+        self._store_coding_memories(accepted)
+        return self._coding_memory_results(accepted)
 
-    def _create_coding_memory(self, data: str, embeddings: List[float], metadata: Dict[str, Any]) -> str:
+    def _store_coding_memories(self, accepted: List[Dict[str, Any]]):
         """
-        Create memory with enhanced coding-specific metadata.
+        Create the memories of accepted facts with one vector store insert and one history transaction.
 
         CRITICAL: Directly implements memory creation to avoid problematic
         dictionary key anti-pattern with potentially long data strings.
         """
-        import uuid
-
-        # Generate memory ID and prepare enhanced metadata
-        memory_id = str(uuid.uuid4())
-        enhanced_metadata = metadata or {}
-        enhanced_metadata["data"] = data
-        enhanced_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        from mem0.memory.timezone_utils import create_memory_timestamp
-
-        enhanced_metadata["created_at"] = create_memory_timestamp()
-
-        # Use pre-computed embeddings directly - SAFE APPROACH
-        self.vector_store.insert(
-            vectors=[embeddings],
-            ids=[memory_id],
-            payloads=[enhanced_metadata],
-        )
+        if not accepted:
+            return
 
-        # Add to history with proper error handling
+        payloads = self._coding_memory_payloads(accepted)
         try:
-            self.db.add_history(
-                memory_id,
-                None,
-                data,
-                "ADD",
-                created_at=enhanced_metadata.get("created_at"),
-                actor_id=enhanced_metadata.get("actor_id"),
-                role=enhanced_metadata.get("role"),
+            # Use pre-computed embeddings directly - SAFE APPROACH
+            self.vector_store.insert(
+                vectors=[item["embedding"] for item in accepted],
+                ids=[item["id"] for item in accepted],
+                payloads=payloads,
             )
-        except Exception as e:
-            logger.error(f"Failed to add history for coding memory {memory_id}: {e}")
+        except Exception:
+            self._forget_coding_memories(accepted)
+            raise
 
-        # Add telemetry capture for consistency
+        # Add to history with proper error handling
         try:
-            from mem0.memory.telemetry import capture_event
+            self.db.add_history_batch(self._coding_history_records(accepted))
+        except Exception as e:
+            logger.error(f"Failed to add history for {len(accepted)} coding memories: {e}")
 
-            capture_event(
-                "mem0._create_memory",
-                self,
-                {"memory_id": memory_id, "sync_type": "sync"},
-            )
-        except ImportError:
-            logger.debug("Telemetry capture not available")
+        for item in accepted:
+            capture_event("mem0._create_memory", self, {"memory_id": item["id"], "sync_type": "sync"})
 
-        # Store coding-specific patterns for optimization
-        category = metadata.get("category", "general")
-        if category not in self.context_patterns:
-            self.context_patterns[category] = []
+        self._record_coding_patterns(accepted)
 
-        self.context_patterns[category].append(
-            {
-                "memory_id": memory_id,
-                "data": data[:100],  # Store first 100 chars for pattern matching
-                "metadata": metadata,
-            }
-        )
+    def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+        scope = self._stored_memory_scope(memory_id)
+        result = super()._update_memory(memory_id, data, existing_embeddings, metadata)
+        self.deduplication_manager.deduplicator.dedup_cache.pop(memory_id, None)
+        for indexed_scope in self.deduplication_manager.remove_memory(memory_id, scope):
+            self.deduplication_manager.index_memory(memory_id, data, indexed_scope)
+        return result
 
-        return memory_id
+    def _delete_memory(self, memory_id):
+        scope = self._stored_memory_scope(memory_id)
+        result = super()._delete_memory(memory_id)
+        self.deduplication_manager.deduplicator.dedup_cache.pop(memory_id, None)
+        self.deduplication_manager.remove_memory(memory_id, scope)
+        return result
 
     def search_coding_context(
         self,
@@ -379,7 +490,8 @@ class CodingMemory(Memory):
         return {
             "total_memories": total_memories,
             "categories": categories,
-            "patterns": self.context_patterns,
+            "patterns": {category: list(records) for category, records in self.context_patterns.items()},
+            "pattern_counts": dict(self.context_pattern_counts),
             "optimization_suggestions": self._get_optimization_suggestions(categories),
         }
 
@@ -408,6 +520,46 @@ class CodingMemory(Memory):
 
         return suggestions
 
+    def deduplicate_scope(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        similarity_threshold: float = 0.8,
+        delete: bool = False,
+        limit: int = 100000,
+    ) -> Dict[str, Any]:
+        """
+        Find, and optionally delete, near-duplicate memories of a user, agent or run.
+
+        Memories are compared through a MinHash/LSH index rather than pairwise, so this stays practical for scopes
+        with tens of thousands of memories. The oldest memory of each cluster is kept.
+
+        Args:
+            user_id: User identifier
+            agent_id: Agent identifier
+            run_id: Run identifier
+            similarity_threshold: Word-set Jaccard similarity at which two memories are duplicates
+            delete: Delete the duplicates instead of only reporting them
+            limit: Maximum number of memories to scan
+        """
+        filters = {
+            key: value for key, value in (("user_id", user_id), ("agent_id", agent_id), ("run_id", run_id)) if value
+        }
+        if not filters:
+            raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be provided.")
+
+        memories = sorted(self._get_all_from_vector_store(filters, limit), key=lambda m: m.get("created_at") or "")
+        result = self.deduplication_manager.dedupe_scope(
+            memories, scope=self.deduplication_manager.scope_key(filters), similarity_threshold=similarity_threshold
+        )
+        if delete:
+            for memory_id in result["duplicate_ids"]:
+                self.delete(memory_id)
+        logger.info(f"Found {len(result['duplicate_ids'])} near-duplicate memories in {len(memories)} memories")
+        return result
+
     def get_deduplication_analytics(self) -> Dict[str, Any]:
         """
         Get analytics about deduplication performance.
@@ -491,15 +643,14 @@ class CodingMemory(Memory):
         return results
 
 
-class AsyncCodingMemory(AsyncMemory):
+class AsyncCodingMemory(_CodingFactPipeline, AsyncMemory):
     """
     Async version of CodingMemory for high-performance scenarios.
     """
 
     def __init__(self, config: CodingMemoryConfig):
         super().__init__(config)
-        self.coding_config = config
-        self.fact_extractor = CodingFactExtractor()
+        self._initialize_coding_state(config)
 
     async def add_coding_context(
         self,
@@ -538,6 +689,92 @@ class AsyncCodingMemory(AsyncMemory):
             **kwargs,
         )
 
+    async def _add_to_vector_store(self, messages, metadata, effective_filters, infer):
+        """
+        Async version of CodingMemory._add_to_vector_store.
+        """
+        if not infer:
+            return await super()._add_to_vector_store(messages, metadata, effective_filters, infer)
+
+        response = await agenerate_response(
+            self.llm,
+            messages=self._coding_fact_extraction_messages(messages),
+            response_format={"type": "json_object"},
+        )
+        new_retrieved_facts = self._parse_coding_facts(response)
+
+        if not new_retrieved_facts:
+            logger.debug("No coding facts retrieved from input.")
+            return []
+
+        return await self._process_coding_facts(new_retrieved_facts, metadata, effective_filters)
+
+    async def _process_coding_facts(
+        self, facts: List[str], metadata: Dict[str, Any], filters: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of CodingMemory._process_coding_facts.
+
+        The facts are categorized in a worker thread while they are embedded, since neither stage needs the other.
+        """
+        if not facts:
+            return []
+
+        prepared, embeddings = await asyncio.gather(
+            asyncio.to_thread(self._prepare_coding_facts, facts, metadata),
+            aembed_batch(self.embedding_model, facts, "add"),
+        )
+        candidates = await asyncio.to_thread(
+            self.vector_store.search_batch, queries=facts, vectors=embeddings, limit=5, filters=filters
+        )
+        accepted = self._select_coding_facts(prepared, embeddings, candidates, filters)
+        await self._store_coding_memories(accepted)
+        return self._coding_memory_results(accepted)
+
+    async def _store_coding_memories(self, accepted: List[Dict[str, Any]]):
+        """
+        Async version of CodingMemory._store_coding_memories.
+        """
+        if not accepted:
+            return
+
+        payloads = self._coding_memory_payloads(accepted)
+        try:
+            await asyncio.to_thread(
+                self.vector_store.insert,
+                vectors=[item["embedding"] for item in accepted],
+                ids=[item["id"] for item in accepted],
+                payloads=payloads,
+            )
+        except Exception:
+            self._forget_coding_memories(accepted)
+            raise
+
+        try:
+            await asyncio.to_thread(self.db.add_history_batch, self._coding_history_records(accepted))
+        except Exception as e:
+            logger.error(f"Failed to add history for {len(accepted)} coding memories: {e}")
+
+        for item in accepted:
+            capture_event("mem0._create_memory", self, {"memory_id": item["id"], "sync_type": "async"})
+
+        self._record_coding_patterns(accepted)
+
+    async def _update_memory(self, memory_id, data, existing_embeddings, metadata=None):
+        scope = await asyncio.to_thread(self._stored_memory_scope, memory_id)
+        result = await super()._update_memory(memory_id, data, existing_embeddings, metadata)
+        self.deduplication_manager.deduplicator.dedup_cache.pop(memory_id, None)
+        for indexed_scope in self.deduplication_manager.remove_memory(memory_id, scope):
+            self.deduplication_manager.index_memory(memory_id, data, indexed_scope)
+        return result
+
+    async def _delete_memory(self, memory_id):
+        scope = await asyncio.to_thread(self._stored_memory_scope, memory_id)
+        result = await super()._delete_memory(memory_id)
+        self.deduplication_manager.deduplicator.dedup_cache.pop(memory_id, None)
+        self.deduplication_manager.remove_memory(memory_id, scope)
+        return result
+
     async def search_coding_context(
         self,
         query: str,
@@ -5,19 +5,98 @@ This module provides advanced confidence scoring optimized for coding contexts.
 
 import logging
 import math
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 
 from mem0.configs.coding_config import CodingMemoryConfig
+from mem0.memory.learning_state import RingBuffer, StreamingStats, learning_limits
+from mem0.memory.pattern_engine import PatternEngine, literal_table
 from mem0.memory.timezone_utils import (
-    get_memory_age_days,
-    safe_datetime_diff,
-    safe_datetime_now,
+    ages_from_epochs,
+    current_epoch,
+    memory_epoch,
+    timestamp_to_epoch,
 )
 
 logger = logging.getLogger(__name__)
 
+_INDICATOR_KEYWORDS = {
+    "code_block": [
+        "def ",
+        "function",
+        "class ",
+        "import ",
+        "from ",
+        "{",
+        "}",
+        "()",
+        "[]",
+    ],
+    "file_path": [".py", ".js", ".ts", ".java", ".cpp", ".c", ".h", "/", "\\"],
+    "error_message": [
+        "error",
+        "exception",
+        "failed",
+        "crash",
+        "traceback",
+        "stack trace",
+    ],
+    "solution_steps": [
+        "step",
+        "first",
+        "then",
+        "next",
+        "finally",
+        "solution",
+        "fix",
+    ],
+    "configuration": [
+        "config",
+        "setting",
+        "parameter",
+        "option",
+        "environment",
+        "env",
+    ],
+    "performance_data": [
+        "ms",
+        "seconds",
+        "memory",
+        "cpu",
+        "benchmark",
+        "optimization",
+    ],
+}
+
+_QUALITY_INDICATOR_BOOSTS = {
+    "code_block": 0.15,  # Contains code
+    "file_path": 0.10,  # Contains file paths
+    "error_message": 0.12,  # Contains error messages
+    "solution_steps": 0.18,  # Contains solution steps
+    "configuration": 0.08,  # Contains configuration details
+    "performance_data": 0.12,  # Contains performance metrics
+}
+
+# Metadata flags behind the context boosts, in the order the boosts are added
+_CONTEXT_FLAGS = {
+    "file_references": "file_references",
+    "code_blocks": "code_blocks",
+    "error_context": "error_related",
+    "solution_context": "solution_related",
+    "performance_metrics": "performance_metrics",
+    "test_results": "test_results",
+}
+
+
+def _last_accessed_epoch(last_accessed: str) -> Optional[float]:
+    try:
+        return timestamp_to_epoch(last_accessed)
+    except Exception:
+        return None
+
 
 class EnhancedConfidenceScorer:
     """
@@ -64,7 +143,10 @@ class EnhancedConfidenceScorer:
         }
 
         # Performance tracking
-        self.scoring_history = []
+        self.learning_limits = learning_limits(config)
+        self.scoring_history = RingBuffer(maxlen=self.learning_limits["history_size"])
+        self.confidence_stats = StreamingStats.from_limits(self.learning_limits)
+        self.category_counts = defaultdict(int)
         self.accuracy_metrics = {
             "total_scores": 0,
             "correct_predictions": 0,
@@ -72,6 +154,9 @@ class EnhancedConfidenceScorer:
             "false_negatives": 0,
         }
 
+        # Content quality keywords, matched as plain substrings of the lowercased content
+        self._indicator_keywords = PatternEngine(literal_table(_INDICATOR_KEYWORDS), flags=0)
+
         logger.info("Enhanced confidence scorer initialized")
 
     def calculate_confidence(
@@ -133,6 +218,137 @@ class EnhancedConfidenceScorer:
             "explanation": self._generate_explanation(final_confidence, metadata, context),
         }
 
+    def score_batch(self, memories: List[Dict[str, Any]], context: Dict[str, Any] = None) -> np.ndarray:
+        """
+        Calculate the confidence of many memories at once, e.g. to re-rank search results.
+
+        Features are gathered in one pass over the memories and combined with array arithmetic. Each score equals
+        `calculate_confidence(memory["memory"], memory.get("metadata", {}), context)["confidence"]`, but batch scores
+        are not recorded in the scoring history.
+
+        Args:
+            memories: Memories with their content under "memory" and optional "metadata"
+            context: Optional context for scoring, shared by all memories
+
+        Returns:
+            Array of confidence scores in the order of `memories`
+        """
+        return self._score_features(self._batch_features(memories), context or {})
+
+    def _batch_features(self, memories: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Per-memory scoring features as arrays, read in a single pass.
+
+        The logarithm and exponential are taken with `math` here, since NumPy's vectorized versions may differ from
+        the scalar path in the last bit.
+        """
+        category_index = {category: i for i, category in enumerate(self.category_weights)}
+        indicator_names = list(_QUALITY_INDICATOR_BOOSTS)
+        flag_keys = list(_CONTEXT_FLAGS.values())
+        now = current_epoch()
+
+        categories, lengths, short, indicators, flags = [], [], [], [], []
+        access_log, accessed, success_rates, created, historical = [], [], [], [], []
+
+        for memory in memories:
+            content = memory.get("memory", "")
+            metadata = memory.get("metadata") or {}
+
+            categories.append(category_index.get(metadata.get("category", "general"), len(category_index)))
+
+            if not content or len(content.strip()) < 10:
+                short.append(True)
+                lengths.append(0)
+                indicators.append([False] * len(indicator_names))
+            else:
+                short.append(False)
+                lengths.append(len(content))
+                found = self._indicator_keywords.present(content.lower())
+                indicators.append([indicator in found for indicator in indicator_names])
+
+            flags.append([bool(metadata.get(key)) for key in flag_keys])
+
+            access_count = metadata.get("access_count", 0)
+            access_log.append(math.log(access_count + 1) if access_count > 0 else 0.0)
+
+            last_accessed = metadata.get("last_accessed")
+            accessed.append(_last_accessed_epoch(last_accessed) if last_accessed else None)
+
+            success_rates.append(metadata.get("success_rate", 0.0))
+
+            created.append(memory_epoch(metadata) if metadata.get("created_at") else None)
+
+            historical_accuracy = metadata.get("historical_accuracy", 0.8)
+            feedback_scores = metadata.get("feedback_scores", [])
+            if feedback_scores:
+                historical.append((historical_accuracy + sum(feedback_scores) / len(feedback_scores)) / 2)
+            else:
+                historical.append(historical_accuracy)
+
+        accessed_ages = ages_from_epochs(accessed, now)
+        created_ages = ages_from_epochs(created, now)
+        count = len(categories)
+        return {
+            "categories": np.array(categories, dtype=np.intp),
+            "lengths": np.array(lengths, dtype=float),
+            "short": np.array(short, dtype=bool),
+            "indicators": np.array(indicators, dtype=bool).reshape(count, len(indicator_names)),
+            "flags": np.array(flags, dtype=bool).reshape(count, len(flag_keys)),
+            "access_log": np.array(access_log, dtype=float),
+            "recency": np.array([0.0 if math.isnan(age) else math.exp(-age / 86400) for age in accessed_ages.tolist()]),
+            "success_rates": np.array(success_rates, dtype=float),
+            "age_days": np.nan_to_num(created_ages // 86400),
+            "historical": np.array(historical, dtype=float),
+        }
+
+    def _score_features(self, features: Dict[str, np.ndarray], context: Dict[str, Any]) -> np.ndarray:
+        """
+        Combine batch features into confidence scores, adding terms in the order of the scalar path.
+        """
+        base_weights = np.array([*self.category_weights.values(), 0.80])
+        base_confidence = base_weights[features["categories"]]
+
+        # Content quality
+        lengths = features["lengths"]
+        content_quality = 0.7 + np.where((lengths >= 50) & (lengths <= 1000), 0.1, np.where(lengths > 1000, 0.05, 0.0))
+        for j, boost in enumerate(_QUALITY_INDICATOR_BOOSTS.values()):
+            content_quality = content_quality + np.where(features["indicators"][:, j], boost, 0.0)
+        content_quality = np.where(features["short"], 0.5, np.minimum(content_quality, 1.0))
+
+        # Context boost
+        context_boost = np.zeros(len(lengths))
+        for j, factor in enumerate(_CONTEXT_FLAGS):
+            context_boost = context_boost + np.where(features["flags"][:, j], self.context_factors[factor], 0.0)
+        if context.get("recent_activity", False):
+            context_boost = context_boost + self.context_factors["recent_activity"]
+        context_boost = np.minimum(context_boost, 0.5)
+
+        # Retrieval boost
+        retrieval_boost = np.minimum(features["access_log"] * 0.02, self.retrieval_factors["frequency_boost"])
+        retrieval_boost = retrieval_boost + features["recency"] * self.retrieval_factors["recency_boost"]
+        success_rates = features["success_rates"]
+        retrieval_boost = retrieval_boost + np.where(
+            success_rates > 0, success_rates * self.retrieval_factors["success_rate_boost"], 0.0
+        )
+        relevance_score = context.get("relevance_score", 0.0)
+        if relevance_score > 0:
+            retrieval_boost = retrieval_boost + relevance_score * self.retrieval_factors["relevance_boost"]
+        retrieval_boost = np.minimum(retrieval_boost, 0.4)
+
+        # Temporal relevance
+        age_days = features["age_days"]
+        temporal_factor = np.select(
+            [age_days <= 1, age_days <= 7, age_days <= 30, age_days <= 90], [1.0, 0.95, 0.9, 0.85], 0.8
+        )
+
+        return np.minimum(
+            (base_confidence + context_boost + retrieval_boost)
+            * temporal_factor
+            * features["historical"]
+            * content_quality,
+            1.0,
+        )
+
     def _calculate_base_confidence(self, metadata: Dict[str, Any]) -> float:
         """
         Calculate base confidence from memory category.
@@ -157,18 +373,9 @@ class EnhancedConfidenceScorer:
             quality_score += 0.05  # Diminishing returns for very long content
 
         # Specific content indicators
-        quality_indicators = {
-            "code_block": 0.15,  # Contains code
-            "file_path": 0.10,  # Contains file paths
-            "error_message": 0.12,  # Contains error messages
-            "solution_steps": 0.18,  # Contains solution steps
-            "configuration": 0.08,  # Contains configuration details
-            "performance_data": 0.12,  # Contains performance metrics
-        }
-
-        content_lower = content.lower()
-        for indicator, boost in quality_indicators.items():
-            if any(keyword in content_lower for keyword in self._get_indicator_keywords(indicator)):
+        found = self._indicator_keywords.present(content.lower())
+        for indicator, boost in _QUALITY_INDICATOR_BOOSTS.items():
+            if indicator in found:
                 quality_score += boost
 
         return min(quality_score, 1.0)
@@ -177,54 +384,7 @@ class EnhancedConfidenceScorer:
         """
         Get keywords for content quality indicators.
         """
-        keywords = {
-            "code_block": [
-                "def ",
-                "function",
-                "class ",
-                "import ",
-                "from ",
-                "{",
-                "}",
-                "()",
-                "[]",
-            ],
-            "file_path": [".py", ".js", ".ts", ".java", ".cpp", ".c", ".h", "/", "\\"],
-            "error_message": [
-                "error",
-                "exception",
-                "failed",
-                "crash",
-                "traceback",
-                "stack trace",
-            ],
-            "solution_steps": [
-                "step",
-                "first",
-                "then",
-                "next",
-                "finally",
-                "solution",
-                "fix",
-            ],
-            "configuration": [
-                "config",
-                "setting",
-                "parameter",
-                "option",
-                "environment",
-                "env",
-            ],
-            "performance_data": [
-                "ms",
-                "seconds",
-                "memory",
-                "cpu",
-                "benchmark",
-                "optimization",
-            ],
-        }
-        return keywords.get(indicator, [])
+        return list(_INDICATOR_KEYWORDS.get(indicator, []))
 
     def _calculate_context_boost(self, metadata: Dict[str, Any], context: Dict[str, Any]) -> float:
         """
@@ -301,8 +461,7 @@ class EnhancedConfidenceScorer:
         Calculate recency boost based on last access time.
         """
         try:
-            last_time = datetime.fromisoformat(last_accessed.replace("Z", "+00:00"))
-            time_diff = safe_datetime_diff(safe_datetime_now(last_time), last_time).total_seconds()
+            time_diff = current_epoch() - timestamp_to_epoch(last_accessed)
 
             # Exponential decay with half-life of 1 day
             decay_factor = math.exp(-time_diff / 86400)  # 86400 seconds in a day
@@ -318,24 +477,24 @@ class EnhancedConfidenceScorer:
         if not created_at:
             return 1.0
 
-        try:
-            datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            age_days = get_memory_age_days(created_at)
-
-            # Memories lose relevance over time, but level off
-            if age_days <= 1:
-                return 1.0
-            elif age_days <= 7:
-                return 0.95
-            elif age_days <= 30:
-                return 0.9
-            elif age_days <= 90:
-                return 0.85
-            else:
-                return 0.8
-        except Exception:
+        created_time = memory_epoch(metadata)
+        if created_time is None:
             return 1.0
 
+        age_days = (current_epoch() - created_time) // 86400
+
+        # Memories lose relevance over time, but level off
+        if age_days <= 1:
+            return 1.0
+        elif age_days <= 7:
+            return 0.95
+        elif age_days <= 30:
+            return 0.9
+        elif age_days <= 90:
+            return 0.85
+        else:
+            return 0.8
+
     def _calculate_historical_factor(self, metadata: Dict[str, Any]) -> float:
         """
         Calculate historical performance factor.
@@ -364,10 +523,8 @@ class EnhancedConfidenceScorer:
             }
         )
 
-        # Keep only recent history
-        if len(self.scoring_history) > 1000:
-            self.scoring_history = self.scoring_history[-1000:]
-
+        self.confidence_stats.add(confidence)
+        self.category_counts[metadata.get("category", "general")] += 1
         self.accuracy_metrics["total_scores"] += 1
 
     def _generate_explanation(self, confidence: float, metadata: Dict[str, Any], context: Dict[str, Any]) -> str:
@@ -435,11 +592,8 @@ class EnhancedConfidenceScorer:
         return {
             **self.accuracy_metrics,
             "accuracy": accuracy,
-            "avg_confidence": (
-                sum(h["confidence"] for h in self.scoring_history) / len(self.scoring_history)
-                if self.scoring_history
-                else 0.0
-            ),
+            "avg_confidence": self.confidence_stats.mean,
+            "confidence": self.confidence_stats.snapshot(),
             "category_distribution": self._get_category_distribution(),
         }
 
@@ -447,11 +601,7 @@ class EnhancedConfidenceScorer:
         """
         Get distribution of scores by category.
         """
-        distribution = {}
-        for record in self.scoring_history:
-            category = record["category"]
-            distribution[category] = distribution.get(category, 0) + 1
-        return distribution
+        return dict(self.category_counts)
 
     def adapt_scoring_parameters(self):
         """
@@ -483,6 +633,8 @@ class EnhancedConfidenceScorer:
             "false_negatives": 0,
         }
         self.scoring_history.clear()
+        self.confidence_stats.reset()
+        self.category_counts.clear()
         logger.info("Confidence scoring metrics reset")
 
 
@@ -540,6 +692,38 @@ class ContextAwareConfidenceScorer:
             "context_profile": context_profile,
         }
 
+    def score_batch(self, memories: List[Dict[str, Any]], context_type: str = "autonomous_coding") -> np.ndarray:
+        """
+        Context-adjusted confidence of many memories at once.
+
+        Each score equals the "context_adjusted_confidence" of `score_for_context(memory["memory"],
+        memory.get("metadata", {}), context_type)`; batch scores are not recorded in the scoring history.
+        """
+        features = self.base_scorer._batch_features(memories)
+        base_confidence = self.base_scorer._score_features(features, {})
+        profile = self.context_profiles.get(context_type, {})
+        flags = dict(zip(_CONTEXT_FLAGS.values(), features["flags"].T))
+
+        # Apply boosts
+        adjusted = base_confidence
+        for boost, flag in (
+            ("boost_code_context", "code_blocks"),
+            ("boost_error_solutions", "solution_related"),
+            ("boost_debug_context", "error_related"),
+            ("boost_file_references", "file_references"),
+        ):
+            if profile.get(boost):
+                adjusted = adjusted + np.where(flags[flag], profile[boost], 0.0)
+
+        # Apply penalties
+        if profile.get("penalize_uncertainty"):
+            adjusted = adjusted - np.where(base_confidence < 0.6, profile["penalize_uncertainty"], 0.0)
+
+        if profile.get("penalize_outdated"):
+            adjusted = adjusted - np.where(features["age_days"] > 30, profile["penalize_outdated"], 0.0)
+
+        return np.maximum(0.0, np.minimum(adjusted, 1.0))
+
     def _apply_context_adjustments(
         self, base_confidence: float, metadata: Dict[str, Any], profile: Dict[str, Any]
     ) -> float:
@@ -568,12 +752,8 @@ class ContextAwareConfidenceScorer:
         if profile.get("penalize_outdated"):
             created_at = metadata.get("created_at")
             if created_at:
-                try:
-                    datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    age_days = get_memory_age_days(created_at)
-                    if age_days > 30:
-                        adjusted -= profile["penalize_outdated"]
-                except Exception:
-                    pass
+                created_time = memory_epoch(metadata)
+                if created_time is not None and (current_epoch() - created_time) // 86400 > 30:
+                    adjusted -= profile["penalize_outdated"]
 
         return max(0.0, min(adjusted, 1.0))
@@ -5,16 +5,33 @@ This module provides advanced deduplication logic optimized for coding contexts.
 
 import hashlib
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 
 from mem0.configs.coding_config import CodingFactExtractor
-from mem0.memory.timezone_utils import safe_datetime_diff
+from mem0.memory.learning_state import StreamingStats, learning_limits
+from mem0.memory.near_duplicates import MinHashLSHIndex
+from mem0.memory.timezone_utils import parse_timestamp, safe_datetime_diff
 
 logger = logging.getLogger(__name__)
 
 
+class _FactFeatures:
+    """Comparison features of one text, computed once and reused for every pair it is part of."""
+
+    __slots__ = ("text", "words", "pattern_mask", "embedding")
+
+    def __init__(self, text: str, words: frozenset, pattern_mask: int, embedding: Optional[np.ndarray]):
+        self.text = text
+        self.words = words
+        self.pattern_mask = pattern_mask
+        self.embedding = embedding
+
+
 class EnhancedDeduplicator:
     """
     Enhanced deduplication system for autonomous AI memory storage.
@@ -89,9 +106,11 @@ class EnhancedDeduplicator:
             ],
         }
 
-        # Context-aware deduplication cache
-        self.dedup_cache = {}
+        # Context-aware deduplication cache: memory id -> _FactFeatures, least recently used evicted first
+        self.dedup_cache: "OrderedDict[str, _FactFeatures]" = OrderedDict()
+        self.dedup_cache_size = self.config.get("deduplication_cache_size") or 10000
         self.pattern_cache = {}
+        self._compile_semantic_patterns()
 
         logger.info("Enhanced deduplicator initialized")
 
@@ -100,6 +119,8 @@ class EnhancedDeduplicator:
         new_fact: str,
         existing_memories: List[Dict[str, Any]],
         metadata: Dict[str, Any],
+        embedding: Optional[Sequence[float]] = None,
+        candidate_embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
     ) -> Tuple[bool, Optional[str], float]:
         """
         Determine if a new fact should be deduplicated against existing memories.
@@ -108,6 +129,9 @@ class EnhancedDeduplicator:
             new_fact: The new fact to check
             existing_memories: List of existing memories to compare against
             metadata: Metadata for the new fact
+            embedding: Embedding of the new fact, if the caller already has it
+            candidate_embeddings: Embeddings of `existing_memories`, in order; None entries fall back to the
+                embedding cached for the memory id, then to word overlap
 
         Returns:
             Tuple of (should_deduplicate, duplicate_id, similarity_score)
@@ -120,14 +144,10 @@ class EnhancedDeduplicator:
         threshold = self.similarity_thresholds.get(category, 0.85)
 
         # Apply context-aware deduplication
-        for memory in existing_memories:
-            similarity = self._calculate_enhanced_similarity(
-                new_fact,
-                memory.get("memory", memory.get("text", "")),
-                metadata,
-                memory.get("metadata", {}),
-            )
-
+        similarities = self._calculate_enhanced_similarities(
+            new_fact, existing_memories, metadata, embedding, candidate_embeddings
+        )
+        for memory, similarity in zip(existing_memories, similarities.tolist()):
             if similarity >= threshold:
                 # Check if this is a meaningful duplicate
                 if self._is_meaningful_duplicate(new_fact, memory, metadata, similarity):
@@ -135,6 +155,115 @@ class EnhancedDeduplicator:
 
         return False, None, 0.0
 
+    def remember(self, memory_id: str, text: str, embedding: Optional[Sequence[float]] = None):
+        """Cache the features of a stored memory, so later comparisons against it can use its embedding."""
+        self._cache_features(memory_id, self._features(text, embedding))
+
+    def _calculate_enhanced_similarities(
+        self,
+        new_fact: str,
+        existing_memories: List[Dict[str, Any]],
+        metadata: Dict[str, Any],
+        embedding: Optional[Sequence[float]] = None,
+        candidate_embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    ) -> np.ndarray:
+        """
+        Enhanced similarity of a new fact to every existing memory, combined as in `_calculate_enhanced_similarity`.
+        """
+        new_features = self._features(new_fact, embedding)
+        candidates = [
+            self._memory_features(memory, candidate_embeddings[i] if candidate_embeddings is not None else None)
+            for i, memory in enumerate(existing_memories)
+        ]
+
+        scores = [memory.get("score") for memory in existing_memories]
+        base_similarity = self._base_similarities(new_features, candidates, scores)
+        context_boost = np.array(
+            [self._calculate_context_similarity(metadata, memory.get("metadata", {})) for memory in existing_memories]
+        )
+        semantic_boost = np.minimum(
+            np.array([bin(new_features.pattern_mask & c.pattern_mask).count("1") * 0.25 for c in candidates]), 1.0
+        )
+        temporal_factor = np.array(
+            [self._calculate_temporal_factor(metadata, memory.get("metadata", {})) for memory in existing_memories]
+        )
+
+        return np.minimum((base_similarity * 0.6 + context_boost * 0.2 + semantic_boost * 0.2) * temporal_factor, 1.0)
+
+    def _base_similarities(
+        self,
+        new_features: _FactFeatures,
+        candidates: List[_FactFeatures],
+        scores: Optional[Sequence[Optional[float]]] = None,
+    ) -> np.ndarray:
+        """
+        Cosine similarity of embeddings, computed as one matrix-vector product for all candidates that have one.
+        Candidates without an embedding use their vector search `scores` instead, so every candidate is compared on
+        the same scale; word overlap is only the fallback for candidates that have neither.
+        """
+        similarities = np.array(
+            [
+                min(max(float(score), 0.0), 1.0) if score is not None else self._jaccard(new_features.words, c.words)
+                for c, score in zip(candidates, scores if scores is not None else [None] * len(candidates))
+            ],
+            dtype=np.float64,
+        )
+        if new_features.embedding is None:
+            return similarities
+        embedded = [i for i, c in enumerate(candidates) if c.embedding is not None]
+        if embedded:
+            matrix = np.stack([candidates[i].embedding for i in embedded])
+            similarities[embedded] = np.clip(matrix @ new_features.embedding, 0.0, 1.0)
+        return similarities
+
+    def _memory_features(self, memory: Dict[str, Any], embedding: Optional[Sequence[float]]) -> _FactFeatures:
+        text = memory.get("memory", memory.get("text", ""))
+        memory_id = memory.get("id")
+        cached = self.dedup_cache.get(memory_id) if memory_id is not None else None
+        if cached is not None and cached.text == text:
+            self.dedup_cache.move_to_end(memory_id)
+            if embedding is None or cached.embedding is not None:
+                return cached
+        features = self._features(text, embedding)
+        if memory_id is not None:
+            self._cache_features(memory_id, features)
+        return features
+
+    def _cache_features(self, memory_id: str, features: _FactFeatures):
+        self.dedup_cache[memory_id] = features
+        self.dedup_cache.move_to_end(memory_id)
+        while len(self.dedup_cache) > self.dedup_cache_size:
+            self.dedup_cache.popitem(last=False)
+
+    def _features(self, text: str, embedding: Optional[Sequence[float]] = None) -> _FactFeatures:
+        lowered = text.lower()
+        normalized = None
+        if embedding is not None:
+            normalized = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(normalized)
+            normalized = normalized / norm if norm else None
+        return _FactFeatures(text, frozenset(lowered.split()), self._pattern_mask(lowered), normalized)
+
+    def _compile_semantic_patterns(self):
+        """Compile each semantic pattern group into one regex; a text's groups become bits of a mask."""
+        self._semantic_regexes = [
+            re.compile("|".join(re.escape(pattern) for pattern in patterns))
+            for patterns in self.semantic_patterns.values()
+        ]
+
+    def _pattern_mask(self, lowered_text: str) -> int:
+        mask = 0
+        for bit, regex in enumerate(self._semantic_regexes):
+            if regex.search(lowered_text):
+                mask |= 1 << bit
+        return mask
+
+    @staticmethod
+    def _jaccard(words1: frozenset, words2: frozenset) -> float:
+        if not words1 or not words2:
+            return 0.0
+        return len(words1 & words2) / len(words1 | words2)
+
     def _calculate_enhanced_similarity(
         self,
         fact1: str,
@@ -145,7 +274,7 @@ class EnhancedDeduplicator:
         """
         Calculate enhanced similarity between two facts using multiple methods.
         """
-        # Base similarity (would normally use vector embeddings)
+        # Base similarity (word overlap; `should_deduplicate` uses embeddings when they are available)
         base_similarity = self._calculate_text_similarity(fact1, fact2)
 
         # Context-aware adjustments
@@ -164,20 +293,9 @@ class EnhancedDeduplicator:
 
     def _calculate_text_similarity(self, text1: str, text2: str) -> float:
         """
-        Calculate basic text similarity (simplified version).
-        In production, this would use actual vector embeddings.
+        Calculate basic text similarity as the Jaccard overlap of the word sets.
         """
-        # Simple Jaccard similarity for demonstration
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-
-        return len(intersection) / len(union) if union else 0.0
+        return self._jaccard(frozenset(text1.lower().split()), frozenset(text2.lower().split()))
 
     def _calculate_context_similarity(self, metadata1: Dict[str, Any], metadata2: Dict[str, Any]) -> float:
         """
@@ -211,23 +329,10 @@ class EnhancedDeduplicator:
 
     def _calculate_semantic_similarity(self, fact1: str, fact2: str) -> float:
         """
-        Calculate semantic similarity using pattern matching.
+        Calculate semantic similarity using pattern matching: 0.25 per pattern group found in both facts.
         """
-        fact1_lower = fact1.lower()
-        fact2_lower = fact2.lower()
-
-        semantic_score = 0.0
-
-        # Check for semantic patterns
-        for pattern_type, patterns in self.semantic_patterns.items():
-            count1 = sum(1 for pattern in patterns if pattern in fact1_lower)
-            count2 = sum(1 for pattern in patterns if pattern in fact2_lower)
-
-            if count1 > 0 and count2 > 0:
-                # Both facts contain patterns from the same category
-                semantic_score += 0.25
-
-        return min(semantic_score, 1.0)
+        shared = self._pattern_mask(fact1.lower()) & self._pattern_mask(fact2.lower())
+        return min(bin(shared).count("1") * 0.25, 1.0)
 
     def _calculate_temporal_factor(self, metadata1: Dict[str, Any], metadata2: Dict[str, Any]) -> float:
         """
@@ -242,8 +347,8 @@ class EnhancedDeduplicator:
 
         try:
             # Parse timestamps
-            time1 = datetime.fromisoformat(created1.replace("Z", "+00:00"))
-            time2 = datetime.fromisoformat(created2.replace("Z", "+00:00"))
+            time1 = parse_timestamp(created1)
+            time2 = parse_timestamp(created2)
 
             # Calculate time difference
             time_diff = abs(safe_datetime_diff(time1, time2).total_seconds())
@@ -423,6 +528,8 @@ class AutonomousDeduplicationManager:
         # Learning parameters
         self.learning_rate = 0.1
         self.adaptation_threshold = 10  # Number of evaluations before adapting
+        self.learning_limits = learning_limits(config)
+        self.similarity_stats = StreamingStats.from_limits(self.learning_limits)
 
         # Performance tracking
         self.performance_metrics = {
@@ -433,19 +540,153 @@ class AutonomousDeduplicationManager:
             "average_similarity": 0.0,
         }
 
+        # Near-duplicate indexes per (user_id, agent_id, run_id) scope, persisted when a directory is configured
+        self.near_duplicate_indexes: Dict[Tuple, MinHashLSHIndex] = {}
+        self.near_duplicate_index_dir = self.config.get("near_duplicate_index_dir")
+        self.near_duplicate_threshold = self.config.get("near_duplicate_threshold") or 0.9
+
+    @staticmethod
+    def scope_key(filters: Dict[str, Any]) -> Tuple:
+        """Key near-duplicate indexes by the session identifiers of `filters` or of a memory's metadata."""
+        return filters.get("user_id"), filters.get("agent_id"), filters.get("run_id")
+
+    def _index_path(self, scope: Tuple) -> Optional[str]:
+        if not self.near_duplicate_index_dir:
+            return None
+        digest = hashlib.sha1(repr(scope).encode("utf-8")).hexdigest()
+        return os.path.join(self.near_duplicate_index_dir, f"{digest}.npz")
+
+    def get_index(self, scope: Tuple) -> MinHashLSHIndex:
+        """The near-duplicate index of a scope, loaded from disk on first use when persisted."""
+        index = self.near_duplicate_indexes.get(scope)
+        if index is None:
+            path = self._index_path(scope)
+            if path and os.path.exists(path):
+                index = MinHashLSHIndex.load(path)
+            else:
+                index = MinHashLSHIndex()
+            self.near_duplicate_indexes[scope] = index
+        return index
+
+    def index_memory(self, memory_id: str, text: str, scope: Tuple, save: bool = True):
+        """
+        Add a stored memory to its scope's near-duplicate index at ingest time.
+
+        The index is written back to disk when persisted; batch callers pass `save=False` and call `save_indexes`
+        with the scopes they touched once the batch is indexed.
+        """
+        self.get_index(scope).insert(memory_id, text)
+        if save:
+            self.save_indexes([scope])
+
+    def remove_memory(self, memory_id: str, scope: Optional[Tuple] = None) -> List[Tuple]:
+        """
+        Drop a deleted memory from its scope's index, or from every loaded index; returns the scopes it was in.
+
+        Persisted indexes are only found through `scope`: a scope not loaded since the process started is loaded
+        from disk, cleaned and written back. Without it, only the indexes already in memory are cleaned.
+        """
+        scopes = [scope] if scope is not None else list(self.near_duplicate_indexes)
+        removed = []
+        for key in scopes:
+            index = self.get_index(key)
+            if memory_id in index:
+                index.remove(memory_id)
+                removed.append(key)
+        self.save_indexes(removed)
+        return removed
+
+    def save_indexes(self, scopes: Optional[List[Tuple]] = None):
+        """Write the loaded near-duplicate indexes of `scopes`, or all of them, to `near_duplicate_index_dir`."""
+        if not self.near_duplicate_index_dir:
+            return
+        for scope in self.near_duplicate_indexes if scopes is None else scopes:
+            index = self.near_duplicate_indexes.get(scope)
+            if index is not None:
+                index.save(self._index_path(scope))
+
+    def dedupe_scope(
+        self, memories: List[Dict[str, Any]], scope: Optional[Tuple] = None, similarity_threshold: float = 0.8
+    ) -> Dict[str, Any]:
+        """
+        Find the near-duplicate clusters among all memories of a scope.
+
+        The memories are re-indexed from scratch, bucketed with MinHash/LSH and verified with exact Jaccard
+        similarity inside buckets. In each cluster the first memory, in the given order, is kept.
+
+        Returns:
+            Dict with "clusters" (lists of memory ids) and "duplicate_ids" (every id but the first of each cluster)
+        """
+        index = MinHashLSHIndex()
+        for memory in memories:
+            index.insert(memory["id"], memory.get("memory", memory.get("text", "")))
+        clusters = [cluster for cluster in index.clusters(threshold=similarity_threshold) if len(cluster) > 1]
+
+        if scope is not None:
+            for duplicate_id in (memory_id for cluster in clusters for memory_id in cluster[1:]):
+                index.remove(duplicate_id)
+            self.near_duplicate_indexes[scope] = index
+            path = self._index_path(scope)
+            if path:
+                index.save(path)
+
+        return {
+            "clusters": clusters,
+            "duplicate_ids": [memory_id for cluster in clusters for memory_id in cluster[1:]],
+        }
+
+    def _find_near_duplicate(
+        self,
+        new_fact: str,
+        metadata: Dict[str, Any],
+        scope: Tuple,
+        memory_exists: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[Optional[str], float]:
+        """
+        Look up the scope's index for a stored memory that is a near-duplicate of `new_fact`.
+
+        The index can outlive memories deleted by another process. When `memory_exists` is given, a match is
+        confirmed with it first, and matches of memories that no longer exist are dropped from the index.
+        """
+        index = self.get_index(scope)
+        if not index:
+            return None, 0.0
+        for memory_id, similarity in index.query(new_fact, self.near_duplicate_threshold):
+            candidate = {"id": memory_id, "memory": index.text(memory_id), "metadata": {}}
+            if not self.deduplicator._is_meaningful_duplicate(new_fact, candidate, metadata, similarity):
+                continue
+            if memory_exists is not None and not memory_exists(memory_id):
+                logger.debug(f"Dropping deleted memory {memory_id} from the near-duplicate index")
+                self.remove_memory(memory_id, scope)
+                continue
+            return memory_id, similarity
+        return None, 0.0
+
     def process_memory(
         self,
         new_fact: str,
         existing_memories: List[Dict[str, Any]],
         metadata: Dict[str, Any],
+        embedding: Optional[Sequence[float]] = None,
+        candidate_embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
+        scope: Optional[Tuple] = None,
+        memory_exists: Optional[Callable[[str], bool]] = None,
     ) -> Dict[str, Any]:
         """
         Process a new memory for deduplication with autonomous adaptation.
+
+        When `scope` is given, memories of the scope's near-duplicate index are checked as well, so duplicates
+        the vector search did not return are still caught; `memory_exists` confirms that such a memory is still
+        stored before the new one is rejected as its duplicate.
         """
         # Check for deduplication
         should_dedup, duplicate_id, similarity = self.deduplicator.should_deduplicate(
-            new_fact, existing_memories, metadata
+            new_fact, existing_memories, metadata, embedding=embedding, candidate_embeddings=candidate_embeddings
         )
+        if not should_dedup and scope is not None:
+            near_duplicate_id, near_similarity = self._find_near_duplicate(new_fact, metadata, scope, memory_exists)
+            if near_duplicate_id is not None:
+                should_dedup, duplicate_id, similarity = True, near_duplicate_id, near_similarity
 
         # Update performance metrics
         self.performance_metrics["total_processed"] += 1
@@ -471,10 +712,8 @@ class AutonomousDeduplicationManager:
         self.total_evaluations += 1
 
         # Update average similarity
-        current_avg = self.performance_metrics["average_similarity"]
-        self.performance_metrics["average_similarity"] = (
-            current_avg * (self.total_evaluations - 1) + similarity
-        ) / self.total_evaluations
+        self.similarity_stats.add(similarity)
+        self.performance_metrics["average_similarity"] = self.similarity_stats.mean
 
         # Adapt thresholds periodically
         if self.total_evaluations % self.adaptation_threshold == 0:
@@ -547,6 +786,7 @@ class AutonomousDeduplicationManager:
                 "total_evaluations": self.total_evaluations,
                 "learning_rate": self.learning_rate,
             },
+            "similarity": self.similarity_stats.snapshot(),
             "deduplication_stats": self.deduplicator.get_deduplication_stats(),
         }
 
@@ -562,6 +802,7 @@ class AutonomousDeduplicationManager:
             "average_similarity": 0.0,
         }
         self.total_evaluations = 0
+        self.similarity_stats.reset()
         logger.info("Performance metrics reset")
 
 
@@ -592,11 +833,24 @@ def extract_key_features(fact: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def similarity_based_clustering(
-    memories: List[Dict[str, Any]], similarity_threshold: float = 0.8
+    memories: List[Dict[str, Any]], similarity_threshold: float = 0.8, exact_limit: int = 1000
 ) -> List[List[Dict[str, Any]]]:
     """
     Cluster memories based on similarity for batch deduplication.
+
+    Up to `exact_limit` memories are compared pairwise. Larger sets are bucketed with a MinHash/LSH index and only
+    memories sharing a bucket are compared.
     """
+    if len(memories) <= exact_limit:
+        return _pairwise_clustering(memories, similarity_threshold)
+
+    index = MinHashLSHIndex()
+    for i, memory in enumerate(memories):
+        index.insert(i, memory.get("memory", ""))
+    return [[memories[i] for i in cluster] for cluster in index.clusters(range(len(memories)), similarity_threshold)]
+
+
+def _pairwise_clustering(memories: List[Dict[str, Any]], similarity_threshold: float) -> List[List[Dict[str, Any]]]:
     clusters = []
     processed = set()
 
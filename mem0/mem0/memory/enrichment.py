@@ -0,0 +1,186 @@
+"""
+Optional offloading of the CPU-bound enrichment of memories to a process pool.
+
+Fact categorization, coding metadata extraction, semantic tagging and hierarchical categorization are regex-heavy and
+hold the GIL, so enriching an ingestion burst on the request thread stalls concurrent searches in the same process.
+With the "process" backend these steps run in worker processes instead; the "inline" backend runs them on the calling
+thread as before.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from mem0.configs.coding_config import CodingFactExtractor
+
+logger = logging.getLogger(__name__)
+
+ENRICHMENT_BACKENDS = ("inline", "process")
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_TIMEOUT = 30.0
+
+
+def _enrich_coding_facts(tables: Dict[str, Any], facts: Sequence[str]) -> List[tuple]:
+    return [
+        (CodingFactExtractor.categorize_coding_fact(fact), CodingFactExtractor.extract_coding_metadata(fact))
+        for fact in facts
+    ]
+
+
+def _tag_memories(tables: Dict[str, Any], items: Sequence[tuple]) -> List[Dict[str, Any]]:
+    tagger = tables["tagger"]
+    return [tagger._compute_tags(content, metadata, context) for content, metadata, context in items]
+
+
+def _categorize_memories(tables: Dict[str, Any], items: Sequence[tuple]) -> List[Dict[str, Any]]:
+    categorizer = tables["categorizer"]
+    return [categorizer._compute_categorization(content, metadata) for content, metadata, _context in items]
+
+
+# Enrichment steps by name; each takes the rule tables and a batch of items and returns one result per item
+_ENRICHERS: Dict[str, Callable[[Dict[str, Any], Sequence[Any]], List[Any]]] = {
+    "coding_facts": _enrich_coding_facts,
+    "tags": _tag_memories,
+    "categories": _categorize_memories,
+}
+
+# Rule tables of the current worker process, set once by the pool initializer
+_worker_tables: Dict[str, Any] = {}
+
+
+def _initialize_worker(tables: Dict[str, Any]):
+    _worker_tables.clear()
+    _worker_tables.update(tables)
+
+
+def _run_batch(kind: str, items: Sequence[Any]) -> List[Any]:
+    return _ENRICHERS[kind](_worker_tables, items)
+
+
+class EnrichmentExecutor:
+    """
+    Runs enrichment steps over batches of memories, inline or in a process pool.
+
+    The rule tables (a `SemanticTagger` or `HierarchicalCategorizer` with its compiled patterns) are pickled once per
+    worker by the pool initializer, so tasks only carry the memories; each task enriches up to `batch_size` of them.
+    When a table's `rules_version` changes, the pool is restarted so the workers pick up the new rules. Batches that
+    fail, or whose results are not back within `timeout` seconds of the call, are enriched inline instead.
+    """
+
+    def __init__(
+        self,
+        backend: str = "inline",
+        max_workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        **tables: Any,
+    ):
+        if backend not in ENRICHMENT_BACKENDS:
+            raise ValueError(f"Unsupported enrichment backend '{backend}', expected one of {ENRICHMENT_BACKENDS}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.backend = backend
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.tables = tables
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_versions: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self.stats = {"batches": 0, "remote_batches": 0, "fallbacks": 0, "pool_starts": 0}
+
+    def _rules_versions(self) -> tuple:
+        return tuple(getattr(table, "rules_version", 0) for table in self.tables.values())
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            versions = self._rules_versions()
+            if self._pool is not None and self._pool_versions != versions:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._pool is None:
+                # Forking a process with running threads can deadlock, so workers start from a clean interpreter
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_initialize_worker,
+                    initargs=(self.tables,),
+                )
+                self._pool_versions = versions
+                self.stats["pool_starts"] += 1
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def map(self, kind: str, items: Sequence[Any]) -> List[Any]:
+        """
+        Run an enrichment step over items, returning one result per item in order.
+
+        Args:
+            kind: "coding_facts" for facts, or "tags" / "categories" for (content, metadata, context) tuples
+            items: The items to enrich
+        """
+        enrich = _ENRICHERS[kind]
+        chunks = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        self.stats["batches"] += len(chunks)
+        if self.backend == "inline" or not chunks:
+            return enrich(self.tables, items)
+
+        try:
+            pool = self._get_pool()
+            futures = [pool.submit(_run_batch, kind, chunk) for chunk in chunks]
+        except Exception as e:
+            logger.warning(f"Enrichment pool unavailable, enriching inline: {e}")
+            self.stats["fallbacks"] += len(chunks)
+            return enrich(self.tables, items)
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        results = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                results.extend(future.result(timeout=remaining))
+                self.stats["remote_batches"] += 1
+            except Exception as e:
+                future.cancel()
+                if isinstance(e, BrokenProcessPool):
+                    self._discard_pool(pool)
+                logger.warning(f"Enrichment batch of {len(chunk)} failed in the worker pool, enriching inline: {e!r}")
+                self.stats["fallbacks"] += 1
+                results.extend(enrich(self.tables, chunk))
+        return results
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes; a later call to `map` starts new ones."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def create_enrichment_executor(config: Dict[str, Any], **tables: Any) -> EnrichmentExecutor:
+    """
+    Build an enrichment executor from a manager's config dict.
+
+    Args:
+        config: Manager config; `enrichment_backend`, `enrichment_workers`, `enrichment_batch_size` and
+            `enrichment_timeout` are used when set.
+        **tables: Rule tables the enrichment steps need, e.g. `tagger=` or `categorizer=`
+    """
+    return EnrichmentExecutor(
+        backend=config.get("enrichment_backend") or "inline",
+        max_workers=config.get("enrichment_workers"),
+        batch_size=config.get("enrichment_batch_size") or DEFAULT_BATCH_SIZE,
+        timeout=config.get("enrichment_timeout", DEFAULT_TIMEOUT),
+        **tables,
+    )
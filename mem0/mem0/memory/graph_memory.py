@@ -1,70 +1,104 @@
+import json
 import logging
 
-from mem0.memory.utils import format_entities
-
 try:
     from langchain_neo4j import Neo4jGraph
 except ImportError:
     raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
-from mem0.graphs.tools import (
-    DELETE_MEMORY_STRUCT_TOOL_GRAPH,
-    DELETE_MEMORY_TOOL_GRAPH,
-    EXTRACT_ENTITIES_STRUCT_TOOL,
-    EXTRACT_ENTITIES_TOOL,
-    RELATIONS_STRUCT_TOOL,
-    RELATIONS_TOOL,
-)
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.embeddings.configs import compacted_dims
+from mem0.graphs.bm25 import IncrementalBM25Index
+from mem0.graphs.extraction import GraphExtractionMixin
+from mem0.graphs.pagination import GraphPaginationMixin, build_page, build_summary, page_conditions
+from mem0.graphs.resolution import EntityResolutionCache, LexicalEntityResolver, scope_key
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+ENTITY_VECTOR_INDEX = "entity_embedding"
 
-class MemoryGraph:
-    def __init__(self, config):
+
+class MemoryGraph(GraphExtractionMixin, GraphPaginationMixin):
+    def __init__(self, config, embedding_model=None, llm=None):
         self.config = config
+        graph_config = self.config.graph_store.config
         self.graph = Neo4jGraph(
-            self.config.graph_store.config.url,
-            self.config.graph_store.config.username,
-            self.config.graph_store.config.password,
-            self.config.graph_store.config.database,
+            graph_config.url,
+            graph_config.username,
+            graph_config.password,
+            graph_config.database,
             refresh_schema=False,
-            driver_config={"notifications_min_severity": "OFF"},
-        )
-        self.embedding_model = EmbedderFactory.create(
-            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+            driver_config={"notifications_min_severity": "OFF", **self._driver_pool_config()},
         )
-        self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
+        self._setup_components(embedding_model, llm)
 
-        if self.config.graph_store.config.base_label:
-            # Safely add user_id index
-            try:
-                self.graph.query(f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)")
-            except Exception:
-                pass
-            try:  # Safely try to add composite index (Enterprise only)
-                self.graph.query(
-                    f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)"
-                )
+        for cypher in self._entity_index_queries():
+            try:  # Safely add indexes; composite ones are Enterprise only on older versions
+                self.graph.query(cypher)
             except Exception:
                 pass
 
+        self.vector_index_name = self._create_vector_index()
+
+    def _driver_pool_config(self):
+        """Connection pool settings shared by the sync and async drivers."""
+        graph_config = self.config.graph_store.config
+        pool_config = {}
+        for key in ("max_connection_pool_size", "connection_acquisition_timeout"):
+            value = getattr(graph_config, key, None)
+            if isinstance(value, (int, float)):
+                pool_config[key] = value
+        return pool_config
+
+    def _setup_components(self, embedding_model=None, llm=None):
+        """
+        Set up the embedder, LLM and in-process indexes that do not depend on the database connection.
+
+        `embedding_model` and `llm` are instances already built from the same config, e.g. by `Memory`; they are
+        reused instead of creating a second model and client.
+        """
+        graph_config = self.config.graph_store.config
+        self.embedding_model = embedding_model or EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+        )
+        self.node_label = ":`__Entity__`" if graph_config.base_label else ""
+        self.vector_index_candidates = getattr(graph_config, "vector_index_candidates", None) or 100
+        self.search_depth = getattr(graph_config, "search_depth", None) or 1
+        self.search_hop_limit = getattr(graph_config, "search_hop_limit", None)
+
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
             self.llm_provider = self.config.llm.provider
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.llm = llm or LlmFactory.create(self.llm_provider, self.config.llm.config)
         self.user_id = None
         self.threshold = 0.7
 
+        self.extraction_mode = getattr(self.config.graph_store, "extraction_mode", "multi_call")
+        self.search_entity_resolver = getattr(self.config.graph_store, "search_entity_resolver", "llm")
+        self.lexical_resolver = LexicalEntityResolver()
+        self.entity_cache = EntityResolutionCache()
+        self.bm25_index = IncrementalBM25Index()
+        self.rerank_top_n = getattr(self.config.graph_store, "rerank_top_n", 5)
+
+    def _entity_index_queries(self):
+        """
+        Property indexes on the base label: user_id, (name, user_id) where the edition supports it, and
+        (user_id, created), which pages of `get_page` seek into.
+        """
+        if not self.node_label:
+            return []
+        return [
+            f"CREATE INDEX entity_single IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id)",
+            f"CREATE INDEX entity_composite IF NOT EXISTS FOR (n {self.node_label}) ON (n.name, n.user_id)",
+            f"CREATE INDEX entity_page IF NOT EXISTS FOR (n {self.node_label}) ON (n.user_id, n.created)",
+        ]
+
+    def _query(self, cypher, params=None):
+        return self.graph.query(cypher, params=params)
+
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -73,12 +107,14 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
+        if self.extraction_mode == "single_call":
+            entity_type_map, to_be_added = self._extract_graph_from_data(data, filters)
+        else:
+            entity_type_map = self._retrieve_nodes_from_data(data, filters)
+            to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
         search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
         to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
-        # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters)
         added_entities = self._add_entities(to_be_added, filters, entity_type_map)
@@ -99,19 +135,29 @@ class MemoryGraph:
                 - "contexts": List of search results from the base data store.
                 - "entities": List of related graph data based on the query.
         """
-        entity_type_map = self._retrieve_nodes_from_data(query, filters)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+        if self.search_entity_resolver == "lexical":
+            node_list = self._resolve_query_entities(query, filters)
+        else:
+            node_list = list(self._retrieve_nodes_from_data(query, filters).keys())
+        search_output = self._search_graph_db(
+            node_list=node_list, filters=filters, depth=self.search_depth, hop_limit=self.search_hop_limit
+        )
 
         if not search_output:
             return []
 
+        if not self.bm25_index.is_loaded(scope_key(filters)):
+            self._load_bm25_index(filters)
+        return self._rerank(query, filters, search_output)
+
+    def _rerank(self, query, filters, search_output):
+        """Keep the `rerank_top_n` relations of `search_output` that best match the query under BM25."""
         search_outputs_sequence = [
-            [item["source"], item["relationship"], item["destination"]] for item in search_output
+            (item["source"], item["relationship"], item["destination"]) for item in search_output
         ]
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
+        reranked_results = self.bm25_index.top_n(
+            scope_key(filters), query, search_outputs_sequence, n=self.rerank_top_n
+        )
 
         search_results = []
         for item in reranked_results:
@@ -122,6 +168,10 @@ class MemoryGraph:
         return search_results
 
     def delete_all(self, filters):
+        self._query(*self._delete_all_query(filters))
+        self._invalidate_scope(filters)
+
+    def _delete_all_query(self, filters):
         if filters.get("agent_id"):
             cypher = f"""
             MATCH (n {self.node_label} {{user_id: $user_id, agent_id: $agent_id}})
@@ -134,7 +184,14 @@ class MemoryGraph:
             DETACH DELETE n
             """
             params = {"user_id": filters["user_id"]}
-        self.graph.query(cypher, params=params)
+        return cypher, params
+
+    def _invalidate_scope(self, filters):
+        """Drop the in-process state derived from the user's graph after its nodes were deleted."""
+        self.lexical_resolver.invalidate(scope_key(filters))
+        self.bm25_index.invalidate((filters["user_id"], None))
+        # Writes resolve names against every node of the user, so drop the cached resolutions of all its agents.
+        self.entity_cache.invalidate((filters["user_id"], None))
 
     def get_all(self, filters, limit=100):
         """
@@ -147,21 +204,7 @@ class MemoryGraph:
                 - 'contexts': The base data store response for each memory.
                 - 'entities': A list of strings representing the nodes and relationships
         """
-        params = {"user_id": filters["user_id"], "limit": limit}
-
-        # Build node properties based on filters
-        node_props = ["user_id: $user_id"]
-        if filters.get("agent_id"):
-            node_props.append("agent_id: $agent_id")
-            params["agent_id"] = filters["agent_id"]
-        node_props_str = ", ".join(node_props)
-
-        query = f"""
-        MATCH (n {self.node_label} {{{node_props_str}}})-[r]->(m {self.node_label} {{{node_props_str}}})
-        RETURN n.name AS source, type(r) AS relationship, m.name AS target
-        LIMIT $limit
-        """
-        results = self.graph.query(query, params=params)
+        results = self._query(*self._get_all_query(filters, limit))
 
         final_results = []
         for result in results:
@@ -177,221 +220,298 @@ class MemoryGraph:
 
         return final_results
 
-    def _retrieve_nodes_from_data(self, data, filters):
-        """Extracts all the entities mentioned in the query."""
-        _tools = [EXTRACT_ENTITIES_TOOL]
-        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
-            _tools = [EXTRACT_ENTITIES_STRUCT_TOOL]
-        search_results = self.llm.generate_response(
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are a smart assistant who understands entities and their types in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source entity. Extract all the entities from the text. ***DO NOT*** answer the question itself if the given text is a question.",
-                },
-                {"role": "user", "content": data},
-            ],
-            tools=_tools,
-        )
-
-        entity_type_map = {}
-
-        try:
-            for tool_call in search_results["tool_calls"]:
-                if tool_call["name"] != "extract_entities":
-                    continue
-                for item in tool_call["arguments"]["entities"]:
-                    entity_type_map[item["entity"]] = item["entity_type"]
-        except Exception as e:
-            logger.exception(
-                f"Error in search tool: {e}, llm_provider={self.llm_provider}, search_results={search_results}"
-            )
-
-        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
-        logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
-        return entity_type_map
-
-    def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
-        """Establish relations among the extracted nodes."""
+    def get_page(self, filters, page_size=100, page_token=None, relationship=None, entity=None):
+        """
+        Retrieves one page of relations, in a stable order, for streaming a whole graph.
 
-        # Compose user identification string for prompt
-        user_identity = f"user_id: {filters['user_id']}"
-        if filters.get("agent_id"):
-            user_identity += f", agent_id: {filters['agent_id']}"
-
-        if self.config.graph_store.custom_prompt:
-            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
-            # Add the custom prompt line if configured
-            system_content = system_content.replace("CUSTOM_PROMPT", f"4. {self.config.graph_store.custom_prompt}")
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": data},
-            ]
-        else:
-            system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
-            messages = [
-                {"role": "system", "content": system_content},
-                {"role": "user", "content": f"List of entities: {list(entity_type_map.keys())}. \n\nText: {data}"},
-            ]
-
-        _tools = [RELATIONS_TOOL]
-        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
-            _tools = [RELATIONS_STRUCT_TOOL]
-
-        extracted_entities = self.llm.generate_response(
-            messages=messages,
-            tools=_tools,
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            page_size (int): The maximum number of relations in the page. Defaults to 100.
+            page_token (str, optional): The "next_page_token" of the previous page.
+            relationship (str, optional): Only return relations of this type.
+            entity (str, optional): Only return relations whose source or target is this entity.
+        Returns:
+            dict: "results", the relations as in `get_all`, and "next_page_token", None on the last page.
+        """
+        return build_page(
+            self._query(*self._get_page_query(filters, page_size, page_token, relationship, entity)),
+            page_size,
+            encode_cursor=json.dumps,
         )
 
-        entities = []
-        if extracted_entities.get("tool_calls"):
-            entities = extracted_entities["tool_calls"][0].get("arguments", {}).get("entities", [])
-
-        entities = self._remove_spaces_from_entities(entities)
-        logger.debug(f"Extracted entities: {entities}")
-        return entities
+    def summarize(self, filters, top_k=10):
+        """
+        Summarizes the user's graph without transferring it.
 
-    def _search_graph_db(self, node_list, filters, limit=100):
-        """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
+        Returns:
+            dict: "relationships", the number of relations per type, and "top_entities", the `top_k` most
+                mentioned entities.
+        """
+        return build_summary(
+            self._query(*self._relationship_counts_query(filters)),
+            self._query(*self._top_entities_query(filters, top_k)),
+        )
 
-        # Build node properties for filtering
+    def _scope_props(self, filters):
+        """Node property map matching the user (and agent) of `filters`, with its parameters."""
+        params = {"user_id": filters["user_id"]}
         node_props = ["user_id: $user_id"]
         if filters.get("agent_id"):
             node_props.append("agent_id: $agent_id")
-        node_props_str = ", ".join(node_props)
-
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+            params["agent_id"] = filters["agent_id"]
+        return ", ".join(node_props), params
 
-            cypher_query = f"""
-            MATCH (n {self.node_label} {{{node_props_str}}})
-            WHERE n.embedding IS NOT NULL
-            WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
-            WHERE similarity >= $threshold
-            CALL {{
-                WITH n
-                MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
-                RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
-                UNION
-                WITH n
-                MATCH (n)<-[r]-(m {self.node_label} {{{node_props_str}}})
-                RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
-            }}
-            WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
-            RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
-            ORDER BY similarity DESC
-            LIMIT $limit
-            """
+    def _get_all_query(self, filters, limit):
+        node_props_str, params = self._scope_props(filters)
+        query = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})-[r]->(m {self.node_label} {{{node_props_str}}})
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target
+        LIMIT $limit
+        """
+        return query, {**params, "limit": limit}
 
-            params = {
-                "n_embedding": n_embedding,
-                "threshold": self.threshold,
-                "user_id": filters["user_id"],
-                "limit": limit,
-            }
-            if filters.get("agent_id"):
-                params["agent_id"] = filters["agent_id"]
+    def _get_page_query(self, filters, page_size, page_token, relationship, entity):
+        """
+        Keyset-paginated relations, ordered by the creation time and id of their source node, then their own id.
 
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+        Each page seeks the (user_id, created) index from the token's creation time, so it reads the relations
+        after the previous page instead of sorting the whole graph again; only source nodes created in the same
+        millisecond as the token's are filtered row by row. Without the base label there is no index to seek, and
+        every page scans the user's nodes. Nodes are written with `created`; nodes lacking it are not paged.
+        """
+        node_props_str, params = self._scope_props(filters)
+        conditions, page_params = page_conditions(None, None, relationship, entity)
+        if page_token is None:
+            conditions.insert(0, "n.created IS NOT NULL")
+        else:
+            created, node_id, relation_id = json.loads(page_token)
+            conditions.insert(0, "n.created >= $page_created")
+            conditions.append(
+                "(n.created > $page_created OR elementId(n) > $page_node"
+                " OR (elementId(n) = $page_node AND elementId(r) > $page_relation))"
+            )
+            page_params.update(page_created=created, page_node=node_id, page_relation=relation_id)
+        query = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})-[r]->(m {self.node_label} {{{node_props_str}}})
+        WHERE {" AND ".join(conditions)}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target,
+            [n.created, elementId(n), elementId(r)] AS cursor
+        ORDER BY n.created, elementId(n), elementId(r)
+        LIMIT $limit
+        """
+        return query, {**params, **page_params, "limit": page_size + 1}
 
-        return result_relations
+    def _relationship_counts_query(self, filters):
+        node_props_str, params = self._scope_props(filters)
+        query = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})-[r]->(m {self.node_label} {{{node_props_str}}})
+        RETURN type(r) AS relationship, count(r) AS count
+        ORDER BY count DESC, relationship
+        """
+        return query, params
 
-    def _get_delete_entities_from_search_output(self, search_output, data, filters):
-        """Get the entities to be deleted from the search output."""
-        search_output_string = format_entities(search_output)
+    def _top_entities_query(self, filters, top_k):
+        node_props_str, params = self._scope_props(filters)
+        query = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})
+        RETURN n.name AS name, coalesce(n.mentions, 0) AS mentions
+        ORDER BY mentions DESC, name
+        LIMIT $top_k
+        """
+        return query, {**params, "top_k": top_k}
+
+    def _resolve_query_entities(self, query, filters):
+        """Find the user's existing nodes mentioned in the query without calling the LLM."""
+        key = scope_key(filters)
+        if not self.lexical_resolver.is_loaded(key):
+            rows = self._query(*self._node_names_query(filters))
+            self.lexical_resolver.load(key, [row["name"] for row in rows])
+        return self.lexical_resolver.resolve(key, query)
+
+    def _node_names_query(self, filters):
+        node_props_str, params = self._scope_props(filters)
+        cypher = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})
+        RETURN DISTINCT n.name AS name
+        """
+        return cypher, params
 
-        # Compose user identification string for prompt
-        user_identity = f"user_id: {filters['user_id']}"
-        if filters.get("agent_id"):
-            user_identity += f", agent_id: {filters['agent_id']}"
-
-        system_prompt, user_prompt = get_delete_messages(search_output_string, data, user_identity)
-
-        _tools = [DELETE_MEMORY_TOOL_GRAPH]
-        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
-            _tools = [
-                DELETE_MEMORY_STRUCT_TOOL_GRAPH,
-            ]
-
-        memory_updates = self.llm.generate_response(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            tools=_tools,
+    def _load_bm25_index(self, filters):
+        """Index all relations of the user's graph to seed the BM25 corpus statistics."""
+        rows = self._query(*self._relations_query(filters))
+        self.bm25_index.load(
+            scope_key(filters), [(row["source"], row["relationship"], row["destination"]) for row in rows]
         )
 
-        to_be_deleted = []
-        for item in memory_updates.get("tool_calls", []):
-            if item.get("name") == "delete_graph_memory":
-                to_be_deleted.append(item.get("arguments"))
-        # Clean entities formatting
-        to_be_deleted = self._remove_spaces_from_entities(to_be_deleted)
-        logger.debug(f"Deleted relationships: {to_be_deleted}")
-        return to_be_deleted
+    def _relations_query(self, filters):
+        node_props_str, params = self._scope_props(filters)
+        cypher = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})-[r]->(m {self.node_label} {{{node_props_str}}})
+        RETURN n.name AS source, type(r) AS relationship, m.name AS destination
+        """
+        return cypher, params
 
-    def _delete_entities(self, to_be_deleted, filters):
-        """Delete the entities from the graph."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-        results = []
+    def _search_graph_db(self, node_list, filters, limit=100, depth=1, hop_limit=None):
+        """Search the relations around the nodes similar to any of `node_list`, in a single query.
 
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
+        All names are embedded in one batch. Seed nodes are matched for every embedding, and the relations up to
+        `depth` hops away are collected, deduplicated and ranked by the best similarity of the seed they were
+        reached from. At most `hop_limit` relations are kept per hop, and `limit` overall.
+        """
+        if not node_list:
+            return []
+        embeddings = self.embedding_model.embed_batch(list(node_list))
+        return self._query_similar_nodes(*self._search_graph_db_query(embeddings, filters, limit, depth, hop_limit))
 
-            # Build the agent filter for the query
+    def _search_graph_db_query(self, embeddings, filters, limit, depth, hop_limit):
+        """Build the neighbourhood search for `embeddings`; returns (build_query, params)."""
+        node_filter = "n.user_id = $user_id"
+        if filters.get("agent_id"):
+            node_filter += " AND n.agent_id = $agent_id"
+        path_filter = node_filter.replace("n.", "x.")
+
+        def build_query():
+            return f"""
+        UNWIND range(0, size($embeddings) - 1) AS i
+        CALL {{
+            WITH i
+            {self._similar_nodes_cypher("n", "$embeddings[i]", node_filter)}
+            WHERE similarity >= $threshold
+            RETURN n, similarity
+        }}
+        WITH n, max(similarity) AS similarity
+        MATCH p = (n)-[*1..{max(1, int(depth))}]-(m {self.node_label})
+        WHERE all(x IN nodes(p) WHERE {path_filter})
+        WITH last(relationships(p)) AS r, length(p) AS hop, similarity
+        WITH r, min(hop) AS hop, max(similarity) AS similarity
+        ORDER BY similarity DESC
+        WITH hop, collect({{r: r, similarity: similarity}})[..$hop_limit] AS edges
+        UNWIND edges AS edge
+        WITH edge.r AS r, edge.similarity AS similarity
+        WITH r, startNode(r) AS s, endNode(r) AS d, similarity
+        RETURN s.name AS source, elementId(s) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, d.name AS destination, elementId(d) AS destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        """
 
-            params = {
-                "source_name": source,
-                "dest_name": destination,
-                "user_id": user_id,
-            }
+        params = {
+            "embeddings": embeddings,
+            "threshold": self.threshold,
+            "user_id": filters["user_id"],
+            "limit": limit,
+            "hop_limit": hop_limit or limit,
+            "candidates": max(limit, self.vector_index_candidates),
+        }
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
 
-            if agent_id:
-                params["agent_id"] = agent_id
+        return build_query, params
 
-            # Build node properties for filtering
-            node_props = ["name: $source_name", "user_id: $user_id"]
-            dest_props = ["name: $dest_name", "user_id: $user_id"]
+    def _delete_entities(self, to_be_deleted, filters):
+        """Delete the entities from the graph, one UNWIND statement per relationship type in a single transaction."""
+        records = self._run_write_transaction(self._delete_entities_statements(to_be_deleted, filters))
+        results = self._collect_by_index(records, len(to_be_deleted))
+        self.bm25_index.remove(scope_key(filters), self._triples(results))
+        return results
 
-            if agent_id:
-                node_props.append("agent_id: $agent_id")
-                dest_props.append("agent_id: $agent_id")
+    def _delete_entities_statements(self, to_be_deleted, filters):
+        user_id = filters["user_id"]
+        agent_id = filters.get("agent_id", None)
 
-            node_props_str = ", ".join(node_props)
-            dest_props_str = ", ".join(dest_props)
+        params = {"user_id": user_id}
+        node_props = ["name: row.source_name", "user_id: $user_id"]
+        dest_props = ["name: row.dest_name", "user_id: $user_id"]
+        if agent_id:
+            params["agent_id"] = agent_id
+            node_props.append("agent_id: $agent_id")
+            dest_props.append("agent_id: $agent_id")
+        node_props_str = ", ".join(node_props)
+        dest_props_str = ", ".join(dest_props)
+
+        groups = {}
+        for idx, item in enumerate(to_be_deleted):
+            groups.setdefault(item["relationship"], []).append(
+                {"idx": idx, "source_name": item["source"], "dest_name": item["destination"]}
+            )
 
+        statements = []
+        for relationship, rows in groups.items():
             # Delete the specific relationship between nodes
             cypher = f"""
+            UNWIND $rows AS row
             MATCH (n {self.node_label} {{{node_props_str}}})
             -[r:{relationship}]->
             (m {self.node_label} {{{dest_props_str}}})
 
             DELETE r
             RETURN
+                row.idx AS idx,
                 n.name AS source,
                 m.name AS target,
                 type(r) AS relationship
             """
+            statements.append((cypher, {**params, "rows": rows}))
+        return statements
+
+    @staticmethod
+    def _triples(results):
+        return [
+            (record["source"], record["relationship"], record["target"]) for records in results for record in records
+        ]
 
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+    def _add_entities(self, to_be_added, filters, entity_type_map, prepared=None):
+        """Add the new entities to the graph. Merge the nodes if they already exist.
 
+        Names seen before in the same scope are served from the entity cache. The remaining names are embedded
+        in one batch and resolved to existing nodes with a single query, then relations are written with one UNWIND
+        statement per relationship type and node shape, in a single transaction.
+        """
+        resolved, embeddings, cached = prepared or self._prepare_entities(to_be_added, filters)
+        statements = self._add_entities_statements(to_be_added, filters, entity_type_map, resolved, embeddings)
+        records = self._run_write_transaction(statements)
+        results, stale = self._record_added_entities(to_be_added, filters, records, embeddings, cached)
+        if stale:
+            retried = self._add_entities([to_be_added[idx] for idx in stale], filters, entity_type_map)
+            for idx, result in zip(stale, retried):
+                results[idx] = result
+        self._index_added_entities(filters, embeddings, results)
         return results
 
-    def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
+    def _prepare_entities(self, to_be_added, filters):
+        """Resolve the names of `to_be_added` to existing nodes; returns (resolved ids, embeddings, cached names)."""
+        resolved, embeddings, cached, misses = self._lookup_entity_cache(to_be_added, filters)
+        if misses:
+            embeddings.update(zip(misses, self.embedding_model.embed_batch(misses)))
+            resolved.update(self._resolve_nodes({name: embeddings[name] for name in misses}, filters, threshold=0.9))
+        return resolved, embeddings, cached
+
+    def _lookup_entity_cache(self, to_be_added, filters):
+        cache_key = scope_key(filters)
+        resolved, embeddings, cached, misses = {}, {}, set(), []
+        names = []
+        for item in to_be_added:
+            names.extend([item["source"], item["destination"]])
+        for name in dict.fromkeys(names):
+            hit = self.entity_cache.get(cache_key, name)
+            if hit is None:
+                misses.append(name)
+            else:
+                resolved[name], embeddings[name] = hit
+                cached.add(name)
+        return resolved, embeddings, cached, misses
+
+    def _add_entities_statements(self, to_be_added, filters, entity_type_map, resolved, embeddings):
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
+
+        params = {"user_id": user_id}
+        if agent_id:
+            params["agent_id"] = agent_id
+
+        groups = {}
+        for idx, item in enumerate(to_be_added):
             source = item["source"]
             destination = item["destination"]
-            relationship = item["relationship"]
 
             # types
             source_type = entity_type_map.get(source, "__User__")
@@ -401,232 +521,263 @@ class MemoryGraph:
             destination_label = self.node_label if self.node_label else f":`{destination_type}`"
             destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
 
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=0.9)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=0.9)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                # Build destination MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    source.created = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-
-            else:
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET source.created = timestamp(),
-                            source.mentions = 1
-                            {source_extra_set}
-                ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET destination.created = timestamp(),
-                            destination.mentions = 1
-                            {destination_extra_set}
-                ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
-                WITH source, destination
-                MERGE (source)-[rel:{relationship}]->(destination)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN source.name AS source, type(rel) AS relationship, destination.name AS target
-                """
-
-                params = {
+            key = (
+                item["relationship"],
+                source in resolved,
+                destination in resolved,
+                source_label,
+                source_extra_set,
+                destination_label,
+                destination_extra_set,
+            )
+            groups.setdefault(key, []).append(
+                {
+                    "idx": idx,
                     "source_name": source,
+                    "source_id": resolved.get(source),
+                    "source_embedding": embeddings[source],
                     "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
+                    "dest_id": resolved.get(destination),
+                    "dest_embedding": embeddings[destination],
                 }
-                if agent_id:
-                    params["agent_id"] = agent_id
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
-        return results
+            )
 
-    def _remove_spaces_from_entities(self, entity_list):
-        for item in entity_list:
-            item["source"] = item["source"].lower().replace(" ", "_")
-            item["relationship"] = item["relationship"].lower().replace(" ", "_")
-            item["destination"] = item["destination"].lower().replace(" ", "_")
-        return entity_list
+        return [
+            (self._add_entities_cypher(*key, agent_id=agent_id), {**params, "rows": rows})
+            for key, rows in groups.items()
+        ]
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
-        cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE source_candidate.embedding IS NOT NULL
-            AND source_candidate.user_id = $user_id
+    def _record_added_entities(self, to_be_added, filters, records, embeddings, cached):
+        """Cache the nodes the write resolved to and regroup its records; returns (results, stale indexes)."""
+        cache_key = scope_key(filters)
+        for record in records:
+            item = to_be_added[record["idx"]]
+            self.entity_cache.put(cache_key, item["source"], record.pop("source_id"), embeddings[item["source"]])
+            self.entity_cache.put(
+                cache_key, item["destination"], record.pop("destination_id"), embeddings[item["destination"]]
+            )
+        results = self._collect_by_index(records, len(to_be_added))
+
+        # A cached node may have been deleted behind our back, in which case its MATCH wrote nothing. Forget the
+        # stale names so that those relations are written again through a fresh resolution.
+        stale = [
+            idx
+            for idx, item in enumerate(to_be_added)
+            if not results[idx] and (item["source"] in cached or item["destination"] in cached)
+        ]
+        if stale:
+            logger.debug(f"Entity cache had {len(stale)} stale relation(s), resolving again")
+            self.entity_cache.discard(cache_key, cached)
+        return results, stale
+
+    def _index_added_entities(self, filters, embeddings, results):
+        cache_key = scope_key(filters)
+        self.lexical_resolver.add(cache_key, embeddings.keys())
+        self.bm25_index.add(cache_key, self._triples(results))
+
+    def _add_entities_cypher(
+        self,
+        relationship,
+        source_exists,
+        destination_exists,
+        source_label,
+        source_extra_set,
+        destination_label,
+        destination_extra_set,
+        agent_id=None,
+    ):
+        """Build the UNWIND statement writing one group of relations that share type and node resolution."""
+        agent_prop = ", agent_id: $agent_id" if agent_id else ""
+        # Cached element ids can outlive their node, and Neo4j reuses ids after deletes; a cached MATCH must never
+        # land on another user's node. A mismatch writes nothing and goes through the stale-entry retry.
+        source_scope = "source.user_id = $user_id" + (" AND source.agent_id = $agent_id" if agent_id else "")
+        destination_scope = "destination.user_id = $user_id" + (
+            " AND destination.agent_id = $agent_id" if agent_id else ""
+        )
 
+        if source_exists:
+            source_clause = f"""
+            MATCH (source)
+            WHERE elementId(source) = row.source_id AND {source_scope}
+            SET source.mentions = coalesce(source.mentions, 0) + 1
+            """
+        else:
+            source_clause = f"""
+            MERGE (source {source_label} {{name: row.source_name, user_id: $user_id{agent_prop}}})
+            ON CREATE SET source.created = timestamp(),
+                        source.mentions = 1
+                        {source_extra_set}
+            ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
+            WITH row, source
+            CALL db.create.setNodeVectorProperty(source, 'embedding', row.source_embedding)
+            """
+
+        if destination_exists:
+            destination_clause = f"""
+            MATCH (destination)
+            WHERE elementId(destination) = row.dest_id AND {destination_scope}
+            SET destination.mentions = coalesce(destination.mentions, 0) + 1
+            """
+        else:
+            destination_clause = f"""
+            MERGE (destination {destination_label} {{name: row.dest_name, user_id: $user_id{agent_prop}}})
+            ON CREATE SET destination.created = timestamp(),
+                        destination.mentions = 1
+                        {destination_extra_set}
+            ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
+            WITH row, source, destination
+            CALL db.create.setNodeVectorProperty(destination, 'embedding', row.dest_embedding)
+            """
+
+        if source_exists and destination_exists:
+            on_create = "r.created_at = timestamp(), r.updated_at = timestamp(), r.mentions = 1"
+        else:
+            on_create = "r.created = timestamp(), r.mentions = 1"
+
+        return f"""
+            UNWIND $rows AS row
+            {source_clause}
+            WITH row, source
+            {destination_clause}
+            WITH row, source, destination
+            MERGE (source)-[r:{relationship}]->(destination)
+            ON CREATE SET {on_create}
+            ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
+            RETURN
+                row.idx AS idx,
+                source.name AS source,
+                type(r) AS relationship,
+                destination.name AS target,
+                elementId(source) AS source_id,
+                elementId(destination) AS destination_id
+            """
 
-            WITH source_candidate,
-            round(2 * vector.similarity.cosine(source_candidate.embedding, $source_embedding) - 1, 4) AS source_similarity // denormalize for backward compatibility
-            WHERE source_similarity >= $threshold
+    def _resolve_nodes(self, embeddings, filters, threshold=0.9):
+        """Map each entity name to the elementId of its most similar existing node, in a single query."""
+        if not embeddings:
+            return {}
+        results = self._query_similar_nodes(*self._resolve_nodes_query(embeddings, filters, threshold))
+        return {row["name"]: row["element_id"] for row in results}
 
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
+    def _resolve_nodes_query(self, embeddings, filters, threshold):
+        # Candidates are scoped like the elementId MATCH that writes to them, so a resolved node is always writable
+        candidate_filter = "candidate.user_id = $user_id"
+        if filters.get("agent_id"):
+            candidate_filter += " AND candidate.agent_id = $agent_id"
 
-            RETURN elementId(source_candidate)
+        def build_query():
+            return f"""
+            UNWIND $rows AS row
+            CALL {{
+                WITH row
+                {self._similar_nodes_cypher("candidate", "row.embedding", candidate_filter)}
+                WHERE similarity >= $threshold
+                WITH candidate, similarity
+                ORDER BY similarity DESC
+                LIMIT 1
+                RETURN elementId(candidate) AS element_id
+            }}
+            RETURN row.name AS name, element_id
             """
 
         params = {
-            "source_embedding": source_embedding,
+            "rows": [{"name": name, "embedding": embedding} for name, embedding in embeddings.items()],
             "user_id": filters["user_id"],
             "threshold": threshold,
+            "candidates": self.vector_index_candidates,
         }
         if filters.get("agent_id"):
             params["agent_id"] = filters["agent_id"]
+        return build_query, params
 
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
-        cypher = f"""
-            MATCH (destination_candidate {self.node_label})
-            WHERE destination_candidate.embedding IS NOT NULL
-            AND destination_candidate.user_id = $user_id
-
-
-            WITH destination_candidate,
-            round(2 * vector.similarity.cosine(destination_candidate.embedding, $destination_embedding) - 1, 4) AS destination_similarity // denormalize for backward compatibility
+    def _run_write_transaction(self, statements):
+        """Run (cypher, params) statements in a single write transaction and return their records."""
+        if not statements:
+            return []
 
-            WHERE destination_similarity >= $threshold
+        def work(tx):
+            records = []
+            for cypher, params in statements:
+                records.extend(tx.run(cypher, params).data())
+            return records
+
+        with self.graph._driver.session(database=self.graph._database) as session:
+            return session.execute_write(work)
+
+    @staticmethod
+    def _collect_by_index(records, size):
+        """Regroup records tagged with `idx` into one result list per input relation."""
+        results = [[] for _ in range(size)]
+        for record in records:
+            idx = record.pop("idx")
+            results[idx].append(record)
+        return results
 
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
+    def _create_vector_index(self):
+        """Create the native vector index on entity embeddings. Returns its name, or None if unavailable."""
+        embedding_dims = self._vector_index_dims()
+        if not embedding_dims:
+            return None
 
-            RETURN elementId(destination_candidate)
+        try:
+            self.graph.query(self._vector_index_query(embedding_dims))
+        except Exception as e:
+            logger.warning(f"Could not create vector index {ENTITY_VECTOR_INDEX}, falling back to full scans: {e}")
+            return None
+        return ENTITY_VECTOR_INDEX
+
+    def _vector_index_dims(self):
+        """Dimensions of the entity vector index, or None when the index is disabled or cannot be sized."""
+        graph_config = self.config.graph_store.config
+        if not self.node_label or not getattr(graph_config, "vector_index", True):
+            return None
+
+        embedder_config = self.config.embedder.config or {}
+        embedding_dims = (
+            compacted_dims(self.config.embedder)
+            or embedder_config.get("embedding_dims")
+            or getattr(self.config.vector_store.config, "embedding_model_dims", None)
+        )
+        if not embedding_dims:
+            logger.info("Embedding dimensions unknown; graph similarity search will scan nodes.")
+        return embedding_dims
+
+    def _vector_index_query(self, embedding_dims):
+        return f"""
+            CREATE VECTOR INDEX {ENTITY_VECTOR_INDEX} IF NOT EXISTS
+            FOR (n {self.node_label}) ON (n.embedding)
+            OPTIONS {{indexConfig: {{
+                `vector.dimensions`: {int(embedding_dims)},
+                `vector.similarity_function`: 'cosine'
+            }}}}
             """
 
-        params = {
-            "destination_embedding": destination_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
+    def _similar_nodes_cypher(self, var, embedding, where):
+        """Cypher fragment binding `var` and its `similarity` to `embedding` for nodes satisfying `where`."""
+        if self.vector_index_name:
+            # Over-fetch from the index, then post-filter by user/agent.
+            return f"""
+            CALL db.index.vector.queryNodes('{self.vector_index_name}', $candidates, {embedding})
+            YIELD node AS {var}, score
+            WITH {var}, score
+            WHERE {where}
+            WITH {var}, round(2 * score - 1, 4) AS similarity // denormalize for backward compatibility
+            """
+        return f"""
+            MATCH ({var} {self.node_label})
+            WHERE {var}.embedding IS NOT NULL AND {where}
+            WITH {var}, round(2 * vector.similarity.cosine({var}.embedding, {embedding}) - 1, 4) AS similarity // denormalize for backward compatibility
+            """
 
-        result = self.graph.query(cypher, params=params)
-        return result
+    def _query_similar_nodes(self, build_query, params):
+        """Run a similarity query, falling back to a full scan if the vector index cannot be queried."""
+        if self.vector_index_name:
+            try:
+                return self._query(build_query(), params)
+            except Exception as e:
+                logger.warning(f"Vector index query failed, falling back to full scans: {e}")
+                self.vector_index_name = None
+        return self._query(build_query(), params)
 
     # Reset is not defined in base.py
     def reset(self):
@@ -635,4 +786,10 @@ class MemoryGraph:
         cypher_query = """
         MATCH (n) DETACH DELETE n
         """
-        return self.graph.query(cypher_query)
+        self._reset_caches()
+        return self._query(cypher_query)
+
+    def _reset_caches(self):
+        self.lexical_resolver.invalidate()
+        self.entity_cache.invalidate()
+        self.bm25_index.invalidate()
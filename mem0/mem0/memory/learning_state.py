@@ -0,0 +1,127 @@
+"""
+Bounded state for the learning and statistics bookkeeping of long-lived managers.
+"""
+
+import itertools
+import math
+import random
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HISTORY_SIZE = 1000
+DEFAULT_RESERVOIR_SIZE = 100
+DEFAULT_EWMA_ALPHA = 0.1
+
+
+class RingBuffer(deque):
+    """
+    A deque that keeps the last `maxlen` records and supports slicing, so it can stand in for a trimmed list.
+
+    Appending to a full buffer drops the oldest record in O(1) instead of copying the list.
+    """
+
+    def __init__(self, iterable=(), maxlen: Optional[int] = DEFAULT_HISTORY_SIZE):
+        super().__init__(iterable, maxlen)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                if start >= len(self) // 2:
+                    # Walk from the right for tail slices such as [-10:]
+                    tail = list(itertools.islice(reversed(self), len(self) - stop, len(self) - start))
+                    return tail[::-1]
+                return list(itertools.islice(self, start, stop))
+            return list(self)[index]
+        return super().__getitem__(index)
+
+
+class StreamingStats:
+    """
+    Aggregates of a stream of numbers in constant memory: count, sum, mean, variance, min, max, an exponentially
+    weighted moving average and a uniform reservoir sample.
+
+    Every update and every read is O(1), except `snapshot`, which copies the reservoir.
+    """
+
+    def __init__(
+        self,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        seed: Optional[int] = None,
+    ):
+        if not 0.0 < ewma_alpha <= 1.0:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        self.ewma_alpha = ewma_alpha
+        self.reservoir_size = reservoir_size
+        self._random = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.ewma: Optional[float] = None
+        self.reservoir: List[float] = []
+
+    def add(self, value: float):
+        value = float(value)
+        self.count += 1
+        self.total += value
+        # Welford's update keeps the variance numerically stable
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.ewma = value if self.ewma is None else self.ewma + self.ewma_alpha * (value - self.ewma)
+
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.reservoir_size:
+                self.reservoir[slot] = value
+
+    @classmethod
+    def from_limits(cls, limits: Dict[str, Any]) -> "StreamingStats":
+        """Build from the dict returned by `learning_limits`."""
+        return cls(ewma_alpha=limits["ewma_alpha"], reservoir_size=limits["reservoir_size"])
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "ewma": self.ewma,
+            "sample": list(self.reservoir),
+        }
+
+
+def learning_limits(config: Dict[str, Any], history_size: int = DEFAULT_HISTORY_SIZE) -> Dict[str, Any]:
+    """
+    The memory budget of a manager's learning state, read from its config dict.
+
+    Args:
+        config: Manager config; `learning_history_size`, `learning_reservoir_size` and `learning_ewma_alpha` are used
+            when set.
+        history_size: Default capacity of the manager's history buffers.
+    """
+    return {
+        "history_size": config.get("learning_history_size") or history_size,
+        "reservoir_size": config.get("learning_reservoir_size") or DEFAULT_RESERVOIR_SIZE,
+        "ewma_alpha": config.get("learning_ewma_alpha") or DEFAULT_EWMA_ALPHA,
+    }
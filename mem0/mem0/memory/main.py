@@ -11,7 +11,6 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-import pytz
 from pydantic import ValidationError
 
 from mem0.configs.base import MemoryConfig, MemoryItem
@@ -24,14 +23,17 @@ from mem0.memory.base import MemoryBase
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
+from mem0.memory.timezone_utils import TIMESTAMP_PAYLOAD_KEYS, get_timezone, memory_epoch
 from mem0.memory.utils import (
+    aembed,
+    agenerate_response,
     get_fact_retrieval_messages,
     parse_messages,
     parse_vision_messages,
     process_telemetry_filters,
     remove_code_blocks,
 )
-from mem0.utils.factory import EmbedderFactory, LlmFactory, VectorStoreFactory
+from mem0.utils.factory import EmbedderFactory, GraphStoreFactory, LlmFactory, VectorStoreFactory
 
 
 def _build_filters_and_metadata(
@@ -124,9 +126,11 @@ class Memory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            self.config.embedder.coalescing,
+            self.config.embedder.compaction,
         )
         self.vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+            self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.cache
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
         self.db = SQLiteManager(self.config.history_db_path)
@@ -136,14 +140,12 @@ class Memory(MemoryBase):
         self.enable_graph = False
 
         if self.config.graph_store.config:
-            if self.config.graph_store.provider == "memgraph":
-                from mem0.memory.memgraph_memory import MemoryGraph
-            elif self.config.graph_store.provider == "neptune":
-                from mem0.graphs.neptune.main import MemoryGraph
-            else:
-                from mem0.memory.graph_memory import MemoryGraph
-
-            self.graph = MemoryGraph(self.config)
+            self.graph = GraphStoreFactory.create(
+                self.config.graph_store.provider,
+                self.config,
+                embedding_model=self.embedding_model,
+                llm=self.llm,
+            )
             self.enable_graph = True
         else:
             self.graph = None
@@ -484,7 +486,7 @@ class Memory(MemoryBase):
             "role",
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
         result_item = MemoryItem(
             id=memory.id,
@@ -572,7 +574,41 @@ class Memory(MemoryBase):
         else:
             return {"results": all_memories_result}
 
+    def iter_all(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10000,
+    ):
+        """
+        Yield the memories of a user, agent or run one at a time, formatted like the results of `get_all`.
+
+        Memories are formatted as they are consumed, so a caller that aggregates or selects from them (for example
+        `IntelligentStorageManager.optimize_storage_stream`) never holds the whole formatted set.
+
+        Args:
+            user_id (str, optional): user id
+            agent_id (str, optional): agent id
+            run_id (str, optional): run id
+            filters (dict, optional): Additional custom key-value filters to apply.
+            limit (int, optional): The maximum number of memories to yield. Defaults to 10000.
+        """
+        _, effective_filters = _build_filters_and_metadata(
+            user_id=user_id, agent_id=agent_id, run_id=run_id, input_filters=filters
+        )
+
+        if not any(key in effective_filters for key in ("user_id", "agent_id", "run_id")):
+            raise ValueError("At least one of 'user_id', 'agent_id', or 'run_id' must be specified.")
+
+        yield from self._iter_vector_store_memories(effective_filters, limit)
+
     def _get_all_from_vector_store(self, filters, limit):
+        return list(self._iter_vector_store_memories(filters, limit))
+
+    def _iter_vector_store_memories(self, filters, limit):
         memories_result = self.vector_store.list(filters=filters, limit=limit)
         actual_memories = (
             memories_result[0]
@@ -587,9 +623,8 @@ class Memory(MemoryBase):
             "actor_id",
             "role",
         ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
-        formatted_memories = []
         for mem in actual_memories:
             memory_item_dict = MemoryItem(
                 id=mem.id,
@@ -607,9 +642,7 @@ class Memory(MemoryBase):
             if additional_metadata:
                 memory_item_dict["metadata"] = additional_metadata
 
-            formatted_memories.append(memory_item_dict)
-
-        return formatted_memories
+            yield memory_item_dict
 
     def search(
         self,
@@ -699,7 +732,7 @@ class Memory(MemoryBase):
             "role",
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
         original_memories = []
         for mem in memories:
@@ -812,7 +845,9 @@ class Memory(MemoryBase):
         metadata = metadata or {}
         metadata["data"] = data
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        created_at = datetime.now(get_timezone("US/Pacific"))
+        metadata["created_at"] = created_at.isoformat()
+        metadata["created_at_epoch"] = created_at.timestamp()
 
         self.vector_store.insert(
             vectors=[embeddings],
@@ -885,7 +920,12 @@ class Memory(MemoryBase):
         new_metadata["data"] = data
         new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        created_at_epoch = memory_epoch(existing_memory.payload)
+        if created_at_epoch is not None:
+            new_metadata["created_at_epoch"] = created_at_epoch
+        updated_at = datetime.now(get_timezone("US/Pacific"))
+        new_metadata["updated_at"] = updated_at.isoformat()
+        new_metadata["updated_at_epoch"] = updated_at.timestamp()
 
         if "user_id" in existing_memory.payload:
             new_metadata["user_id"] = existing_memory.payload["user_id"]
@@ -961,7 +1001,7 @@ class Memory(MemoryBase):
             logger.warning("Vector store does not support reset. Skipping.")
             self.vector_store.delete_col()
             self.vector_store = VectorStoreFactory.create(
-                self.config.vector_store.provider, self.config.vector_store.config
+                self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.cache
             )
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
@@ -977,9 +1017,11 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            self.config.embedder.coalescing,
+            self.config.embedder.compaction,
         )
         self.vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+            self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.cache
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
         self.db = SQLiteManager(self.config.history_db_path)
@@ -989,9 +1031,13 @@ class AsyncMemory(MemoryBase):
         self.enable_graph = False
 
         if self.config.graph_store.config:
-            from mem0.memory.graph_memory import MemoryGraph
-
-            self.graph = MemoryGraph(self.config)
+            self.graph = GraphStoreFactory.create(
+                self.config.graph_store.provider,
+                self.config,
+                use_async=True,
+                embedding_model=self.embedding_model,
+                llm=self.llm,
+            )
             self.enable_graph = True
         else:
             self.graph = None
@@ -1136,7 +1182,7 @@ class AsyncMemory(MemoryBase):
                     per_msg_meta["actor_id"] = actor_name
 
                 msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
+                msg_embeddings = await aembed(self.embedding_model, msg_content, "add")
                 mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
 
                 returned_memories.append(
@@ -1157,8 +1203,8 @@ class AsyncMemory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
+        response = await agenerate_response(
+            self.llm,
             messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
             response_format={"type": "json_object"},
         )
@@ -1176,7 +1222,7 @@ class AsyncMemory(MemoryBase):
         new_message_embeddings = {}
 
         async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            embeddings = await aembed(self.embedding_model, new_mem_content, "add")
             new_message_embeddings[new_mem_content] = embeddings
             existing_mems = await asyncio.to_thread(
                 self.vector_store.search,
@@ -1207,8 +1253,8 @@ class AsyncMemory(MemoryBase):
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
             try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
+                response = await agenerate_response(
+                    self.llm,
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
                 )
@@ -1296,10 +1342,17 @@ class AsyncMemory(MemoryBase):
                 filters["user_id"] = "user"
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
-            added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            added_entities = await self._call_graph("add", data, filters)
 
         return added_entities
 
+    async def _call_graph(self, method, *args):
+        """Await a graph store method natively when it is async, otherwise run it in a worker thread."""
+        fn = getattr(self.graph, method)
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
     async def get(self, memory_id):
         """
         Retrieve a memory by ID asynchronously.
@@ -1323,7 +1376,7 @@ class AsyncMemory(MemoryBase):
             "role",
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
         result_item = MemoryItem(
             id=memory.id,
@@ -1386,22 +1439,15 @@ class AsyncMemory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
-
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
-
         if self.enable_graph:
+            all_memories_result, graph_entities_result = await asyncio.gather(
+                self._get_all_from_vector_store(effective_filters, limit),
+                self._call_graph("get_all", effective_filters, limit),
+            )
             return {"results": all_memories_result, "relations": graph_entities_result}
 
+        all_memories_result = await self._get_all_from_vector_store(effective_filters, limit)
+
         if self.api_version == "v1.0":
             warnings.warn(
                 "The current get_all API output format is deprecated. "
@@ -1429,7 +1475,7 @@ class AsyncMemory(MemoryBase):
             "actor_id",
             "role",
         ]
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
         formatted_memories = []
         for mem in actual_memories:
@@ -1506,10 +1552,7 @@ class AsyncMemory(MemoryBase):
 
         graph_task = None
         if self.enable_graph:
-            if hasattr(self.graph.search, "__await__"):  # Check if graph search is async
-                graph_task = asyncio.create_task(self.graph.search(query, effective_filters, limit))
-            else:
-                graph_task = asyncio.create_task(asyncio.to_thread(self.graph.search, query, effective_filters, limit))
+            graph_task = asyncio.create_task(self._call_graph("search", query, effective_filters, limit))
 
         if graph_task:
             original_memories, graph_entities = await asyncio.gather(vector_store_task, graph_task)
@@ -1533,7 +1576,7 @@ class AsyncMemory(MemoryBase):
             return {"results": original_memories}
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
+        embeddings = await aembed(self.embedding_model, query, "search")
         memories = await asyncio.to_thread(
             self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
         )
@@ -1546,7 +1589,7 @@ class AsyncMemory(MemoryBase):
             "role",
         ]
 
-        core_and_promoted_keys = {"data", "hash", "created_at", "updated_at", "id", *promoted_payload_keys}
+        core_and_promoted_keys = {"data", "hash", *TIMESTAMP_PAYLOAD_KEYS, "id", *promoted_payload_keys}
 
         original_memories = []
         for mem in memories:
@@ -1585,7 +1628,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await aembed(self.embedding_model, data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -1637,7 +1680,7 @@ class AsyncMemory(MemoryBase):
         logger.info(f"Deleted {len(memories[0])} memories")
 
         if self.enable_graph:
-            await asyncio.to_thread(self.graph.delete_all, filters)
+            await self._call_graph("delete_all", filters)
 
         return {"message": "Memories deleted successfully!"}
 
@@ -1659,13 +1702,15 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await aembed(self.embedding_model, data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
         metadata["data"] = data
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        created_at = datetime.now(get_timezone("US/Pacific"))
+        metadata["created_at"] = created_at.isoformat()
+        metadata["created_at_epoch"] = created_at.timestamp()
 
         await asyncio.to_thread(
             self.vector_store.insert,
@@ -1722,7 +1767,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await agenerate_response(self.llm, messages=parsed_messages)
         except Exception as e:
             logger.error(f"Error generating procedural memory summary: {e}")
             raise
@@ -1731,7 +1776,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await aembed(self.embedding_model, procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -1755,7 +1800,12 @@ class AsyncMemory(MemoryBase):
         new_metadata["data"] = data
         new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        created_at_epoch = memory_epoch(existing_memory.payload)
+        if created_at_epoch is not None:
+            new_metadata["created_at_epoch"] = created_at_epoch
+        updated_at = datetime.now(get_timezone("US/Pacific"))
+        new_metadata["updated_at"] = updated_at.isoformat()
+        new_metadata["updated_at_epoch"] = updated_at.timestamp()
 
         if "user_id" in existing_memory.payload:
             new_metadata["user_id"] = existing_memory.payload["user_id"]
@@ -1772,7 +1822,7 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await aembed(self.embedding_model, data, "update")
 
         await asyncio.to_thread(
             self.vector_store.update,
@@ -1838,7 +1888,7 @@ class AsyncMemory(MemoryBase):
         self.db = SQLiteManager(self.config.history_db_path)
 
         self.vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+            self.config.vector_store.provider, self.config.vector_store.config, self.config.vector_store.cache
         )
         capture_event("mem0.reset", self, {"sync_type": "async"})
 
@@ -12,6 +12,8 @@ try:
 except ImportError:
     raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
 
+from mem0.embeddings.configs import compacted_dims
+from mem0.graphs.pagination import GraphPaginationMixin, build_page, build_summary, page_conditions
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -26,15 +28,15 @@ from mem0.utils.factory import EmbedderFactory, LlmFactory
 logger = logging.getLogger(__name__)
 
 
-class MemoryGraph:
-    def __init__(self, config):
+class MemoryGraph(GraphPaginationMixin):
+    def __init__(self, config, embedding_model=None, llm=None):
         self.config = config
         self.graph = Memgraph(
             self.config.graph_store.config.url,
             self.config.graph_store.config.username,
             self.config.graph_store.config.password,
         )
-        self.embedding_model = EmbedderFactory.create(
+        self.embedding_model = embedding_model or EmbedderFactory.create(
             self.config.embedder.provider,
             self.config.embedder.config,
             {"enable_embeddings": True},
@@ -46,21 +48,71 @@ class MemoryGraph:
         if self.config.graph_store.llm:
             self.llm_provider = self.config.graph_store.llm.provider
 
-        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.llm = llm or LlmFactory.create(self.llm_provider, self.config.llm.config)
         self.user_id = None
         self.threshold = 0.7
 
+        graph_config = self.config.graph_store.config
+        self.vector_index_candidates = getattr(graph_config, "vector_index_candidates", None) or 100
+        self.vector_index_min_capacity = getattr(graph_config, "vector_index_capacity", None) or 1000
+        self.vector_index_capacity = 0
+        self.vector_index_size = 0
+
         # Setup Memgraph:
-        # 1. Create vector index (created Entity label on all nodes)
+        # 1. Create vector index (created Entity label on all nodes), sized to the existing nodes
         # 2. Create label property index for performance optimizations
-        embedding_dims = self.config.embedder.config["embedding_dims"]
-        create_vector_index_query = f"CREATE VECTOR INDEX memzero ON :Entity(embedding) WITH CONFIG {{'dimension': {embedding_dims}, 'capacity': 1000, 'metric': 'cos'}};"
-        self.graph.query(create_vector_index_query, params={})
+        self._ensure_vector_index()
         create_label_prop_index_query = "CREATE INDEX ON :Entity(user_id);"
         self.graph.query(create_label_prop_index_query, params={})
         create_label_index_query = "CREATE INDEX ON :Entity;"
         self.graph.query(create_label_index_query, params={})
 
+    def _vector_index_info(self):
+        """Return (capacity, size) of the memzero vector index, or None if it does not exist."""
+        try:
+            rows = self.graph.query(
+                "CALL vector_search.show_index_info() YIELD index_name, capacity, size "
+                "WITH index_name, capacity, size WHERE index_name = 'memzero' RETURN capacity, size;",
+                params={},
+            )
+        except Exception as e:
+            logger.debug(f"Could not read vector index info: {e}")
+            return None
+        return (rows[0]["capacity"], rows[0]["size"]) if rows else None
+
+    def _required_capacity(self, node_count):
+        """Capacity for `node_count` nodes with room to grow: the next power of two above twice the count."""
+        capacity = self.vector_index_min_capacity
+        while capacity < 2 * node_count:
+            capacity *= 2
+        return capacity
+
+    def _ensure_vector_index(self):
+        """Create the memzero vector index, or recreate it larger when the nodes are nearing its capacity."""
+        info = self._vector_index_info()
+        if info is None:
+            node_count = self.graph.query("MATCH (n:Entity) RETURN count(n) AS count;", params={})[0]["count"]
+        else:
+            node_count = info[1]
+        capacity = self._required_capacity(node_count)
+        if info is not None and info[0] >= capacity:
+            self.vector_index_capacity, self.vector_index_size = info
+            return
+
+        if info is not None:
+            logger.info(f"Growing vector index memzero from capacity {info[0]} to {capacity}")
+            self.graph.query("DROP VECTOR INDEX memzero;", params={})
+        embedding_dims = compacted_dims(self.config.embedder) or self.config.embedder.config["embedding_dims"]
+        create_vector_index_query = f"CREATE VECTOR INDEX memzero ON :Entity(embedding) WITH CONFIG {{'dimension': {embedding_dims}, 'capacity': {capacity}, 'metric': 'cos'}};"
+        self.graph.query(create_vector_index_query, params={})
+        self.vector_index_capacity, self.vector_index_size = capacity, node_count
+
+    def _record_new_nodes(self, count):
+        """Account for nodes that may have been created and grow the vector index once 90% full."""
+        self.vector_index_size += count
+        if self.vector_index_size >= 0.9 * self.vector_index_capacity:
+            self._ensure_vector_index()
+
     def add(self, data, filters):
         """
         Adds data to the graph.
@@ -179,6 +231,76 @@ class MemoryGraph:
 
         return final_results
 
+    def get_page(self, filters, page_size=100, page_token=None, relationship=None, entity=None):
+        """
+        Retrieves one page of relations, ordered by relationship id, for streaming a whole graph.
+
+        Memgraph cannot index relationship ids, so every page matches and sorts all of the user's relations before
+        skipping to the token; streaming N relations costs about N / page_size such scans.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+                Supports 'user_id' (required) and 'agent_id' (optional).
+            page_size (int): The maximum number of relations in the page. Defaults to 100.
+            page_token (str, optional): The "next_page_token" of the previous page.
+            relationship (str, optional): Only return relations of this type.
+            entity (str, optional): Only return relations whose source or target is this entity.
+        Returns:
+            dict: "results", the relations as in `get_all`, and "next_page_token", None on the last page.
+        """
+        node_props, params = self._scope_props(filters)
+        conditions, page_params = page_conditions("id(r)", page_token, relationship, entity, parse_token=int)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+        MATCH (n:Entity {{{node_props}}})-[r]->(m:Entity {{{node_props}}})
+        {where}
+        RETURN n.name AS source, type(r) AS relationship, m.name AS target, id(r) AS cursor
+        ORDER BY cursor
+        LIMIT $limit
+        """
+        rows = self.graph.query(query, params={**params, **page_params, "limit": page_size + 1})
+        return build_page(rows, page_size)
+
+    def summarize(self, filters, top_k=10):
+        """
+        Summarizes the user's graph without transferring it.
+
+        Memgraph nodes carry no mention counts, so entities are ranked by their number of relations.
+
+        Returns:
+            dict: "relationships", the number of relations per type, and "top_entities", the `top_k` most
+                connected entities.
+        """
+        node_props, params = self._scope_props(filters)
+        relationship_rows = self.graph.query(
+            f"""
+            MATCH (n:Entity {{{node_props}}})-[r]->(m:Entity {{{node_props}}})
+            RETURN type(r) AS relationship, count(r) AS count
+            ORDER BY count DESC, relationship
+            """,
+            params=params,
+        )
+        entity_rows = self.graph.query(
+            f"""
+            MATCH (n:Entity {{{node_props}}})
+            RETURN n.name AS name, coalesce(n.mentions, degree(n)) AS mentions
+            ORDER BY mentions DESC, name
+            LIMIT $top_k
+            """,
+            params={**params, "top_k": top_k},
+        )
+        return build_summary(relationship_rows, entity_rows)
+
+    @staticmethod
+    def _scope_props(filters):
+        """Node property map matching the user (and agent) of `filters`, with its parameters."""
+        params = {"user_id": filters["user_id"]}
+        node_props = ["user_id: $user_id"]
+        if filters.get("agent_id"):
+            node_props.append("agent_id: $agent_id")
+            params["agent_id"] = filters["agent_id"]
+        return ", ".join(node_props), params
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -254,70 +376,39 @@ class MemoryGraph:
         return entities
 
     def _search_graph_db(self, node_list, filters, limit=100):
-        """Search similar nodes among and their respective incoming and outgoing relations."""
+        """Search the vector index for nodes similar to `node_list` and return their incoming and outgoing relations."""
         result_relations = []
+        if not node_list:
+            return result_relations
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        seed_agent_filter = neighbour_agent_filter = ""
+        if filters.get("agent_id"):
+            seed_agent_filter = "AND n.agent_id = $agent_id"
+            neighbour_agent_filter = "AND m.agent_id = $agent_id"
+        cypher_query = f"""
+        CALL vector_search.search("memzero", $candidates, $n_embedding)
+        YIELD node, similarity
+        WITH node AS n, similarity
+        WHERE n.user_id = $user_id {seed_agent_filter}
+        AND similarity >= $threshold
+        MATCH (n)-[r]-(m:Entity)
+        WHERE m.user_id = $user_id {neighbour_agent_filter}
+        WITH startNode(r) AS source, r, endNode(r) AS destination, similarity
+        RETURN DISTINCT source.name AS source, id(source) AS source_id, type(r) AS relationship, id(r) AS relation_id, destination.name AS destination, id(destination) AS destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit;
+        """
 
-            # Build query based on whether agent_id is provided
+        for n_embedding in self.embedding_model.embed_batch(list(node_list)):
+            params = {
+                "n_embedding": n_embedding,
+                "candidates": self.vector_index_candidates,
+                "threshold": self.threshold,
+                "user_id": filters["user_id"],
+                "limit": limit,
+            }
             if filters.get("agent_id"):
-                cypher_query = """
-                MATCH (n:Entity {user_id: $user_id, agent_id: $agent_id})-[r]->(m:Entity {user_id: $user_id, agent_id: $agent_id})
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node1.name AS source, id(node1) AS source_id, type(r) AS relationship, id(r) AS relation_id, node2.name AS destination, id(node2) AS destination_id, similarity
-                UNION
-                MATCH (n:Entity {user_id: $user_id, agent_id: $agent_id})<-[r]-(m:Entity {user_id: $user_id, agent_id: $agent_id})
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node2.name AS source, id(node2) AS source_id, type(r) AS relationship, id(r) AS relation_id, node1.name AS destination, id(node1) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "agent_id": filters["agent_id"],
-                    "limit": limit,
-                }
-            else:
-                cypher_query = """
-                MATCH (n:Entity {user_id: $user_id})-[r]->(m:Entity {user_id: $user_id})
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node1.name AS source, id(node1) AS source_id, type(r) AS relationship, id(r) AS relation_id, node2.name AS destination, id(node2) AS destination_id, similarity
-                UNION
-                MATCH (n:Entity {user_id: $user_id})<-[r]-(m:Entity {user_id: $user_id})
-                WHERE n.embedding IS NOT NULL
-                WITH collect(n) AS nodes1, collect(m) AS nodes2, r
-                CALL node_similarity.cosine_pairwise("embedding", nodes1, nodes2)
-                YIELD node1, node2, similarity
-                WITH node1, node2, similarity, r
-                WHERE similarity >= $threshold
-                RETURN node2.name AS source, id(node2) AS source_id, type(r) AS relationship, id(r) AS relation_id, node1.name AS destination, id(node1) AS destination_id, similarity
-                ORDER BY similarity DESC
-                LIMIT $limit;
-                """
-                params = {
-                    "n_embedding": n_embedding,
-                    "threshold": self.threshold,
-                    "user_id": filters["user_id"],
-                    "limit": limit,
-                }
+                params["agent_id"] = filters["agent_id"]
 
             ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
@@ -523,6 +614,7 @@ class MemoryGraph:
 
             result = self.graph.query(cypher, params=params)
             results.append(result)
+            self._record_new_nodes(int(not source_node_search_result) + int(not destination_node_search_result))
         return results
 
     def _remove_spaces_from_entities(self, entity_list):
@@ -534,78 +626,40 @@ class MemoryGraph:
 
     def _search_source_node(self, source_embedding, filters, threshold=0.9):
         """Search for source nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
-
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding)
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id
-                AND source_candidate.agent_id = $agent_id
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $source_embedding)
-                YIELD distance, node, similarity
-                WITH node AS source_candidate, similarity
-                WHERE source_candidate.user_id = $user_id
-                AND similarity >= $threshold
-                RETURN id(source_candidate);
-                """
-            params = {
-                "source_embedding": source_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
-
-        result = self.graph.query(cypher, params=params)
-        return result
+        return self._search_similar_node(source_embedding, filters, "source_candidate", threshold)
 
     def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
         """Search for destination nodes with similar embeddings."""
-        user_id = filters["user_id"]
-        agent_id = filters.get("agent_id", None)
+        return self._search_similar_node(destination_embedding, filters, "destination_candidate", threshold)
 
-        if agent_id:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding)
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id
-                AND node.agent_id = $agent_id
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "agent_id": agent_id,
-                "threshold": threshold,
-            }
-        else:
-            cypher = """
-                CALL vector_search.search("memzero", 1, $destination_embedding)
-                YIELD distance, node, similarity
-                WITH node AS destination_candidate, similarity
-                WHERE node.user_id = $user_id
-                AND similarity >= $threshold
-                RETURN id(destination_candidate);
-                """
-            params = {
-                "destination_embedding": destination_embedding,
-                "user_id": user_id,
-                "threshold": threshold,
-            }
+    def _search_similar_node(self, embedding, filters, alias, threshold):
+        """
+        Find the user's most similar node through the vector index.
+
+        The index is shared by all users, so the nearest `vector_index_candidates` nodes are fetched and filtered by
+        user and agent afterwards; the single nearest node often belongs to someone else.
+        """
+        agent_filter = ""
+        if filters.get("agent_id"):
+            agent_filter = f"AND {alias}.agent_id = $agent_id"
+        cypher = f"""
+            CALL vector_search.search("memzero", $candidates, $embedding)
+            YIELD node, similarity
+            WITH node AS {alias}, similarity
+            WHERE {alias}.user_id = $user_id {agent_filter}
+            AND similarity >= $threshold
+            WITH {alias}, similarity
+            ORDER BY similarity DESC
+            LIMIT 1
+            RETURN id({alias});
+            """
+        params = {
+            "embedding": embedding,
+            "candidates": self.vector_index_candidates,
+            "user_id": filters["user_id"],
+            "threshold": threshold,
+        }
+        if filters.get("agent_id"):
+            params["agent_id"] = filters["agent_id"]
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        return self.graph.query(cypher, params=params)
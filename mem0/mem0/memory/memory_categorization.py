@@ -4,15 +4,102 @@ This module provides advanced categorization logic optimized for coding contexts
 """
 
 import logging
-import re
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from mem0.configs.coding_config import CodingMemoryConfig
+from mem0.memory.enrichment import create_enrichment_executor
+from mem0.memory.learning_state import RingBuffer, StreamingStats, learning_limits
+from mem0.memory.pattern_engine import PatternEngine
 
 logger = logging.getLogger(__name__)
 
+_SUB_CATEGORY_PATTERNS = {
+    "functions": [r"\bdef\s+\w+\(", r"\bfunction\s+\w+", r"\bmethod\b"],
+    "classes": [r"\bclass\s+\w+", r"\bobject\s+oriented", r"\binheritance\b"],
+    "modules": [r"\bmodule\b", r"\bpackage\b", r"\bimport\b"],
+    "algorithms": [
+        r"\balgorithm\b",
+        r"\bsort\b",
+        r"\bsearch\b",
+        r"\boptimize\b",
+    ],
+    "patterns": [
+        r"\bpattern\b",
+        r"\bsingleton\b",
+        r"\bfactory\b",
+        r"\bobserver\b",
+    ],
+    "design": [r"\bdesign\b", r"\barchitecture\b", r"\bstructure\b"],
+    "unit_tests": [r"\bunit\s+test\b", r"\bunittest\b", r"\bpytest\b"],
+    "integration_tests": [r"\bintegration\s+test\b", r"\bapi\s+test\b"],
+    "syntax_errors": [
+        r"\bsyntax\s+error\b",
+        r"\bindentation\b",
+        r"\bparsing\b",
+    ],
+    "logic_errors": [r"\blogic\s+error\b", r"\balgorithm\s+bug\b"],
+    "runtime_errors": [r"\bruntime\s+error\b", r"\bexception\b", r"\bcrash\b"],
+    "techniques": [r"\btechnique\b", r"\bmethod\b", r"\bapproach\b"],
+    "tools": [r"\btool\b", r"\bdebugger\b", r"\bprofiler\b"],
+    "bottlenecks": [r"\bbottleneck\b", r"\bperformance\s+issue\b"],
+    "optimization": [r"\boptimization\b", r"\boptimize\b", r"\bspeed\s+up\b"],
+    "ci_cd": [r"\bci\b", r"\bcd\b", r"\bpipeline\b", r"\bjenkins\b"],
+    "containerization": [r"\bdocker\b", r"\bcontainer\b", r"\bkubernetes\b"],
+    "logging": [r"\blog\b", r"\blogging\b", r"\blogger\b"],
+    "metrics": [r"\bmetric\b", r"\bmonitoring\b", r"\btelemetry\b"],
+    "api_docs": [r"\bapi\s+doc\b", r"\bswagger\b", r"\bopenapi\b"],
+    "readme": [r"\breadme\b", r"\bdocumentation\b"],
+    "concepts": [r"\bconcept\b", r"\btheory\b", r"\bprinciple\b"],
+    "best_practices": [
+        r"\bbest\s+practice\b",
+        r"\bconvention\b",
+        r"\bstandard\b",
+    ],
+}
+
+_LANGUAGE_PATTERNS = {
+    "python": [r"\bpython\b", r"\bpy\b", r"\.py\b", r"\bpip\b", r"\bpytest\b"],
+    "javascript": [
+        r"\bjavascript\b",
+        r"\bjs\b",
+        r"\.js\b",
+        r"\bnpm\b",
+        r"\bnode\b",
+    ],
+    "typescript": [r"\btypescript\b", r"\bts\b", r"\.ts\b", r"\btsc\b"],
+    "java": [r"\bjava\b", r"\.java\b", r"\bmaven\b", r"\bgradle\b"],
+    "cpp": [r"\bc\+\+\b", r"\bcpp\b", r"\.cpp\b", r"\bg\+\+\b"],
+    "c": [r"\bc\b", r"\.c\b", r"\bgcc\b"],
+    "go": [r"\bgolang\b", r"\bgo\b", r"\.go\b"],
+    "rust": [r"\brust\b", r"\.rs\b", r"\bcargo\b"],
+    "php": [r"\bphp\b", r"\.php\b"],
+    "ruby": [r"\bruby\b", r"\.rb\b", r"\bgem\b"],
+    "swift": [r"\bswift\b", r"\.swift\b"],
+    "kotlin": [r"\bkotlin\b", r"\.kt\b"],
+    "scala": [r"\bscala\b", r"\.scala\b"],
+    "r": [r"\br\b", r"\.r\b"],
+    "sql": [r"\bsql\b", r"\.sql\b", r"\bmysql\b", r"\bpostgres\b"],
+}
+
+_FRAMEWORK_PATTERNS = {
+    "react": [r"\breact\b", r"\bjsx\b", r"\breact\s+native\b"],
+    "vue": [r"\bvue\b", r"\bvuejs\b"],
+    "angular": [r"\bangular\b", r"\bangularjs\b"],
+    "express": [r"\bexpress\b", r"\bexpress\.js\b"],
+    "fastapi": [r"\bfastapi\b", r"\bfast\s+api\b"],
+    "django": [r"\bdjango\b"],
+    "flask": [r"\bflask\b"],
+    "spring": [r"\bspring\b", r"\bspring\s+boot\b"],
+    "nodejs": [r"\bnode\.js\b", r"\bnodejs\b"],
+    "docker": [r"\bdocker\b", r"\bcontainer\b"],
+    "kubernetes": [r"\bkubernetes\b", r"\bk8s\b"],
+    "aws": [r"\baws\b", r"\bamazon\s+web\s+services\b"],
+    "gcp": [r"\bgcp\b", r"\bgoogle\s+cloud\b"],
+    "azure": [r"\bazure\b", r"\bmicrosoft\s+azure\b"],
+}
+
 
 class HierarchicalCategorizer:
     """
@@ -195,11 +282,31 @@ class HierarchicalCategorizer:
         }
 
         # Category statistics
+        self.learning_limits = learning_limits(config)
         self.category_stats = defaultdict(int)
-        self.categorization_history = []
+        self.categorization_history = RingBuffer(maxlen=self.learning_limits["history_size"])
+        self.confidence_stats = StreamingStats.from_limits(self.learning_limits)
+
+        self._technology_patterns = PatternEngine(
+            {
+                **{("language", language): patterns for language, patterns in _LANGUAGE_PATTERNS.items()},
+                **{("framework", framework): patterns for framework, patterns in _FRAMEWORK_PATTERNS.items()},
+            }
+        )
+        self._sub_category_patterns: Dict[str, PatternEngine] = {}
+        # Bumped whenever the patterns are recompiled, so enrichment workers holding a copy are restarted
+        self.rules_version = 0
+        self._compile_patterns()
 
         logger.info("Hierarchical categorizer initialized")
 
+    def _compile_patterns(self):
+        """
+        Compile the detection patterns; called again whenever they are updated.
+        """
+        self.rules_version += 1
+        self._detection_patterns = PatternEngine(self.detection_patterns)
+
     def categorize_memory(
         self,
         memory_content: str,
@@ -217,8 +324,39 @@ class HierarchicalCategorizer:
         Returns:
             Dictionary containing category information
         """
-        context = context or {}
+        result = self._compute_categorization(memory_content, metadata)
+
+        # Record categorization
+        self._record_categorization(result["primary_category"], result["sub_categories"], result["confidence"])
+
+        return result
+
+    def categorize_memories(
+        self, memories: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]], executor=None
+    ) -> List[Dict[str, Any]]:
+        """
+        Categorize several memories, as `categorize_memory` does for each.
+
+        Args:
+            memories: (content, metadata, context) tuples
+            executor: Optional `EnrichmentExecutor` built with this categorizer, which may categorize in worker
+                processes; statistics are always recorded here
+
+        Returns:
+            One categorization result per memory, in order
+        """
+        if executor is None:
+            results = [self._compute_categorization(content, metadata) for content, metadata, _context in memories]
+        else:
+            results = executor.map("categories", list(memories))
+        for result in results:
+            self._record_categorization(result["primary_category"], result["sub_categories"], result["confidence"])
+        return results
 
+    def _compute_categorization(self, memory_content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Categorize without recording statistics, so it can run in an enrichment worker.
+        """
         # Auto-detect primary category
         primary_category = self._detect_primary_category(memory_content, metadata)
 
@@ -234,9 +372,6 @@ class HierarchicalCategorizer:
         # Build hierarchical path
         hierarchical_path = self._build_hierarchical_path(primary_category, sub_categories, technology_tags)
 
-        # Record categorization
-        self._record_categorization(primary_category, sub_categories, confidence)
-
         return {
             "primary_category": primary_category,
             "sub_categories": sub_categories,
@@ -261,14 +396,8 @@ class HierarchicalCategorizer:
         # Pattern-based detection
         category_scores = {}
 
-        for category, patterns in self.detection_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-                score += matches
-
-            if score > 0:
-                category_scores[category] = score
+        for category, matches in self._detection_patterns.findall(content_lower).items():
+            category_scores[category] = len(matches)
 
         # File extension hints
         file_refs = metadata.get("file_references", [])
@@ -307,15 +436,16 @@ class HierarchicalCategorizer:
         for main_category, sub_cats in self.category_hierarchy.items():
             if primary_category in sub_cats:
                 # Check for sub-category patterns
-                content_lower = content.lower()
                 available_subs = sub_cats[primary_category]
-
-                for sub_cat in available_subs:
-                    sub_patterns = self._get_sub_category_patterns(sub_cat)
-                    for pattern in sub_patterns:
-                        if re.search(pattern, content_lower, re.IGNORECASE):
-                            sub_categories.append(sub_cat)
-                            break
+                engine = self._sub_category_patterns.get(primary_category)
+                if engine is None:
+                    engine = PatternEngine(
+                        {sub_cat: self._get_sub_category_patterns(sub_cat) for sub_cat in available_subs}
+                    )
+                    self._sub_category_patterns[primary_category] = engine
+
+                matched = engine.matches(content.lower())
+                sub_categories.extend(sub_cat for sub_cat in available_subs if sub_cat in matched)
                 break
 
         return list(set(sub_categories))  # Remove duplicates
@@ -324,115 +454,17 @@ class HierarchicalCategorizer:
         """
         Get patterns for detecting sub-categories.
         """
-        patterns = {
-            "functions": [r"\bdef\s+\w+\(", r"\bfunction\s+\w+", r"\bmethod\b"],
-            "classes": [r"\bclass\s+\w+", r"\bobject\s+oriented", r"\binheritance\b"],
-            "modules": [r"\bmodule\b", r"\bpackage\b", r"\bimport\b"],
-            "algorithms": [
-                r"\balgorithm\b",
-                r"\bsort\b",
-                r"\bsearch\b",
-                r"\boptimize\b",
-            ],
-            "patterns": [
-                r"\bpattern\b",
-                r"\bsingleton\b",
-                r"\bfactory\b",
-                r"\bobserver\b",
-            ],
-            "design": [r"\bdesign\b", r"\barchitecture\b", r"\bstructure\b"],
-            "unit_tests": [r"\bunit\s+test\b", r"\bunittest\b", r"\bpytest\b"],
-            "integration_tests": [r"\bintegration\s+test\b", r"\bapi\s+test\b"],
-            "syntax_errors": [
-                r"\bsyntax\s+error\b",
-                r"\bindentation\b",
-                r"\bparsing\b",
-            ],
-            "logic_errors": [r"\ologic\s+error\b", r"\balgorithm\s+bug\b"],
-            "runtime_errors": [r"\bruntime\s+error\b", r"\bexception\b", r"\bcrash\b"],
-            "techniques": [r"\btechnique\b", r"\bmethod\b", r"\bapproach\b"],
-            "tools": [r"\btool\b", r"\bdebugger\b", r"\bprofiler\b"],
-            "bottlenecks": [r"\bbottleneck\b", r"\bperformance\s+issue\b"],
-            "optimization": [r"\boptimization\b", r"\boptimize\b", r"\bspeed\s+up\b"],
-            "ci_cd": [r"\bci\b", r"\bcd\b", r"\bpipeline\b", r"\bjenkins\b"],
-            "containerization": [r"\bdocker\b", r"\bcontainer\b", r"\bkubernetes\b"],
-            "logging": [r"\blog\b", r"\blogging\b", r"\blogger\b"],
-            "metrics": [r"\bmetric\b", r"\bmonitoring\b", r"\btelemetry\b"],
-            "api_docs": [r"\bapi\s+doc\b", r"\bswagger\b", r"\bopenapi\b"],
-            "readme": [r"\breadme\b", r"\bdocumentation\b"],
-            "concepts": [r"\bconcept\b", r"\btheory\b", r"\bprinciple\b"],
-            "best_practices": [
-                r"\bbest\s+practice\b",
-                r"\bconvention\b",
-                r"\bstandard\b",
-            ],
-        }
-
-        return patterns.get(sub_category, [sub_category.replace("_", r"\s+")])
+        return _SUB_CATEGORY_PATTERNS.get(sub_category, [sub_category.replace("_", r"\s+")])
 
     def _extract_technology_tags(self, content: str, metadata: Dict[str, Any]) -> List[str]:
         """
         Extract technology tags from content and metadata.
         """
         tags = set()
-        content_lower = content.lower()
-
-        # Programming languages
-        languages = {
-            "python": [r"\bpython\b", r"\bpy\b", r"\.py\b", r"\bpip\b", r"\bpytest\b"],
-            "javascript": [
-                r"\bjavascript\b",
-                r"\bjs\b",
-                r"\.js\b",
-                r"\bnpm\b",
-                r"\bnode\b",
-            ],
-            "typescript": [r"\btypescript\b", r"\bts\b", r"\.ts\b", r"\btsc\b"],
-            "java": [r"\bjava\b", r"\.java\b", r"\bmaven\b", r"\bgradle\b"],
-            "cpp": [r"\bc\+\+\b", r"\bcpp\b", r"\.cpp\b", r"\bg\+\+\b"],
-            "c": [r"\bc\b", r"\.c\b", r"\bgcc\b"],
-            "go": [r"\bgolang\b", r"\bgo\b", r"\.go\b"],
-            "rust": [r"\brust\b", r"\.rs\b", r"\bcargo\b"],
-            "php": [r"\bphp\b", r"\.php\b"],
-            "ruby": [r"\bruby\b", r"\.rb\b", r"\bgem\b"],
-            "swift": [r"\bswift\b", r"\.swift\b"],
-            "kotlin": [r"\bkotlin\b", r"\.kt\b"],
-            "scala": [r"\bscala\b", r"\.scala\b"],
-            "r": [r"\br\b", r"\.r\b"],
-            "sql": [r"\bsql\b", r"\.sql\b", r"\bmysql\b", r"\bpostgres\b"],
-        }
-
-        # Frameworks and libraries
-        frameworks = {
-            "react": [r"\breact\b", r"\bjsx\b", r"\breact\s+native\b"],
-            "vue": [r"\bvue\b", r"\bvuejs\b"],
-            "angular": [r"\bangular\b", r"\bangularjs\b"],
-            "express": [r"\bexpress\b", r"\bexpress\.js\b"],
-            "fastapi": [r"\bfastapi\b", r"\bfast\s+api\b"],
-            "django": [r"\bdjango\b"],
-            "flask": [r"\bflask\b"],
-            "spring": [r"\bspring\b", r"\bspring\s+boot\b"],
-            "nodejs": [r"\bnode\.js\b", r"\bnodejs\b"],
-            "docker": [r"\bdocker\b", r"\bcontainer\b"],
-            "kubernetes": [r"\bkubernetes\b", r"\bk8s\b"],
-            "aws": [r"\baws\b", r"\bamazon\s+web\s+services\b"],
-            "gcp": [r"\bgcp\b", r"\bgoogle\s+cloud\b"],
-            "azure": [r"\bazure\b", r"\bmicrosoft\s+azure\b"],
-        }
 
-        # Check for language tags
-        for lang, patterns in languages.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    tags.add(lang)
-                    break
-
-        # Check for framework tags
-        for framework, patterns in frameworks.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    tags.add(framework)
-                    break
+        # Check for language and framework tags
+        for _, technology in self._technology_patterns.matches(content.lower()):
+            tags.add(technology)
 
         # Extract from file references
         file_refs = metadata.get("file_references", [])
@@ -466,11 +498,7 @@ class HierarchicalCategorizer:
             base_confidence *= 1.1
 
         # Adjust based on pattern strength
-        content_lower = content.lower()
-        pattern_matches = 0
-        if primary_category in self.detection_patterns:
-            for pattern in self.detection_patterns[primary_category]:
-                pattern_matches += len(re.findall(pattern, content_lower, re.IGNORECASE))
+        pattern_matches = len(self._detection_patterns.findall(content.lower()).get(primary_category, []))
 
         if pattern_matches > 3:
             base_confidence *= 1.15
@@ -526,9 +554,7 @@ class HierarchicalCategorizer:
             }
         )
 
-        # Keep only recent history
-        if len(self.categorization_history) > 1000:
-            self.categorization_history = self.categorization_history[-1000:]
+        self.confidence_stats.add(confidence)
 
     def _generate_categorization_explanation(
         self, primary_category: str, sub_categories: List[str], confidence: float
@@ -558,11 +584,8 @@ class HierarchicalCategorizer:
                 else {}
             ),
             "hierarchy_structure": self.category_hierarchy,
-            "average_confidence": (
-                sum(h["confidence"] for h in self.categorization_history) / len(self.categorization_history)
-                if self.categorization_history
-                else 0.0
-            ),
+            "average_confidence": self.confidence_stats.mean,
+            "confidence": self.confidence_stats.snapshot(),
         }
 
     def suggest_categories(self, partial_content: str) -> List[Dict[str, Any]]:
@@ -570,14 +593,9 @@ class HierarchicalCategorizer:
         Suggest categories for partial content.
         """
         suggestions = []
-        content_lower = partial_content.lower()
-
-        for category, patterns in self.detection_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-                score += matches
 
+        for category, matches in self._detection_patterns.findall(partial_content.lower()).items():
+            score = len(matches)
             if score > 0:
                 suggestions.append(
                     {
@@ -597,6 +615,7 @@ class HierarchicalCategorizer:
         """
         if category in self.detection_patterns:
             self.detection_patterns[category].extend(new_patterns)
+            self._compile_patterns()
             logger.info(f"Updated patterns for category '{category}'")
         else:
             logger.warning(f"Category '{category}' not found in detection patterns")
@@ -607,6 +626,7 @@ class HierarchicalCategorizer:
         """
         self.category_stats.clear()
         self.categorization_history.clear()
+        self.confidence_stats.reset()
         logger.info("Categorization statistics reset")
 
 
@@ -618,11 +638,14 @@ class AutoCategorizer:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.hierarchical_categorizer = HierarchicalCategorizer(config)
+        self.enrichment_executor = create_enrichment_executor(config, categorizer=self.hierarchical_categorizer)
 
         # Learning parameters
         self.learning_enabled = config.get("enable_learning", True)
-        self.feedback_history = []
+        self.learning_limits = learning_limits(config)
+        self.feedback_history = RingBuffer(maxlen=self.learning_limits["history_size"])
         self.category_accuracy = defaultdict(float)
+        self.confidence_stats = StreamingStats.from_limits(self.learning_limits)
 
         # Auto-categorization rules
         self.auto_rules = {
@@ -643,7 +666,30 @@ class AutoCategorizer:
         """
         # Get categorization result
         result = self.hierarchical_categorizer.categorize_memory(memory_content, metadata, context)
+        return self._finish_auto_categorization(result, memory_content, context)
 
+    def auto_categorize_memories(
+        self, memories: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Automatically categorize several memories, categorizing them through the enrichment executor.
+
+        Args:
+            memories: (content, metadata, context) tuples
+
+        Returns:
+            One `auto_categorize` result per memory, in order
+        """
+        memories = list(memories)
+        results = self.hierarchical_categorizer.categorize_memories(memories, executor=self.enrichment_executor)
+        return [
+            self._finish_auto_categorization(result, content, context)
+            for result, (content, _metadata, context) in zip(results, memories)
+        ]
+
+    def _finish_auto_categorization(
+        self, result: Dict[str, Any], memory_content: str, context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         # Make auto-categorization decision
         confidence = result["confidence"]
 
@@ -680,10 +726,7 @@ class AutoCategorizer:
             }
 
             self.feedback_history.append(decision_record)
-
-            # Keep only recent history
-            if len(self.feedback_history) > 1000:
-                self.feedback_history = self.feedback_history[-1000:]
+            self.confidence_stats.add(result["confidence"])
 
     def provide_feedback(self, memory_id: str, correct_category: str, was_correct: bool):
         """
@@ -732,6 +775,7 @@ class AutoCategorizer:
             "category_accuracy": dict(self.category_accuracy),
             "current_thresholds": self.auto_rules,
             "recent_decisions": (self.feedback_history[-10:] if self.feedback_history else []),
+            "confidence": self.confidence_stats.snapshot(),
         }
 
     def reset_learning_data(self):
@@ -740,4 +784,5 @@ class AutoCategorizer:
         """
         self.feedback_history.clear()
         self.category_accuracy.clear()
+        self.confidence_stats.reset()
         logger.info("Auto-categorization learning data reset")
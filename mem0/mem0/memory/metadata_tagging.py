@@ -4,18 +4,138 @@ This module provides advanced metadata tagging and semantic enrichment.
 """
 
 import logging
-import re
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from mem0.configs.coding_config import CodingMemoryConfig
+from mem0.memory.enrichment import create_enrichment_executor
+from mem0.memory.learning_state import RingBuffer, StreamingStats, learning_limits
+from mem0.memory.pattern_engine import PatternEngine
 from mem0.memory.timezone_utils import (
     get_memory_age_hours,
+    parse_timestamp,
 )
 
 logger = logging.getLogger(__name__)
 
+_ERROR_PATTERNS = {
+    "syntax_error": [
+        r"\bsyntax\s+error\b",
+        r"\bindentation\s+error\b",
+        r"\bparsing\s+error\b",
+    ],
+    "runtime_error": [r"\bruntime\s+error\b", r"\bexception\b", r"\bcrash\b"],
+    "logic_error": [
+        r"\blogic\s+error\b",
+        r"\bwrong\s+result\b",
+        r"\bincorrect\b",
+    ],
+    "type_error": [
+        r"\btype\s+error\b",
+        r"\btype\s+mismatch\b",
+        r"\bwrong\s+type\b",
+    ],
+    "memory_error": [
+        r"\bmemory\s+error\b",
+        r"\bsegmentation\s+fault\b",
+        r"\bstack\s+overflow\b",
+    ],
+    "network_error": [
+        r"\bnetwork\s+error\b",
+        r"\bconnection\s+error\b",
+        r"\btimeout\b",
+    ],
+}
+
+_SOLUTION_PATTERNS = {
+    "workaround": [
+        r"\bworkaround\b",
+        r"\btemporary\s+fix\b",
+        r"\bquick\s+fix\b",
+    ],
+    "permanent_fix": [
+        r"\bpermanent\s+fix\b",
+        r"\bproper\s+solution\b",
+        r"\bfinal\s+fix\b",
+    ],
+    "patch": [r"\bpatch\b", r"\bhotfix\b", r"\bband\-aid\b"],
+    "optimization": [
+        r"\boptimization\b",
+        r"\bimprovement\b",
+        r"\benhancement\b",
+    ],
+    "refactoring": [r"\brefactor\b", r"\bcleanup\b", r"\brestructure\b"],
+    "configuration": [
+        r"\bconfiguration\s+change\b",
+        r"\bsetting\s+update\b",
+        r"\bparameter\s+adjustment\b",
+    ],
+}
+
+_CODE_PATTERNS = {
+    "function_definition": [
+        r"\bdef\s+\w+\(",
+        r"\bfunction\s+\w+\(",
+        r"\w+\s*\([^)]*\)\s*\{",
+    ],
+    "class_definition": [
+        r"\bclass\s+\w+",
+        r"\binterface\s+\w+",
+        r"\bstruct\s+\w+",
+    ],
+    "import_statement": [
+        r"\bimport\s+\w+",
+        r"\bfrom\s+\w+\s+import",
+        r"\b#include\s*<",
+    ],
+    "variable_declaration": [r"\bvar\s+\w+", r"\blet\s+\w+", r"\bconst\s+\w+"],
+    "loop_construct": [r"\bfor\s+\w+\s+in\b", r"\bwhile\s*\(", r"\bdo\s*\{"],
+    "conditional": [r"\bif\s*\(", r"\belse\s+if\b", r"\bswitch\s*\("],
+    "error_handling": [r"\btry\s*\{", r"\bcatch\s*\(", r"\bfinally\s*\{"],
+    "async_pattern": [r"\basync\s+\w+", r"\bawait\s+\w+", r"\bPromise\s*\<"],
+}
+
+_DETAIL_PATTERNS = [
+    r"\bstep\s+\d+",
+    r"\bfirst\b",
+    r"\bsecond\b",
+    r"\bthen\b",
+    r"\bfor\s+example\b",
+    r"\bspecifically\b",
+    r"\bnamely\b",
+]
+
+_CODE_QUALITY_PATTERNS = [
+    r"\bbest\s+practice\b",
+    r"\bclean\s+code\b",
+    r"\bcode\s+review\b",
+    r"\boptimize\b",
+    r"\bperformance\b",
+    r"\befficient\b",
+]
+
+_COMPLETENESS_PATTERNS = [
+    r"\bcomplete\b",
+    r"\bfinished\b",
+    r"\bfinal\b",
+    r"\bdone\b",
+]
+
+_ACCURACY_PATTERNS = [
+    r"\bverified\b",
+    r"\btested\b",
+    r"\bconfirmed\b",
+    r"\bvalidated\b",
+]
+
+_USEFULNESS_PATTERNS = [
+    r"\buseful\b",
+    r"\bhelpful\b",
+    r"\bvaluable\b",
+    r"\bimportant\b",
+]
+
 
 class SemanticTagger:
     """
@@ -195,8 +315,54 @@ class SemanticTagger:
             "auto_tag_accuracy": 0.0,
         }
 
+        # Bumped whenever the patterns are recompiled, so enrichment workers holding a copy are restarted
+        self.rules_version = 0
+        self._compile_patterns()
+
         logger.info("Semantic tagger initialized")
 
+    def _compile_patterns(self):
+        """
+        Compile the pattern tables; called again whenever the tagging rules change.
+        """
+        self.rules_version += 1
+        content_table = {
+            ("semantic", category): config["patterns"] for category, config in self.semantic_categories.items()
+        }
+        for tech_category, technologies in self.technology_tags.items():
+            for tech_name, patterns in technologies.items():
+                content_table[("technology", tech_category, tech_name)] = patterns
+        for context_category, contexts in self.context_tags.items():
+            for context_name, patterns in contexts.items():
+                content_table[("context", context_category, context_name)] = patterns
+        content_table.update({("error", error_type): patterns for error_type, patterns in _ERROR_PATTERNS.items()})
+        content_table.update(
+            {("solution", solution_type): patterns for solution_type, patterns in _SOLUTION_PATTERNS.items()}
+        )
+        # Matched against the lowercased content
+        self._content_patterns = PatternEngine(content_table)
+
+        self._file_reference_patterns = PatternEngine(
+            {
+                (tech_category, tech_name): patterns
+                for tech_category, technologies in self.technology_tags.items()
+                for tech_name, patterns in technologies.items()
+            }
+        )
+
+        # Matched against the original content
+        raw_table = {("code", pattern_type): patterns for pattern_type, patterns in _CODE_PATTERNS.items()}
+        raw_table.update(
+            {
+                "detail": _DETAIL_PATTERNS,
+                "code_quality": _CODE_QUALITY_PATTERNS,
+                "completeness": _COMPLETENESS_PATTERNS,
+                "accuracy": _ACCURACY_PATTERNS,
+                "usefulness": _USEFULNESS_PATTERNS,
+            }
+        )
+        self._raw_patterns = PatternEngine(raw_table)
+
     def tag_memory(
         self,
         memory_content: str,
@@ -214,6 +380,44 @@ class SemanticTagger:
         Returns:
             Dictionary containing all generated tags
         """
+        result = self._compute_tags(memory_content, metadata, context)
+
+        # Update statistics
+        self._update_tag_statistics(result["tags"])
+
+        return result
+
+    def tag_memories(
+        self, memories: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]], executor=None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate tags for several memories, as `tag_memory` does for each.
+
+        Args:
+            memories: (content, metadata, context) tuples
+            executor: Optional `EnrichmentExecutor` built with this tagger, which may compute the tags in worker
+                processes; statistics are always updated here
+
+        Returns:
+            One tagging result per memory, in order
+        """
+        if executor is None:
+            results = [self._compute_tags(content, metadata, context) for content, metadata, context in memories]
+        else:
+            results = executor.map("tags", list(memories))
+        for result in results:
+            self._update_tag_statistics(result["tags"])
+        return results
+
+    def _compute_tags(
+        self,
+        memory_content: str,
+        metadata: Dict[str, Any],
+        context: Dict[str, Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate the tags of `tag_memory` without touching any state, so it can run in an enrichment worker.
+        """
         context = context or {}
 
         # Extract semantic tags
@@ -247,9 +451,6 @@ class SemanticTagger:
         # Calculate tag confidence
         tag_confidence = self._calculate_tag_confidence(all_tags, memory_content)
 
-        # Update statistics
-        self._update_tag_statistics(all_tags)
-
         return {
             "tags": all_tags,
             "confidence": tag_confidence,
@@ -262,16 +463,11 @@ class SemanticTagger:
         Extract semantic tags from content.
         """
         semantic_tags = {}
-        content_lower = content.lower()
+        found = self._content_patterns.findall(content.lower())
 
         for category, config in self.semantic_categories.items():
-            patterns = config["patterns"]
             weight = config["weight"]
-
-            matches = []
-            for pattern in patterns:
-                found_matches = re.findall(pattern, content_lower, re.IGNORECASE)
-                matches.extend(found_matches)
+            matches = found.get(("semantic", category))
 
             if matches:
                 semantic_tags[category] = {
@@ -288,20 +484,18 @@ class SemanticTagger:
         Extract technology-specific tags.
         """
         technology_tags = {}
-        content_lower = content.lower()
+        matched = self._content_patterns.matches(content.lower())
 
         for tech_category, technologies in self.technology_tags.items():
             category_tags = {}
 
-            for tech_name, patterns in technologies.items():
-                for pattern in patterns:
-                    if re.search(pattern, content_lower, re.IGNORECASE):
-                        category_tags[tech_name] = {
-                            "detected": True,
-                            "confidence": 0.8,
-                            "source": "content_analysis",
-                        }
-                        break
+            for tech_name in technologies:
+                if ("technology", tech_category, tech_name) in matched:
+                    category_tags[tech_name] = {
+                        "detected": True,
+                        "confidence": 0.8,
+                        "source": "content_analysis",
+                    }
 
             if category_tags:
                 technology_tags[tech_category] = category_tags
@@ -311,15 +505,12 @@ class SemanticTagger:
         if file_refs:
             file_extension_tags = {}
             for file_ref in file_refs:
-                for tech_category, technologies in self.technology_tags.items():
-                    for tech_name, patterns in technologies.items():
-                        for pattern in patterns:
-                            if re.search(pattern, file_ref, re.IGNORECASE):
-                                file_extension_tags[tech_name] = {
-                                    "detected": True,
-                                    "confidence": 0.9,
-                                    "source": "file_reference",
-                                }
+                for _, tech_name in self._file_reference_patterns.matches(file_ref):
+                    file_extension_tags[tech_name] = {
+                        "detected": True,
+                        "confidence": 0.9,
+                        "source": "file_reference",
+                    }
 
             if file_extension_tags:
                 if "languages" not in technology_tags:
@@ -333,20 +524,18 @@ class SemanticTagger:
         Extract context-specific tags.
         """
         context_tags = {}
-        content_lower = content.lower()
+        matched = self._content_patterns.matches(content.lower())
 
         for context_category, contexts in self.context_tags.items():
             detected_contexts = {}
 
-            for context_name, patterns in contexts.items():
-                for pattern in patterns:
-                    if re.search(pattern, content_lower, re.IGNORECASE):
-                        detected_contexts[context_name] = {
-                            "detected": True,
-                            "confidence": 0.7,
-                            "source": "pattern_match",
-                        }
-                        break
+            for context_name in contexts:
+                if ("context", context_category, context_name) in matched:
+                    detected_contexts[context_name] = {
+                        "detected": True,
+                        "confidence": 0.7,
+                        "source": "pattern_match",
+                    }
 
             if detected_contexts:
                 context_tags[context_category] = detected_contexts
@@ -410,47 +599,17 @@ class SemanticTagger:
         """
         Detect error-related tags.
         """
-        error_patterns = {
-            "syntax_error": [
-                r"\bsyntax\s+error\b",
-                r"\bindentation\s+error\b",
-                r"\bparsing\s+error\b",
-            ],
-            "runtime_error": [r"\bruntime\s+error\b", r"\bexception\b", r"\bcrash\b"],
-            "logic_error": [
-                r"\blogic\s+error\b",
-                r"\bwrong\s+result\b",
-                r"\bincorrect\b",
-            ],
-            "type_error": [
-                r"\btype\s+error\b",
-                r"\btype\s+mismatch\b",
-                r"\bwrong\s+type\b",
-            ],
-            "memory_error": [
-                r"\bmemory\s+error\b",
-                r"\bsegmentation\s+fault\b",
-                r"\bstack\s+overflow\b",
-            ],
-            "network_error": [
-                r"\bnetwork\s+error\b",
-                r"\bconnection\s+error\b",
-                r"\btimeout\b",
-            ],
-        }
-
         detected_errors = {}
-        content_lower = content.lower()
-
-        for error_type, patterns in error_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    detected_errors[error_type] = {
-                        "detected": True,
-                        "confidence": 0.85,
-                        "pattern": pattern,
-                    }
-                    break
+        matched = self._content_patterns.matches(content.lower())
+
+        for error_type in _ERROR_PATTERNS:
+            patterns = matched.get(("error", error_type))
+            if patterns:
+                detected_errors[error_type] = {
+                    "detected": True,
+                    "confidence": 0.85,
+                    "pattern": patterns[0],
+                }
 
         return detected_errors
 
@@ -458,43 +617,17 @@ class SemanticTagger:
         """
         Detect solution-related tags.
         """
-        solution_patterns = {
-            "workaround": [
-                r"\bworkaround\b",
-                r"\btemporary\s+fix\b",
-                r"\bquick\s+fix\b",
-            ],
-            "permanent_fix": [
-                r"\bpermanent\s+fix\b",
-                r"\bproper\s+solution\b",
-                r"\bfinal\s+fix\b",
-            ],
-            "patch": [r"\bpatch\b", r"\bhotfix\b", r"\bband\-aid\b"],
-            "optimization": [
-                r"\boptimization\b",
-                r"\bimprovement\b",
-                r"\benhancement\b",
-            ],
-            "refactoring": [r"\brefactor\b", r"\bcleanup\b", r"\brestructure\b"],
-            "configuration": [
-                r"\bconfiguration\s+change\b",
-                r"\bsetting\s+update\b",
-                r"\bparameter\s+adjustment\b",
-            ],
-        }
-
         detected_solutions = {}
-        content_lower = content.lower()
-
-        for solution_type, patterns in solution_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower, re.IGNORECASE):
-                    detected_solutions[solution_type] = {
-                        "detected": True,
-                        "confidence": 0.8,
-                        "pattern": pattern,
-                    }
-                    break
+        matched = self._content_patterns.matches(content.lower())
+
+        for solution_type in _SOLUTION_PATTERNS:
+            patterns = matched.get(("solution", solution_type))
+            if patterns:
+                detected_solutions[solution_type] = {
+                    "detected": True,
+                    "confidence": 0.8,
+                    "pattern": patterns[0],
+                }
 
         return detected_solutions
 
@@ -502,40 +635,17 @@ class SemanticTagger:
         """
         Detect code-related patterns.
         """
-        code_patterns = {
-            "function_definition": [
-                r"\bdef\s+\w+\(",
-                r"\bfunction\s+\w+\(",
-                r"\w+\s*\([^)]*\)\s*\{",
-            ],
-            "class_definition": [
-                r"\bclass\s+\w+",
-                r"\binterface\s+\w+",
-                r"\bstruct\s+\w+",
-            ],
-            "import_statement": [
-                r"\bimport\s+\w+",
-                r"\bfrom\s+\w+\s+import",
-                r"\b#include\s*<",
-            ],
-            "variable_declaration": [r"\bvar\s+\w+", r"\blet\s+\w+", r"\bconst\s+\w+"],
-            "loop_construct": [r"\bfor\s+\w+\s+in\b", r"\bwhile\s*\(", r"\bdo\s*\{"],
-            "conditional": [r"\bif\s*\(", r"\belse\s+if\b", r"\bswitch\s*\("],
-            "error_handling": [r"\btry\s*\{", r"\bcatch\s*\(", r"\bfinally\s*\{"],
-            "async_pattern": [r"\basync\s+\w+", r"\bawait\s+\w+", r"\bPromise\s*\<"],
-        }
-
         detected_patterns = {}
-
-        for pattern_type, patterns in code_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    detected_patterns[pattern_type] = {
-                        "detected": True,
-                        "confidence": 0.9,
-                        "pattern": pattern,
-                    }
-                    break
+        matched = self._raw_patterns.matches(content)
+
+        for pattern_type in _CODE_PATTERNS:
+            patterns = matched.get(("code", pattern_type))
+            if patterns:
+                detected_patterns[pattern_type] = {
+                    "detected": True,
+                    "confidence": 0.9,
+                    "pattern": patterns[0],
+                }
 
         return detected_patterns
 
@@ -548,7 +658,7 @@ class SemanticTagger:
         created_at = metadata.get("created_at")
         if created_at:
             try:
-                datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                parse_timestamp(created_at)
                 age_hours = get_memory_age_hours(created_at)
 
                 if age_hours < 1:
@@ -582,6 +692,7 @@ class SemanticTagger:
         Detect quality indicators in content.
         """
         quality_indicators = {}
+        matched = self._raw_patterns.matches(content)
 
         # Content length assessment
         length = len(content)
@@ -595,17 +706,7 @@ class SemanticTagger:
             quality_indicators["length"] = "very_long"
 
         # Detail level assessment
-        detail_patterns = [
-            r"\bstep\s+\d+",
-            r"\bfirst\b",
-            r"\bsecond\b",
-            r"\bthen\b",
-            r"\bfor\s+example\b",
-            r"\bspecifically\b",
-            r"\bnamely\b",
-        ]
-
-        detail_count = sum(1 for pattern in detail_patterns if re.search(pattern, content, re.IGNORECASE))
+        detail_count = len(matched.get("detail", []))
 
         if detail_count >= 3:
             quality_indicators["detail_level"] = "high"
@@ -615,16 +716,7 @@ class SemanticTagger:
             quality_indicators["detail_level"] = "low"
 
         # Code quality indicators
-        code_quality_patterns = [
-            r"\bbest\s+practice\b",
-            r"\bclean\s+code\b",
-            r"\bcode\s+review\b",
-            r"\boptimize\b",
-            r"\bperformance\b",
-            r"\befficient\b",
-        ]
-
-        if any(re.search(pattern, content, re.IGNORECASE) for pattern in code_quality_patterns):
+        if "code_quality" in matched:
             quality_indicators["code_quality"] = "high"
 
         return quality_indicators
@@ -634,16 +726,10 @@ class SemanticTagger:
         Generate quality-related tags.
         """
         quality_tags = {}
+        matched = self._raw_patterns.matches(content)
 
         # Content completeness
-        completeness_indicators = [
-            r"\bcomplete\b",
-            r"\bfinished\b",
-            r"\bfinal\b",
-            r"\bdone\b",
-        ]
-
-        if any(re.search(pattern, content, re.IGNORECASE) for pattern in completeness_indicators):
+        if "completeness" in matched:
             quality_tags["completeness"] = "complete"
         elif any(word in content.lower() for word in ["partial", "incomplete", "draft", "wip"]):
             quality_tags["completeness"] = "partial"
@@ -651,14 +737,7 @@ class SemanticTagger:
             quality_tags["completeness"] = "unknown"
 
         # Accuracy indicators
-        accuracy_indicators = [
-            r"\bverified\b",
-            r"\btested\b",
-            r"\bconfirmed\b",
-            r"\bvalidated\b",
-        ]
-
-        if any(re.search(pattern, content, re.IGNORECASE) for pattern in accuracy_indicators):
+        if "accuracy" in matched:
             quality_tags["accuracy"] = "verified"
         elif any(word in content.lower() for word in ["untested", "unverified", "uncertain"]):
             quality_tags["accuracy"] = "uncertain"
@@ -666,14 +745,7 @@ class SemanticTagger:
             quality_tags["accuracy"] = "unknown"
 
         # Usefulness indicators
-        usefulness_indicators = [
-            r"\buseful\b",
-            r"\bhelpful\b",
-            r"\bvaluable\b",
-            r"\bimportant\b",
-        ]
-
-        if any(re.search(pattern, content, re.IGNORECASE) for pattern in usefulness_indicators):
+        if "usefulness" in matched:
             quality_tags["usefulness"] = "high"
 
         return quality_tags
@@ -857,6 +929,7 @@ class SemanticTagger:
         Update auto-tagging rules.
         """
         self.auto_tagging_rules.update(new_rules)
+        self._compile_patterns()
         logger.info(f"Updated auto-tagging rules: {new_rules}")
 
     def add_custom_semantic_category(self, category_name: str, patterns: List[str], weight: float):
@@ -867,6 +940,7 @@ class SemanticTagger:
             "patterns": patterns,
             "weight": weight,
         }
+        self._compile_patterns()
         logger.info(f"Added custom semantic category: {category_name}")
 
     def reset_statistics(self):
@@ -890,11 +964,16 @@ class AutoTaggingManager:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.semantic_tagger = SemanticTagger(config)
+        self.enrichment_executor = create_enrichment_executor(config, tagger=self.semantic_tagger)
 
         # Learning parameters
         self.learning_enabled = config.get("enable_learning", True)
-        self.feedback_history = []
+        self.learning_limits = learning_limits(config)
+        self.feedback_history = RingBuffer(maxlen=self.learning_limits["history_size"])
         self.tag_performance = defaultdict(lambda: {"correct": 0, "total": 0})
+        self.feedback_totals = {"correct": 0, "total": 0}
+        self.confidence_stats = StreamingStats.from_limits(self.learning_limits)
+        self.tag_count_stats = StreamingStats.from_limits(self.learning_limits)
 
         # Auto-tagging thresholds
         self.auto_thresholds = {
@@ -922,7 +1001,30 @@ class AutoTaggingManager:
         """
         # Generate tags
         tagging_result = self.semantic_tagger.tag_memory(memory_content, metadata, context)
+        return self._finish_auto_tagging(tagging_result, memory_content, metadata)
+
+    def auto_tag_memories(
+        self, memories: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Automatically tag several memories, computing their tags through the enrichment executor.
+
+        Args:
+            memories: (content, metadata, context) tuples
 
+        Returns:
+            One `auto_tag_memory` result per memory, in order
+        """
+        memories = list(memories)
+        tagging_results = self.semantic_tagger.tag_memories(memories, executor=self.enrichment_executor)
+        return [
+            self._finish_auto_tagging(tagging_result, content, metadata)
+            for tagging_result, (content, metadata, _context) in zip(tagging_results, memories)
+        ]
+
+    def _finish_auto_tagging(
+        self, tagging_result: Dict[str, Any], memory_content: str, metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
         # Apply auto-tagging logic
         auto_tagged = self._apply_auto_tagging_logic(tagging_result)
 
@@ -1036,7 +1138,7 @@ class AutoTaggingManager:
                     # Keep highest confidence tags
                     sorted_tags = sorted(
                         category_tags.items(),
-                        key=lambda x: (x[1].get("confidence", 0) if isinstance(x[1], dict) else 0),
+                        key=lambda x: x[1].get("confidence", 0) if isinstance(x[1], dict) else 0,
                         reverse=True,
                     )
                     validated_tags[category] = dict(sorted_tags[:max_tags])
@@ -1080,10 +1182,8 @@ class AutoTaggingManager:
         }
 
         self.feedback_history.append(record)
-
-        # Keep only recent history
-        if len(self.feedback_history) > 1000:
-            self.feedback_history = self.feedback_history[-1000:]
+        self.confidence_stats.add(record["confidence"])
+        self.tag_count_stats.add(record["tag_count"])
 
     def provide_feedback(self, memory_id: str, correct_tags: List[str], incorrect_tags: List[str]):
         """
@@ -1097,6 +1197,9 @@ class AutoTaggingManager:
         for tag in incorrect_tags:
             self.tag_performance[tag]["total"] += 1
 
+        self.feedback_totals["correct"] += len(correct_tags)
+        self.feedback_totals["total"] += len(correct_tags) + len(incorrect_tags)
+
         # Adapt thresholds based on performance
         if self.learning_enabled:
             self._adapt_thresholds_based_on_feedback()
@@ -1110,8 +1213,8 @@ class AutoTaggingManager:
         Adapt auto-tagging thresholds based on feedback.
         """
         # Calculate overall accuracy
-        total_correct = sum(perf["correct"] for perf in self.tag_performance.values())
-        total_attempts = sum(perf["total"] for perf in self.tag_performance.values())
+        total_correct = self.feedback_totals["correct"]
+        total_attempts = self.feedback_totals["total"]
 
         if total_attempts < 10:  # Need minimum feedback
             return
@@ -1139,8 +1242,8 @@ class AutoTaggingManager:
                 tag_accuracy[tag] = performance["correct"] / performance["total"]
 
         # Calculate overall statistics
-        total_correct = sum(perf["correct"] for perf in self.tag_performance.values())
-        total_attempts = sum(perf["total"] for perf in self.tag_performance.values())
+        total_correct = self.feedback_totals["correct"]
+        total_attempts = self.feedback_totals["total"]
         overall_accuracy = total_correct / total_attempts if total_attempts > 0 else 0.0
 
         return {
@@ -1150,6 +1253,17 @@ class AutoTaggingManager:
             "current_thresholds": self.auto_thresholds,
             "learning_enabled": self.learning_enabled,
             "feedback_history_size": len(self.feedback_history),
+            **self.get_learning_stats(),
+        }
+
+    def get_learning_stats(self) -> Dict[str, Any]:
+        """
+        Get the streaming aggregates of every auto-tagging decision, including those no longer in the history.
+        """
+        return {
+            "decisions": self.confidence_stats.count,
+            "confidence": self.confidence_stats.snapshot(),
+            "tag_count": self.tag_count_stats.snapshot(),
         }
 
     def reset_learning_data(self):
@@ -1158,4 +1272,7 @@ class AutoTaggingManager:
         """
         self.feedback_history.clear()
         self.tag_performance.clear()
+        self.feedback_totals = {"correct": 0, "total": 0}
+        self.confidence_stats.reset()
+        self.tag_count_stats.reset()
         logger.info("Auto-tagging learning data reset")
@@ -0,0 +1,182 @@
+"""
+MinHash / LSH index for finding near-duplicate memories without comparing every pair.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def word_set(text: str) -> frozenset:
+    """The word set whose Jaccard similarity `calculate_simple_similarity` measures."""
+    return frozenset(text.lower().split())
+
+
+def jaccard(words1: frozenset, words2: frozenset) -> float:
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+class MinHashLSHIndex:
+    """
+    Near-duplicate index over the word sets of memories.
+
+    Each memory gets a MinHash signature of `num_perm` values, split into `bands` bands; memories sharing any band
+    land in the same bucket and become candidates, which are then verified with exact Jaccard similarity. With the
+    defaults (16 bands of 8 rows) pairs above ~0.7 Jaccard are found with high probability while unrelated pairs are
+    almost never compared.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.seed = seed
+        generator = np.random.default_rng(seed)
+        self._a = generator.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = generator.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._texts: Dict[Hashable, str] = {}
+        self._words: Dict[Hashable, frozenset] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._texts
+
+    def signature(self, words: Iterable[str]) -> Optional[np.ndarray]:
+        """MinHash signature of a word set, or None for an empty one."""
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little") for word in words),
+            dtype=np.uint64,
+        )
+        if not hashes.size:
+            return None
+        hashes %= np.uint64(_MERSENNE_PRIME)
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows : (band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def insert(self, key: Hashable, text: str, signature: Optional[np.ndarray] = None):
+        """Add or replace the memory `key`."""
+        if key in self._texts:
+            self.remove(key)
+        words = word_set(text)
+        if signature is None:
+            signature = self.signature(words)
+        self._texts[key] = text
+        self._words[key] = words
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable):
+        self._texts.pop(key, None)
+        self._words.pop(key, None)
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def text(self, key: Hashable) -> Optional[str]:
+        return self._texts.get(key)
+
+    def _candidates_for_signature(self, signature: Optional[np.ndarray]) -> Set[Hashable]:
+        candidates: Set[Hashable] = set()
+        if signature is None:
+            return candidates
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+        return candidates
+
+    def candidates(self, key: Hashable) -> Set[Hashable]:
+        """Keys sharing at least one bucket with the indexed memory `key`, excluding itself."""
+        candidates = self._candidates_for_signature(self._signatures.get(key))
+        candidates.discard(key)
+        return candidates
+
+    def query(self, text: str, threshold: float = 0.8) -> List[Tuple[Hashable, float]]:
+        """Indexed memories whose word-set Jaccard similarity to `text` is at least `threshold`, best first."""
+        words = word_set(text)
+        matches = []
+        for key in self._candidates_for_signature(self.signature(words)):
+            similarity = jaccard(words, self._words[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+    def clusters(self, keys: Optional[Iterable[Hashable]] = None, threshold: float = 0.8) -> List[List[Hashable]]:
+        """
+        Greedily cluster memories in `keys` order (insertion order by default): each memory not yet clustered seeds
+        a cluster with every later memory of its buckets that is at least `threshold` similar to it.
+        """
+        order = list(self._texts if keys is None else keys)
+        position = {key: i for i, key in enumerate(order)}
+        clustered: Set[Hashable] = set()
+        clusters = []
+        for i, key in enumerate(order):
+            if key in clustered:
+                continue
+            cluster = [key]
+            clustered.add(key)
+            later = sorted(
+                (other for other in self.candidates(key) if position.get(other, -1) > i and other not in clustered),
+                key=position.__getitem__,
+            )
+            for other in later:
+                if jaccard(self._words[key], self._words[other]) >= threshold:
+                    cluster.append(other)
+                    clustered.add(other)
+            clusters.append(cluster)
+        return clusters
+
+    def save(self, path: str):
+        """Persist the index to an .npz file; keys are stored as strings."""
+        keys = list(self._texts)
+        signatures = np.zeros((len(keys), self.num_perm), dtype=np.uint32)
+        for row, key in enumerate(keys):
+            if key in self._signatures:
+                signatures[row] = self._signatures[key]
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.savez_compressed(
+            path,
+            params=np.array([self.num_perm, self.bands, self.seed]),
+            keys=np.array([str(key) for key in keys], dtype=str),
+            texts=np.array([self._texts[key] for key in keys], dtype=str),
+            has_signature=np.array([key in self._signatures for key in keys], dtype=bool),
+            signatures=signatures,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "MinHashLSHIndex":
+        with np.load(path) as data:
+            num_perm, bands, seed = (int(value) for value in data["params"])
+            index = cls(num_perm=num_perm, bands=bands, seed=seed)
+            for key, text, has_signature, signature in zip(
+                data["keys"].tolist(), data["texts"].tolist(), data["has_signature"], data["signatures"]
+            ):
+                index.insert(key, text, signature=signature if has_signature else None)
+        return index
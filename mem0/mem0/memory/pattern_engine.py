@@ -0,0 +1,195 @@
+"""
+Compiled pattern tables shared by the tagging, categorization and confidence scoring modules.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+_REPEATS = tuple(
+    getattr(sre_parse, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") if hasattr(sre_parse, name)
+)
+_ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+
+def _better(option: FrozenSet[str], best: Optional[FrozenSet[str]]) -> bool:
+    if best is None:
+        return True
+    return (min(map(len, option)), -len(option)) > (min(map(len, best)), -len(best))
+
+
+def _required_literals(items) -> Optional[FrozenSet[str]]:
+    """Lowercase ASCII strings one of which occurs in every match of a parsed pattern, or None if there are none."""
+    best, run = None, []
+
+    def flush():
+        nonlocal best
+        if run:
+            option = frozenset(["".join(run)])
+            if _better(option, best):
+                best = option
+            run.clear()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if op is sre_parse.AT:
+            # Zero-width, so the literals on either side are still adjacent in the text
+            continue
+        flush()
+        option = None
+        if op is sre_parse.SUBPATTERN:
+            option = _required_literals(av[-1])
+        elif op is _ATOMIC_GROUP:
+            option = _required_literals(av)
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branches):
+                option = frozenset().union(*branches)
+        elif op in _REPEATS and av[0] >= 1:
+            option = _required_literals(av[2])
+        if option and _better(option, best):
+            best = option
+    flush()
+    return best
+
+
+def required_literals(pattern: str, flags: int = 0) -> Optional[FrozenSet[str]]:
+    """
+    Lowercase literals one of which every match of `pattern` contains, e.g. {"priority"} for "high priority" with any
+    whitespace in between.
+
+    Returns None when no such literal can be derived, in which case the pattern has to be run on every text.
+    """
+    try:
+        return _required_literals(sre_parse.parse(pattern, flags))
+    except Exception:
+        return None
+
+
+def _plain_literal(pattern: str, flags: int) -> Optional[str]:
+    """The string a case-sensitive pattern of only literal characters matches, or None for any other pattern."""
+    if flags & re.IGNORECASE:
+        return None
+    try:
+        items = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    if not all(op is sre_parse.LITERAL for op, _ in items):
+        return None
+    return "".join(chr(av) for _, av in items)
+
+
+class PatternEngine:
+    """
+    Matches every pattern of a `{name: [patterns]}` table against a text in one call.
+
+    Patterns are compiled once, and each is indexed under literals that any of its matches must contain. A scan
+    lowercases the text once, checks the literals with substring search and runs only the patterns whose literals
+    occur; the rest cannot match. For every name with a match, `scan` returns the matching patterns in table order,
+    each with exactly what `re.findall` would have returned for it.
+    """
+
+    def __init__(self, table: Mapping[Hashable, Iterable[str]], flags: int = re.IGNORECASE, cache_size: int = 8):
+        self.flags = flags
+        self.cache_size = cache_size
+        self._entries: List[Tuple[Hashable, str, re.Pattern]] = [
+            (name, pattern, re.compile(pattern, flags)) for name, patterns in table.items() for pattern in patterns
+        ]
+        self._triggers: Dict[str, List[int]] = {}
+        self._ungated: List[int] = []
+        # Per name, the plain keywords that match by substring search and the patterns that need the regex engine
+        self._presence: Dict[Hashable, Tuple[List[str], List[int]]] = {}
+        for index, (name, pattern, _) in enumerate(self._entries):
+            plains, searched = self._presence.setdefault(name, ([], []))
+            plain = _plain_literal(pattern, flags)
+            if plain is not None:
+                plains.append(plain)
+            else:
+                searched.append(index)
+            literals = required_literals(pattern, flags)
+            if literals is None:
+                self._ungated.append(index)
+                continue
+            for literal in literals:
+                self._triggers.setdefault(literal, []).append(index)
+        self._cache: "OrderedDict[str, Dict[Hashable, List[Tuple[str, List[Any]]]]]" = OrderedDict()
+
+    def _candidates(self, text: str) -> Iterable[int]:
+        # Lowercasing only preserves case-insensitive substring matches for ASCII text
+        if not text.isascii():
+            return range(len(self._entries))
+        lowered = text.lower()
+        candidates = set(self._ungated)
+        for literal, indices in self._triggers.items():
+            if literal in lowered:
+                candidates.update(indices)
+        return sorted(candidates)
+
+    def scan(self, text: str) -> Dict[Hashable, List[Tuple[str, List[Any]]]]:
+        """
+        Match all patterns against `text`.
+
+        Returns:
+            dict: `{name: [(pattern, findall_result), ...]}` for the names with at least one matching pattern, in
+            table order. Results are cached for the last few texts and must not be modified.
+        """
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+
+        result: Dict[Hashable, List[Tuple[str, List[Any]]]] = {}
+        for index in self._candidates(text):
+            name, pattern, compiled = self._entries[index]
+            values = compiled.findall(text)
+            if values:
+                result.setdefault(name, []).append((pattern, values))
+
+        self._cache[text] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def matches(self, text: str) -> Dict[Hashable, List[str]]:
+        """Names with at least one matching pattern, mapped to their matching patterns in table order."""
+        return {name: [pattern for pattern, _ in hits] for name, hits in self.scan(text).items()}
+
+    def present(self, text: str) -> Set[Hashable]:
+        """
+        Names with at least one matching pattern, for callers that only need presence.
+
+        Plain keywords are checked with substring search and other patterns stop at their first match, so this is
+        cheaper than `matches` on texts that are not scanned again.
+        """
+        found: Set[Hashable] = set()
+        candidates = None
+        for name, (plains, searched) in self._presence.items():
+            for plain in plains:
+                if plain in text:
+                    found.add(name)
+                    break
+            if name in found or not searched:
+                continue
+            if candidates is None:
+                candidates = set(self._candidates(text))
+            for index in searched:
+                if index in candidates and self._entries[index][2].search(text):
+                    found.add(name)
+                    break
+        return found
+
+    def findall(self, text: str) -> Dict[Hashable, List[Any]]:
+        """Names mapped to the concatenated `re.findall` results of their patterns, in table order."""
+        return {name: [value for _, values in hits for value in values] for name, hits in self.scan(text).items()}
+
+
+def literal_table(table: Mapping[Hashable, Iterable[str]]) -> Dict[Hashable, List[str]]:
+    """Escape a `{name: [keywords]}` table so that an engine with `flags=0` finds the keywords as plain substrings."""
+    return {name: [re.escape(keyword) for keyword in keywords] for name, keywords in table.items()}
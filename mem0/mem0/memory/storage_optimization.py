@@ -3,22 +3,198 @@ Enhanced storage optimization system for autonomous AI memory storage.
 This module provides advanced storage limits and intelligent purging logic.
 """
 
+import heapq
 import logging
 import math
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from mem0.configs.coding_config import CodingMemoryConfig
+from mem0.memory.learning_state import RingBuffer, StreamingStats, learning_limits
 from mem0.memory.timezone_utils import (
+    ages_from_epochs,
     create_memory_timestamp,
-    safe_datetime_diff,
+    current_epoch,
+    memory_epoch,
+    parse_timestamp,
     safe_datetime_now,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def memory_scope(memory: Dict[str, Any]) -> Tuple:
+    """The (user_id, agent_id, run_id) a memory belongs to, read from the memory or its metadata."""
+    metadata = memory.get("metadata") or {}
+    return (
+        memory.get("user_id", metadata.get("user_id")),
+        memory.get("agent_id", metadata.get("agent_id")),
+        memory.get("run_id", metadata.get("run_id")),
+    )
+
+
+# Recency factors decay exponentially with a half-life of 7 days
+RECENCY_DECAY_SECONDS = 7 * 24 * 3600
+
+
+def _recency_epoch(metadata: Dict[str, Any]) -> Optional[float]:
+    """Epoch of the last access of a memory, or of its creation if it was never accessed."""
+    return memory_epoch(metadata, "last_accessed" if metadata.get("last_accessed") else "created_at")
+
+
+class StorageAccounting:
+    """
+    Running storage statistics of a memory store: counts and byte totals per category and per scope, the access
+    distribution and the oldest and newest memory.
+
+    Memories are accounted as they are added, updated and deleted, so reading the statistics is O(1) in the number of
+    memories. With `track_entries=False` nothing is kept per memory, which suits a single pass over a stream but
+    does not support `remove`.
+    """
+
+    def __init__(self, track_entries: bool = True):
+        self.track_entries = track_entries
+        self.entries: Dict[Any, Tuple] = {}
+        self.total_memories = 0
+        self.total_size_bytes = 0
+        self.category_counts: Dict[str, int] = defaultdict(int)
+        self.category_sizes: Dict[str, int] = defaultdict(int)
+        self.scope_counts: Dict[Tuple, int] = defaultdict(int)
+        self.scope_sizes: Dict[Tuple, int] = defaultdict(int)
+        self.access_distribution: Dict[int, int] = defaultdict(int)
+        # (created_at epoch, memory id) of the oldest and newest memory
+        self._oldest: Optional[Tuple[float, Any]] = None
+        self._newest: Optional[Tuple[float, Any]] = None
+        self._extremes_stale = False
+
+    def add(self, memory: Dict[str, Any], scope: Optional[Tuple] = None):
+        """Account a stored memory; a memory whose id is already accounted replaces the previous version."""
+        memory_id = memory.get("id")
+        if self.track_entries and memory_id is not None and memory_id in self.entries:
+            self.remove(memory_id)
+
+        metadata = memory.get("metadata", {})
+        size = len(str(memory).encode("utf-8"))
+        category = metadata.get("category", "general")
+        scope = memory_scope(memory) if scope is None else scope
+        created_time = memory_epoch(metadata)
+        access_bucket = min(metadata.get("access_count", 0) // 5, 10)  # Group by 5s, cap at 10
+
+        self.total_memories += 1
+        self.total_size_bytes += size
+        self.category_counts[category] += 1
+        self.category_sizes[category] += size
+        self.scope_counts[scope] += 1
+        self.scope_sizes[scope] += size
+        self.access_distribution[access_bucket] += 1
+
+        if created_time is not None and not self._extremes_stale:
+            if self._oldest is None or created_time < self._oldest[0]:
+                self._oldest = (created_time, memory_id)
+            if self._newest is None or created_time > self._newest[0]:
+                self._newest = (created_time, memory_id)
+
+        if self.track_entries and memory_id is not None:
+            self.entries[memory_id] = (scope, category, size, created_time, access_bucket)
+
+    def update(self, memory: Dict[str, Any], scope: Optional[Tuple] = None):
+        """Account the new version of an updated memory."""
+        self.add(memory, scope=scope)
+
+    def remove(self, memory_id: Any) -> bool:
+        """Stop accounting a deleted memory. Returns False when the memory was not accounted."""
+        entry = self.entries.pop(memory_id, None)
+        if entry is None:
+            return False
+
+        scope, category, size, _, access_bucket = entry
+        self.total_memories -= 1
+        self.total_size_bytes -= size
+        self._decrement(self.category_counts, category, 1)
+        self._decrement(self.category_sizes, category, size)
+        self._decrement(self.scope_counts, scope, 1)
+        self._decrement(self.scope_sizes, scope, size)
+        self._decrement(self.access_distribution, access_bucket, 1)
+
+        # Losing an extreme is the only change that needs a rescan, deferred until the statistics are read
+        if any(extreme is not None and extreme[1] == memory_id for extreme in (self._oldest, self._newest)):
+            self._extremes_stale = True
+        return True
+
+    @staticmethod
+    def _decrement(counter: Dict[Any, int], key: Any, amount: int):
+        counter[key] -= amount
+        if counter[key] <= 0:
+            del counter[key]
+
+    def _refresh_extremes(self):
+        self._oldest = self._newest = None
+        for memory_id, (_, _, _, created_time, _) in self.entries.items():
+            if created_time is None:
+                continue
+            if self._oldest is None or created_time < self._oldest[0]:
+                self._oldest = (created_time, memory_id)
+            if self._newest is None or created_time > self._newest[0]:
+                self._newest = (created_time, memory_id)
+        self._extremes_stale = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Storage statistics in the shape returned by `IntelligentStorageManager._calculate_storage_stats`."""
+        if self._extremes_stale:
+            self._refresh_extremes()
+        return {
+            "total_memories": self.total_memories,
+            "total_size_bytes": self.total_size_bytes,
+            "category_counts": defaultdict(int, self.category_counts),
+            "category_sizes": defaultdict(int, self.category_sizes),
+            "avg_memory_size": self.total_size_bytes / self.total_memories if self.total_memories else 0,
+            "oldest_memory": self._oldest[1] if self._oldest else None,
+            "newest_memory": self._newest[1] if self._newest else None,
+            "access_distribution": defaultdict(int, self.access_distribution),
+            "scope_counts": dict(self.scope_counts),
+            "scope_sizes": dict(self.scope_sizes),
+        }
+
+
+class _Candidate:
+    """Heap entry ordered in reverse, so that `heapq` keeps the largest of the `k` smallest on top."""
+
+    __slots__ = ("rank", "memory")
+
+    def __init__(self, rank: Tuple, memory: Dict[str, Any]):
+        self.rank = rank
+        self.memory = memory
+
+    def __lt__(self, other: "_Candidate") -> bool:
+        return self.rank > other.rank
+
+
+class _BoundedSelection:
+    """
+    The `k` smallest memories of a stream by key in O(k) memory, with ties broken by position in the stream,
+    which is the order `sorted(stream, key=key)[:k]` gives.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[_Candidate] = []
+
+    def push(self, key: Any, position: int, memory: Dict[str, Any]):
+        if self.k <= 0:
+            return
+        rank = (key, position)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, _Candidate(rank, memory))
+        elif rank < self._heap[0].rank:
+            heapq.heapreplace(self._heap, _Candidate(rank, memory))
+
+    def ranked(self) -> List[Tuple[Tuple, Dict[str, Any]]]:
+        return [(candidate.rank, candidate.memory) for candidate in self._heap]
+
+
 class IntelligentStorageManager:
     """
     Intelligent storage management system for autonomous AI memory storage.
@@ -134,6 +310,10 @@ class IntelligentStorageManager:
             "memories_purged": 0,
         }
 
+        # Incremental accounting of the stored memories, seeded by load_accounting and kept current through
+        # record_add/update/delete
+        self.accounting = StorageAccounting()
+
         # Performance tracking
         self.performance_metrics = {
             "storage_efficiency": 0.0,
@@ -144,18 +324,65 @@ class IntelligentStorageManager:
 
         logger.info("Intelligent storage manager initialized")
 
-    def check_storage_limits(self, memories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def load_accounting(self, memories: Iterable[Dict[str, Any]]) -> int:
+        """
+        Seed the incremental storage statistics from the memories already stored, such as `Memory.iter_all`.
+
+        Nothing in `Memory` updates these statistics, so a caller that relies on them (`check_storage_limits`
+        without a list, `optimize_storage_stream` without a total) must seed them once with this method, then call
+        `record_add`, `record_update` and `record_delete` as it stores, changes and deletes memories. Any previous
+        accounting is replaced.
+
+        Args:
+            memories: Iterable of every stored memory, read once
+
+        Returns:
+            Number of memories accounted
+        """
+        accounting = StorageAccounting()
+        for memory in memories:
+            accounting.add(memory)
+        self.accounting = accounting
+        return accounting.total_memories
+
+    def record_add(self, memory: Dict[str, Any], scope: Optional[Tuple] = None):
+        """
+        Account a newly stored memory in the incremental storage statistics seeded by `load_accounting`.
+
+        Args:
+            memory: The stored memory, with its "id" and "metadata"
+            scope: (user_id, agent_id, run_id) of the memory; read from the memory when omitted
+        """
+        self.accounting.add(memory, scope=scope)
+
+    def record_update(self, memory: Dict[str, Any], scope: Optional[Tuple] = None):
+        """
+        Account the new version of an updated memory in the incremental storage statistics.
+        """
+        self.accounting.update(memory, scope=scope)
+
+    def record_delete(self, memory_id: Any) -> bool:
+        """
+        Remove a deleted memory from the incremental storage statistics.
+        """
+        return self.accounting.remove(memory_id)
+
+    def check_storage_limits(self, memories: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Check current storage against limits and recommend actions.
 
         Args:
-            memories: List of current memories
+            memories: List of current memories. When omitted, the incrementally accounted statistics are used and
+                the check is O(1) in the number of memories; they must have been seeded with `load_accounting`.
 
         Returns:
             Dictionary containing storage status and recommendations
         """
         # Calculate current usage
-        current_stats = self._calculate_storage_stats(memories)
+        if memories is None:
+            current_stats = self.accounting.stats()
+        else:
+            current_stats = self._calculate_storage_stats(memories)
 
         # Check various limits
         limits_status = {}
@@ -208,61 +435,14 @@ class IntelligentStorageManager:
             "recommendations": recommendations,
         }
 
-    def _calculate_storage_stats(self, memories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_storage_stats(self, memories: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Calculate detailed storage statistics.
+        Calculate detailed storage statistics in a single pass.
         """
-        stats = {
-            "total_memories": len(memories),
-            "total_size_bytes": 0,
-            "category_counts": defaultdict(int),
-            "category_sizes": defaultdict(int),
-            "avg_memory_size": 0,
-            "oldest_memory": None,
-            "newest_memory": None,
-            "access_distribution": defaultdict(int),
-        }
-
-        if not memories:
-            return stats
-
-        total_size = 0
-        oldest_time = None
-        newest_time = None
-
+        accounting = StorageAccounting(track_entries=False)
         for memory in memories:
-            # Calculate size
-            memory_size = len(str(memory).encode("utf-8"))
-            total_size += memory_size
-
-            # Category stats
-            category = memory.get("metadata", {}).get("category", "general")
-            stats["category_counts"][category] += 1
-            stats["category_sizes"][category] += memory_size
-
-            # Time tracking
-            created_at = memory.get("metadata", {}).get("created_at")
-            if created_at:
-                try:
-                    created_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    if oldest_time is None or created_time < oldest_time:
-                        oldest_time = created_time
-                        stats["oldest_memory"] = memory.get("id")
-                    if newest_time is None or created_time > newest_time:
-                        newest_time = created_time
-                        stats["newest_memory"] = memory.get("id")
-                except Exception:
-                    pass
-
-            # Access pattern
-            access_count = memory.get("metadata", {}).get("access_count", 0)
-            access_bucket = min(access_count // 5, 10)  # Group by 5s, cap at 10
-            stats["access_distribution"][access_bucket] += 1
-
-        stats["total_size_bytes"] = total_size
-        stats["avg_memory_size"] = total_size / len(memories) if memories else 0
-
-        return stats
+            accounting.add(memory)
+        return accounting.stats()
 
     def _get_status_level(self, usage_ratio: float) -> str:
         """
@@ -374,6 +554,101 @@ class IntelligentStorageManager:
         purge_function = self.purging_strategies[strategy]
         memories_to_purge = purge_function(memories, memories_to_remove)
 
+        return self._complete_optimization(initial_stats, memories_to_purge, strategy)
+
+    def optimize_storage_stream(
+        self,
+        memories: Iterable[Dict[str, Any]],
+        strategy: str = "hybrid",
+        target_reduction: float = 0.1,
+        total_memories: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Optimize storage over a stream of memories, such as `Memory.iter_all`, without materializing it.
+
+        The stream is read once. Only the purge candidates each strategy could select are kept, at most
+        `target_reduction * total_memories` per selection, so memory is O(k) and time O(n log k). The purged
+        memories are the ones `optimize_storage` would select from the same memories.
+
+        Args:
+            memories: Iterable of memories to optimize
+            strategy: Optimization strategy to use
+            target_reduction: Target reduction percentage (0.0-1.0)
+            total_memories: Number of memories in the stream; defaults to the incrementally accounted total, which
+                must have been seeded with `load_accounting`
+
+        Returns:
+            Dictionary containing optimization results
+        """
+        if strategy not in self.purging_strategies:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        if total_memories is None:
+            if not self.accounting.entries:
+                raise ValueError("total_memories is required when no memories are accounted; see load_accounting")
+            total_memories = self.accounting.total_memories
+
+        target_count = int(total_memories * (1 - target_reduction))
+        memories_to_remove = total_memories - target_count
+
+        if memories_to_remove <= 0:
+            return {
+                "status": "no_optimization_needed",
+                "memories_removed": 0,
+                "size_saved_mb": 0,
+                "strategy_used": strategy,
+            }
+
+        # Candidate pools: LRU order, priority order and, per category, the memories old or weak enough to purge
+        use_lru = strategy in ("lru", "context_aware", "hybrid")
+        use_priority = strategy in ("priority_based", "hybrid")
+        use_categories = strategy in ("context_aware", "hybrid")
+        lru_pool = _BoundedSelection(memories_to_remove)
+        priority_pool = _BoundedSelection(memories_to_remove)
+        category_pools: Dict[str, _BoundedSelection] = {}
+        now = current_epoch()
+
+        accounting = StorageAccounting(track_entries=False)
+        for position, memory in enumerate(memories):
+            accounting.add(memory)
+            if use_lru:
+                lru_pool.push(self._last_accessed_key(memory), position, memory)
+            if use_priority:
+                priority_pool.push(self._calculate_memory_priority(memory, now), position, memory)
+            if use_categories:
+                category = memory.get("metadata", {}).get("category", "general")
+                policy = self.retention_policies.get(category, self.retention_policies["general"])
+                score = self._calculate_category_specific_score(memory, policy, now)
+                if self._is_purge_eligible(memory, score, timedelta(days=policy["max_age_days"]), now):
+                    pool = category_pools.setdefault(category, _BoundedSelection(memories_to_remove))
+                    pool.push(score, position, memory)
+
+        # Run the strategy on the candidates, in stream order, with the category sizes of the whole stream
+        candidates = {}
+        for pool in [lru_pool, priority_pool, *category_pools.values()]:
+            for (_, position), memory in pool.ranked():
+                candidates[position] = memory
+        candidates = [candidates[position] for position in sorted(candidates)]
+
+        initial_stats = accounting.stats()
+        purge_function = self.purging_strategies[strategy]
+        if use_categories:
+            memories_to_purge = purge_function(
+                candidates, memories_to_remove, category_counts=initial_stats["category_counts"]
+            )
+        else:
+            memories_to_purge = purge_function(candidates, memories_to_remove)
+
+        return self._complete_optimization(initial_stats, memories_to_purge, strategy)
+
+    def _complete_optimization(
+        self,
+        initial_stats: Dict[str, Any],
+        memories_to_purge: List[Dict[str, Any]],
+        strategy: str,
+    ) -> Dict[str, Any]:
+        """
+        Record a purge and build the optimization result.
+        """
         # Calculate savings
         size_saved = sum(len(str(memory).encode("utf-8")) for memory in memories_to_purge)
         size_saved_mb = size_saved / (1024 * 1024)
@@ -399,35 +674,43 @@ class IntelligentStorageManager:
         """
         Purge memories using Least Recently Used strategy.
         """
-        # Sort by last access time
-        sorted_memories = sorted(
-            memories,
-            key=lambda m: m.get("metadata", {}).get("last_accessed", "1970-01-01T00:00:00Z"),
-        )
+        # Select the least recently accessed without sorting everything
+        return heapq.nsmallest(count, memories, key=self._last_accessed_key)
 
-        return sorted_memories[:count]
+    @staticmethod
+    def _last_accessed_key(memory: Dict[str, Any]) -> str:
+        return memory.get("metadata", {}).get("last_accessed", "1970-01-01T00:00:00Z")
 
     def _priority_based_purge(self, memories: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
         """
         Purge memories using priority-based strategy.
         """
         # Calculate priority scores
+        now = current_epoch()
         scored_memories = []
         for memory in memories:
-            score = self._calculate_memory_priority(memory)
+            score = self._calculate_memory_priority(memory, now)
             scored_memories.append((score, memory))
 
-        # Sort by priority (lower scores first for purging)
-        scored_memories.sort(key=lambda x: x[0])
+        # Lowest priority scores first for purging
+        return [memory for _, memory in heapq.nsmallest(count, scored_memories, key=lambda x: x[0])]
 
-        return [memory for _, memory in scored_memories[:count]]
-
-    def _context_aware_purge(self, memories: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    def _context_aware_purge(
+        self,
+        memories: List[Dict[str, Any]],
+        count: int,
+        category_counts: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Purge memories using context-aware strategy.
+
+        `category_counts` gives the size of each category, in order of first appearance, when `memories` holds
+        only the purge candidates of a larger set.
         """
         # Group memories by category
         category_groups = defaultdict(list)
+        for category in category_counts or ():
+            category_groups[category] = []
         for memory in memories:
             category = memory.get("metadata", {}).get("category", "general")
             category_groups[category].append(memory)
@@ -443,9 +726,10 @@ class IntelligentStorageManager:
             policy = self.retention_policies.get(category, self.retention_policies["general"])
 
             # Determine how many to purge from this category
+            category_size = category_counts[category] if category_counts else len(category_memories)
             category_purge_count = min(
                 remaining_count,
-                max(0, len(category_memories) - policy["min_retention_count"]),
+                max(0, category_size - policy["min_retention_count"]),
             )
 
             if category_purge_count > 0:
@@ -456,22 +740,29 @@ class IntelligentStorageManager:
 
         # If we still need to purge more, use LRU on remaining
         if remaining_count > 0:
-            remaining_memories = [m for m in memories if m not in memories_to_purge]
+            purged_ids = {id(m) for m in memories_to_purge}
+            remaining_memories = [m for m in memories if id(m) not in purged_ids]
             additional_purged = self._lru_purge(remaining_memories, remaining_count)
             memories_to_purge.extend(additional_purged)
 
         return memories_to_purge
 
-    def _hybrid_purge(self, memories: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    def _hybrid_purge(
+        self,
+        memories: List[Dict[str, Any]],
+        count: int,
+        category_counts: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Purge memories using hybrid strategy (combination of methods).
         """
         # First pass: context-aware purging (70% of target)
         context_count = int(count * 0.7)
-        context_purged = self._context_aware_purge(memories, context_count)
+        context_purged = self._context_aware_purge(memories, context_count, category_counts=category_counts)
 
         # Second pass: priority-based purging on remaining (30% of target)
-        remaining_memories = [m for m in memories if m not in context_purged]
+        purged_ids = {id(m) for m in context_purged}
+        remaining_memories = [m for m in memories if id(m) not in purged_ids]
         remaining_count = count - len(context_purged)
 
         if remaining_count > 0:
@@ -489,43 +780,45 @@ class IntelligentStorageManager:
         """
         Purge memories from a specific category based on policy.
         """
-        # Calculate scores for each memory
-        scored_memories = []
-        for memory in category_memories:
-            score = self._calculate_category_specific_score(memory, policy)
-            scored_memories.append((score, memory))
-
-        # Sort by score (lower scores first for purging)
-        scored_memories.sort(key=lambda x: x[0])
+        # Heap of (score, position, memory); popping walks the memories lowest score first, like a stable sort
+        now = current_epoch()
+        scored_memories = [
+            (self._calculate_category_specific_score(memory, policy, now), position, memory)
+            for position, memory in enumerate(category_memories)
+        ]
+        heapq.heapify(scored_memories)
 
         # Check age restrictions
         max_age = timedelta(days=policy["max_age_days"])
-        current_time = safe_datetime_now()
 
         purged = []
-        for score, memory in scored_memories:
-            if len(purged) >= purge_count:
-                break
-
-            # Check if memory is old enough to purge
-            created_at = memory.get("metadata", {}).get("created_at")
-            if created_at:
-                try:
-                    created_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    if safe_datetime_diff(current_time, created_time) > max_age:
-                        purged.append(memory)
-                    elif score < 0.3:  # Very low score, purge regardless of age
-                        purged.append(memory)
-                except Exception:
-                    # If we can't parse the date, include it for purging
-                    purged.append(memory)
-            else:
-                # No creation date, include for purging
+        while scored_memories and len(purged) < purge_count:
+            score, _, memory = heapq.heappop(scored_memories)
+            if self._is_purge_eligible(memory, score, max_age, now):
                 purged.append(memory)
 
         return purged
 
-    def _calculate_memory_priority(self, memory: Dict[str, Any]) -> float:
+    @staticmethod
+    def _is_purge_eligible(memory: Dict[str, Any], score: float, max_age: timedelta, now: float) -> bool:
+        """
+        Whether a memory may be purged by its category policy: it is older than the policy allows, or its score is
+        very low. `now` is the current epoch.
+        """
+        # Check if memory is old enough to purge
+        metadata = memory.get("metadata", {})
+        if metadata.get("created_at"):
+            created_time = memory_epoch(metadata)
+            if created_time is None:
+                # If we can't parse the date, include it for purging
+                return True
+            if now - created_time > max_age.total_seconds():
+                return True
+            return score < 0.3  # Very low score, purge regardless of age
+        # No creation date, include for purging
+        return True
+
+    def _calculate_memory_priority(self, memory: Dict[str, Any], now: Optional[float] = None) -> float:
         """
         Calculate priority score for a memory (higher = more important).
         """
@@ -541,7 +834,7 @@ class IntelligentStorageManager:
         access_factor = min(math.log(access_count + 1) / 10, 1.0)
 
         # Recency factor
-        recency_factor = self._calculate_recency_factor(metadata)
+        recency_factor = self._calculate_recency_factor(metadata, now)
 
         # Success rate factor
         success_rate = metadata.get("success_rate", 0.5)
@@ -561,7 +854,9 @@ class IntelligentStorageManager:
 
         return priority
 
-    def _calculate_category_specific_score(self, memory: Dict[str, Any], policy: Dict[str, Any]) -> float:
+    def _calculate_category_specific_score(
+        self, memory: Dict[str, Any], policy: Dict[str, Any], now: Optional[float] = None
+    ) -> float:
         """
         Calculate category-specific score for purging decisions.
         """
@@ -575,7 +870,7 @@ class IntelligentStorageManager:
         access_score = min(math.log(access_count + 1) / 10, 1.0) * policy["access_weight"]
 
         # Recency score
-        recency_score = self._calculate_recency_factor(metadata) * 0.3
+        recency_score = self._calculate_recency_factor(metadata, now) * 0.3
 
         # Error/solution importance
         importance_boost = 0.0
@@ -589,26 +884,19 @@ class IntelligentStorageManager:
 
         return score
 
-    def _calculate_recency_factor(self, metadata: Dict[str, Any]) -> float:
+    def _calculate_recency_factor(self, metadata: Dict[str, Any], now: Optional[float] = None) -> float:
         """
-        Calculate recency factor (newer = higher score).
+        Calculate recency factor (newer = higher score). `now` is the current epoch, taken once per pass by callers
+        that score many memories.
         """
-        last_accessed = metadata.get("last_accessed")
-        if not last_accessed:
-            created_at = metadata.get("created_at")
-            if not created_at:
-                return 0.0
-            last_accessed = created_at
+        last_time = _recency_epoch(metadata)
+        if last_time is None:
+            return 0.0
 
-        try:
-            last_time = datetime.fromisoformat(last_accessed.replace("Z", "+00:00"))
-            time_diff = safe_datetime_diff(safe_datetime_now(), last_time).total_seconds()
+        time_diff = (current_epoch() if now is None else now) - last_time
 
-            # Exponential decay with half-life of 7 days
-            decay_factor = math.exp(-time_diff / (7 * 24 * 3600))
-            return decay_factor
-        except Exception:
-            return 0.0
+        # Exponential decay with half-life of 7 days
+        return math.exp(-time_diff / RECENCY_DECAY_SECONDS)
 
     def _calculate_performance_impact(
         self, initial_stats: Dict[str, Any], purged_memories: List[Dict[str, Any]]
@@ -628,9 +916,8 @@ class IntelligentStorageManager:
         )
 
         # Calculate recency impact
-        recent_purged = sum(
-            1 for memory in purged_memories if self._calculate_recency_factor(memory.get("metadata", {})) > 0.8
-        )
+        ages = ages_from_epochs(_recency_epoch(memory.get("metadata", {})) for memory in purged_memories)
+        recent_purged = int(np.count_nonzero(np.exp(-ages / RECENCY_DECAY_SECONDS) > 0.8))
 
         return {
             "category_impact": dict(category_impact),
@@ -735,7 +1022,10 @@ class AutonomousStorageManager:
 
         # Learning parameters
         self.learning_enabled = config.get("enable_learning", True)
-        self.optimization_history = []
+        self.learning_limits = learning_limits(config, history_size=100)
+        self.optimization_history = RingBuffer(maxlen=self.learning_limits["history_size"])
+        self.memories_removed_stats = StreamingStats.from_limits(self.learning_limits)
+        self.size_saved_stats = StreamingStats.from_limits(self.learning_limits)
         self.performance_tracking = {
             "optimizations_performed": 0,
             "total_memories_purged": 0,
@@ -790,7 +1080,7 @@ class AutonomousStorageManager:
             return True
 
         try:
-            last_opt_time = datetime.fromisoformat(self.last_optimization)
+            last_opt_time = parse_timestamp(self.last_optimization)
             interval = timedelta(hours=self.autonomous_settings["optimization_interval_hours"])
             return safe_datetime_now() - last_opt_time >= interval
         except Exception:
@@ -839,10 +1129,8 @@ class AutonomousStorageManager:
         }
 
         self.optimization_history.append(record)
-
-        # Keep only recent history
-        if len(self.optimization_history) > 100:
-            self.optimization_history = self.optimization_history[-100:]
+        self.memories_removed_stats.add(record["memories_removed"])
+        self.size_saved_stats.add(record["size_saved_mb"])
 
     def _update_learning_data(self, result: Dict[str, Any]):
         """
@@ -912,6 +1200,8 @@ class AutonomousStorageManager:
             "autonomous_settings": self.autonomous_settings,
             "performance_tracking": self.performance_tracking,
             "optimization_history": self.optimization_history[-10:],  # Last 10 optimizations
+            "memories_removed": self.memories_removed_stats.snapshot(),
+            "size_saved_mb": self.size_saved_stats.snapshot(),
             "learning_enabled": self.learning_enabled,
             "last_optimization": self.last_optimization,
         }
@@ -928,6 +1218,8 @@ class AutonomousStorageManager:
         Reset learning and performance data.
         """
         self.optimization_history.clear()
+        self.memories_removed_stats.reset()
+        self.size_saved_stats.reset()
         self.performance_tracking = {
             "optimizations_performed": 0,
             "total_memories_purged": 0,
@@ -4,13 +4,45 @@ This module provides consistent timezone handling across all memory components.
 """
 
 import logging
+import math
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
 
+import numpy as np
 import pytz
 
 logger = logging.getLogger(__name__)
 
+# Timestamp fields of a memory payload; the epochs are numeric copies of the ISO strings for fast age arithmetic
+TIMESTAMP_PAYLOAD_KEYS = ("created_at", "updated_at", "created_at_epoch", "updated_at_epoch")
+
+
+@lru_cache(maxsize=None)
+def get_timezone(name: str):
+    """
+    Get a pytz timezone by name, created once per name.
+
+    Args:
+        name: IANA timezone name, e.g. "US/Pacific"
+    """
+    return pytz.timezone(name)
+
+
+@lru_cache(maxsize=65536)
+def parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an ISO formatted timestamp, accepting a trailing "Z" for UTC.
+
+    Stored timestamps are parsed again on every scoring and purge pass, so results are memoized; datetimes are
+    immutable, which makes sharing them safe.
+
+    Raises:
+        ValueError: If the timestamp is not ISO formatted
+    """
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
 
 class TimezoneConfig:
     """
@@ -27,7 +59,7 @@ class TimezoneConfig:
         """
         self.default_timezone = default_timezone
         self.use_system_timezone = use_system_timezone
-        self._default_tz = pytz.timezone(default_timezone)
+        self._default_tz = get_timezone(default_timezone)
 
     def get_default_timezone(self):
         """Get the configured default timezone."""
@@ -169,7 +201,7 @@ def get_memory_age_hours(created_at: str, reference_time: Optional[datetime] = N
         Age in hours, or 0.0 if calculation fails
     """
     try:
-        created_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        created_time = parse_timestamp(created_at)
         current_time = safe_datetime_now(reference_time)
         age_diff = safe_datetime_diff(current_time, created_time)
         return age_diff.total_seconds() / 3600
@@ -190,10 +222,98 @@ def get_memory_age_days(created_at: str, reference_time: Optional[datetime] = No
         Age in days, or 0 if calculation fails
     """
     try:
-        created_time = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        created_time = parse_timestamp(created_at)
         current_time = safe_datetime_now(reference_time)
         age_diff = safe_datetime_diff(current_time, created_time)
         return age_diff.days
     except Exception as e:
         logger.warning(f"Error calculating memory age: {e}")
         return 0
+
+
+def to_epoch(dt: datetime) -> float:
+    """
+    Convert a datetime to seconds since the Unix epoch.
+
+    Naive datetimes are taken to be in the default timezone, as in `safe_datetime_diff`.
+    """
+    if dt.tzinfo is None:
+        dt = _timezone_config.get_default_timezone().localize(dt)
+    return dt.timestamp()
+
+
+def timestamp_to_epoch(timestamp: str) -> float:
+    """
+    Convert an ISO formatted timestamp to seconds since the Unix epoch, memoized like `parse_timestamp`.
+
+    Raises:
+        ValueError: If the timestamp is not ISO formatted
+    """
+    return _timestamp_to_epoch(timestamp, _timezone_config.get_default_timezone())
+
+
+@lru_cache(maxsize=65536)
+def _timestamp_to_epoch(timestamp: str, default_tz) -> float:
+    # Keyed by the default timezone too, since naive timestamps are read in it
+    dt = parse_timestamp(timestamp)
+    if dt.tzinfo is None:
+        dt = default_tz.localize(dt)
+    return dt.timestamp()
+
+
+def current_epoch() -> float:
+    """Current time in seconds since the Unix epoch."""
+    return time.time()
+
+
+def create_memory_timestamps(reference_time: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Create the creation timestamp fields of a memory payload.
+
+    Returns:
+        Dictionary with the ISO formatted "created_at" and its numeric "created_at_epoch"
+    """
+    now = safe_datetime_now(reference_time)
+    return {"created_at": now.isoformat(), "created_at_epoch": now.timestamp()}
+
+
+def memory_epoch(metadata: Dict[str, Any], key: str = "created_at") -> Optional[float]:
+    """
+    Get a timestamp of a memory as seconds since the Unix epoch.
+
+    The numeric `<key>_epoch` stored next to the ISO string is used when present, so only memories written before
+    epochs were stored are parsed.
+
+    Args:
+        metadata: Memory metadata or payload
+        key: Timestamp field, e.g. "created_at", "updated_at" or "last_accessed"
+
+    Returns:
+        Epoch seconds, or None if the timestamp is missing or invalid
+    """
+    epoch = metadata.get(f"{key}_epoch")
+    if epoch is not None:
+        return float(epoch)
+    timestamp = metadata.get(key)
+    if not timestamp:
+        return None
+    try:
+        return timestamp_to_epoch(timestamp)
+    except Exception:
+        return None
+
+
+def ages_from_epochs(epochs: Iterable[Optional[float]], now: Optional[float] = None) -> np.ndarray:
+    """
+    Ages in seconds of many timestamps at once.
+
+    Args:
+        epochs: Epoch seconds, None for a missing timestamp
+        now: Reference epoch; defaults to the current time
+
+    Returns:
+        Array of ages in seconds, NaN where the timestamp is missing
+    """
+    now = current_epoch() if now is None else now
+    values = np.array([math.nan if epoch is None else epoch for epoch in epochs], dtype=float)
+    return now - values
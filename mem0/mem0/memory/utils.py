@@ -1,4 +1,6 @@
+import asyncio
 import hashlib
+import inspect
 import re
 
 from mem0.configs.prompts import FACT_RETRIEVAL_PROMPT
@@ -131,3 +133,32 @@ def process_telemetry_filters(filters):
         encoded_ids["run_id"] = hashlib.sha256(filters["run_id"].encode()).hexdigest()
 
     return list(filters.keys()), encoded_ids
+
+
+def _native_async(component, method_name):
+    method = getattr(component, method_name, None)
+    return method if inspect.iscoroutinefunction(method) else None
+
+
+async def aembed(embedding_model, text, *args, **kwargs):
+    """Embed a text with the embedder's native `aembed`, or in a worker thread when it has none."""
+    method = _native_async(embedding_model, "aembed")
+    if method:
+        return await method(text, *args, **kwargs)
+    return await asyncio.to_thread(embedding_model.embed, text, *args, **kwargs)
+
+
+async def aembed_batch(embedding_model, texts, *args, **kwargs):
+    """Embed several texts with the embedder's native `aembed_batch`, or in a worker thread when it has none."""
+    method = _native_async(embedding_model, "aembed_batch")
+    if method:
+        return await method(texts, *args, **kwargs)
+    return await asyncio.to_thread(embedding_model.embed_batch, texts, *args, **kwargs)
+
+
+async def agenerate_response(llm, **kwargs):
+    """Call the LLM's native `agenerate_response`, or `generate_response` in a worker thread when it has none."""
+    method = _native_async(llm, "agenerate_response")
+    if method:
+        return await method(**kwargs)
+    return await asyncio.to_thread(llm.generate_response, **kwargs)
@@ -59,17 +59,44 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config, vector_config: Optional[dict]):
+    def create(
+        cls, provider_name, config, vector_config: Optional[dict], coalescing_config=None, compaction_config=None
+    ):
         if provider_name == "upstash_vector" and vector_config and vector_config.enable_embeddings:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            instance = embedder_instance(base_config)
+            if compaction_config:
+                instance = cls._wrap_with_compaction(instance, compaction_config)
+            if coalescing_config:
+                return cls._wrap_with_coalescing(provider_name, instance, coalescing_config)
+            return instance
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
+    @classmethod
+    def _wrap_with_compaction(cls, instance, compaction_config):
+        from mem0.embeddings.compaction import CompactingEmbedder
+
+        if not isinstance(compaction_config, dict):
+            compaction_config = compaction_config.model_dump()
+        return CompactingEmbedder(instance, **compaction_config)
+
+    @classmethod
+    def _wrap_with_coalescing(cls, provider_name, instance, coalescing_config):
+        from mem0.embeddings.coalescing import DEFAULT_MAX_BATCH_SIZE, PROVIDER_MAX_BATCH_SIZES, CoalescingEmbedder
+
+        if not isinstance(coalescing_config, dict):
+            coalescing_config = coalescing_config.model_dump()
+        coalescing_config = dict(coalescing_config)
+        max_batch_size = coalescing_config.pop("max_batch_size", None) or PROVIDER_MAX_BATCH_SIZES.get(
+            provider_name, DEFAULT_MAX_BATCH_SIZE
+        )
+        return CoalescingEmbedder(instance, max_batch_size=max_batch_size, **coalescing_config)
+
 
 class VectorStoreFactory:
     provider_to_class = {
@@ -92,17 +119,69 @@ class VectorStoreFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config):
+    def create(cls, provider_name, config, cache_config=None):
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             if not isinstance(config, dict):
                 config = config.model_dump()
             vector_store_instance = load_class(class_type)
-            return vector_store_instance(**config)
+            instance = vector_store_instance(**config)
+            if cache_config:
+                return cls._wrap_with_cache(provider_name, instance, cache_config)
+            return instance
         else:
             raise ValueError(f"Unsupported VectorStore provider: {provider_name}")
 
+    @classmethod
+    def _wrap_with_cache(cls, provider_name, instance, cache_config):
+        from mem0.vector_stores.hot_set_cache import PROVIDER_METRICS, HotSetVectorCache
+
+        if not isinstance(cache_config, dict):
+            cache_config = cache_config.model_dump()
+        cache_config = dict(cache_config)
+        metric = cache_config.pop("metric", None) or PROVIDER_METRICS.get(provider_name)
+        if metric is None:
+            raise ValueError(
+                f"Cannot infer the score metric of vector store provider '{provider_name}'. "
+                "Set `vector_store.cache.metric` explicitly."
+            )
+        return HotSetVectorCache(instance, metric=metric, **cache_config)
+
     @classmethod
     def reset(cls, instance):
         instance.reset()
         return instance
+
+
+class GraphStoreFactory:
+    provider_to_class = {
+        "neo4j": "mem0.memory.graph_memory.MemoryGraph",
+        "memgraph": "mem0.memory.memgraph_memory.MemoryGraph",
+        "neptune": "mem0.graphs.neptune.main.MemoryGraph",
+        "local": "mem0.graphs.local.MemoryGraph",
+    }
+    # Providers with a native asyncio implementation; the others are run in worker threads by AsyncMemory.
+    provider_to_async_class = {
+        "neo4j": "mem0.memory.async_graph_memory.AsyncMemoryGraph",
+    }
+
+    @classmethod
+    def create(cls, provider_name, config, use_async=False, embedding_model=None, llm=None):
+        """
+        Create a graph store.
+
+        `embedding_model` and `llm` are the instances the caller already built from the same config; passing them lets
+        the graph share one embedding model and client pool with the vector store side instead of creating its own.
+        The LLM is only shared when the graph store does not configure a different LLM provider.
+        """
+        class_type = (use_async and cls.provider_to_async_class.get(provider_name)) or cls.provider_to_class.get(
+            provider_name
+        )
+        if class_type:
+            graph_class = load_class(class_type)
+            graph_llm = getattr(config.graph_store, "llm", None)
+            if graph_llm and graph_llm.provider != config.llm.provider:
+                llm = None
+            return graph_class(config, embedding_model=embedding_model, llm=llm)
+        else:
+            raise ValueError(f"Unsupported GraphStore provider: {provider_name}")
@@ -17,6 +17,26 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_batch(self, queries, vectors, limit=5, filters=None):
+        """
+        Search for the vectors similar to each of several query vectors.
+
+        Stores whose client accepts multiple queries per request override this to search in one round trip.
+
+        Args:
+            queries (list): Queries, one per vector.
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query vector, in order.
+        """
+        return [
+            self.search(query=query, vectors=vector, limit=limit, filters=filters)
+            for query, vector in zip(queries, vectors)
+        ]
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
@@ -56,3 +76,15 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+    def list_vectors(self, filters=None, limit=None):
+        """
+        List stored vectors together with their payloads.
+
+        Optional capability used by in-process caches that need the raw vectors of a scope.
+        Stores that cannot return vectors leave this unimplemented.
+
+        Returns:
+            list: Tuples of (id, vector, payload).
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing vectors")
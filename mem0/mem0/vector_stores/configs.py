@@ -3,12 +3,32 @@ from typing import Dict, Optional
 from pydantic import BaseModel, Field, model_validator
 
 
+class VectorCacheConfig(BaseModel):
+    max_memory_mb: float = Field(
+        description="Memory budget for cached scopes in megabytes",
+        default=256.0,
+    )
+    max_scope_size: int = Field(
+        description="Scopes holding more vectors than this are always served by the vector store",
+        default=20000,
+    )
+    metric: Optional[str] = Field(
+        description="Score semantics of the vector store ('cosine', 'cosine_distance', 'inner_product'). "
+        "Inferred from the provider when omitted",
+        default=None,
+    )
+
+
 class VectorStoreConfig(BaseModel):
     provider: str = Field(
         description="Provider of the vector store (e.g., 'qdrant', 'chroma', 'upstash_vector')",
         default="qdrant",
     )
     config: Optional[Dict] = Field(description="Configuration for the specific vector store", default=None)
+    cache: Optional[VectorCacheConfig] = Field(
+        description="Optional in-process hot-set cache in front of the vector store",
+        default=None,
+    )
 
     _provider_configs: Dict[str, str] = {
         "qdrant": "QdrantConfig",
@@ -0,0 +1,352 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from mem0.vector_stores.base import VectorStoreBase
+
+logger = logging.getLogger(__name__)
+
+SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+# Score semantics of the stores the cache knows how to mirror.
+# "cosine" -> similarity, higher is better (Qdrant)
+# "cosine_distance" -> 1 - cosine similarity, lower is better (pgvector `<=>`)
+# "inner_product" -> raw dot product, higher is better
+PROVIDER_METRICS = {
+    "qdrant": "cosine",
+    "pgvector": "cosine_distance",
+}
+SUPPORTED_METRICS = ("cosine", "cosine_distance", "inner_product")
+
+
+class OutputData(BaseModel):
+    id: Optional[str]
+    score: Optional[float]
+    payload: Optional[Dict]
+
+
+class _ScopeEntry:
+    __slots__ = ("ids", "matrix", "payloads", "nbytes")
+
+    def __init__(self, ids: List[str], matrix: np.ndarray, payloads: List[Dict], nbytes: int):
+        self.ids = ids
+        self.matrix = matrix
+        self.payloads = payloads
+        self.nbytes = nbytes
+
+
+class HotSetVectorCache(VectorStoreBase):
+    """
+    In-process cache of recently searched scopes in front of a remote vector store.
+
+    A scope is the combination of `user_id`/`agent_id`/`run_id` in the search filters. On the first search for a
+    scope, all of its vectors and payloads are loaded into a matrix and subsequent searches are answered with an
+    exact top-k over that matrix. Every mutation is written through to the backing store and drops all cached
+    scopes it touches, so cached results never diverge from the backing store. Whole scopes are evicted in LRU
+    order once the memory budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        store: VectorStoreBase,
+        metric: str,
+        max_memory_mb: float = 256.0,
+        max_scope_size: int = 20000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            store (VectorStoreBase): Backing vector store. Must implement `list_vectors`.
+            metric (str): Score semantics of the backing store. One of 'cosine', 'cosine_distance', 'inner_product'.
+            max_memory_mb (float, optional): Memory budget for cached scopes. Defaults to 256.
+            max_scope_size (int, optional): Scopes with more vectors than this are never cached. Defaults to 20000.
+        """
+        if metric not in SUPPORTED_METRICS:
+            raise ValueError(f"Unsupported cache metric: {metric}. Must be one of {', '.join(SUPPORTED_METRICS)}")
+
+        self.store = store
+        self.metric = metric
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self.max_scope_size = max_scope_size
+
+        self._scopes: "OrderedDict[Tuple, _ScopeEntry]" = OrderedDict()
+        self._id_to_scopes: Dict[str, set] = {}
+        self._used_bytes = 0
+        self._write_epoch = 0
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "bypasses": 0, "evictions": 0, "invalidations": 0}
+
+    def __getattr__(self, name):
+        # Only reached for attributes not defined on the cache, e.g. store-specific `client` or `collection_name`.
+        store = self.__dict__.get("store")
+        if store is None:
+            raise AttributeError(name)
+        return getattr(store, name)
+
+    @staticmethod
+    def _scope_key(filters: Optional[Dict]) -> Optional[Tuple]:
+        if not filters:
+            return None
+        key = tuple((k, filters[k]) for k in SCOPE_KEYS if k in filters)
+        return key or None
+
+    @staticmethod
+    def _payload_in_scope(payload: Optional[Dict], scope: Tuple) -> bool:
+        if not payload:
+            return False
+        return all(payload.get(k) == v for k, v in scope)
+
+    def _cacheable(self, filters: Optional[Dict]) -> Optional[Tuple]:
+        scope = self._scope_key(filters)
+        if scope is None:
+            return None
+        # Only plain equality filters can be evaluated locally with the backing store's semantics.
+        for value in filters.values():
+            if not isinstance(value, str):
+                return None
+        return scope
+
+    def _load_scope(self, scope: Tuple) -> Optional[_ScopeEntry]:
+        with self._lock:
+            epoch = self._write_epoch
+
+        try:
+            rows = self.store.list_vectors(filters=dict(scope), limit=self.max_scope_size + 1)
+        except NotImplementedError:
+            logger.warning(f"{type(self.store).__name__} cannot list vectors; hot-set cache is disabled")
+            self.max_scope_size = 0
+            return None
+
+        if len(rows) > self.max_scope_size:
+            return None
+
+        ids = [row[0] for row in rows]
+        payloads = [row[2] or {} for row in rows]
+        if rows:
+            matrix = np.asarray([row[1] for row in rows], dtype=np.float32)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        if self.metric in ("cosine", "cosine_distance") and matrix.size:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+
+        nbytes = matrix.nbytes + sum(len(json.dumps(p, default=str)) for p in payloads)
+        entry = _ScopeEntry(ids, matrix, payloads, nbytes)
+
+        with self._lock:
+            # A write landed while we were loading; the snapshot may be stale.
+            if epoch != self._write_epoch:
+                return entry
+            if nbytes > self.max_bytes:
+                return entry
+            self._install(scope, entry)
+        return entry
+
+    def _install(self, scope: Tuple, entry: _ScopeEntry):
+        self._drop(scope)
+        self._scopes[scope] = entry
+        self._used_bytes += entry.nbytes
+        for vector_id in entry.ids:
+            self._id_to_scopes.setdefault(vector_id, set()).add(scope)
+
+        while self._used_bytes > self.max_bytes and self._scopes:
+            evicted, _ = next(iter(self._scopes.items()))
+            self._drop(evicted)
+            self._stats["evictions"] += 1
+
+    def _drop(self, scope: Tuple):
+        entry = self._scopes.pop(scope, None)
+        if entry is None:
+            return
+        self._used_bytes -= entry.nbytes
+        for vector_id in entry.ids:
+            scopes = self._id_to_scopes.get(vector_id)
+            if scopes is not None:
+                scopes.discard(scope)
+                if not scopes:
+                    del self._id_to_scopes[vector_id]
+
+    def _invalidate(self, vector_ids=(), payloads=()):
+        with self._lock:
+            self._write_epoch += 1
+            stale = set()
+            for vector_id in vector_ids:
+                stale.update(self._id_to_scopes.get(vector_id, ()))
+            for payload in payloads:
+                stale.update(scope for scope in self._scopes if self._payload_in_scope(payload, scope))
+            for scope in stale:
+                self._drop(scope)
+            self._stats["invalidations"] += len(stale)
+
+    def _score(self, entry: _ScopeEntry, vectors) -> np.ndarray:
+        query = np.asarray(vectors, dtype=np.float32).reshape(-1)
+        if self.metric == "inner_product":
+            return entry.matrix @ query
+        norm = np.linalg.norm(query)
+        similarities = entry.matrix @ (query / norm if norm else query)
+        if self.metric == "cosine_distance":
+            return 1.0 - similarities
+        return similarities
+
+    def search(self, query, vectors, limit=5, filters=None):
+        """
+        Search for similar vectors, serving cached scopes locally.
+
+        Args:
+            query (str): Query.
+            vectors (List[float]): Query vector.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Dict, optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            list: Search results.
+        """
+        scope = self._cacheable(filters) if self.max_scope_size else None
+        if scope is None:
+            with self._lock:
+                self._stats["bypasses"] += 1
+            return self.store.search(query=query, vectors=vectors, limit=limit, filters=filters)
+
+        with self._lock:
+            entry = self._scopes.get(scope)
+            if entry is not None:
+                self._scopes.move_to_end(scope)
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+
+        if entry is None:
+            entry = self._load_scope(scope)
+            if entry is None:
+                return self.store.search(query=query, vectors=vectors, limit=limit, filters=filters)
+
+        if not entry.ids or limit <= 0:
+            return []
+
+        extra = [(k, v) for k, v in filters.items() if k not in SCOPE_KEYS]
+        candidates = np.arange(len(entry.ids))
+        if extra:
+            candidates = np.asarray(
+                [i for i in candidates if all(entry.payloads[i].get(k) == v for k, v in extra)], dtype=np.int64
+            )
+            if not candidates.size:
+                return []
+
+        scores = self._score(entry, vectors)[candidates]
+        # Distances rank ascending, similarities descending.
+        keys = scores if self.metric == "cosine_distance" else -scores
+        k = min(limit, candidates.size)
+        top = np.argpartition(keys, k - 1)[:k] if k < candidates.size else np.arange(candidates.size)
+        top = top[np.argsort(keys[top], kind="stable")]
+
+        return [
+            OutputData(
+                id=entry.ids[candidates[i]],
+                score=float(scores[i]),
+                payload=dict(entry.payloads[candidates[i]]),
+            )
+            for i in top
+        ]
+
+    def search_batch(self, queries, vectors, limit=5, filters=None):
+        """
+        Search for several query vectors, serving cached scopes locally and batching the rest in the backing store.
+        """
+        if self.max_scope_size and self._cacheable(filters) is not None:
+            return super().search_batch(queries, vectors, limit=limit, filters=filters)
+        with self._lock:
+            self._stats["bypasses"] += len(vectors)
+        return self.store.search_batch(queries=queries, vectors=vectors, limit=limit, filters=filters)
+
+    def insert(self, vectors, payloads=None, ids=None):
+        """Insert vectors into the backing store and invalidate affected scopes."""
+        try:
+            return self.store.insert(vectors=vectors, payloads=payloads, ids=ids)
+        finally:
+            self._invalidate(vector_ids=ids or (), payloads=payloads or ())
+
+    def update(self, vector_id, vector=None, payload=None):
+        """Update a vector in the backing store and invalidate affected scopes."""
+        try:
+            return self.store.update(vector_id=vector_id, vector=vector, payload=payload)
+        finally:
+            self._invalidate(vector_ids=[vector_id], payloads=[payload] if payload else ())
+
+    def delete(self, vector_id):
+        """Delete a vector from the backing store and invalidate affected scopes."""
+        try:
+            return self.store.delete(vector_id=vector_id)
+        finally:
+            self._invalidate(vector_ids=[vector_id])
+
+    def get(self, vector_id):
+        """Retrieve a vector by ID from the backing store."""
+        return self.store.get(vector_id=vector_id)
+
+    def list(self, filters=None, limit=None):
+        """List memories from the backing store."""
+        if limit is None:
+            return self.store.list(filters=filters)
+        return self.store.list(filters=filters, limit=limit)
+
+    def list_vectors(self, filters=None, limit=None):
+        """List vectors from the backing store."""
+        return self.store.list_vectors(filters=filters, limit=limit)
+
+    def create_col(self, *args, **kwargs):
+        """Create a collection in the backing store."""
+        return self.store.create_col(*args, **kwargs)
+
+    def list_cols(self):
+        """List collections of the backing store."""
+        return self.store.list_cols()
+
+    def delete_col(self):
+        """Delete the backing collection and drop all cached scopes."""
+        try:
+            return self.store.delete_col()
+        finally:
+            self.clear()
+
+    def col_info(self):
+        """Get information about the backing collection."""
+        return self.store.col_info()
+
+    def reset(self):
+        """Reset the backing store and drop all cached scopes."""
+        try:
+            return self.store.reset()
+        finally:
+            self.clear()
+
+    def clear(self):
+        """Drop all cached scopes."""
+        with self._lock:
+            self._write_epoch += 1
+            self._scopes.clear()
+            self._id_to_scopes.clear()
+            self._used_bytes = 0
+
+    def cache_info(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict: Hit/miss counters, number of cached scopes and memory usage.
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "scopes": len(self._scopes),
+                "vectors": sum(len(entry.ids) for entry in self._scopes.values()),
+                "used_bytes": self._used_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -33,6 +33,7 @@ class PGVector(VectorStoreBase):
         port,
         diskann,
         hnsw,
+        vector_datatype="float32",
     ):
         """
         Initialize the PGVector database.
@@ -47,11 +48,13 @@ class PGVector(VectorStoreBase):
             port (int, optional): Database port
             diskann (bool, optional): Use DiskANN for faster search
             hnsw (bool, optional): Use HNSW for faster search
+            vector_datatype (str, optional): "float32", or "float16" to store vectors as halfvec
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        self.vector_type = "halfvec" if vector_datatype == "float16" else "vector"
 
         self.conn = psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port)
         self.cur = self.conn.cursor()
@@ -73,13 +76,14 @@ class PGVector(VectorStoreBase):
             f"""
             CREATE TABLE IF NOT EXISTS {self.collection_name} (
                 id UUID PRIMARY KEY,
-                vector vector({embedding_model_dims}),
+                vector {self.vector_type}({embedding_model_dims}),
                 payload JSONB
             );
         """
         )
 
-        if self.use_diskann and embedding_model_dims < 2000:
+        # pgvectorscale's DiskANN index only supports the vector type
+        if self.use_diskann and self.vector_type == "vector" and embedding_model_dims < 2000:
             # Check if vectorscale extension is installed
             self.cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
             if self.cur.fetchone():
@@ -96,7 +100,7 @@ class PGVector(VectorStoreBase):
                 f"""
                 CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
                 ON {self.collection_name}
-                USING hnsw (vector vector_cosine_ops)
+                USING hnsw (vector {self.vector_type}_cosine_ops)
             """
             )
 
@@ -147,7 +151,7 @@ class PGVector(VectorStoreBase):
 
         self.cur.execute(
             f"""
-            SELECT id, vector <=> %s::vector AS distance, payload
+            SELECT id, vector <=> %s::{self.vector_type} AS distance, payload
             FROM {self.collection_name}
             {filter_clause}
             ORDER BY distance
@@ -278,6 +282,45 @@ class PGVector(VectorStoreBase):
         results = self.cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def list_vectors(self, filters=None, limit=None):
+        """
+        List vectors with their payloads.
+
+        Args:
+            filters (Dict, optional): Filters to apply to the list.
+            limit (int, optional): Number of vectors to return. Defaults to no limit.
+
+        Returns:
+            List[Tuple[str, List[float], Dict]]: (id, vector, payload) tuples.
+        """
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        limit_clause = "LIMIT %s" if limit is not None else ""
+        params = (*filter_params, limit) if limit is not None else tuple(filter_params)
+
+        self.cur.execute(
+            f"""
+            SELECT id, vector, payload
+            FROM {self.collection_name}
+            {filter_clause}
+            {limit_clause}
+        """,
+            params,
+        )
+
+        results = []
+        for r in self.cur.fetchall():
+            vector = json.loads(r[1]) if isinstance(r[1], str) else list(r[1])
+            results.append((str(r[0]), vector, r[2]))
+        return results
+
     def __del__(self):
         """
         Close the database connection when the object is deleted.
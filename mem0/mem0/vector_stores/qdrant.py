@@ -4,12 +4,14 @@ import shutil
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    Datatype,
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
     PointIdsList,
     PointStruct,
+    QueryRequest,
     Range,
     VectorParams,
 )
@@ -31,6 +33,7 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        vector_datatype: str = "float32",
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,6 +48,7 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            vector_datatype (str, optional): "float32", or "float16" to store vectors at half precision. Defaults to "float32".
         """
         if client:
             self.client = client
@@ -68,6 +72,7 @@ class Qdrant(VectorStoreBase):
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.vector_datatype = vector_datatype
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -86,9 +91,12 @@ class Qdrant(VectorStoreBase):
                 logger.debug(f"Collection {self.collection_name} already exists. Skipping creation.")
                 return
 
+        vector_params = {"size": vector_size, "distance": distance, "on_disk": on_disk}
+        if self.vector_datatype == "float16":
+            vector_params["datatype"] = Datatype.FLOAT16
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
+            vectors_config=VectorParams(**vector_params),
         )
 
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
@@ -151,6 +159,30 @@ class Qdrant(VectorStoreBase):
         )
         return hits.points
 
+    def search_batch(self, queries: list, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for the vectors similar to each query vector in one request.
+
+        Args:
+            queries (list): Queries, one per vector.
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query vector.
+        """
+        if not vectors:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True) for vector in vectors
+            ],
+        )
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -233,6 +265,37 @@ class Qdrant(VectorStoreBase):
         )
         return result
 
+    def list_vectors(self, filters: dict = None, limit: int = None) -> list:
+        """
+        List vectors with their payloads.
+
+        Args:
+            filters (dict, optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to no limit.
+
+        Returns:
+            list: (id, vector, payload) tuples.
+        """
+        query_filter = self._create_filter(filters) if filters else None
+        results = []
+        offset = None
+        while True:
+            page_size = 256 if limit is None else min(256, limit - len(results))
+            if page_size <= 0:
+                break
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                scroll_filter=query_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True,
+            )
+            results.extend((str(point.id), point.vector, point.payload) for point in points)
+            if offset is None:
+                break
+        return results
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -4,13 +4,13 @@ from datetime import datetime
 from functools import reduce
 
 import numpy as np
-import pytz
 import redis
 from redis.commands.search.query import Query
 from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.query.filter import Tag
 
+from mem0.memory.timezone_utils import get_timezone
 from mem0.memory.utils import extract_json
 from mem0.vector_stores.base import VectorStoreBase
 
@@ -37,6 +37,16 @@ DEFAULT_FIELDS = [
 
 excluded_keys = {"user_id", "agent_id", "run_id", "hash", "data", "created_at", "updated_at"}
 
+PACIFIC_TZ = get_timezone("US/Pacific")
+
+
+def _epoch_field(payload: dict, key: str) -> int:
+    """Numeric index value of a payload timestamp, from its stored epoch when present."""
+    epoch = payload.get(f"{key}_epoch")
+    if epoch is None:
+        epoch = datetime.fromisoformat(payload[key]).timestamp()
+    return int(epoch)
+
 
 class MemoryResult:
     def __init__(self, id: str, payload: dict, score: float = None):
@@ -127,7 +137,7 @@ class RedisDB(VectorStoreBase):
                 "memory_id": id,
                 "hash": payload["hash"],
                 "memory": payload["data"],
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+                "created_at": _epoch_field(payload, "created_at"),
                 "embedding": np.array(vector, dtype=np.float32).tobytes(),
             }
 
@@ -163,14 +173,14 @@ class RedisDB(VectorStoreBase):
                 payload={
                     "hash": result["hash"],
                     "data": result["memory"],
-                    "created_at": datetime.fromtimestamp(
-                        int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds"),
+                    "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=PACIFIC_TZ).isoformat(
+                        timespec="microseconds"
+                    ),
                     **(
                         {
-                            "updated_at": datetime.fromtimestamp(
-                                int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                            ).isoformat(timespec="microseconds")
+                            "updated_at": datetime.fromtimestamp(int(result["updated_at"]), tz=PACIFIC_TZ).isoformat(
+                                timespec="microseconds"
+                            )
                         }
                         if "updated_at" in result
                         else {}
@@ -190,8 +200,8 @@ class RedisDB(VectorStoreBase):
             "memory_id": vector_id,
             "hash": payload["hash"],
             "memory": payload["data"],
-            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
+            "created_at": _epoch_field(payload, "created_at"),
+            "updated_at": _epoch_field(payload, "updated_at"),
             "embedding": np.array(vector, dtype=np.float32).tobytes(),
         }
 
@@ -207,14 +217,14 @@ class RedisDB(VectorStoreBase):
         payload = {
             "hash": result["hash"],
             "data": result["memory"],
-            "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=pytz.timezone("US/Pacific")).isoformat(
+            "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=PACIFIC_TZ).isoformat(
                 timespec="microseconds"
             ),
             **(
                 {
-                    "updated_at": datetime.fromtimestamp(
-                        int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds")
+                    "updated_at": datetime.fromtimestamp(int(result["updated_at"]), tz=PACIFIC_TZ).isoformat(
+                        timespec="microseconds"
+                    )
                 }
                 if "updated_at" in result
                 else {}
@@ -270,13 +280,13 @@ class RedisDB(VectorStoreBase):
                     payload={
                         "hash": result["hash"],
                         "data": result["memory"],
-                        "created_at": datetime.fromtimestamp(
-                            int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                        ).isoformat(timespec="microseconds"),
+                        "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=PACIFIC_TZ).isoformat(
+                            timespec="microseconds"
+                        ),
                         **(
                             {
                                 "updated_at": datetime.fromtimestamp(
-                                    int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
+                                    int(result["updated_at"]), tz=PACIFIC_TZ
                                 ).isoformat(timespec="microseconds")
                             }
                             if result.__dict__.get("updated_at")
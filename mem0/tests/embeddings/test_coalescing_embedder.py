@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.coalescing import CoalescingEmbedder
+from mem0.utils.factory import EmbedderFactory
+
+
+class RecordingEmbedder(EmbeddingBase):
+    def __init__(self, fail=False):
+        super().__init__()
+        self.calls = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def embed(self, text, memory_action=None):
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts, memory_action=None):
+        with self._lock:
+            self.calls.append((list(texts), memory_action))
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return [[float(len(text)), 1.0 if memory_action == "search" else 0.0] for text in texts]
+
+
+def _embed_concurrently(embedder, texts, action="add"):
+    barrier = threading.Barrier(len(texts))
+
+    def call(text):
+        barrier.wait()
+        return embedder.embed(text, action)
+
+    with ThreadPoolExecutor(len(texts)) as pool:
+        return list(pool.map(call, texts))
+
+
+def test_concurrent_calls_are_merged_and_fanned_out():
+    inner = RecordingEmbedder()
+    embedder = CoalescingEmbedder(inner, max_batch_size=4, max_wait_ms=200)
+    texts = ["a" * n for n in range(1, 9)]
+
+    results = _embed_concurrently(embedder, texts)
+
+    assert results == [[float(len(text)), 0.0] for text in texts]
+    assert sorted(len(batch) for batch, _ in inner.calls) == [4, 4]
+    info = embedder.coalescing_info()
+    assert (info["requests"], info["batches"], info["full_flushes"]) == (8, 2, 2)
+    assert info["mean_batch_size"] == 4
+
+
+def test_lone_call_flushes_after_max_wait_and_actions_stay_apart():
+    inner = RecordingEmbedder()
+    embedder = CoalescingEmbedder(inner, max_batch_size=64, max_wait_ms=1)
+
+    assert embedder.embed("query", "search") == [5.0, 1.0]
+    assert embedder.embed("fact", "add") == [4.0, 0.0]
+    assert inner.calls == [(["query"], "search"), (["fact"], "add")]
+    assert embedder.coalescing_info()["timed_flushes"] == 2
+
+
+def test_errors_reach_every_caller_of_the_batch():
+    embedder = CoalescingEmbedder(RecordingEmbedder(fail=True), max_batch_size=3, max_wait_ms=200)
+    barrier = threading.Barrier(3)
+
+    def call(text):
+        barrier.wait()
+        with pytest.raises(RuntimeError, match="provider unavailable"):
+            embedder.embed(text, "add")
+
+    with ThreadPoolExecutor(3) as pool:
+        list(pool.map(call, ["a", "b", "c"]))
+    assert embedder.coalescing_info()["errors"] == 1
+
+
+def test_embed_batch_respects_max_batch_size():
+    inner = RecordingEmbedder()
+    embedder = CoalescingEmbedder(inner, max_batch_size=2)
+
+    assert len(embedder.embed_batch(["a", "b", "c"])) == 3
+    assert [batch for batch, _ in inner.calls] == [["a", "b"], ["c"]]
+
+
+def test_factory_wraps_with_provider_batch_size(mocker):
+    mocker.patch("mem0.utils.factory.load_class", return_value=lambda config: RecordingEmbedder())
+
+    embedder = EmbedderFactory.create("openai", {}, None, {"max_wait_ms": 2})
+    assert isinstance(embedder, CoalescingEmbedder)
+    assert (embedder.max_batch_size, embedder.max_wait) == (2048, 0.002)
+    assert embedder.config is embedder.embedder.config
+
+    assert not isinstance(EmbedderFactory.create("openai", {}, None), CoalescingEmbedder)
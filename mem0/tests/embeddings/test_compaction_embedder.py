@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Datatype
+
+from mem0.configs.base import MemoryConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.coalescing import CoalescingEmbedder
+from mem0.embeddings.compaction import CompactingEmbedder
+from mem0.utils.factory import EmbedderFactory
+from mem0.vector_stores.qdrant import Qdrant
+
+WIDTH = 64
+TOPICS = ["parser", "deployment", "cache", "database", "frontend", "auth", "logging", "billing"]
+TEXTS = [f"{topic} note {i}" for topic in TOPICS for i in range(12)]
+
+
+class TopicEmbedder(EmbeddingBase):
+    """Vectors clustered by topic with most of their variance in few directions, as real embeddings are."""
+
+    def __init__(self):
+        super().__init__()
+        self.config.embedding_dims = WIDTH
+        basis = np.random.default_rng(0).normal(size=(len(TOPICS), WIDTH))
+        self.centres = dict(zip(TOPICS, basis))
+
+    def embed(self, text, memory_action=None):
+        return self.embed_batch([text], memory_action)[0]
+
+    def embed_batch(self, texts, memory_action=None):
+        vectors = []
+        for text in texts:
+            seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+            noise = np.random.default_rng(seed).normal(scale=0.2, size=WIDTH)
+            vectors.append((self.centres[text.split()[0]] + noise).tolist())
+        return vectors
+
+
+def test_truncation_renormalizes_queries_and_stored_vectors_alike():
+    embedder = CompactingEmbedder(TopicEmbedder(), dims=16, float16=True)
+
+    stored = np.array(embedder.embed_batch(TEXTS[:3], "add"))
+    query = np.array(embedder.embed(TEXTS[0], "search"))
+
+    assert stored.shape == (3, 16) and embedder.config.embedding_dims == 16
+    assert np.allclose(np.linalg.norm(stored, axis=1), 1.0, atol=1e-3)
+    assert np.array_equal(query, stored[0])
+    assert np.array_equal(stored, stored.astype(np.float16))
+    assert asyncio.run(embedder.aembed_batch(TEXTS[:3])) == stored.tolist()
+
+    with pytest.raises(ValueError):
+        CompactingEmbedder(TopicEmbedder(), dims=WIDTH + 1).embed("parser note")
+
+
+class ArrayEmbedder(TopicEmbedder):
+    """Local-model double returning float32 matrices; its list path must not be used."""
+
+    def embed_batch(self, texts, memory_action=None):
+        raise AssertionError("the list path was used")
+
+    def embed_batch_array(self, texts, memory_action=None):
+        return np.asarray(TopicEmbedder.embed_batch(self, texts, memory_action), dtype=np.float32)
+
+
+def test_array_embedders_skip_the_list_round_trip():
+    embedder = CompactingEmbedder(ArrayEmbedder(), dims=16)
+
+    vectors = embedder.embed_batch_array(TEXTS[:3], "add")
+
+    assert vectors.dtype == np.float32 and vectors.shape == (3, 16)
+    assert embedder.embed_batch(TEXTS[:3]) == vectors.tolist()
+    assert embedder.compaction_report(TEXTS, k=5)["dims"] == 16
+    assert embedder.embed_batch_array([]).shape == (0, 16)
+
+
+def test_pca_projection_is_fitted_saved_and_reported(tmp_path):
+    path = str(tmp_path / "projection.npz")
+    embedder = CompactingEmbedder(TopicEmbedder(), dims=8, method="pca", projection_path=path)
+    with pytest.raises(ValueError):
+        embedder.embed("parser note")
+
+    embedder.fit_projection(TEXTS)
+    reloaded = CompactingEmbedder(TopicEmbedder(), dims=8, method="pca", projection_path=path)
+    assert reloaded.embed_batch(TEXTS[:2]) == embedder.embed_batch(TEXTS[:2])
+
+    report = embedder.compaction_report(TEXTS, k=5)
+    assert report["compression"] == 8.0
+    assert report["recall_at_k"] > 0.4
+    assert (
+        report["recall_at_k"]
+        > CompactingEmbedder(TopicEmbedder(), dims=8).compaction_report(TEXTS, k=5)["recall_at_k"] - 0.2
+    )
+
+
+def test_factory_compacts_before_coalescing(mocker):
+    mocker.patch("mem0.utils.factory.load_class", return_value=lambda config: TopicEmbedder())
+    embedder = EmbedderFactory.create("openai", {}, None, {"max_wait_ms": 0}, {"dims": 32})
+
+    assert isinstance(embedder, CoalescingEmbedder) and isinstance(embedder.embedder, CompactingEmbedder)
+    assert len(embedder.embed("cache note 1")) == embedder.config.embedding_dims == 32
+
+
+def test_memory_config_sizes_the_store_for_compacted_vectors():
+    config = MemoryConfig(embedder={"provider": "openai", "compaction": {"dims": 256}})
+    assert config.vector_store.config.embedding_model_dims == 256
+
+    with pytest.raises(ValueError):
+        MemoryConfig(
+            embedder={"provider": "openai", "compaction": {"dims": 256}},
+            vector_store={"provider": "qdrant", "config": {"embedding_model_dims": 1536}},
+        )
+
+
+def test_pca_config_requires_a_fitted_projection(tmp_path):
+    path = str(tmp_path / "projection.npz")
+    embedder = {"provider": "openai", "compaction": {"method": "pca", "dims": 8, "projection_path": path}}
+    with pytest.raises(ValueError, match="fitted beforehand"):
+        MemoryConfig(embedder={"provider": "openai", "compaction": {"method": "pca", "dims": 8}})
+    with pytest.raises(ValueError, match="fitted beforehand"):
+        MemoryConfig(embedder=embedder)
+
+    CompactingEmbedder(TopicEmbedder(), dims=8, method="pca", projection_path=path).fit_projection(TEXTS)
+    config = MemoryConfig(embedder=embedder)
+    wrapped = EmbedderFactory._wrap_with_compaction(TopicEmbedder(), config.embedder.compaction)
+    assert len(wrapped.embed("cache note 1")) == config.vector_store.config.embedding_model_dims == 8
+
+
+def test_qdrant_stores_float16_vectors():
+    store = Qdrant("half", 16, client=QdrantClient(":memory:"), vector_datatype="float16")
+    vectors = CompactingEmbedder(TopicEmbedder(), dims=16, float16=True).embed_batch(TEXTS[:2])
+    store.insert(vectors, payloads=[{"user_id": "alice"}] * 2, ids=[1, 2])
+
+    info = store.client.get_collection("half")
+    assert info.config.params.vectors.datatype == Datatype.FLOAT16
+    assert store.search("q", vectors[0], limit=1)[0].id == 1
@@ -70,3 +70,54 @@ def test_embed_with_custom_embedding_dims(mock_sentence_transformer):
     assert embedder.config.embedding_dims == 768
 
     assert result == [1.0, 1.1, 1.2]
+
+
+def test_embed_batch_encodes_in_one_pass(mock_sentence_transformer):
+    embedder = HuggingFaceEmbedding(BaseEmbedderConfig())
+
+    mock_sentence_transformer.encode.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
+    result = embedder.embed_batch(["first", "second"])
+
+    mock_sentence_transformer.encode.assert_called_once_with(["first", "second"], convert_to_numpy=True)
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+    assert embedder.embed_batch([]) == []
+
+
+def test_onnx_backend_uses_quantized_export_and_thread_settings():
+    config = BaseEmbedderConfig(
+        model="all-MiniLM-L6-v2",
+        model_kwargs={"device": "cpu"},
+        huggingface_backend="onnx",
+        huggingface_quantization="avx2",
+        huggingface_threads=2,
+    )
+    with patch("mem0.embeddings.huggingface.SentenceTransformer") as transformer:
+        with patch("mem0.embeddings.huggingface._onnx_session_options", return_value="options") as session_options:
+            with patch("mem0.embeddings.huggingface._export_quantized_onnx_model", return_value="/export") as export:
+                HuggingFaceEmbedding(config)
+
+    session_options.assert_called_once_with(2)
+    export.assert_called_once_with("all-MiniLM-L6-v2", "avx2", device="cpu")
+    transformer.assert_called_once_with(
+        "/export",
+        backend="onnx",
+        model_kwargs={"session_options": "options", "file_name": "onnx/model_qint8_avx2.onnx"},
+        device="cpu",
+    )
+
+
+def test_quantization_requires_onnx_backend(mock_sentence_transformer):
+    with pytest.raises(ValueError):
+        HuggingFaceEmbedding(BaseEmbedderConfig(huggingface_quantization="avx2"))
+
+
+def test_warmup_batch_size_and_float32_arrays(mock_sentence_transformer):
+    config = BaseEmbedderConfig(huggingface_warmup=True, huggingface_batch_size=16)
+    mock_sentence_transformer.encode.return_value = np.array([[0.1, 0.2]])
+    embedder = HuggingFaceEmbedding(config)
+
+    mock_sentence_transformer.encode.assert_called_once_with(["warm-up"], convert_to_numpy=True, batch_size=16)
+
+    result = embedder.embed_batch_array(["first"])
+    assert result.dtype == np.float32
+    assert result.shape == (1, 2)
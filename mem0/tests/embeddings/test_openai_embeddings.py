@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -88,3 +88,37 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_uses_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.4, 0.5], index=1), Mock(embedding=[0.1, 0.2], index=0)]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Goodbye"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Goodbye"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.4, 0.5]]
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings_use_the_async_client(mock_openai_client):
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="key", openai_base_url="https://api.example.com/v1"))
+        async_client = mock_async_openai.return_value
+        async_client.embeddings.create = AsyncMock(
+            return_value=Mock(data=[Mock(index=1, embedding=[0.3]), Mock(index=0, embedding=[0.1])])
+        )
+
+        assert await embedder.aembed_batch(["first\ntext", "second"]) == [[0.1], [0.3]]
+        assert await embedder.aembed_batch([]) == []
+
+    mock_async_openai.assert_called_once_with(api_key="key", base_url="https://api.example.com/v1")
+    async_client.embeddings.create.assert_awaited_once_with(
+        input=["first text", "second"], model="text-embedding-3-small", dimensions=1536
+    )
+    mock_openai_client.embeddings.create.assert_not_called()
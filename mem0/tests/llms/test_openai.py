@@ -1,5 +1,5 @@
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -104,3 +104,25 @@ def test_generate_response_with_tools(mock_openai_client):
     assert len(response["tool_calls"]) == 1
     assert response["tool_calls"][0]["name"] == "add_memory"
     assert response["tool_calls"][0]["arguments"] == {"data": "Today is a sunny day."}
+
+
+@pytest.mark.asyncio
+async def test_agenerate_response_uses_the_async_client(mock_openai_client):
+    with patch("mem0.llms.openai.AsyncOpenAI") as mock_async_openai:
+        llm = OpenAILLM(BaseLlmConfig(model="gpt-4o", temperature=0.7, max_tokens=100, top_p=1.0))
+        messages = [{"role": "user", "content": "Hello"}]
+        async_create = AsyncMock(return_value=Mock(choices=[Mock(message=Mock(content='{"facts": []}'))]))
+        mock_async_openai.return_value.chat.completions.create = async_create
+
+        response = await llm.agenerate_response(messages, response_format={"type": "json_object"})
+
+    async_create.assert_awaited_once_with(
+        model="gpt-4o",
+        messages=messages,
+        temperature=0.7,
+        max_tokens=100,
+        top_p=1.0,
+        response_format={"type": "json_object"},
+    )
+    assert response == '{"facts": []}'
+    mock_openai_client.chat.completions.create.assert_not_called()
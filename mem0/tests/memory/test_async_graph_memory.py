@@ -0,0 +1,164 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mem0.memory.async_graph_memory import AsyncMemoryGraph
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    async def data(self):
+        return self.records
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        self.driver.open_sessions += 1
+        self.driver.max_open_sessions = max(self.driver.max_open_sessions, self.driver.open_sessions)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.driver.open_sessions -= 1
+
+    async def run(self, cypher, params):
+        self.driver.queries.append((cypher, params))
+        await asyncio.sleep(0.01)
+        return FakeResult(self.driver.respond(cypher, params))
+
+    async def execute_write(self, work):
+        self.driver.transactions += 1
+        return await work(self)
+
+
+class FakeDriver:
+    """Async driver double recording queries; write rows are echoed back with fresh element ids."""
+
+    def __init__(self):
+        self.queries = []
+        self.transactions = 0
+        self.open_sessions = 0
+        self.max_open_sessions = 0
+
+    def session(self, database=None):
+        return FakeSession(self)
+
+    def respond(self, cypher, params):
+        rows = params.get("rows") or []
+        if "MERGE (source)-[r:" in cypher:
+            return [
+                {
+                    "idx": row["idx"],
+                    "source": row["source_name"],
+                    "relationship": "likes",
+                    "target": row["dest_name"],
+                    "source_id": f"id:{row['source_name']}",
+                    "destination_id": f"id:{row['dest_name']}",
+                }
+                for row in rows
+            ]
+        return []
+
+
+@pytest.fixture
+def config():
+    config = MagicMock()
+    config.graph_store.config.base_label = True
+    config.graph_store.config.vector_index = True
+    config.graph_store.config.vector_index_candidates = 50
+    config.graph_store.config.search_depth = 1
+    config.graph_store.config.search_hop_limit = None
+    config.graph_store.config.max_connection_pool_size = 20
+    config.graph_store.config.connection_acquisition_timeout = None
+    config.graph_store.llm = None
+    config.graph_store.custom_prompt = None
+    config.graph_store.extraction_mode = "multi_call"
+    config.graph_store.search_entity_resolver = "llm"
+    config.graph_store.rerank_top_n = 5
+    config.llm.provider = "openai_structured"
+    config.embedder.config = {"embedding_dims": 3}
+    return config
+
+
+@pytest.fixture
+def graph(config):
+    driver = FakeDriver()
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+    with patch("mem0.memory.async_graph_memory.AsyncGraphDatabase.driver", return_value=driver) as create_driver:
+        with patch("mem0.memory.graph_memory.EmbedderFactory.create", return_value=embedder):
+            with patch("mem0.memory.graph_memory.LlmFactory.create", return_value=MagicMock()):
+                graph = AsyncMemoryGraph(config)
+    graph.create_driver = create_driver
+    return graph
+
+
+def test_driver_uses_configured_pool(graph):
+    assert graph.create_driver.call_args.kwargs["max_connection_pool_size"] == 20
+    assert "connection_acquisition_timeout" not in graph.create_driver.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_schema_is_created_once_on_first_use(graph):
+    await asyncio.gather(graph.search("anything", {"user_id": "alice"}), graph.search("else", {"user_id": "bob"}))
+
+    assert len([q for q, _ in graph.driver.queries if "CREATE VECTOR INDEX" in q]) == 1
+    assert graph.vector_index_name == "entity_embedding"
+
+
+@pytest.mark.asyncio
+async def test_add_writes_in_one_async_transaction(graph):
+    graph._aretrieve_nodes_from_data = AsyncMock(return_value={"alice": "person", "pizza": "food"})
+    graph._aestablish_nodes_relations_from_data = AsyncMock(
+        return_value=[{"source": "alice", "relationship": "likes", "destination": "pizza"}]
+    )
+    graph._aget_delete_entities_from_search_output = AsyncMock(return_value=[])
+
+    result = await graph.add("I like pizza", {"user_id": "alice"})
+
+    assert result["added_entities"] == [[{"source": "alice", "relationship": "likes", "target": "pizza"}]]
+    assert graph.driver.transactions == 1
+    # The search for deletions and the resolution of new entities ran concurrently.
+    assert graph.driver.max_open_sessions >= 2
+
+    # A second add resolves both names from the entity cache.
+    graph.driver.queries.clear()
+    await graph.add("I like pizza", {"user_id": "alice"})
+    assert not [q for q, _ in graph.driver.queries if "RETURN row.name AS name, element_id" in q]
+
+
+class NativeAsyncLLM:
+    """LLM double with a native `agenerate_response`; the blocking call must not be used."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate_response(self, **kwargs):
+        raise AssertionError("the blocking LLM call was used")
+
+    async def agenerate_response(self, messages, tools=None, **kwargs):
+        name = tools[0]["function"]["name"]
+        self.calls.append(name)
+        if name == "extract_entities":
+            entities = [{"entity": "alice", "entity_type": "person"}, {"entity": "pizza", "entity_type": "food"}]
+            return {"tool_calls": [{"name": name, "arguments": {"entities": entities}}]}
+        if name == "establish_relations":
+            relations = [{"source": "alice", "relationship": "likes", "destination": "pizza"}]
+            return {"tool_calls": [{"name": name, "arguments": {"entities": relations}}]}
+        return {"tool_calls": []}
+
+
+@pytest.mark.asyncio
+async def test_llm_steps_use_the_native_async_client(graph):
+    graph.llm = NativeAsyncLLM()
+
+    result = await graph.add("I like pizza", {"user_id": "alice"})
+    await graph.search("What do I like?", {"user_id": "alice"})
+
+    assert result["added_entities"] == [[{"source": "alice", "relationship": "likes", "target": "pizza"}]]
+    assert graph.llm.calls == ["extract_entities", "establish_relations", "delete_graph_memory", "extract_entities"]
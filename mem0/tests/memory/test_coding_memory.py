@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import json
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from mem0.configs.coding_config import CodingMemoryConfig
+from mem0.embeddings.base import EmbeddingBase
+from mem0.memory.coding_memory import AsyncCodingMemory, CodingMemory
+from mem0.memory.enhanced_deduplication import AutonomousDeduplicationManager
+from mem0.memory.storage import SQLiteManager
+from mem0.vector_stores.qdrant import Qdrant
+
+DIMS = 32
+FACTS = [
+    "Fixed the KeyError in src/app.py by checking the config before import",
+    "Fixed the KeyError in src/app.py by checking the config before import",
+    "Use functools.lru_cache to speed up the parser",
+    "The deployment failed because DATABASE_URL was missing",
+]
+
+
+class HashEmbedder(EmbeddingBase):
+    """Deterministic embeddings, so identical facts get identical vectors."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def _vector(self, text):
+        seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).normal(size=DIMS).tolist()
+
+    def embed(self, text, memory_action=None):
+        raise AssertionError("facts should be embedded in one batch")
+
+    def embed_batch(self, texts, memory_action=None):
+        self.batches.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+
+@pytest.fixture
+def components(mocker):
+    embedder = HashEmbedder()
+    store = Qdrant(collection_name="coding_test", embedding_model_dims=DIMS, client=QdrantClient(":memory:"))
+    db = SQLiteManager(":memory:")
+    llm = mocker.MagicMock()
+    llm.generate_response.return_value = json.dumps({"facts": FACTS})
+
+    mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=embedder)
+    mocker.patch("mem0.utils.factory.VectorStoreFactory.create", side_effect=[store, mocker.MagicMock()])
+    mocker.patch("mem0.utils.factory.LlmFactory.create", return_value=llm)
+    mocker.patch("mem0.memory.main.SQLiteManager", return_value=db)
+    mocker.patch("mem0.memory.coding_memory.capture_event")
+    mocker.spy(store, "search_batch")
+    mocker.spy(store, "insert")
+    mocker.spy(db, "add_history_batch")
+    return embedder, store, db
+
+
+def _check_single_pass(result, embedder, store, db):
+    assert [r["memory"] for r in result] == [FACTS[0], FACTS[2], FACTS[3]]
+    assert embedder.batches == [FACTS]
+    assert store.search_batch.call_count == 1
+    assert store.insert.call_count == 1
+    assert db.add_history_batch.call_count == 1
+
+    stored = {point.payload["data"]: point.payload for point in store.list(filters={"user_id": "alice"})[0]}
+    assert set(stored) == set(FACTS)
+    assert all(payload["created_at_epoch"] for payload in stored.values())
+    history = db.get_history(result[0]["id"])
+    assert [(h["event"], h["new_memory"]) for h in history] == [("ADD", FACTS[0])]
+
+
+def test_batch_ingestion_embeds_searches_and_inserts_once(components):
+    embedder, store, db = components
+    memory = CodingMemory(CodingMemoryConfig())
+
+    result = memory._add_to_vector_store(
+        [{"role": "user", "content": "notes"}], {"user_id": "alice"}, {"user_id": "alice"}, infer=True
+    )
+
+    _check_single_pass(result, embedder, store, db)
+    assert sum(memory.context_pattern_counts.values()) == 3
+
+    # Stored facts are found by the next batch's candidate search
+    assert memory._process_coding_facts([FACTS[2]], {"user_id": "alice"}, {"user_id": "alice"}) == []
+
+
+def test_async_batch_ingestion(components):
+    embedder, store, db = components
+    memory = AsyncCodingMemory(CodingMemoryConfig())
+
+    result = asyncio.run(
+        memory._add_to_vector_store(
+            [{"role": "user", "content": "notes"}], {"user_id": "alice"}, {"user_id": "alice"}, infer=True
+        )
+    )
+
+    _check_single_pass(result, embedder, store, db)
+
+
+def test_persisted_near_duplicate_index_follows_deletes(components, tmp_path):
+    memory = CodingMemory(CodingMemoryConfig(near_duplicate_index_dir=str(tmp_path)))
+    result = memory._process_coding_facts(FACTS, {"user_id": "alice"}, {"user_id": "alice"})
+    scope = ("alice", None, None)
+
+    # Every accepted fact is on disk without an explicit save, and a delete after a restart cleans it.
+    memory.deduplication_manager = AutonomousDeduplicationManager({"near_duplicate_index_dir": str(tmp_path)})
+    memory._delete_memory(result[0]["id"])
+    reloaded = AutonomousDeduplicationManager({"near_duplicate_index_dir": str(tmp_path)})
+    assert set(reloaded.get_index(scope)._texts) == {r["id"] for r in result[1:]}
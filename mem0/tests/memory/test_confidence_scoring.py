@@ -0,0 +1,76 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from mem0.memory import confidence_scoring
+from mem0.memory.confidence_scoring import ContextAwareConfidenceScorer, EnhancedConfidenceScorer
+from mem0.memory.timezone_utils import safe_datetime_now
+
+FLAGS = ["file_references", "code_blocks", "error_related", "solution_related", "performance_metrics", "test_results"]
+WORDS = ["def f()", "error", "config", "fix", "then", "12ms", "src/app.py", "plain", "traceback", "café"]
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    now = safe_datetime_now()
+    monkeypatch.setattr(confidence_scoring, "current_epoch", lambda: now.timestamp())
+    return now
+
+
+def _memories(now, count=300, seed=0):
+    rng = random.Random(seed)
+    categories = ["bug_fix", "testing", "general", "unknown"]
+    memories = []
+    for _ in range(count):
+        metadata = {flag: True for flag in FLAGS if rng.random() < 0.3}
+        metadata.update(
+            category=rng.choice(categories),
+            access_count=rng.randint(0, 30),
+            success_rate=rng.uniform(-0.2, 1.0),
+        )
+        if rng.random() < 0.7:
+            metadata["last_accessed"] = rng.choice(
+                [(now - timedelta(hours=rng.uniform(0, 200))).isoformat(), "not a date"]
+            )
+        if rng.random() < 0.7:
+            age = timedelta(days=rng.choice([0, 3, 10, 40, 100]), hours=12)
+            metadata["created_at"] = (now - age).replace(tzinfo=None).isoformat()
+        if rng.random() < 0.3:
+            metadata["feedback_scores"] = [rng.random() for _ in range(3)]
+        content = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 40)))
+        memories.append({"memory": content, "metadata": metadata})
+    return memories
+
+
+@pytest.mark.parametrize("context", [{}, {"recent_activity": True, "relevance_score": 0.6}])
+def test_score_batch_is_identical_to_scalar_path(frozen_now, context):
+    scorer = EnhancedConfidenceScorer({})
+    memories = _memories(frozen_now)
+
+    scores = scorer.score_batch(memories, context)
+
+    assert scores.tolist() == [
+        scorer.calculate_confidence(m["memory"], m["metadata"], context)["confidence"] for m in memories
+    ]
+
+
+@pytest.mark.parametrize("context_type", ["autonomous_coding", "interactive_debugging", "knowledge_building"])
+def test_context_aware_score_batch_is_identical_to_scalar_path(frozen_now, context_type):
+    scorer = ContextAwareConfidenceScorer({})
+    memories = _memories(frozen_now, seed=1)
+
+    scores = scorer.score_batch(memories, context_type)
+
+    assert scores.tolist() == [
+        scorer.score_for_context(m["memory"], m["metadata"], context_type)["context_adjusted_confidence"]
+        for m in memories
+    ]
+
+
+def test_score_batch_does_not_record_history():
+    scorer = EnhancedConfidenceScorer({})
+
+    assert scorer.score_batch([]).shape == (0,)
+    scorer.score_batch([{"memory": "fixed the error in app.py"}])
+    assert scorer.accuracy_metrics["total_scores"] == 0
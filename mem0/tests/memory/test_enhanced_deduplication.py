@@ -0,0 +1,72 @@
+import numpy as np
+
+from mem0.memory.enhanced_deduplication import EnhancedDeduplicator
+
+
+def make_memories(texts):
+    return [{"id": f"m{i}", "memory": text, "metadata": {"category": "general"}} for i, text in enumerate(texts)]
+
+
+def test_similarities_match_pairwise_path_without_embeddings():
+    deduplicator = EnhancedDeduplicator({})
+    memories = make_memories(
+        ["Fixed the crash in the parser", "Build the cache layer faster", "unrelated note", "the parser crash fix"]
+    )
+    metadata = {"category": "general"}
+
+    similarities = deduplicator._calculate_enhanced_similarities("Fix the parser crash", memories, metadata)
+
+    expected = [
+        deduplicator._calculate_enhanced_similarity("Fix the parser crash", m["memory"], metadata, m["metadata"])
+        for m in memories
+    ]
+    np.testing.assert_allclose(similarities, expected)
+
+
+def test_embeddings_drive_base_similarity_and_are_cached_by_id():
+    deduplicator = EnhancedDeduplicator({"deduplication_cache_size": 2})
+    memories = make_memories(["Resolved serializer exception; the code now uses orjson", "Something else entirely"])
+    for memory in memories:
+        memory["metadata"]["file_references"] = ["api.py"]
+    metadata = {"category": "general", "file_references": ["api.py"]}
+    fact = "Fix the serializer crash by switching code to orjson"
+
+    # Worded differently, but the embeddings say the first candidate is the same fact.
+    should_dedup, duplicate_id, similarity = deduplicator.should_deduplicate(
+        fact,
+        memories,
+        metadata,
+        embedding=[1.0, 0.0],
+        candidate_embeddings=[[2.0, 0.0], [0.0, 1.0]],
+    )
+    assert should_dedup and duplicate_id == "m0"
+    assert similarity > 0.9
+    assert not deduplicator.should_deduplicate(fact, memories, metadata)[0]
+
+    # Later calls reuse the embeddings cached for the candidate ids.
+    assert deduplicator.should_deduplicate(fact, memories, metadata, embedding=[1.0, 0.0])[1] == "m0"
+
+    deduplicator.remember("m9", "new memory", [0.0, 1.0])
+    assert list(deduplicator.dedup_cache) == ["m1", "m9"]
+
+
+def test_search_scores_are_the_base_similarity_of_candidates_without_embeddings():
+    memories = make_memories(["Resolved serializer exception; the code now uses orjson", "Something else entirely"])
+    for memory in memories:
+        memory["metadata"]["file_references"] = ["api.py"]
+    metadata = {"category": "general", "file_references": ["api.py"]}
+    fact = "Fix the serializer crash by switching code to orjson"
+
+    # A search score stands in for the cosine similarity of an embedding the deduplicator has not seen.
+    scored = [{**memory, "score": score} for memory, score in zip(memories, [0.97, 0.1])]
+    by_score = EnhancedDeduplicator({})._calculate_enhanced_similarities(fact, scored, metadata, embedding=[1.0, 0.0])
+    by_embedding = EnhancedDeduplicator({})._calculate_enhanced_similarities(
+        fact, memories, metadata, embedding=[1.0, 0.0], candidate_embeddings=[[0.97, np.sqrt(1 - 0.97**2)], [0.1, 1.0]]
+    )
+    np.testing.assert_allclose(by_score[0], by_embedding[0])
+
+    # Word overlap is only the fallback for candidates with neither.
+    by_words = EnhancedDeduplicator({})._calculate_enhanced_similarities(fact, memories, metadata)
+    assert by_score[0] > by_words[0]
+    assert EnhancedDeduplicator({}).should_deduplicate(fact, scored, metadata)[1] == "m0"
+    assert not EnhancedDeduplicator({}).should_deduplicate(fact, memories, metadata)[0]
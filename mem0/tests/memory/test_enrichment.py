@@ -0,0 +1,81 @@
+import pytest
+
+from mem0.configs.coding_config import CodingFactExtractor
+from mem0.memory.enrichment import EnrichmentExecutor, create_enrichment_executor
+from mem0.memory.memory_categorization import AutoCategorizer, HierarchicalCategorizer
+from mem0.memory.metadata_tagging import AutoTaggingManager, SemanticTagger
+
+FACTS = [
+    "Fixed the KeyError in src/app.py by checking the config before import",
+    "Use functools.lru_cache in the React component to optimize rendering",
+    "The deployment failed because the Docker environment variable was missing",
+    "Refactored the class hierarchy; the tests in tests/test_api.py pass now",
+    "Plain note",
+]
+MEMORIES = [(fact, {"category": "general"}, {"session_type": "debugging"}) for fact in FACTS]
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return {"tagger": SemanticTagger({}), "categorizer": HierarchicalCategorizer({})}
+
+
+@pytest.fixture(scope="module")
+def process_executor(tables):
+    executor = EnrichmentExecutor("process", max_workers=1, batch_size=2, timeout=60, **tables)
+    yield executor
+    executor.shutdown()
+
+
+def test_process_backend_matches_inline(tables, process_executor):
+    inline = EnrichmentExecutor("inline", **tables)
+
+    for kind, items in (("coding_facts", FACTS), ("tags", MEMORIES), ("categories", MEMORIES)):
+        assert process_executor.map(kind, items) == inline.map(kind, items)
+
+    assert inline.map("coding_facts", FACTS)[0] == (
+        CodingFactExtractor.categorize_coding_fact(FACTS[0]),
+        CodingFactExtractor.extract_coding_metadata(FACTS[0]),
+    )
+    assert process_executor.stats["remote_batches"] == 9
+    assert process_executor.stats["fallbacks"] == 0
+
+
+def test_rule_changes_restart_the_workers(tables, process_executor):
+    tagger = tables["tagger"]
+    starts = process_executor.stats["pool_starts"]
+    tagger.add_custom_semantic_category("caching", [r"\blru_cache\b"], 0.9)
+    try:
+        results = process_executor.map("tags", MEMORIES)
+        assert "caching" in results[1]["tags"]["semantic"]
+        assert process_executor.stats["pool_starts"] == starts + 1
+    finally:
+        del tagger.semantic_categories["caching"]
+        tagger._compile_patterns()
+
+
+def test_timeout_falls_back_to_inline(tables):
+    executor = EnrichmentExecutor("process", max_workers=1, batch_size=2, timeout=0, **tables)
+    try:
+        results = executor.map("categories", MEMORIES)
+    finally:
+        executor.shutdown()
+
+    assert results == EnrichmentExecutor("inline", **tables).map("categories", MEMORIES)
+    assert executor.stats["fallbacks"] == 3
+
+
+def test_config_validation():
+    assert create_enrichment_executor({}).backend == "inline"
+    with pytest.raises(ValueError):
+        create_enrichment_executor({"enrichment_backend": "threads"})
+
+
+def test_managers_batch_like_single_calls():
+    single, batch = AutoTaggingManager({}), AutoTaggingManager({"enrichment_batch_size": 2})
+    assert batch.auto_tag_memories(MEMORIES) == [single.auto_tag_memory(*memory) for memory in MEMORIES]
+    assert batch.semantic_tagger.tag_stats == single.semantic_tagger.tag_stats
+
+    single, batch = AutoCategorizer({}), AutoCategorizer({})
+    assert batch.auto_categorize_memories(MEMORIES) == [single.auto_categorize(*memory) for memory in MEMORIES]
+    assert batch.hierarchical_categorizer.category_stats == single.hierarchical_categorizer.category_stats
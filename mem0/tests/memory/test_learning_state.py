@@ -0,0 +1,70 @@
+import copy
+import pickle
+import statistics
+
+import pytest
+
+from mem0.memory.confidence_scoring import EnhancedConfidenceScorer
+from mem0.memory.learning_state import RingBuffer, StreamingStats, learning_limits
+from mem0.memory.memory_categorization import AutoCategorizer
+
+
+def test_ring_buffer_is_bounded_and_slices_like_a_list():
+    buffer = RingBuffer(maxlen=5)
+    for value in range(12):
+        buffer.append(value)
+
+    assert list(buffer) == [7, 8, 9, 10, 11]
+    assert buffer[-2:] == [10, 11]
+    assert buffer[:2] == [7, 8]
+    assert buffer[1:4] == [8, 9, 10]
+    assert buffer[::-2] == [11, 9, 7]
+    assert buffer[-1] == 11
+    assert list(copy.copy(buffer)) == list(buffer)
+    assert pickle.loads(pickle.dumps(buffer)).maxlen == 5
+
+
+def test_streaming_stats_match_exact_aggregates():
+    values = [0.5, 0.9, 0.1, 0.7, 0.3, 0.8]
+    stats = StreamingStats(ewma_alpha=0.5, reservoir_size=4, seed=0)
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == 6
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.std == pytest.approx(statistics.pstdev(values))
+    assert (stats.min, stats.max) == (0.1, 0.9)
+    ewma = values[0]
+    for value in values[1:]:
+        ewma += 0.5 * (value - ewma)
+    assert stats.ewma == pytest.approx(ewma)
+    assert len(stats.reservoir) == 4 and set(stats.reservoir) <= set(values)
+
+    stats.reset()
+    assert stats.snapshot()["count"] == 0
+
+
+def test_learning_limits_read_config():
+    assert learning_limits({}, history_size=100)["history_size"] == 100
+    limits = learning_limits({"learning_history_size": 3, "learning_reservoir_size": 2, "learning_ewma_alpha": 0.5})
+    assert limits == {"history_size": 3, "reservoir_size": 2, "ewma_alpha": 0.5}
+
+
+def test_managers_keep_bounded_history_and_all_time_aggregates():
+    config = {"learning_history_size": 3}
+    scorer = EnhancedConfidenceScorer(config)
+    for i in range(10):
+        scorer._record_scoring(0.5 + i * 0.01, {"category": "bug_fix" if i % 2 else "testing"}, {})
+
+    assert len(scorer.scoring_history) == 3
+    metrics = scorer.get_performance_metrics()
+    assert metrics["avg_confidence"] == pytest.approx(0.545)
+    assert metrics["category_distribution"] == {"testing": 5, "bug_fix": 5}
+
+    categorizer = AutoCategorizer(config)
+    for _ in range(5):
+        categorizer.auto_categorize("fixed the bug in the parser", {})
+    learning = categorizer.get_learning_statistics()
+    assert learning["feedback_count"] == 3
+    assert len(learning["recent_decisions"]) == 3
+    assert learning["confidence"]["count"] == 5
@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.graphs.local import MemoryGraph
+
+VECTORS = {
+    "alice": [1.0, 0.0, 0.0],
+    "pizza": [0.0, 1.0, 0.0],
+    "pizzas": [0.0, 0.99, 0.05],
+    "rome": [0.0, 0.0, 1.0],
+}
+
+
+def embed_batch(texts):
+    return [VECTORS[text] for text in texts]
+
+
+@pytest.fixture
+def graph(tmp_path):
+    config = MagicMock()
+    config.graph_store.config.path = str(tmp_path / "graph.db")
+    config.graph_store.llm = None
+    config.graph_store.extraction_mode = "multi_call"
+    config.graph_store.search_entity_resolver = "lexical"
+    config.graph_store.rerank_top_n = 5
+    config.llm.provider = "openai_structured"
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = embed_batch
+    with patch("mem0.graphs.local.EmbedderFactory.create", return_value=embedder):
+        with patch("mem0.graphs.local.LlmFactory.create", return_value=MagicMock()):
+            graph = MemoryGraph(config)
+    graph._get_delete_entities_from_search_output = MagicMock(return_value=[])
+    return graph
+
+
+def add(graph, relations, filters):
+    graph._retrieve_nodes_from_data = MagicMock(
+        return_value={name: "entity" for relation in relations for name in (relation[0], relation[2])}
+    )
+    graph._establish_nodes_relations_from_data = MagicMock(
+        return_value=[
+            {"source": source, "relationship": relationship, "destination": destination}
+            for source, relationship, destination in relations
+        ]
+    )
+    return graph.add("data", filters)
+
+
+def test_add_merges_similar_nodes_and_repeated_relations(graph):
+    filters = {"user_id": "alice"}
+    add(graph, [("alice", "likes", "pizza")], filters)
+    result = add(graph, [("alice", "likes", "pizzas"), ("alice", "lives_in", "rome")], filters)
+
+    assert result["added_entities"] == [
+        [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "rome"}],
+    ]
+    assert graph.get_all(filters) == [
+        {"source": "alice", "relationship": "likes", "target": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "target": "rome"},
+    ]
+    assert graph.connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0] == 3
+
+
+def test_search_expands_matched_entities_and_reranks(graph):
+    filters = {"user_id": "alice"}
+    add(graph, [("alice", "likes", "pizza"), ("alice", "lives_in", "rome")], filters)
+
+    results = graph.search("where does alice live", filters)
+
+    assert results[0] == {"source": "alice", "relationship": "lives_in", "destination": "rome"}
+    assert len(results) == 2
+    assert graph.search("anything", {"user_id": "bob"}) == []
+
+
+def test_delete_entities_and_delete_all_are_scoped(graph):
+    add(graph, [("alice", "likes", "pizza"), ("alice", "lives_in", "rome")], {"user_id": "alice"})
+    add(graph, [("alice", "likes", "pizza")], {"user_id": "bob"})
+
+    deleted = graph._delete_entities(
+        [{"source": "alice", "relationship": "likes", "destination": "pizza"}], {"user_id": "alice"}
+    )
+    assert deleted == [[{"source": "alice", "target": "pizza", "relationship": "likes"}]]
+    assert graph.get_all({"user_id": "alice"}) == [{"source": "alice", "relationship": "lives_in", "target": "rome"}]
+
+    graph.delete_all({"user_id": "alice"})
+    assert graph.get_all({"user_id": "alice"}) == []
+    assert graph.get_all({"user_id": "bob"}) == [{"source": "alice", "relationship": "likes", "target": "pizza"}]
+
+
+def test_graph_persists_to_path(graph):
+    add(graph, [("alice", "likes", "pizza")], {"user_id": "alice"})
+    graph.close()
+
+    embedder = MagicMock()
+    embedder.embed_batch.side_effect = embed_batch
+    with patch("mem0.graphs.local.EmbedderFactory.create", return_value=embedder):
+        with patch("mem0.graphs.local.LlmFactory.create", return_value=MagicMock()):
+            reopened = MemoryGraph(graph.config)
+
+    assert reopened.get_all({"user_id": "alice"}) == [{"source": "alice", "relationship": "likes", "target": "pizza"}]
+    assert reopened._search_graph_db(["pizza"], {"user_id": "alice"})[0]["similarity"] == 1.0
+
+
+def test_iter_all_streams_pages_with_filters_and_summarize(graph):
+    filters = {"user_id": "alice"}
+    add(graph, [("alice", "likes", "pizza"), ("alice", "lives_in", "rome"), ("rome", "likes", "pizza")], filters)
+
+    assert [r["target"] for r in graph.iter_all(filters, page_size=1)] == ["pizza", "rome", "pizza"]
+    assert [r["source"] for r in graph.iter_all(filters, page_size=1, relationship="likes")] == ["alice", "rome"]
+    assert [r["relationship"] for r in graph.iter_all(filters, entity="Rome")] == ["lives_in", "likes"]
+
+    page = graph.get_page(filters, page_size=2)
+    assert len(page["results"]) == 2
+    assert graph.get_page(filters, page_size=2, page_token=page["next_page_token"])["next_page_token"] is None
+
+    summary = graph.summarize(filters, top_k=1)
+    assert summary["relationships"] == [{"relationship": "likes", "count": 2}, {"relationship": "lives_in", "count": 1}]
+    assert summary["top_entities"] == [{"name": "alice", "mentions": 2}]
+
+
+@pytest.mark.parametrize("graph_llm, shares_llm", [(None, True), ({"provider": "anthropic", "config": {}}, False)])
+def test_memory_shares_its_embedder_and_llm_with_the_graph(tmp_path, graph_llm, shares_llm):
+    from mem0.configs.base import MemoryConfig
+    from mem0.memory.main import Memory
+
+    config = MemoryConfig(
+        graph_store={"provider": "local", "llm": graph_llm}, history_db_path=str(tmp_path / "history.db")
+    )
+    with patch("mem0.utils.factory.EmbedderFactory.create", side_effect=lambda *args: MagicMock()) as embedders:
+        with patch("mem0.utils.factory.LlmFactory.create", side_effect=lambda *args: MagicMock()) as llms:
+            with patch("mem0.utils.factory.VectorStoreFactory.create"), patch("mem0.memory.main.capture_event"):
+                memory = Memory(config)
+
+    assert embedders.call_count == 1
+    assert memory.graph.embedding_model is memory.embedding_model
+    assert (memory.graph.llm is memory.llm) == shares_llm
+    assert llms.call_count == (1 if shares_llm else 2)
@@ -125,3 +125,22 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Invalid JSON response" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_helpers_prefer_native_coroutines():
+    from mem0.llms.base import LLMBase
+    from mem0.memory.utils import agenerate_response
+
+    class NativeLLM(LLMBase):
+        def generate_response(self, messages, **kwargs):
+            raise AssertionError("the native coroutine should be used")
+
+        async def agenerate_response(self, messages, **kwargs):
+            return "native"
+
+    threaded = MagicMock()
+    threaded.generate_response.return_value = "threaded"
+
+    assert await agenerate_response(NativeLLM(), messages=[]) == "native"
+    assert await agenerate_response(threaded, messages=[]) == "threaded"
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("langchain_memgraph")
+
+from mem0.memory.memgraph_memory import MemoryGraph  # noqa: E402
+
+
+def make_graph(index_info, node_count=0):
+    config = MagicMock()
+    config.graph_store.config.vector_index_capacity = None
+    config.graph_store.config.vector_index_candidates = 50
+    config.graph_store.llm = None
+    config.llm.provider = "openai_structured"
+    config.embedder.config = {"embedding_dims": 3}
+
+    client = MagicMock()
+
+    def query(cypher, params):
+        if "show_index_info" in cypher:
+            return index_info
+        if "count(n)" in cypher:
+            return [{"count": node_count}]
+        return []
+
+    client.query.side_effect = query
+    with patch("mem0.memory.memgraph_memory.Memgraph", return_value=client):
+        with patch("mem0.memory.memgraph_memory.EmbedderFactory.create", return_value=MagicMock()):
+            with patch("mem0.memory.memgraph_memory.LlmFactory.create", return_value=MagicMock()):
+                graph = MemoryGraph(config)
+    return graph, client
+
+
+def queries(client, fragment):
+    return [call.args[0] for call in client.query.call_args_list if fragment in call.args[0]]
+
+
+def test_vector_index_is_sized_from_existing_nodes():
+    graph, client = make_graph(index_info=[], node_count=3000)
+
+    assert "'capacity': 8000" in queries(client, "CREATE VECTOR INDEX")[0]
+    assert graph.vector_index_capacity == 8000
+
+
+def test_vector_index_grows_when_nearing_capacity():
+    graph, client = make_graph(index_info=[{"capacity": 1000, "size": 100}])
+    assert not queries(client, "CREATE VECTOR INDEX")
+
+    client.query.side_effect = lambda cypher, params: (
+        [{"capacity": 1000, "size": 900}] if "show_index_info" in cypher else []
+    )
+    graph._record_new_nodes(800)
+
+    assert queries(client, "DROP VECTOR INDEX memzero")
+    assert "'capacity': 2000" in queries(client, "CREATE VECTOR INDEX")[0]
+
+
+def test_node_resolution_post_filters_index_candidates():
+    graph, client = make_graph(index_info=[{"capacity": 1000, "size": 0}])
+
+    graph._search_source_node([0.1, 0.2, 0.3], {"user_id": "alice", "agent_id": "bot"})
+
+    cypher, params = client.query.call_args.args[0], client.query.call_args.kwargs["params"]
+    assert 'vector_search.search("memzero", $candidates, $embedding)' in cypher
+    assert "source_candidate.agent_id = $agent_id" in cypher
+    assert params["candidates"] == 50
@@ -0,0 +1,102 @@
+import random
+
+from mem0.memory.enhanced_deduplication import AutonomousDeduplicationManager, similarity_based_clustering
+from mem0.memory.near_duplicates import MinHashLSHIndex
+
+
+def make_memories(n, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(500)]
+    memories = []
+    for i in range(n):
+        if memories and rng.random() < 0.3:
+            # Near-copy of an earlier memory with one word swapped.
+            words = rng.choice(memories)["memory"].split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        else:
+            words = rng.sample(vocabulary, 12)
+        memories.append({"id": f"m{i}", "memory": " ".join(words)})
+    return memories
+
+
+def cluster_ids(clusters):
+    return [[memory["id"] for memory in cluster] for cluster in clusters]
+
+
+def test_lsh_clustering_matches_pairwise_clustering():
+    memories = make_memories(300)
+
+    exact = cluster_ids(similarity_based_clustering(memories, 0.8))
+    approximate = cluster_ids(similarity_based_clustering(memories, 0.8, exact_limit=0))
+
+    assert approximate == exact
+    assert any(len(cluster) > 1 for cluster in exact)
+
+
+def test_index_query_and_persistence(tmp_path):
+    index = MinHashLSHIndex()
+    index.insert("a", "the cache is invalidated on every write")
+    index.insert("b", "deploys run from the main branch")
+    index.insert("empty", "")
+
+    path = str(tmp_path / "index.npz")
+    index.save(path)
+    loaded = MinHashLSHIndex.load(path)
+
+    assert len(loaded) == 3
+    assert [key for key, _ in loaded.query("The cache is invalidated on every write")] == ["a"]
+    assert loaded.query("unrelated text entirely") == []
+    loaded.remove("a")
+    assert loaded.query("the cache is invalidated on every write") == []
+
+
+def test_manager_incremental_and_bulk_dedupe(tmp_path):
+    manager = AutonomousDeduplicationManager({"near_duplicate_index_dir": str(tmp_path)})
+    scope = manager.scope_key({"user_id": "alice"})
+    manager.index_memory("m1", "pytest fixtures live in conftest.py at the repo root", scope)
+
+    # Not among the vector search results, but found through the scope's index.
+    result = manager.process_memory("Pytest fixtures live in conftest.py at the repo ROOT", [], {}, scope=scope)
+    assert result["should_deduplicate"] and result["duplicate_id"] == "m1"
+    assert not manager.process_memory("pytest fixtures live in conftest.py", [], {}, scope=scope)["should_deduplicate"]
+
+    memories = [
+        {"id": "m1", "memory": "pytest fixtures live in conftest.py at the repo root"},
+        {"id": "m2", "memory": "use black with a line length of 120"},
+        {"id": "m3", "memory": "pytest fixtures live in conftest.py at the repo root"},
+    ]
+    report = manager.dedupe_scope(memories, scope=scope)
+    assert report == {"clusters": [["m1", "m3"]], "duplicate_ids": ["m3"]}
+
+    # The rebuilt index was persisted and is picked up by a new manager.
+    reloaded = AutonomousDeduplicationManager({"near_duplicate_index_dir": str(tmp_path)})
+    assert sorted(reloaded.get_index(scope)._texts) == ["m1", "m2"]
+
+
+def test_persisted_index_follows_inserts_and_deletes_across_restarts(tmp_path):
+    config = {"near_duplicate_index_dir": str(tmp_path)}
+    scope = ("alice", None, None)
+    fact = "pytest fixtures live in conftest.py at the repo root"
+    AutonomousDeduplicationManager(config).dedupe_scope([{"id": "a", "memory": fact}], scope=scope)
+    AutonomousDeduplicationManager(config).index_memory("b", "use black with a line length of 120", scope)
+
+    # A later process deletes "a" knowing only its scope, and the next one no longer matches it.
+    assert AutonomousDeduplicationManager(config).remove_memory("a", scope) == [scope]
+    restarted = AutonomousDeduplicationManager(config)
+    assert sorted(restarted.get_index(scope)._texts) == ["b"]
+    assert not restarted.process_memory(fact, [], {}, scope=scope)["should_deduplicate"]
+
+
+def test_near_duplicates_of_deleted_memories_are_not_rejected(tmp_path):
+    config = {"near_duplicate_index_dir": str(tmp_path)}
+    scope = ("alice", None, None)
+    fact = "pytest fixtures live in conftest.py at the repo root"
+    AutonomousDeduplicationManager(config).index_memory("a", fact, scope)
+
+    # "a" was deleted by a process that did not clean the index.
+    manager = AutonomousDeduplicationManager(config)
+    result = manager.process_memory(fact, [], {}, scope=scope, memory_exists=lambda memory_id: False)
+
+    assert not result["should_deduplicate"]
+    assert "a" not in AutonomousDeduplicationManager(config).get_index(scope)
+    assert manager.process_memory(fact, [], {}, scope=scope, memory_exists=None)["should_deduplicate"] is False
@@ -0,0 +1,440 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mem0.memory.graph_memory import ENTITY_VECTOR_INDEX, MemoryGraph
+
+
+class TestNeo4jMemoryGraph(unittest.TestCase):
+    """Test suite for the Neo4j MemoryGraph implementation."""
+
+    def setUp(self):
+        self.config = MagicMock()
+        self.config.graph_store.config.base_label = True
+        self.config.graph_store.config.vector_index = True
+        self.config.graph_store.config.vector_index_candidates = 50
+        self.config.graph_store.config.search_depth = 1
+        self.config.graph_store.config.search_hop_limit = None
+        self.config.graph_store.llm = None
+        self.config.graph_store.custom_prompt = None
+        self.config.graph_store.rerank_top_n = 5
+        self.config.llm.provider = "openai_structured"
+        self.config.embedder.config = {"embedding_dims": 3}
+
+        self.mock_graph = MagicMock()
+        self.mock_graph.query.return_value = []
+        self.mock_embedding_model = MagicMock()
+        self.mock_embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+        self.mock_embedding_model.embed_batch.side_effect = lambda texts: [[0.1, 0.2, 0.3] for _ in texts]
+        self.mock_llm = MagicMock()
+
+        self.neo4j_patcher = patch("mem0.memory.graph_memory.Neo4jGraph", return_value=self.mock_graph)
+        self.embedder_patcher = patch(
+            "mem0.memory.graph_memory.EmbedderFactory.create", return_value=self.mock_embedding_model
+        )
+        self.llm_patcher = patch("mem0.memory.graph_memory.LlmFactory.create", return_value=self.mock_llm)
+        self.neo4j_patcher.start()
+        self.embedder_patcher.start()
+        self.llm_patcher.start()
+
+        self.filters = {"user_id": "alice"}
+
+    def tearDown(self):
+        self.neo4j_patcher.stop()
+        self.embedder_patcher.stop()
+        self.llm_patcher.stop()
+
+    def _queries(self):
+        return [c.args[0] for c in self.mock_graph.query.call_args_list]
+
+    def _embedded_texts(self):
+        return [text for c in self.mock_embedding_model.embed_batch.call_args_list for text in c.args[0]]
+
+    def test_creates_vector_index_sized_from_embedder(self):
+        graph = MemoryGraph(self.config)
+
+        self.assertEqual(graph.vector_index_name, ENTITY_VECTOR_INDEX)
+        index_queries = [q for q in self._queries() if "CREATE VECTOR INDEX" in q]
+        self.assertEqual(len(index_queries), 1)
+        self.assertIn("`vector.dimensions`: 3", index_queries[0])
+
+    def test_no_vector_index_without_base_label(self):
+        self.config.graph_store.config.base_label = False
+        graph = MemoryGraph(self.config)
+
+        self.assertIsNone(graph.vector_index_name)
+        graph._resolve_nodes({"bob": [0.1, 0.2, 0.3]}, self.filters)
+        self.assertIn("vector.similarity.cosine", self._queries()[-1])
+
+    def test_similarity_lookups_use_vector_index(self):
+        graph = MemoryGraph(self.config)
+
+        graph._resolve_nodes({"bob": [0.1, 0.2, 0.3]}, self.filters)
+        graph._search_graph_db(["bob"], self.filters, limit=10)
+
+        for cypher in self._queries()[-2:]:
+            self.assertIn("db.index.vector.queryNodes", cypher)
+            self.assertNotIn("vector.similarity.cosine", cypher)
+        params = self.mock_graph.query.call_args.kwargs["params"]
+        self.assertEqual(params["candidates"], 50)
+
+    def test_falls_back_to_scan_when_index_query_fails(self):
+        graph = MemoryGraph(self.config)
+        self.mock_graph.query.side_effect = [Exception("no such index"), [{"name": "bob", "element_id": "4:1"}]]
+
+        result = graph._resolve_nodes({"bob": [0.1, 0.2, 0.3]}, self.filters)
+
+        self.assertEqual(result, {"bob": "4:1"})
+        self.assertIsNone(graph.vector_index_name)
+        self.assertIn("vector.similarity.cosine", self._queries()[-1])
+
+    def test_search_graph_db_sends_one_query_for_all_entities(self):
+        graph = MemoryGraph(self.config)
+        self.mock_graph.query.reset_mock()
+
+        graph._search_graph_db(["alice", "bob", "acme"], {"user_id": "alice", "agent_id": "bot"}, limit=20)
+
+        self.mock_graph.query.assert_called_once()
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob", "acme"])
+        self.mock_embedding_model.embed.assert_not_called()
+        cypher = self.mock_graph.query.call_args.args[0]
+        params = self.mock_graph.query.call_args.kwargs["params"]
+        self.assertIn("UNWIND range(0, size($embeddings) - 1) AS i", cypher)
+        self.assertIn("[*1..1]", cypher)
+        self.assertIn("LIMIT $limit", cypher)
+        self.assertEqual(len(params["embeddings"]), 3)
+        self.assertEqual((params["limit"], params["hop_limit"], params["agent_id"]), (20, 20, "bot"))
+
+    def test_search_expands_configured_hops(self):
+        self.config.graph_store.config.search_depth = 2
+        self.config.graph_store.config.search_hop_limit = 10
+        graph = MemoryGraph(self.config)
+        self.mock_graph.query.reset_mock()
+        self.mock_llm.generate_response.return_value = {
+            "tool_calls": [
+                {"name": "extract_entities", "arguments": {"entities": [{"entity": "bob", "entity_type": "person"}]}}
+            ]
+        }
+
+        graph.search("Who is Bob?", self.filters)
+
+        cypher = self.mock_graph.query.call_args.args[0]
+        self.assertIn("[*1..2]", cypher)
+        self.assertEqual(self.mock_graph.query.call_args.kwargs["params"]["hop_limit"], 10)
+        self.assertEqual(graph._search_graph_db([], self.filters), [])
+
+    def test_search_reranks_with_persistent_bm25_index(self):
+        self.config.graph_store.search_entity_resolver = "lexical"
+        self.config.graph_store.rerank_top_n = 2
+        graph = MemoryGraph(self.config)
+        corpus = [
+            {"source": "alice", "relationship": "lives_in", "destination": "new_york"},
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            {"source": "bob", "relationship": "lives_in", "destination": "paris"},
+        ]
+        graph.graph.query.side_effect = lambda cypher, params=None: (
+            corpus if "RETURN n.name AS source" in cypher else [{"name": "alice"}]
+        )
+        graph._search_graph_db = MagicMock(return_value=corpus[:2])
+
+        results = graph.search("Where does Alice live?", self.filters)
+
+        self.assertEqual(results[0], corpus[0])
+        self.assertEqual(len(results), 2)
+        graph.search("What does Alice like?", self.filters)
+        corpus_queries = [q for q in self._queries() if "RETURN n.name AS source" in q]
+        self.assertEqual(len(corpus_queries), 1)
+
+        # Writes and deletions keep the corpus statistics current without reloading.
+        statements, _ = self._capture_transaction()
+        graph.graph.query.side_effect = None
+        graph.graph.query.return_value = []
+        relation = {"source": "carol", "relationship": "lives_in", "destination": "rome"}
+        docs = graph.bm25_index._scopes[("alice", None)].docs
+        graph._add_entities([dict(relation)], self.filters, {})
+        self.assertIn(("carol", "r", "rome"), docs)
+        graph._delete_entities([dict(relation)], self.filters)
+        self.assertNotIn(("carol", "r", "rome"), docs)
+
+    def _capture_transaction(self, missing_ids=(), owners=None):
+        """Route write transactions to a fake tx that echoes one record per UNWIND row.
+
+        Rows matching a node id in `missing_ids` produce no record, as if that node had been deleted. `owners` maps
+        node ids to the (user, agent) owning them; rows matching a node outside the statement's scope produce no
+        record when the statement scopes its elementId MATCH to the user and agent.
+        """
+        statements = []
+        owners = owners or {}
+
+        def in_scope(owner, cypher, params):
+            user_id, agent_id = owner
+            if "_id AND source.user_id = $user_id" not in cypher and "_id AND destination.user_id" not in cypher:
+                return True
+            return user_id == params["user_id"] and (
+                "agent_id = $agent_id" not in cypher or agent_id == params["agent_id"]
+            )
+
+        def run(cypher, params):
+            statements.append((cypher, params))
+            missing = set(missing_ids) | {i for i, owner in owners.items() if not in_scope(owner, cypher, params)}
+            result = MagicMock()
+            result.data.return_value = [
+                {
+                    "idx": row["idx"],
+                    "source": row["source_name"],
+                    "relationship": "r",
+                    "target": row["dest_name"],
+                    "source_id": row.get("source_id") or f"id:{row['source_name']}",
+                    "destination_id": row.get("dest_id") or f"id:{row['dest_name']}",
+                }
+                for row in params["rows"]
+                if row.get("source_id") not in missing and row.get("dest_id") not in missing
+            ]
+            return result
+
+        tx = MagicMock()
+        tx.run.side_effect = run
+        session = self.mock_graph._driver.session.return_value.__enter__.return_value
+        session.execute_write.side_effect = lambda work: work(tx)
+        return statements, session
+
+    def test_add_entities_batches_writes_by_relationship(self):
+        graph = MemoryGraph(self.config)
+        statements, session = self._capture_transaction()
+        self.mock_graph.query.reset_mock()
+        self.mock_graph.query.return_value = [{"name": "alice", "element_id": "4:1"}]
+
+        to_be_added = [
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            {"source": "alice", "relationship": "works_at", "destination": "acme"},
+            {"source": "alice", "relationship": "likes", "destination": "sushi"},
+        ]
+        results = graph._add_entities(to_be_added, self.filters, {"pizza": "food", "sushi": "food"})
+
+        # One resolution query for all names, one transaction for all writes.
+        self.assertEqual(self.mock_graph.query.call_count, 1)
+        resolve_params = self.mock_graph.query.call_args.kwargs["params"]
+        self.assertEqual([row["name"] for row in resolve_params["rows"]], ["alice", "pizza", "acme", "sushi"])
+        self.assertEqual(self._embedded_texts(), ["alice", "pizza", "acme", "sushi"])
+        session.execute_write.assert_called_once()
+
+        self.assertEqual(len(statements), 2)
+        likes_cypher, likes_params = next(st for st in statements if ":likes]" in st[0])
+        self.assertIn("UNWIND $rows AS row", likes_cypher)
+        self.assertIn("elementId(source) = row.source_id", likes_cypher)
+        self.assertEqual([row["dest_name"] for row in likes_params["rows"]], ["pizza", "sushi"])
+        self.assertEqual(likes_params["rows"][0]["source_id"], "4:1")
+
+        self.assertEqual([r[0]["target"] for r in results], ["pizza", "acme", "sushi"])
+        self.assertNotIn("source_id", results[0][0])
+
+    def test_add_entities_reuses_cached_resolutions(self):
+        graph = MemoryGraph(self.config)
+        statements, session = self._capture_transaction()
+        self.mock_graph.query.reset_mock()
+        self.mock_graph.query.return_value = [{"name": "alice", "element_id": "4:1"}]
+
+        graph._add_entities([{"source": "alice", "relationship": "likes", "destination": "pizza"}], self.filters, {})
+        self.assertEqual(len(self._embedded_texts()), 2)
+        self.assertEqual(self.mock_graph.query.call_count, 1)
+
+        # Both names are cached now: no embedding, no resolution query, and both nodes are matched by id.
+        graph._add_entities([{"source": "alice", "relationship": "eats", "destination": "pizza"}], self.filters, {})
+        self.assertEqual(len(self._embedded_texts()), 2)
+        self.assertEqual(self.mock_graph.query.call_count, 1)
+        rows = statements[-1][1]["rows"]
+        self.assertEqual((rows[0]["source_id"], rows[0]["dest_id"]), ("4:1", "id:pizza"))
+
+        # Other users and cleared scopes resolve again.
+        graph._add_entities(
+            [{"source": "alice", "relationship": "likes", "destination": "pizza"}], {"user_id": "bob"}, {}
+        )
+        self.assertEqual(len(self._embedded_texts()), 4)
+        graph.delete_all(self.filters)
+        graph._add_entities([{"source": "alice", "relationship": "likes", "destination": "pizza"}], self.filters, {})
+        self.assertEqual(len(self._embedded_texts()), 6)
+
+    def test_add_entities_retries_stale_cache_entries(self):
+        graph = MemoryGraph(self.config)
+        self._capture_transaction()
+        self.mock_graph.query.return_value = []
+        relation = {"source": "alice", "relationship": "likes", "destination": "pizza"}
+        graph._add_entities([dict(relation)], self.filters, {})
+
+        # The cached pizza node disappears; the relation is written again through a fresh resolution.
+        statements, _ = self._capture_transaction(missing_ids={"id:pizza"})
+        results = graph._add_entities([dict(relation)], self.filters, {})
+
+        self.assertEqual(len(statements), 2)
+        self.assertIsNone(statements[-1][1]["rows"][0]["dest_id"])
+        self.assertEqual(results[0][0]["target"], "pizza")
+
+    def test_add_entities_never_matches_a_cached_id_of_another_user(self):
+        graph = MemoryGraph(self.config)
+        self._capture_transaction()
+        self.mock_graph.query.return_value = []
+        relation = {"source": "alice", "relationship": "likes", "destination": "pizza"}
+        graph._add_entities([dict(relation)], {"user_id": "alice", "agent_id": "bot"}, {})
+
+        # The pizza node was deleted elsewhere and Neo4j reused its element id for one of bob's nodes.
+        statements, _ = self._capture_transaction(owners={"id:pizza": ("bob", "bot")})
+        results = graph._add_entities([dict(relation)], {"user_id": "alice", "agent_id": "bot"}, {})
+
+        cached_cypher, params = statements[0]
+        self.assertIn("elementId(destination) = row.dest_id AND destination.user_id = $user_id", cached_cypher)
+        self.assertIn("destination.agent_id = $agent_id", cached_cypher)
+        self.assertEqual(params["rows"][0]["dest_id"], "id:pizza")
+        self.assertEqual(len(statements), 2)
+        self.assertIsNone(statements[-1][1]["rows"][0]["dest_id"])
+        self.assertEqual(results[0][0]["target"], "pizza")
+
+    def test_add_entities_resolves_only_nodes_of_the_same_agent(self):
+        graph = MemoryGraph(self.config)
+        statements, _ = self._capture_transaction(owners={"4:other-agent": ("alice", "other")})
+        nodes = [{"element_id": "4:other-agent", "user_id": "alice", "agent_id": "other"}]
+
+        def query(cypher, params):
+            # The user's "pizza" node belongs to another agent; it only resolves if the query ignores agents.
+            visible = [
+                n
+                for n in nodes
+                if "candidate.agent_id = $agent_id" not in cypher or n["agent_id"] == params["agent_id"]
+            ]
+            return [{"name": row["name"], "element_id": visible[0]["element_id"]} for row in params["rows"] if visible]
+
+        self.mock_graph.query.side_effect = query
+        filters = {"user_id": "alice", "agent_id": "bot"}
+        results = graph._add_entities(
+            [{"source": "alice", "relationship": "likes", "destination": "pizza"}], filters, {}
+        )
+
+        self.assertIn("candidate.agent_id = $agent_id", self._queries()[-1])
+        self.assertIsNone(statements[0][1]["rows"][0]["dest_id"])
+        self.assertEqual(results[0][0]["target"], "pizza")
+
+    def test_delete_entities_batches_by_relationship(self):
+        graph = MemoryGraph(self.config)
+        statements, session = self._capture_transaction()
+
+        to_be_deleted = [
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            {"source": "alice", "relationship": "likes", "destination": "sushi"},
+        ]
+        results = graph._delete_entities(to_be_deleted, {"user_id": "alice", "agent_id": "bot"})
+
+        session.execute_write.assert_called_once()
+        self.assertEqual(len(statements), 1)
+        cypher, params = statements[0]
+        self.assertIn("DELETE r", cypher)
+        self.assertIn("agent_id: $agent_id", cypher)
+        self.assertEqual(params["agent_id"], "bot")
+        self.assertEqual(len(results), 2)
+
+    def test_single_call_extraction(self):
+        self.config.graph_store.extraction_mode = "single_call"
+        graph = MemoryGraph(self.config)
+        self.mock_llm.generate_response.return_value = {
+            "tool_calls": [
+                {
+                    "name": "extract_graph",
+                    "arguments": {
+                        "entities": [
+                            {"entity": "alice", "entity_type": "person"},
+                            {"entity": "New York", "entity_type": "city"},
+                        ],
+                        "relations": [{"source": "alice", "relationship": "lives in", "destination": "New York"}],
+                    },
+                }
+            ]
+        }
+        graph._search_graph_db = MagicMock(return_value=[])
+        graph._get_delete_entities_from_search_output = MagicMock(return_value=[])
+        graph._delete_entities = MagicMock(return_value=[])
+        graph._add_entities = MagicMock(return_value=[])
+
+        graph.add("I live in New York", self.filters)
+
+        self.assertEqual(self.mock_llm.generate_response.call_count, 1)
+        graph._search_graph_db.assert_called_once_with(node_list=["alice", "new_york"], filters=self.filters)
+        to_be_added, _, entity_type_map = graph._add_entities.call_args.args
+        self.assertEqual(to_be_added, [{"source": "alice", "relationship": "lives_in", "destination": "new_york"}])
+        self.assertEqual(entity_type_map, {"alice": "person", "new_york": "city"})
+
+    def test_lexical_search_needs_no_llm(self):
+        self.config.graph_store.search_entity_resolver = "lexical"
+        graph = MemoryGraph(self.config)
+        self.mock_graph.query.return_value = [{"name": "alice"}, {"name": "new_york"}, {"name": "acme_corp"}]
+        graph._search_graph_db = MagicMock(return_value=[])
+
+        graph.search("Does my friend still live in New York?", self.filters)
+        graph.search("Where is Acme Corp?", self.filters)
+
+        self.mock_llm.generate_response.assert_not_called()
+        node_lists = [c.kwargs["node_list"] for c in graph._search_graph_db.call_args_list]
+        self.assertEqual(node_lists, [["alice", "new_york"], ["acme_corp"]])
+        # Known names are loaded once per user and cached.
+        name_queries = [q for q in self._queries() if "RETURN DISTINCT n.name" in q]
+        self.assertEqual(len(name_queries), 1)
+
+        graph.delete_all(self.filters)
+        graph.search("Where is Acme Corp?", self.filters)
+        name_queries = [q for q in self._queries() if "RETURN DISTINCT n.name" in q]
+        self.assertEqual(len(name_queries), 2)
+
+    def test_iter_all_pages_with_a_keyset_cursor(self):
+        graph = MemoryGraph(self.config)
+        # Two source nodes share a creation time, and one of them has more relations than a page.
+        rows = [
+            {"source": source, "relationship": "likes", "target": f"t{i}", "cursor": [created, node, f"5:x:{i}"]}
+            for i, (source, created, node) in enumerate(
+                [("alice", 10, "4:x:1"), ("alice", 10, "4:x:1"), ("alice", 10, "4:x:1"), ("bob", 10, "4:x:2")]
+                + [("carol", 20, "4:x:0")]
+            )
+        ]
+
+        def query(cypher, params):
+            if "AS cursor" not in cypher:
+                return []
+            if "page_created" not in params:
+                return rows[: params["limit"]]
+            after = (params["page_created"], params["page_node"], params["page_relation"])
+            return [row for row in rows if tuple(row["cursor"]) > after][: params["limit"]]
+
+        self.mock_graph.query.side_effect = query
+        results = list(graph.iter_all(self.filters, page_size=2, relationship="Likes", entity="Alice"))
+
+        self.assertEqual([r["target"] for r in results], ["t0", "t1", "t2", "t3", "t4"])
+        page_params = [c.kwargs["params"] for c in self.mock_graph.query.call_args_list if "AS cursor" in c.args[0]]
+        self.assertEqual(
+            [(p.get("page_created"), p.get("page_node"), p.get("page_relation")) for p in page_params],
+            [(None, None, None), (10, "4:x:1", "5:x:1"), (10, "4:x:2", "5:x:3")],
+        )
+        self.assertEqual(page_params[0]["relationship"], "likes")
+        self.assertEqual(page_params[0]["entity"], "alice")
+        page_queries = [c for c in self._queries() if "AS cursor" in c]
+        self.assertIn("ORDER BY n.created, elementId(n), elementId(r)", page_queries[0])
+        self.assertIn("n.created >= $page_created", page_queries[1])
+        self.assertTrue(any("ON (n.user_id, n.created)" in q for q in self._queries()))
+
+    def test_summarize_aggregates_in_cypher(self):
+        graph = MemoryGraph(self.config)
+        self.mock_graph.query.side_effect = lambda cypher, params: (
+            [{"relationship": "likes", "count": 3}]
+            if "count(r)" in cypher
+            else [{"name": "alice", "mentions": 7}]
+            if "mentions" in cypher
+            else []
+        )
+
+        summary = graph.summarize(self.filters, top_k=1)
+
+        self.assertEqual(
+            summary,
+            {
+                "relationships": [{"relationship": "likes", "count": 3}],
+                "top_entities": [{"name": "alice", "mentions": 7}],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import re
+
+import pytest
+
+from mem0.memory.confidence_scoring import EnhancedConfidenceScorer
+from mem0.memory.memory_categorization import HierarchicalCategorizer
+from mem0.memory.metadata_tagging import SemanticTagger
+from mem0.memory.pattern_engine import PatternEngine, literal_table, required_literals
+
+TABLE = {
+    "semantic": [r"\b(error|exception|bug)\b", r"\b(try|catch)\b"],
+    "python": [r"\bpython\b", r"\bpy\b", r"\.py\b"],
+    "cpp": [r"\bc\+\+\b", r"\bg\+\+\b"],
+    "function": [r"\w+\s*\([^)]*\)\s*\{", r"\bdef\s+\w+\("],
+    "pair": [r"(a)(b)?c"],
+    "priority": [r"\bhigh\s+priority\b"],
+}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "Bug in main.py: exception raised, try/catch it in python",
+        "def parse(x) { return x } c++ and g++ ac abc",
+        "HIGH   priority café exception",
+        "Kelvin K and high priority",
+    ],
+)
+def test_scan_matches_findall_per_pattern(text):
+    engine = PatternEngine(TABLE)
+
+    expected = {}
+    for name, patterns in TABLE.items():
+        for pattern in patterns:
+            values = re.findall(pattern, text, re.IGNORECASE)
+            if values:
+                expected.setdefault(name, []).append((pattern, values))
+
+    assert engine.scan(text) == expected
+
+
+def test_required_literals():
+    assert required_literals(r"\bhigh\s+priority\b") == {"priority"}
+    assert required_literals(r"\b(Error|exception)\b") == {"error", "exception"}
+    assert required_literals(r"\bc\+\+\b") == {"c++"}
+    assert required_literals(r"\w+\s*\(") == {"("}
+    assert required_literals(r"\w+") is None
+
+
+def test_literal_table_matches_substrings():
+    engine = PatternEngine(literal_table({"code": ["def ", "()"], "path": ["/", "\\"]}), flags=0)
+
+    assert engine.matches("call f() in a\\b") == {"code": ["\\(\\)"], "path": ["\\\\"]}
+    assert engine.matches("DEF x") == {}
+
+
+def test_tagger_recompiles_custom_categories():
+    tagger = SemanticTagger({})
+    assert "frontend" not in tagger._extract_semantic_tags("A React hook")
+
+    tagger.add_custom_semantic_category("frontend", [r"\b(react|hook)\b"], 0.6)
+
+    tags = tagger._extract_semantic_tags("A React hook")
+    assert tags["frontend"]["count"] == 2
+    assert sorted(tags["frontend"]["matches"]) == ["hook", "react"]
+
+
+def test_categorizer_recompiles_updated_patterns_and_detects_sub_categories():
+    categorizer = HierarchicalCategorizer({})
+    assert categorizer._detect_primary_category("the widget", {}) == "code_implementation"
+
+    categorizer.update_category_patterns("deployment", [r"\bwidget\b"])
+
+    assert categorizer._detect_primary_category("the widget", {}) == "deployment"
+    result = categorizer.categorize_memory("Logic error and a crash in the parser", {"category": "bug_fix"})
+    assert sorted(result["sub_categories"]) == ["logic_errors", "runtime_errors"]
+
+
+def test_confidence_scorer_keyword_indicators():
+    scorer = EnhancedConfidenceScorer({})
+
+    assert scorer._assess_content_quality("plain words without any signal", {}) == pytest.approx(0.7)
+    assert scorer._assess_content_quality("Traceback in src/app.py fixed", {}) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("text", ["", "Bug in main.py: exception raised", "HIGH   priority café", "def parse(x) { c++"])
+def test_present_matches_scan(text):
+    engine = PatternEngine(TABLE)
+    keywords = PatternEngine(literal_table({"code": ["def ", "()"], "path": ["/", ".py"]}), flags=0)
+
+    assert engine.present(text) == set(engine.scan(text))
+    assert keywords.present(text) == set(keywords.scan(text))
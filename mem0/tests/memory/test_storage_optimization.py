@@ -0,0 +1,90 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from mem0.memory.storage_optimization import IntelligentStorageManager
+from mem0.memory.timezone_utils import safe_datetime_now
+
+CATEGORIES = ["bug_fix", "testing", "general", "debugging", "custom"]
+
+
+def _memories(count, seed=0):
+    rng = random.Random(seed)
+    now = safe_datetime_now()
+    memories = []
+    for i in range(count):
+        metadata = {
+            "category": rng.choice(CATEGORIES),
+            "access_count": rng.randint(0, 30),
+            "created_at": (now - timedelta(days=rng.randint(0, 400))).isoformat(),
+        }
+        if rng.random() < 0.5:
+            metadata["last_accessed"] = (now - timedelta(days=rng.randint(0, 60))).isoformat()
+        memories.append(
+            {"id": f"m{i}", "memory": "x" * rng.randint(0, 600), "user_id": rng.choice("ab"), "metadata": metadata}
+        )
+    return memories
+
+
+@pytest.fixture
+def manager():
+    manager = IntelligentStorageManager({})
+    for policy in manager.retention_policies.values():
+        policy["min_retention_count"] = 5
+    return manager
+
+
+def test_incremental_accounting_matches_full_recount(manager):
+    memories = _memories(300)
+    for memory in memories:
+        manager.record_add(memory)
+
+    updated = dict(memories[0], memory="changed", metadata=dict(memories[0]["metadata"], category="testing"))
+    manager.record_update(updated)
+    removed = memories[1::3]
+    for memory in removed:
+        assert manager.record_delete(memory["id"])
+    assert not manager.record_delete("missing")
+
+    remaining = [updated] + [m for m in memories[1:] if m not in removed]
+    expected = manager._calculate_storage_stats(remaining)
+    current = manager.check_storage_limits()["current_stats"]
+
+    assert current == expected
+    assert sum(current["scope_counts"].values()) == len(remaining)
+    assert set(current["scope_counts"]) <= {("a", None, None), ("b", None, None)}
+
+
+@pytest.mark.parametrize("strategy", ["lru", "priority_based", "context_aware", "hybrid"])
+def test_stream_purges_the_same_memories_as_the_list(manager, strategy):
+    memories = _memories(400, seed=1)
+
+    expected = manager.optimize_storage(memories, strategy, 0.2)
+    streamed = manager.optimize_storage_stream(iter(memories), strategy, 0.2, total_memories=len(memories))
+
+    assert streamed["purged_memory_ids"] == expected["purged_memory_ids"]
+    assert streamed["size_saved_mb"] == pytest.approx(expected["size_saved_mb"])
+
+
+def test_stream_uses_accounted_total(manager):
+    memories = _memories(50, seed=2)
+    with pytest.raises(ValueError):
+        manager.optimize_storage_stream(iter(memories), "lru")
+
+    for memory in memories:
+        manager.record_add(memory)
+    result = manager.optimize_storage_stream(iter(memories), "lru", 0.1)
+
+    assert result["memories_removed"] == 5
+
+
+def test_accounting_is_seeded_from_the_stored_memories(manager):
+    memories = _memories(120, seed=3)
+    manager.record_add(memories[0])
+
+    assert manager.load_accounting(iter(memories)) == len(memories)
+    assert manager.check_storage_limits()["current_stats"] == manager._calculate_storage_stats(memories)
+
+    manager.record_delete(memories[0]["id"])
+    assert manager.optimize_storage_stream(iter(memories[1:]), "lru", 0.1)["memories_removed"] == 12
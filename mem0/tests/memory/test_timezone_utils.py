@@ -0,0 +1,49 @@
+import math
+from datetime import datetime, timedelta
+
+import pytz
+
+from mem0.memory.timezone_utils import (
+    ages_from_epochs,
+    create_memory_timestamps,
+    get_timezone,
+    memory_epoch,
+    parse_timestamp,
+    timestamp_to_epoch,
+    to_epoch,
+)
+
+
+def test_parse_timestamp_is_memoized_and_accepts_z():
+    first = parse_timestamp("2024-05-01T12:00:00Z")
+
+    assert first == datetime(2024, 5, 1, 12, tzinfo=pytz.UTC)
+    assert parse_timestamp("2024-05-01T12:00:00Z") is first
+    assert get_timezone("US/Pacific") is get_timezone("US/Pacific")
+
+
+def test_naive_timestamps_are_read_in_the_default_timezone():
+    naive = datetime(2024, 1, 15, 8, 30)
+    expected = pytz.timezone("US/Pacific").localize(naive).timestamp()
+
+    assert to_epoch(naive) == expected
+    assert timestamp_to_epoch(naive.isoformat()) == expected
+
+
+def test_memory_epoch_prefers_the_stored_epoch():
+    timestamps = create_memory_timestamps()
+    assert memory_epoch(timestamps) == parse_timestamp(timestamps["created_at"]).timestamp()
+
+    assert memory_epoch({"created_at": "2024-05-01T12:00:00Z", "created_at_epoch": 5}) == 5.0
+    assert memory_epoch({"updated_at": "2024-05-01T12:00:00Z"}, "updated_at") == 1714564800.0
+    assert memory_epoch({"created_at": "not a date"}) is None
+    assert memory_epoch({}) is None
+
+
+def test_ages_from_epochs_marks_missing_timestamps():
+    now = 1_000_000.0
+    ages = ages_from_epochs([now - 60, None, now - timedelta(days=2).total_seconds()], now)
+
+    assert ages[0] == 60
+    assert math.isnan(ages[1])
+    assert ages[2] == 172800
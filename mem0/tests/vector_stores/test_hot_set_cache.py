@@ -0,0 +1,126 @@
+import uuid
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from mem0.vector_stores.hot_set_cache import HotSetVectorCache
+from mem0.vector_stores.qdrant import Qdrant
+
+DIMS = 16
+
+
+@pytest.fixture
+def qdrant_store():
+    return Qdrant(collection_name="hot_set_test", embedding_model_dims=DIMS, client=QdrantClient(":memory:"))
+
+
+@pytest.fixture
+def populated(qdrant_store):
+    rng = np.random.default_rng(0)
+    ids = [str(uuid.uuid4()) for _ in range(60)]
+    vectors = rng.normal(size=(60, DIMS)).tolist()
+    payloads = [
+        {"data": f"memory {i}", "user_id": "alice" if i % 2 else "bob", "actor_id": "x" if i % 3 else "y"}
+        for i in range(60)
+    ]
+    qdrant_store.insert(vectors=vectors, payloads=payloads, ids=ids)
+    return qdrant_store, rng
+
+
+def _as_tuples(results):
+    return [(str(r.id), round(r.score, 5), r.payload["data"]) for r in results]
+
+
+def test_search_matches_backing_store(populated):
+    store, rng = populated
+    cache = HotSetVectorCache(store, metric="cosine")
+
+    for _ in range(5):
+        query = rng.normal(size=DIMS).tolist()
+        for filters in ({"user_id": "alice"}, {"user_id": "bob", "actor_id": "y"}):
+            expected = store.search(query="", vectors=query, limit=7, filters=filters)
+            actual = cache.search(query="", vectors=query, limit=7, filters=filters)
+            assert _as_tuples(actual) == _as_tuples(expected)
+
+    info = cache.cache_info()
+    assert info["scopes"] == 2
+    assert info["hits"] == 8
+    assert info["misses"] == 2
+
+
+def test_writes_invalidate_scope(populated):
+    store, rng = populated
+    cache = HotSetVectorCache(store, metric="cosine")
+    query = rng.normal(size=DIMS).tolist()
+
+    cache.search(query="", vectors=query, limit=3, filters={"user_id": "alice"})
+    cache.search(query="", vectors=query, limit=3, filters={"user_id": "bob"})
+    assert cache.cache_info()["scopes"] == 2
+
+    new_id = str(uuid.uuid4())
+    cache.insert(vectors=[query], payloads=[{"data": "exact", "user_id": "alice"}], ids=[new_id])
+    assert cache.cache_info()["scopes"] == 1
+
+    results = cache.search(query="", vectors=query, limit=1, filters={"user_id": "alice"})
+    assert results[0].id == new_id
+
+    cache.delete(vector_id=new_id)
+    results = cache.search(query="", vectors=query, limit=1, filters={"user_id": "alice"})
+    assert results[0].id != new_id
+
+
+def test_lru_eviction_respects_budget(populated):
+    store, rng = populated
+    cache = HotSetVectorCache(store, metric="cosine", max_memory_mb=0.004)
+    query = rng.normal(size=DIMS).tolist()
+
+    cache.search(query="", vectors=query, limit=3, filters={"user_id": "alice"})
+    cache.search(query="", vectors=query, limit=3, filters={"user_id": "bob"})
+
+    info = cache.cache_info()
+    assert info["used_bytes"] <= info["max_bytes"]
+    assert info["evictions"] == 1
+    assert info["scopes"] == 1
+
+
+def test_bypasses_unscoped_and_unsupported_stores():
+    store = MagicMock()
+    store.list_vectors.side_effect = NotImplementedError
+    store.search.return_value = ["remote"]
+    cache = HotSetVectorCache(store, metric="cosine_distance")
+
+    assert cache.search(query="", vectors=[0.1] * DIMS, limit=2, filters=None) == ["remote"]
+    assert cache.search(query="", vectors=[0.1] * DIMS, limit=2, filters={"user_id": "alice"}) == ["remote"]
+    assert cache.search(query="", vectors=[0.1] * DIMS, limit=2, filters={"user_id": "alice"}) == ["remote"]
+    store.list_vectors.assert_called_once()
+
+
+def test_cosine_distance_ordering():
+    store = MagicMock()
+    store.list_vectors.return_value = [
+        ("a", [1.0, 0.0], {"user_id": "u"}),
+        ("b", [0.0, 1.0], {"user_id": "u"}),
+        ("c", [1.0, 1.0], {"user_id": "u"}),
+    ]
+    cache = HotSetVectorCache(store, metric="cosine_distance")
+
+    results = cache.search(query="", vectors=[1.0, 0.1], limit=2, filters={"user_id": "u"})
+
+    assert [r.id for r in results] == ["a", "c"]
+    assert results[0].score == pytest.approx(1 - 1 / np.sqrt(1.01), abs=1e-6)
+
+
+def test_search_batch_matches_single_searches(populated):
+    store, rng = populated
+    cache = HotSetVectorCache(store, metric="cosine")
+    queries = rng.normal(size=(4, DIMS)).tolist()
+
+    for filters in (None, {"user_id": "alice"}):
+        expected = [_as_tuples(store.search(query="", vectors=q, limit=5, filters=filters)) for q in queries]
+        for searcher in (store, cache):
+            batches = searcher.search_batch(queries=[""] * len(queries), vectors=queries, limit=5, filters=filters)
+            assert [_as_tuples(results) for results in batches] == expected
+
+    assert cache.cache_info()["bypasses"] == len(queries)
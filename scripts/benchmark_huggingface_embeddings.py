@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+HuggingFace Embedding Backend Benchmark Script
+
+This script compares the local HuggingFace embedding backends (PyTorch, ONNX
+Runtime and int8-quantized ONNX) on a fixed corpus: model load time, per-text
+and batched encode throughput, and how closely each backend's vectors match
+the PyTorch ones (mean cosine similarity and top-5 neighbour overlap).
+
+Usage:
+    python scripts/benchmark_huggingface_embeddings.py [model] [threads] [quantization]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the mem0 package to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mem0"))
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig  # noqa: E402
+from mem0.embeddings.huggingface import HuggingFaceEmbedding  # noqa: E402
+
+SUBJECTS = [
+    "The parser",
+    "The deployment",
+    "The worker",
+    "The migration",
+    "The cache",
+    "The API client",
+]
+EVENTS = [
+    "failed with a KeyError in src/app.py",
+    "got 10x faster after adding functools.lru_cache",
+    "needs DATABASE_URL set before it starts",
+    "should retry with exponential backoff on 503 responses",
+    "is configured through environment variables in docker-compose.yml",
+    "was refactored to use dataclasses for plain records",
+    "times out when the connection pool is exhausted",
+]
+CORPUS = [f"{subject} {event}" for subject in SUBJECTS for event in EVENTS] * 4
+
+
+def time_call(function, repeats: int) -> float:
+    """Return the best wall time of `repeats` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def top_k_overlap(reference: np.ndarray, candidate: np.ndarray, k: int = 5) -> float:
+    """Mean share of each text's k nearest neighbours under the reference vectors kept by the candidate vectors."""
+
+    def neighbours(vectors):
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarities = normalized @ normalized.T
+        np.fill_diagonal(similarities, -np.inf)
+        return np.argsort(-similarities, axis=1)[:, :k]
+
+    expected, actual = neighbours(reference), neighbours(candidate)
+    return float(
+        np.mean(
+            [len(set(e) & set(a)) / k for e, a in zip(expected, actual, strict=True)]
+        )
+    )
+
+
+def main():
+    """Main benchmark function."""
+    model = sys.argv[1] if len(sys.argv) > 1 else "multi-qa-MiniLM-L6-cos-v1"
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    quantization = sys.argv[3] if len(sys.argv) > 3 else "avx2"
+    repeats = 3
+
+    print("🚀 HuggingFace Embedding Backend Benchmark")
+    print("=" * 50)
+    print(
+        f"📊 Test parameters: {model}, {len(CORPUS)} texts, {threads} threads, best of {repeats} runs"
+    )
+
+    backends = {
+        "torch": {"huggingface_backend": "torch"},
+        "onnx": {"huggingface_backend": "onnx"},
+        f"onnx qint8 ({quantization})": {
+            "huggingface_backend": "onnx",
+            "huggingface_quantization": quantization,
+        },
+    }
+    reference = None
+    print(
+        f"\n{'backend':<22}{'load s':>8}{'single ms':>11}{'batch ms':>10}{'cosine':>8}{'top-5':>7}"
+    )
+    for name, options in backends.items():
+        try:
+            start = time.perf_counter()
+            embedder = HuggingFaceEmbedding(
+                BaseEmbedderConfig(
+                    model=model,
+                    huggingface_threads=threads,
+                    huggingface_warmup=True,
+                    **options,
+                )
+            )
+            load_s = time.perf_counter() - start
+        except (ImportError, OSError, RuntimeError, ValueError) as e:
+            print(f"{name:<22}❌ unavailable: {e}")
+            continue
+
+        single_ms = time_call(
+            lambda emb=embedder: [emb.embed(text) for text in CORPUS], repeats
+        )
+        batch_ms = time_call(
+            lambda emb=embedder: emb.embed_batch_array(CORPUS), repeats
+        )
+        vectors = embedder.embed_batch_array(CORPUS)
+        if reference is None:
+            reference = vectors
+        cosine = np.sum(reference * vectors, axis=1) / (
+            np.linalg.norm(reference, axis=1) * np.linalg.norm(vectors, axis=1)
+        )
+        overlap = top_k_overlap(reference, vectors)
+        print(
+            f"{name:<22}{load_s:>8.2f}{single_ms:>11.1f}{batch_ms:>10.1f}{cosine.mean():>8.4f}{overlap:>7.2f}"
+        )
+
+    print("\n🎉 Benchmark completed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -309,10 +309,10 @@ class TestCodingMemory:
         )
 
         # Mock vector store search (no existing memories)
-        self.mock_vector_store.search.return_value = []
+        self.mock_vector_store.search_batch.return_value = [[]]
 
         # Mock embedding
-        self.mock_embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+        self.mock_embedding_model.embed_batch.return_value = [[0.1, 0.2, 0.3]]
 
         messages = [
             {"role": "user", "content": "I fixed a memory leak in the React component"},
@@ -352,43 +352,45 @@ class TestCodingMemory:
             assert len(results["results"]) == 1
             assert "enhanced_score" in results["results"][0]
 
-    def test_should_store_coding_fact_with_high_similarity(self):
-        """Test deduplication with high similarity."""
-        memory = CodingMemory(self.config)
-
-        # Mock high similarity existing memory
-        mock_memory = Mock()
-        mock_memory.score = 0.95
-        self.mock_vector_store.search.return_value = [mock_memory]
-
-        # Mock embedding
-        self.mock_embedding_model.embed.return_value = [0.1, 0.2, 0.3]
-
-        should_store = memory._should_store_coding_fact(
-            "This is a duplicate fact",
-            {"category": "bug_fix"},
-            {"user_id": "test_user"},
+    def _select(self, memory, fact, existing):
+        """Run the batched deduplication decision for one fact against stored memories."""
+        prepared = memory._prepare_coding_facts([fact], {"user_id": "test_user"})
+        return memory._select_coding_facts(
+            prepared, [[0.1, 0.2, 0.3]], [existing], {"user_id": "test_user"}
         )
 
-        assert should_store is False
-
-    def test_should_store_coding_fact_with_low_similarity(self):
-        """Test storing fact with low similarity."""
+    def test_select_coding_facts_rejects_duplicates(self):
+        """Test deduplication of a fact matching a stored memory."""
         memory = CodingMemory(self.config)
+        fact = "Fixed the memory leak in the parser"
+        stored = self._select(memory, fact, [])[0]
 
-        # Mock low similarity existing memory
-        mock_memory = Mock()
-        mock_memory.score = 0.5
-        self.mock_vector_store.search.return_value = [mock_memory]
+        # The search returns the stored memory; its embedding is cached.
+        existing = Mock(
+            id=stored["id"], payload={"data": fact, **stored["metadata"]}, score=1.0
+        )
+        assert self._select(memory, fact, [existing]) == []
 
-        # Mock embedding
-        self.mock_embedding_model.embed.return_value = [0.1, 0.2, 0.3]
+    def test_select_coding_facts_accepts_new_facts(self):
+        """Test storing a fact unlike the stored memories."""
+        memory = CodingMemory(self.config)
+        existing = Mock(
+            id="existing",
+            payload={
+                "data": "Fixed the memory leak in the parser",
+                "category": "bug_fix",
+            },
+            score=0.1,
+        )
 
-        should_store = memory._should_store_coding_fact(
-            "This is a new fact", {"category": "bug_fix"}, {"user_id": "test_user"}
+        accepted = self._select(
+            memory, "Deploy with docker compose on port 8080", [existing]
         )
 
-        assert should_store is True
+        assert len(accepted) == 1
+        assert accepted[0]["fact"] == "Deploy with docker compose on port 8080"
+        assert accepted[0]["embedding"] == [0.1, 0.2, 0.3]
+        assert accepted[0]["id"]
 
     def test_rank_coding_results(self):
         """Test ranking coding results."""